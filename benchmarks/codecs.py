@@ -0,0 +1,118 @@
+"""
+Encode and decode cost of the JSON codecs on real payload shapes.
+
+Compares the stdlib, orjson and msgspec codecs (those that are installed) on:
+
+- decoding a ``GetContactsSerializer`` page of contacts,
+- a full ``client.get(...).json()`` call, i.e. request preparation and
+  decoding, over a stub transport that never touches the network,
+- encoding a bulk-delete body with thousands of contact IDs.
+
+Usage:
+    python benchmarks/codecs.py [--iterations 200] [--page-size 100]
+"""
+
+import argparse
+import json
+import time
+from typing import Any, Callable, Dict, List
+
+from devhub_python import DevoClient
+from devhub_python.codec import CODECS, create_codec
+from devhub_python.exceptions import DevoConfigurationException
+from devhub_python.transport import Transport, TransportResponse
+
+
+def contacts_page(size: int) -> Dict[str, Any]:
+    """Build a contacts page shaped like the API's."""
+    contacts = [
+        {
+            "id": f"contact_{i:08d}",
+            "account_id": "acc_1",
+            "phone_number": f"+1555{i:07d}",
+            "email": f"user{i}@example.com",
+            "first_name": f"First{i}",
+            "last_name": f"Last{i}",
+            "company": "Example Inc.",
+            "country_code": "US",
+            "is_whatsapp_subscribed": True,
+            "is_email_subscribed": True,
+            "is_sms_subscribed": i % 2 == 0,
+            "preferred_channel": "sms",
+            "timezone": "America/New_York",
+            "language": "en",
+            "tags": ["customer", "newsletter"],
+            "contacts_group_ids": ["group_1", "group_2"],
+            "custom_fields": {"plan": "pro", "seats": 12, "score": 0.87},
+            "created_at": "2024-01-01T12:00:00Z",
+            "updated_at": "2024-03-01T08:30:00Z",
+            "metadata": {"source": "import", "batch": i // 100},
+        }
+        for i in range(size)
+    ]
+    return {"contacts": contacts, "total": size * 10, "page": 1, "limit": size, "total_pages": 10}
+
+
+class StubTransport(Transport):
+    """Transport that answers every request with the same body."""
+
+    def __init__(self, body: bytes):
+        self.body = body
+
+    def send(self, method, url, headers, body=None, timeout=None):
+        return TransportResponse(200, {"Content-Type": "application/json"}, self.body, url=url)
+
+
+def per_call_us(func: Callable[[], object], iterations: int) -> float:
+    """Run ``func`` ``iterations`` times and return the mean cost in microseconds."""
+    for _ in range(max(iterations // 10, 1)):
+        func()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--page-size", type=int, default=100)
+    args = parser.parse_args()
+
+    page = contacts_page(args.page_size)
+    page_body = json.dumps(page).encode()
+    delete_body = {"contact_ids": [f"contact_{i:08d}" for i in range(10000)]}
+
+    names: List[str] = []
+    for name in CODECS:
+        try:
+            create_codec(name)
+        except DevoConfigurationException:
+            print(f"skipping {name}: not installed")
+            continue
+        names.append(name)
+
+    print(f"page of {args.page_size} contacts: {len(page_body) / 1024:.0f} KiB")
+    print(f"{'case':<30}" + "".join(f"{name:>12}" for name in names))
+    print("-" * (30 + 12 * len(names)))
+
+    cases = {}
+    for name in names:
+        codec = create_codec(name)
+        client = DevoClient(api_key="bench-api-key", transport=StubTransport(page_body), codec=name)
+        cases.setdefault("decode page", {})[name] = lambda codec=codec: codec.loads(page_body)
+        cases.setdefault("get + response.json()", {})[name] = lambda client=client: client.get("contacts").json()
+        cases.setdefault("encode 10k-ID bulk delete", {})[name] = lambda codec=codec: codec.dumps(delete_body)
+
+    for case, funcs in cases.items():
+        results = {name: per_call_us(func, args.iterations) for name, func in funcs.items()}
+        baseline = results["json"]
+        cells = "".join(
+            f"{results[name]:>9.0f} us" if name == "json" else f"{baseline / results[name]:>11.1f}x" for name in names
+        )
+        print(f"{case:<30}{cells}")
+    print("(stdlib in microseconds per call, other codecs as speedup over stdlib)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Bandwidth and latency of large contact imports with and without request compression.
+
+Runs a local HTTP server that reads request bodies no faster than a
+simulated uplink (``--mbps``) and gunzips them, then times
+``contacts.import_from_csv`` for CSVs of increasing size, uncompressed and
+gzip-compressed at a few levels. The reported latency includes the client's
+compression time, so a level that costs more CPU than it saves in transfer
+shows up as slower.
+
+Usage:
+    python benchmarks/compression.py [--mbps 20] [--repeat 3]
+"""
+
+import argparse
+import gzip
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+
+from devhub_python import DevoClient, RequestCompression
+from devhub_python.models.contacts import CreateContactsFromCsvDto
+
+CONTACT_COUNTS = [1000, 10000, 50000]
+LEVELS: List[Optional[int]] = [None, 1, 6, 9]
+READ_CHUNK = 16 * 1024
+RESPONSE = json.dumps(
+    {"total_processed": 0, "successfully_created": 0, "skipped_duplicates": 0, "failed_imports": 0}
+).encode()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Read the body at the simulated uplink rate and record its size on the wire."""
+
+    protocol_version = "HTTP/1.1"
+    bytes_per_second = 0.0
+    wire_bytes: List[int] = []
+
+    def do_POST(self):
+        remaining = int(self.headers["Content-Length"])
+        self.wire_bytes.append(remaining)
+        chunks = []
+        while remaining:
+            chunk = self.rfile.read(min(READ_CHUNK, remaining))
+            remaining -= len(chunk)
+            chunks.append(chunk)
+            time.sleep(len(chunk) / self.bytes_per_second)
+        body = b"".join(chunks)
+        if self.headers.get("Content-Encoding") == "gzip":
+            body = gzip.decompress(body)
+        json.loads(body)
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(RESPONSE)))
+        self.end_headers()
+        self.wfile.write(RESPONSE)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def make_csv(contacts: int) -> str:
+    """Build a CSV of ``contacts`` made-up contacts."""
+    rows = ["first_name,last_name,email,phone_number,country,tags"]
+    for i in range(contacts):
+        rows.append(f"First{i},Last{i},user{i}@example.com,+1555{i:07d},US,customer;newsletter")
+    return "\n".join(rows)
+
+
+def run(base_url: str, csv_data: str, level: Optional[int], repeat: int) -> Dict[str, float]:
+    """Import ``csv_data`` ``repeat`` times and return the wire size and mean latency."""
+    compression = RequestCompression(threshold=1024, level=level) if level is not None else None
+    client = DevoClient(api_key="bench-api-key", trust_env=False, compression=compression)
+    client.base_url = base_url
+    dto = CreateContactsFromCsvDto(csv_data=csv_data)
+
+    _Handler.wire_bytes = []
+    client.contacts.import_from_csv(dto)  # warm up the connection
+    start = time.perf_counter()
+    for _ in range(repeat):
+        client.contacts.import_from_csv(dto)
+    elapsed = (time.perf_counter() - start) / repeat
+    client.close()
+    return {"wire_bytes": _Handler.wire_bytes[-1], "latency": elapsed}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mbps", type=float, default=20.0, help="simulated uplink bandwidth in megabits per second")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    _Handler.bytes_per_second = args.mbps * 1_000_000 / 8
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    print(f"uplink: {args.mbps:g} Mbit/s")
+    print(f"{'contacts':>9}{'compression':>14}{'KiB sent':>11}{'ratio':>8}{'ms/import':>12}{'speedup':>9}")
+    print("-" * 63)
+    try:
+        for contacts in CONTACT_COUNTS:
+            csv_data = make_csv(contacts)
+            baseline: Optional[Dict[str, float]] = None
+            for level in LEVELS:
+                result = run(base_url, csv_data, level, args.repeat)
+                baseline = baseline or result
+                name = "off" if level is None else f"gzip -{level}"
+                ratio = baseline["wire_bytes"] / result["wire_bytes"]
+                speedup = baseline["latency"] / result["latency"]
+                print(
+                    f"{contacts:>9}{name:>14}{result['wire_bytes'] / 1024:>11.0f}{ratio:>7.1f}x"
+                    f"{result['latency'] * 1000:>12.1f}{speedup:>8.1f}x"
+                )
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
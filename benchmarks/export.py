@@ -0,0 +1,116 @@
+"""
+Throughput and peak memory of exporting contacts to CSV and NDJSON.
+
+Serves pages of contacts from a local HTTP server and exports all of them
+with ``contacts.export()``, once per format, reporting rows per second and
+the peak memory traced during the export. Memory should stay the same as
+the number of contacts grows.
+
+Usage:
+    python benchmarks/export.py [--contacts 20000,100000] [--limit 500] [--codec json]
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import threading
+import time
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict
+from urllib.parse import parse_qs, urlsplit
+
+from devhub_python import DevoClient
+
+
+def contacts_page(page: int, limit: int, total: int) -> Dict[str, Any]:
+    """Build the ``page``-th contacts page of a list of ``total`` contacts."""
+    contacts = [
+        {
+            "id": f"contact_{i:08d}",
+            "phone_number": f"+1555{i:07d}",
+            "email": f"user{i}@example.com",
+            "first_name": f"First{i}",
+            "last_name": f"Last{i}",
+            "is_sms_subscribed": i % 2 == 0,
+            "tags": ["customer", "newsletter"],
+            "custom_fields": {"plan": "pro", "seats": i % 50},
+            "created_at": "2024-01-01T12:00:00Z",
+        }
+        for i in range((page - 1) * limit, min(page * limit, total))
+    ]
+    return {"contacts": contacts, "total": total, "page": page, "limit": limit, "total_pages": -(-total // limit)}
+
+
+def start_server(total: Dict[str, int]) -> ThreadingHTTPServer:
+    """Serve contact pages of a list of ``total["contacts"]`` contacts, and two custom fields."""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:
+            url = urlsplit(self.path)
+            query = {name: int(values[0]) for name, values in parse_qs(url.query).items() if name in ("page", "limit")}
+            if url.path.endswith("custom-fields"):
+                fields = [
+                    {"id": f"f{i}", "name": name, "field_type": "text"} for i, name in enumerate(("plan", "seats"))
+                ]
+                data = {"custom_fields": fields, "total": 2, "page": 1, "limit": query["limit"], "total_pages": 1}
+            else:
+                data = contacts_page(query["page"], query["limit"], total["contacts"])
+            body = json.dumps(data).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--contacts", default="20000,100000")
+    parser.add_argument("--limit", type=int, default=500)
+    parser.add_argument("--codec", default="json", help="JSON library: json, orjson or msgspec")
+    args = parser.parse_args()
+
+    total = {"contacts": 0}
+    server = start_server(total)
+    client = DevoClient(api_key="bench-api-key", codec=args.codec)
+    client.base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    print(f"{'format':<8}{'contacts':>10}{'total':>12}{'rows/s':>10}{'peak':>12}{'file':>11}")
+    print("-" * 63)
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            for count in [int(value) for value in args.contacts.split(",")]:
+                total["contacts"] = count
+                for format in ("csv", "ndjson"):
+                    path = os.path.join(directory, f"contacts.{format}")
+                    tracemalloc.start()
+                    start = time.perf_counter()
+                    progress = client.contacts.export(path, limit=args.limit)
+                    elapsed = time.perf_counter() - start
+                    peak = tracemalloc.get_traced_memory()[1] / 1024
+                    tracemalloc.stop()
+                    assert progress.rows == count, progress
+                    size = os.path.getsize(path) / 1024 / 1024
+                    print(
+                        f"{format:<8}{count:>10}{elapsed * 1e3:>9.0f} ms"
+                        f"{count / elapsed:>10.0f}{peak:>8.0f} KiB{size:>7.1f} MiB"
+                    )
+    finally:
+        client.close()
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""
+Time and peak memory of eager models versus lazy views for a large sync.
+
+Lists a page of contacts, messages and RCS messages through a stub transport
+that never touches the network, and reads two fields of every record: once
+with the full models and once with ``lazy=True``.
+
+Usage:
+    python benchmarks/lazy_views.py [--iterations 50] [--page-size 1000] [--codec json]
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+from devhub_python import DevoClient
+from devhub_python.transport import Transport, TransportResponse
+
+
+def contacts_page(size: int) -> Dict[str, Any]:
+    """Build a contacts page shaped like the API's."""
+    contacts = [
+        {
+            "id": f"contact_{i:08d}",
+            "account_id": "acc_1",
+            "phone_number": f"+1555{i:07d}",
+            "email": f"user{i}@example.com",
+            "first_name": f"First{i}",
+            "last_name": f"Last{i}",
+            "company": "Example Inc.",
+            "country_code": "US",
+            "is_whatsapp_subscribed": True,
+            "is_email_subscribed": True,
+            "is_sms_subscribed": i % 2 == 0,
+            "preferred_channel": "sms",
+            "timezone": "America/New_York",
+            "language": "en",
+            "tags": ["customer", "newsletter"],
+            "contacts_group_ids": ["group_1", "group_2"],
+            "custom_fields": {"plan": "pro", "seats": 12, "score": 0.87},
+            "created_at": "2024-01-01T12:00:00Z",
+            "updated_at": "2024-03-01T08:30:00Z",
+            "metadata": {"source": "import", "batch": i // 100},
+        }
+        for i in range(size)
+    ]
+    return {"contacts": contacts, "total": size * 10, "page": 1, "limit": size, "total_pages": 10}
+
+
+def messages(size: int, rcs: bool) -> List[Dict[str, Any]]:
+    """Build a list of messages shaped like the API's."""
+    items = []
+    for i in range(size):
+        item = {
+            "id": f"msg_{i:08d}",
+            "account_id": "acc_1",
+            "to": f"+1555{i:07d}",
+            "from": "+15550000000",
+            "status": "delivered",
+            "direction": "outbound",
+            "pricing": {"price": "0.0075", "currency": "USD"},
+            "metadata": {"campaign": "spring", "batch": i // 100},
+        }
+        if rcs:
+            item.update(message_type="text", text=f"Hello {i}", created_at="2024-01-01T12:00:00Z")
+            item["updated_at"] = "2024-01-01T12:00:05Z"
+        else:
+            item.update(channel="sms", type="text", content={"body": f"Hello {i}"})
+            item["date_created"] = "2024-01-01T12:00:00Z"
+        items.append(item)
+    return items
+
+
+class StubTransport(Transport):
+    """Transport that answers each path with a fixed body."""
+
+    def __init__(self, bodies: Dict[str, bytes]):
+        self.bodies = bodies
+
+    def send(self, method, url, headers, body=None, timeout=None):
+        path = url.split("?", 1)[0]
+        body = next(value for key, value in self.bodies.items() if path.endswith(key))
+        return TransportResponse(200, {"Content-Type": "application/json"}, body, url=url)
+
+
+def per_call_ms(func: Callable[[], object], iterations: int) -> float:
+    """Run ``func`` ``iterations`` times and return the mean cost in milliseconds."""
+    func()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations * 1e3
+
+
+def peak_kib(func: Callable[[], object]) -> float:
+    """Return the peak memory ``func`` allocates, in KiB."""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1] / 1024
+    finally:
+        tracemalloc.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--page-size", type=int, default=1000)
+    parser.add_argument("--codec", default="json")
+    args = parser.parse_args()
+
+    transport = StubTransport(
+        {
+            "user-api/contacts": json.dumps(contacts_page(args.page_size)).encode(),
+            "rcs/messages": json.dumps(messages(args.page_size, rcs=True)).encode(),
+            "messages": json.dumps({"messages": messages(args.page_size, rcs=False)}).encode(),
+        }
+    )
+    client = DevoClient(api_key="bench-api-key", transport=transport, codec=args.codec)
+
+    def contacts(lazy: bool) -> None:
+        for contact in client.contacts.list(lazy=lazy).contacts:
+            contact.id, contact.phone_number
+
+    def message_list(lazy: bool) -> None:
+        for message in client.messages.list(lazy=lazy):
+            message.id, message.status
+
+    def rcs_list(lazy: bool) -> None:
+        for message in client.rcs.list_messages(lazy=lazy):
+            message.id, message.status
+
+    print(f"pages of {args.page_size} records, reading two fields of each ({args.codec} codec)")
+    print(f"{'call':<20}{'eager':>12}{'lazy':>12}{'eager peak':>14}{'lazy peak':>14}")
+    print("-" * 72)
+    for name, func in (("contacts.list", contacts), ("messages.list", message_list), ("rcs.list_messages", rcs_list)):
+        times = [per_call_ms(lambda lazy=lazy: func(lazy), args.iterations) for lazy in (False, True)]
+        peaks = [peak_kib(lambda lazy=lazy: func(lazy)) for lazy in (False, True)]
+        print(f"{name:<20}{times[0]:>9.1f} ms{times[1]:>9.1f} ms{peaks[0]:>10.0f} KiB{peaks[1]:>10.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
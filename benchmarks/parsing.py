@@ -0,0 +1,114 @@
+"""
+Time and peak memory of parsing responses into models.
+
+Compares, on a ``GetContactsSerializer`` page of contacts:
+
+- ``model_validate(json.loads(body))``, which builds a dict tree and then
+  walks it again to validate,
+- ``model_validate_json(body)``, which validates while parsing the bytes
+  (what ``parse_response`` does),
+- decoding with ``json.loads`` (or orjson, if installed) and building the
+  models with ``model_construct``, skipping validation altogether.
+
+Since Pydantic 2 validates in compiled code while it parses, skipping
+validation doesn't pay off: building the models in Python costs as much as
+validating them, so the SDK has no "trusted" mode that skips validation.
+
+Usage:
+    python benchmarks/parsing.py [--iterations 200] [--page-size 1000]
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+from typing import Any, Callable, Dict
+
+from devhub_python.models.contacts import ContactSerializer, GetContactsSerializer
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def contacts_page(size: int) -> Dict[str, Any]:
+    """Build a contacts page shaped like the API's."""
+    contacts = [
+        {
+            "id": f"contact_{i:08d}",
+            "account_id": "acc_1",
+            "phone_number": f"+1555{i:07d}",
+            "email": f"user{i}@example.com",
+            "first_name": f"First{i}",
+            "last_name": f"Last{i}",
+            "company": "Example Inc.",
+            "country_code": "US",
+            "is_whatsapp_subscribed": True,
+            "is_email_subscribed": True,
+            "is_sms_subscribed": i % 2 == 0,
+            "preferred_channel": "sms",
+            "timezone": "America/New_York",
+            "language": "en",
+            "tags": ["customer", "newsletter"],
+            "contacts_group_ids": ["group_1", "group_2"],
+            "custom_fields": {"plan": "pro", "seats": 12, "score": 0.87},
+            "created_at": "2024-01-01T12:00:00Z",
+            "updated_at": "2024-03-01T08:30:00Z",
+            "metadata": {"source": "import", "batch": i // 100},
+        }
+        for i in range(size)
+    ]
+    return {"contacts": contacts, "total": size * 10, "page": 1, "limit": size, "total_pages": 10}
+
+
+def per_call_us(func: Callable[[], object], iterations: int) -> float:
+    """Run ``func`` ``iterations`` times and return the mean cost in microseconds."""
+    for _ in range(max(iterations // 10, 1)):
+        func()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def peak_kib(func: Callable[[], object]) -> float:
+    """Return the peak memory ``func`` allocates, in KiB."""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1] / 1024
+    finally:
+        tracemalloc.stop()
+
+
+def construct_page(data: Dict[str, Any]) -> GetContactsSerializer:
+    """Build a page of contacts without validating it."""
+    contacts = [ContactSerializer.model_construct(**contact) for contact in data["contacts"]]
+    return GetContactsSerializer.model_construct(**{**data, "contacts": contacts})
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--page-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    body = json.dumps(contacts_page(args.page_size)).encode()
+    cases = {
+        "model_validate(json.loads)": lambda: GetContactsSerializer.model_validate(json.loads(body)),
+        "model_validate_json": lambda: GetContactsSerializer.model_validate_json(body),
+        "model_construct(json.loads)": lambda: construct_page(json.loads(body)),
+    }
+    if orjson is not None:
+        cases["model_construct(orjson.loads)"] = lambda: construct_page(orjson.loads(body))
+
+    print(f"page of {args.page_size} contacts: {len(body) / 1024:.0f} KiB")
+    print(f"{'case':<30}{'time':>12}{'peak memory':>16}")
+    print("-" * 58)
+    for case, func in cases.items():
+        print(f"{case:<30}{per_call_us(func, args.iterations):>9.0f} us{peak_kib(func):>12.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
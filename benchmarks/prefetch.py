@@ -0,0 +1,118 @@
+"""
+Time to walk every contact page by page versus with pages fetched in parallel.
+
+Serves a contact list from a local HTTP server that waits ``--latency``
+milliseconds before answering each page, like a remote API would, and walks it
+with ``contacts.iter_contacts()`` using a growing number of ``workers``, on the
+synchronous client and on the async client.
+
+Usage:
+    python benchmarks/prefetch.py [--pages 100] [--page-size 50] [--latency 20] [--workers 1,2,4,8,16]
+"""
+
+import argparse
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List
+from urllib.parse import parse_qs, urlsplit
+
+from devhub_python import AsyncDevoClient, DevoClient
+
+
+def contacts_page(page: int, size: int, pages: int) -> Dict[str, Any]:
+    """Build the ``page``-th contacts page of a list of ``pages`` pages."""
+    contacts = [
+        {
+            "id": f"contact_{i:08d}",
+            "phone_number": f"+1555{i:07d}",
+            "email": f"user{i}@example.com",
+            "first_name": f"First{i}",
+            "last_name": f"Last{i}",
+            "tags": ["customer"],
+            "created_at": "2024-01-01T12:00:00Z",
+        }
+        for i in range((page - 1) * size, page * size)
+    ]
+    return {"contacts": contacts, "total": size * pages, "page": page, "limit": size, "total_pages": pages}
+
+
+def start_server(pages: List[bytes], latency: float) -> ThreadingHTTPServer:
+    """Serve ``pages`` by their ``page`` query parameter, each after ``latency`` seconds."""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:
+            page = int(parse_qs(urlsplit(self.path).query)["page"][0])
+            body = pages[page - 1]
+            time.sleep(latency)
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def walk(base_url: str, page_size: int, workers: int) -> int:
+    """Walk every contact with the synchronous client and return how many there were."""
+    client = DevoClient(api_key="bench-api-key", thread_safe=True, pool_maxsize=workers)
+    client.base_url = base_url
+    try:
+        return sum(1 for _ in client.contacts.iter_contacts(limit=page_size, workers=workers))
+    finally:
+        client.close()
+
+
+async def walk_async(base_url: str, page_size: int, workers: int) -> int:
+    """Walk every contact with the async client and return how many there were."""
+    async with AsyncDevoClient(api_key="bench-api-key") as client:
+        client.base_url = base_url
+        return sum([1 async for _ in client.contacts.iter_contacts(limit=page_size, workers=workers)])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=100)
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=20.0, help="server delay per page, in milliseconds")
+    parser.add_argument("--workers", default="1,2,4,8,16")
+    args = parser.parse_args()
+
+    pages = [json.dumps(contacts_page(page, args.page_size, args.pages)).encode() for page in range(1, args.pages + 1)]
+    server = start_server(pages, args.latency / 1e3)
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    print(f"{'client':<8}{'workers':>8}{'total':>12}{'contacts/s':>14}{'speed-up':>10}")
+    print("-" * 52)
+    try:
+        for name in ("sync", "async"):
+            baseline = None
+            for workers in [int(value) for value in args.workers.split(",")]:
+                start = time.perf_counter()
+                if name == "sync":
+                    count = walk(base_url, args.page_size, workers)
+                else:
+                    count = asyncio.run(walk_async(base_url, args.page_size, workers))
+                elapsed = time.perf_counter() - start
+                assert count == args.pages * args.page_size, count
+                baseline = baseline or elapsed
+                print(
+                    f"{name:<8}{workers:>8}{elapsed * 1e3:>9.0f} ms{count / elapsed:>14.0f}{baseline / elapsed:>9.1f}x"
+                )
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Memory held per record: full models versus compact records.
+
+Builds the same decoded objects into the full models (as the list endpoints
+do, straight from the JSON bytes) and into records, and reports the bytes
+each holds per object, counting its own copies of the field values.
+
+Usage:
+    python benchmarks/records.py [--count 10000]
+"""
+
+import argparse
+import gc
+import json
+import tracemalloc
+from typing import Any, Callable, Dict, List, Tuple, Type
+
+from pydantic import BaseModel, TypeAdapter
+
+from devhub_python.models.contact_groups import ContactsGroup
+from devhub_python.models.contacts import ContactSerializer
+from devhub_python.models.messages import Message
+from devhub_python.models.rcs import RcsSendMessageSerializer
+from devhub_python.models.whatsapp import WhatsAppTemplate
+from devhub_python.records import record_type
+
+
+def samples(i: int) -> List[Tuple[Type[BaseModel], Dict[str, Any]]]:
+    """Build one object of each record type, shaped like the API's."""
+    timestamp = "2024-01-01T12:00:00Z"
+    return [
+        (
+            ContactSerializer,
+            {
+                "id": f"contact_{i:08d}",
+                "phone_number": f"+1555{i:07d}",
+                "email": f"user{i}@example.com",
+                "first_name": f"First{i}",
+                "last_name": f"Last{i}",
+                "country_code": "US",
+                "is_sms_subscribed": True,
+                "tags": ["customer"],
+                "custom_fields": {"plan": "pro"},
+                "created_at": timestamp,
+                "updated_at": timestamp,
+            },
+        ),
+        (
+            Message,
+            {
+                "id": f"msg_{i:08d}",
+                "channel": "sms",
+                "type": "text",
+                "to": f"+1555{i:07d}",
+                "from": "+15550000000",
+                "content": {"body": f"Hello {i}"},
+                "status": "delivered",
+                "direction": "outbound",
+                "date_created": timestamp,
+            },
+        ),
+        (ContactsGroup, {"id": f"group_{i:08d}", "name": f"Group {i}", "contacts_count": i, "created_at": timestamp}),
+        (
+            WhatsAppTemplate,
+            {
+                "name": f"template_{i}",
+                "language": "en",
+                "status": "APPROVED",
+                "category": "MARKETING",
+                "components": [{"type": "BODY", "text": "Hi {{1}}"}],
+                "created_at": timestamp,
+            },
+        ),
+        (
+            RcsSendMessageSerializer,
+            {
+                "id": f"rcs_{i:08d}",
+                "account_id": "acc_1",
+                "to": f"+1555{i:07d}",
+                "message_type": "text",
+                "status": "sent",
+                "direction": "outbound",
+                "text": f"Hello {i}",
+                "created_at": timestamp,
+                "updated_at": timestamp,
+            },
+        ),
+    ]
+
+
+def held_bytes(build: Callable[[], object]) -> int:
+    """Return the memory still allocated by what ``build`` returns."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = build()
+        gc.collect()
+        held = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del result
+    return held
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=10000)
+    args = parser.parse_args()
+
+    print(f"{'type':<28}{'model':>14}{'record':>14}{'saved':>8}")
+    print("-" * 64)
+    for index, (model_class, _) in enumerate(samples(0)):
+        body = json.dumps([samples(i)[index][1] for i in range(args.count)]).encode()
+        adapter = TypeAdapter(List[model_class])  # type: ignore[valid-type]
+        record_class = record_type(model_class)
+        model_bytes = held_bytes(lambda: adapter.validate_json(body)) / args.count
+        record_bytes = held_bytes(lambda: record_class.from_list(json.loads(body))) / args.count
+        name = record_class.__name__
+        print(f"{name:<28}{model_bytes:>8.0f} B/rec{record_bytes:>8.0f} B/rec{1 - record_bytes / model_bytes:>8.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+Microbenchmark for the client-side overhead of ``DevoClient.request``.
+
+Requests never leave the process: a stub adapter / pool manager answers
+instantly, so the numbers are pure SDK + HTTP library overhead per send.
+
+Usage:
+    python benchmarks/request_overhead.py [--iterations 20000]
+"""
+
+import argparse
+import time
+from typing import Callable, Dict, Optional
+
+import requests
+from requests.adapters import BaseAdapter
+
+from devhub_python import DevoClient, __version__
+from devhub_python.auth import APIKeyAuth
+
+PAYLOAD = {"sender": "+1987654321", "recipient": "+1234567890", "message": "Hello!"}
+BODY = b'{"id": "msg_1", "status": "queued"}'
+
+
+class StubAdapter(BaseAdapter):
+    """requests adapter that answers every request with a canned 200."""
+
+    def send(self, request, **kwargs):
+        response = requests.Response()
+        response.status_code = 200
+        response._content = BODY
+        response.request = request
+        response.url = request.url
+        return response
+
+    def close(self):
+        pass
+
+
+class _StubHTTPResponse:
+    status = 200
+    reason = "OK"
+    headers = {"Content-Type": "application/json"}
+    data = BODY
+
+
+class StubPoolManager:
+    """urllib3 PoolManager stand-in that answers every request with a canned 200."""
+
+    def request(self, *args, **kwargs):
+        return _StubHTTPResponse()
+
+    def clear(self):
+        pass
+
+
+def stub_client(**kwargs) -> DevoClient:
+    """Create a client whose transport never touches the network."""
+    client = DevoClient(api_key="bench-api-key", sandbox_api_key="bench-sandbox-key", **kwargs)
+    if client.session is not None:
+        client.session.mount("https://", StubAdapter())
+    else:
+        client.transport.pool_manager = StubPoolManager()
+    return client
+
+
+def legacy_prepare(client: DevoClient, path: str, headers: Optional[Dict[str, str]], sandbox: bool):
+    """URL and header preparation as it was done before the caches were added."""
+    url = f"{client.base_url.rstrip('/')}/{path.lstrip('/')}"
+    request_headers = {
+        "User-Agent": f"devo-python-sdk/{__version__}",
+        "Accept": "application/json",
+    }
+    if headers:
+        request_headers.update(headers)
+    if sandbox:
+        request_headers.update(APIKeyAuth(client.sandbox_api_key).get_headers())
+    else:
+        request_headers.update(client.auth.get_headers())
+    return url, request_headers
+
+
+def cached_prepare(client: DevoClient, path: str, headers: Optional[Dict[str, str]], sandbox: bool):
+    """URL and header preparation through the client's caches."""
+    return client._build_url(path), client._build_headers(headers, sandbox=sandbox)
+
+
+def per_call_us(func: Callable[[], object], iterations: int) -> float:
+    """Run ``func`` ``iterations`` times and return the mean cost in microseconds."""
+    for _ in range(min(iterations // 10, 1000)):
+        func()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+    n = args.iterations
+
+    client = stub_client()
+    prepare = [
+        ("prepare url+headers (legacy)", lambda: legacy_prepare(client, "user-api/sms/quick-send", None, False)),
+        ("prepare url+headers (cached)", lambda: cached_prepare(client, "user-api/sms/quick-send", None, False)),
+        ("prepare sandbox (legacy)", lambda: legacy_prepare(client, "user-api/sms/quick-send", None, True)),
+        ("prepare sandbox (cached)", lambda: cached_prepare(client, "user-api/sms/quick-send", None, True)),
+    ]
+
+    default_client = stub_client()
+    no_env_client = stub_client(trust_env=False)
+    urllib3_client = stub_client(transport="urllib3")
+    sends = [
+        ("send, requests transport", lambda: default_client.post("user-api/sms/quick-send", json=PAYLOAD)),
+        ("send, requests, trust_env=False", lambda: no_env_client.post("user-api/sms/quick-send", json=PAYLOAD)),
+        ("send, urllib3 transport", lambda: urllib3_client.post("user-api/sms/quick-send", json=PAYLOAD)),
+    ]
+
+    print(f"{'case':<36}{'us/call':>10}")
+    print("-" * 46)
+    results = {}
+    for name, func in prepare + sends:
+        results[name] = per_call_us(func, n)
+        print(f"{name:<36}{results[name]:>10.2f}")
+
+    baseline = results["send, requests transport"]
+    print("-" * 46)
+    for name in ("send, requests, trust_env=False", "send, urllib3 transport"):
+        saved = baseline - results[name]
+        print(f"{name:<36}{saved:>10.2f} us saved ({saved / baseline:.0%})")
+
+
+if __name__ == "__main__":
+    main()
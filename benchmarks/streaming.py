@@ -0,0 +1,141 @@
+"""
+Peak memory and time to first record of whole versus streamed list responses.
+
+Serves pages of contacts of growing size from a local HTTP server and walks
+every contact of each page: once with ``contacts.list()``, which reads and
+validates the whole page first, and once with ``contacts.list(stream=True)``,
+which yields each contact as its bytes arrive. Runs over the requests and
+urllib3 transports.
+
+Usage:
+    python benchmarks/streaming.py [--iterations 5] [--page-sizes 1000,5000,20000]
+"""
+
+import argparse
+import json
+import threading
+import time
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Tuple
+
+from devhub_python import DevoClient
+
+
+def contacts_page(size: int) -> Dict[str, Any]:
+    """Build a contacts page shaped like the API's."""
+    contacts = [
+        {
+            "id": f"contact_{i:08d}",
+            "account_id": "acc_1",
+            "phone_number": f"+1555{i:07d}",
+            "email": f"user{i}@example.com",
+            "first_name": f"First{i}",
+            "last_name": f"Last{i}",
+            "company": "Example Inc.",
+            "country_code": "US",
+            "is_whatsapp_subscribed": True,
+            "is_email_subscribed": True,
+            "is_sms_subscribed": i % 2 == 0,
+            "preferred_channel": "sms",
+            "timezone": "America/New_York",
+            "language": "en",
+            "tags": ["customer", "newsletter"],
+            "contacts_group_ids": ["group_1", "group_2"],
+            "custom_fields": {"plan": "pro", "seats": 12, "score": 0.87},
+            "created_at": "2024-01-01T12:00:00Z",
+            "updated_at": "2024-03-01T08:30:00Z",
+            "metadata": {"source": "import", "batch": i // 100},
+        }
+        for i in range(size)
+    ]
+    return {"contacts": contacts, "total": size * 10, "page": 1, "limit": size, "total_pages": 10}
+
+
+def start_server(pages: Dict[int, bytes]) -> ThreadingHTTPServer:
+    """Serve ``pages`` by their ``limit`` query parameter from a local server thread."""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:
+            limit = int(self.path.split("limit=", 1)[1].split("&", 1)[0])
+            body = memoryview(pages[limit])
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            for start in range(0, len(body), 64 * 1024):
+                self.wfile.write(body[start : start + 64 * 1024])
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def walk(client: DevoClient, size: int, stream: bool) -> float:
+    """Read every contact of a page and return the seconds until the first one was available."""
+    started = time.perf_counter()
+    first = None
+    if stream:
+        with client.contacts.list(limit=size, stream=True) as contacts:
+            for contact in contacts:
+                if first is None:
+                    first = time.perf_counter() - started
+                contact.id
+    else:
+        for contact in client.contacts.list(limit=size).contacts:
+            if first is None:
+                first = time.perf_counter() - started
+            contact.id
+    return first or 0.0
+
+
+def measure(func: Callable[[], float], iterations: int) -> Tuple[float, float, float]:
+    """Return the mean total and first-record milliseconds of ``func``, and its peak memory in KiB."""
+    func()
+    total = first = 0.0
+    for _ in range(iterations):
+        start = time.perf_counter()
+        first += func()
+        total += time.perf_counter() - start
+    tracemalloc.start()
+    try:
+        func()
+        peak = tracemalloc.get_traced_memory()[1] / 1024
+    finally:
+        tracemalloc.stop()
+    return total / iterations * 1e3, first / iterations * 1e3, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=5)
+    parser.add_argument("--page-sizes", default="1000,5000,20000")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.page_sizes.split(",")]
+    server = start_server({size: json.dumps(contacts_page(size)).encode() for size in sizes})
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    print(f"{'transport':<10}{'page':>7}{'mode':>8}{'total':>12}{'first':>12}{'peak':>14}")
+    print("-" * 63)
+    try:
+        for transport in ("requests", "urllib3"):
+            client = DevoClient(api_key="bench-api-key", transport=transport)
+            client.base_url = base_url
+            for size in sizes:
+                for stream in (False, True):
+                    total, first, peak = measure(lambda: walk(client, size, stream), args.iterations)
+                    mode = "stream" if stream else "whole"
+                    print(f"{transport:<10}{size:>7}{mode:>8}{total:>9.1f} ms{first:>9.1f} ms{peak:>10.0f} KiB")
+            client.close()
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Throughput of one shared DevoClient as the number of sender threads grows.
+
+Runs a local keep-alive HTTP server that answers after a fixed delay (to
+stand in for network and API latency) and measures requests per second for
+1 to 64 threads, with a single shared session, per-thread sessions
+(``thread_safe=True``) and the urllib3 transport.
+
+Usage:
+    python benchmarks/thread_scaling.py [--requests-per-thread 50] [--latency-ms 5]
+"""
+
+import argparse
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from devhub_python import DevoClient
+
+THREAD_COUNTS = [1, 2, 4, 8, 16, 32, 64]
+CONFIGS = {
+    "shared session": {},
+    "thread_safe=True": {"thread_safe": True},
+    "urllib3": {"transport": "urllib3"},
+}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    latency = 0.005
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        time.sleep(self.latency)
+        payload = json.dumps({"id": "msg_1", "status": "queued"}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 256
+
+
+def run(config: dict, base_url: str, threads: int, requests_per_thread: int) -> float:
+    """Send ``threads * requests_per_thread`` requests and return requests per second."""
+    client = DevoClient(api_key="bench-api-key", trust_env=False, pool_maxsize=threads, **config)
+    client.base_url = base_url
+    payload = {"sender": "+1987654321", "recipient": "+1234567890", "message": "Hello!"}
+
+    def worker(_):
+        for _ in range(requests_per_thread):
+            client.post("user-api/sms/quick-send", json=payload)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(worker, range(threads)))
+    elapsed = time.perf_counter() - start
+    client.close()
+    return threads * requests_per_thread / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests-per-thread", type=int, default=50)
+    parser.add_argument("--latency-ms", type=float, default=5.0)
+    args = parser.parse_args()
+
+    _Handler.latency = args.latency_ms / 1000
+    server = _Server(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    print(f"{'threads':>8}" + "".join(f"{name:>20}" for name in CONFIGS))
+    baselines = {}
+    for threads in THREAD_COUNTS:
+        row = f"{threads:>8}"
+        for name, config in CONFIGS.items():
+            rate = run(config, base_url, threads, args.requests_per_thread)
+            baselines.setdefault(name, rate)
+            row += f"{rate:>10.0f} req/s {rate / baselines[name]:>4.1f}x"
+        print(row)
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Time to read a month of messages by offset versus by time shards.
+
+Serves messages spread over a month from a local HTTP server. Each page
+costs ``--latency`` milliseconds, plus ``--offset-cost`` milliseconds per
+thousand messages skipped, the way deep offsets slow down a database. The
+whole month is read once with ``messages.iter_messages()`` and then with
+``messages.scan()`` using a growing number of ``workers``.
+
+Usage:
+    python benchmarks/time_scan.py [--messages 20000] [--limit 100] [--latency 10] [--offset-cost 2] [--workers 1,4,8]
+"""
+
+import argparse
+import bisect
+import json
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, List
+from urllib.parse import parse_qs, urlsplit
+
+from devhub_python import DevoClient
+from devhub_python.scanning import parse_timestamp
+
+START = datetime(2024, 3, 1, tzinfo=timezone.utc)
+END = datetime(2024, 4, 1, tzinfo=timezone.utc)
+
+
+def start_server(count: int, latency: float, offset_cost: float) -> ThreadingHTTPServer:
+    """Serve ``count`` messages spread over March 2024, filtered by date and paged by offset."""
+    step = (END - START) / count
+    moments = [START + step * i for i in range(count)]
+    messages = [
+        {"id": f"msg_{i:08d}", "to": "+15550000000", "status": "delivered", "date_sent": moment.isoformat()}
+        for i, moment in enumerate(moments)
+    ]
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:
+            query = {name: values[0] for name, values in parse_qs(urlsplit(self.path).query).items()}
+            low = bisect.bisect_left(moments, parse_timestamp(query.get("date_sent_after", START.isoformat())))
+            high = bisect.bisect_right(moments, parse_timestamp(query.get("date_sent_before", END.isoformat())))
+            offset, limit = int(query["offset"]), int(query["limit"])
+            body = json.dumps({"messages": messages[low + offset : min(high, low + offset + limit)]}).encode()
+            time.sleep(latency + offset_cost * offset / 1000)
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=20000)
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=10.0, help="server delay per page, in milliseconds")
+    parser.add_argument("--offset-cost", type=float, default=2.0, help="milliseconds per thousand skipped")
+    parser.add_argument("--workers", default="1,4,8")
+    args = parser.parse_args()
+
+    server = start_server(args.messages, args.latency / 1e3, args.offset_cost / 1e3)
+    client = DevoClient(api_key="bench-api-key", thread_safe=True)
+    client.base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    runs: List[Any] = [("iter_messages", lambda: client.messages.iter_messages(limit=args.limit, records=True))]
+    for workers in [int(value) for value in args.workers.split(",")]:
+        runs.append(
+            (
+                f"scan, {workers} workers",
+                lambda workers=workers: client.messages.scan(
+                    START, END, shards=2 * workers, workers=workers, limit=args.limit, records=True
+                ),
+            )
+        )
+
+    print(f"{'method':<22}{'total':>12}{'messages/s':>14}")
+    print("-" * 48)
+    try:
+        for name, read in runs:
+            start = time.perf_counter()
+            count = sum(1 for _ in read())
+            elapsed = time.perf_counter() - start
+            assert count == args.messages, count
+            print(f"{name:<22}{elapsed * 1e3:>9.0f} ms{count / elapsed:>14.0f}")
+    finally:
+        client.close()
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
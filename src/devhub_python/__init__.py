@@ -2,13 +2,19 @@ __version__ = "0.1.0"
 __author__ = "Devo Team"
 __email__ = "support@devotel.io"
 
+from .async_client import AsyncDevoClient
+from .circuit import CircuitBreaker
 from .client import DevoClient
+from .codec import JSONCodec
+from .compression import RequestCompression
+from .concurrency import ConcurrencyLimiter
 from .exceptions import (
     DevoAPIException,
     DevoAuthenticationException,
     DevoBadGatewayException,
     DevoBadRequestException,
     DevoChannelNotEnabledException,
+    DevoCircuitOpenException,
     DevoConfigurationException,
     DevoConflictException,
     DevoConnectionException,
@@ -38,9 +44,60 @@ from .exceptions import (
     DevoUnsupportedChannelException,
     DevoValidationException,
 )
+from .export import ExportProgress
+from .hedging import HedgingPolicy
+from .idempotency import IdempotencyJournal
+from .ratelimit import RateLimiter
+from .records import Record
+from .retry import RetryBudget, RetryPolicy, RetryRule
+from .scanning import ScanCheckpoint
+from .streaming import AsyncItemStream, ItemStream
+from .timeout import Timeout, deadline
+from .transport import (
+    RequestsTransport,
+    ThreadLocalRequestsTransport,
+    Transport,
+    TransportResponse,
+    Urllib3Transport,
+)
+from .views import ListView, RecordView
 
 __all__ = [
     "DevoClient",
+    "AsyncDevoClient",
+    # Timeouts
+    "Timeout",
+    "deadline",
+    # Retries
+    "RetryPolicy",
+    "RetryRule",
+    "RetryBudget",
+    # Request compression and JSON codecs
+    "RequestCompression",
+    "JSONCodec",
+    # Lazy response views, compact records and streamed lists
+    "RecordView",
+    "ListView",
+    "Record",
+    "ItemStream",
+    "AsyncItemStream",
+    "ScanCheckpoint",
+    "ExportProgress",
+    # Idempotency
+    "IdempotencyJournal",
+    # Rate and concurrency limiting
+    "RateLimiter",
+    "ConcurrencyLimiter",
+    # Circuit breaking
+    "CircuitBreaker",
+    # Hedging
+    "HedgingPolicy",
+    # Transports
+    "Transport",
+    "TransportResponse",
+    "RequestsTransport",
+    "ThreadLocalRequestsTransport",
+    "Urllib3Transport",
     # Base exceptions
     "DevoException",
     "DevoAPIException",
@@ -74,6 +131,7 @@ __all__ = [
     "DevoConnectionException",
     "DevoDNSException",
     "DevoSSLException",
+    "DevoCircuitOpenException",
     # Configuration exceptions
     "DevoConfigurationException",
     "DevoMissingAPIKeyException",
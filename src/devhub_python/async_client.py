@@ -0,0 +1,435 @@
+import asyncio
+from typing import Any, Awaitable, Dict, Optional, Union
+
+from .circuit import CircuitBreaker
+from .client import BaseClient, SendTimings
+from .codec import JSONCodec
+from .compression import RequestCompression
+from .concurrency import ConcurrencyLimiter
+from .exceptions import (
+    DevoConfigurationException,
+    DevoConnectionException,
+    DevoNetworkException,
+    DevoTimeoutException,
+)
+from .hedging import HedgingPolicy
+from .http2 import HTTP2Stats, create_httpx_client
+from .idempotency import IDEMPOTENCY_KEY_HEADER, IdempotencyJournal
+from .ratelimit import RateLimiter
+from .resources.contacts import AsyncContactsResource
+from .resources.email import AsyncEmailResource
+from .resources.messages import AsyncMessagesResource
+from .resources.rcs import AsyncRCSResource
+from .resources.sms import AsyncSMSResource
+from .resources.whatsapp import AsyncWhatsAppResource
+from .retry import RetryPolicy
+from .services import AsyncServicesNamespace
+from .timeout import Timeout, remaining
+from .transport import build_query_string, encode_body
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - exercised only without the optional dependency
+    httpx = None  # type: ignore[assignment]
+
+
+class AsyncDevoClient(BaseClient):
+    """
+    Asyncio client for interacting with the DevHub API.
+
+    Mirrors :class:`DevoClient` resource for resource, but every API call is a
+    coroutine running on a shared, non-blocking ``httpx`` connection pool, so a
+    single event loop can keep thousands of sends in flight.
+
+    Requires the ``async`` extra: ``pip install devhub-python[async]``.
+
+    Example:
+        >>> async with AsyncDevoClient(api_key="your-api-key") as client:
+        ...     responses = await asyncio.gather(
+        ...         *(
+        ...             client.sms.send_sms(recipient=number, message="Hello!", sender="+0987654321")
+        ...             for number in recipients
+        ...         )
+        ...     )
+    """
+
+    DEFAULT_MAX_CONNECTIONS = 100
+    DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+
+    def __init__(
+        self,
+        api_key: str,
+        sandbox_api_key: Optional[str] = None,
+        timeout: Union[float, Timeout] = BaseClient.DEFAULT_TIMEOUT,
+        max_retries: int = 3,
+        retry_policy: Optional[RetryPolicy] = None,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        http_client: Optional["httpx.AsyncClient"] = None,
+        http2: bool = False,
+        idempotency_journal: Optional[IdempotencyJournal] = None,
+        rate_limiter: Union[bool, RateLimiter, None] = None,
+        concurrency_limiter: Union[bool, ConcurrencyLimiter, None] = None,
+        circuit_breaker: Union[bool, CircuitBreaker, None] = None,
+        hedging: Union[bool, HedgingPolicy, None] = None,
+        compression: Union[bool, RequestCompression, None] = None,
+        codec: Union[str, JSONCodec, None] = None,
+    ):
+        """
+        Initialize the async Devo client.
+
+        Args:
+            api_key: API key for authentication
+            sandbox_api_key: Optional sandbox API key for testing environments
+            timeout: Timeout in seconds for connecting and for each read, or a :class:`Timeout`
+                with separate connect and read timeouts and an overall deadline
+            max_retries: Maximum number of retries for failed requests, unless ``retry_policy`` is given
+            retry_policy: Per-endpoint retry rules with jittered backoff, sharing a budget that
+                caps retries at a share of recent successful calls (default: ``max_retries``
+                retries of the default :class:`RetryRule`)
+            max_connections: Maximum number of concurrent connections in the pool
+            max_keepalive_connections: Maximum number of idle connections kept alive
+            http_client: Custom httpx.AsyncClient (optional)
+            http2: Multiplex requests over HTTP/2 connections (requires the ``http2`` extra)
+            idempotency_journal: Journal that recognises repeated POST and PATCH sends,
+                reusing their idempotency key and replaying recorded responses (optional)
+            rate_limiter: Pace requests to the rate limit the API reports in its
+                ``X-RateLimit-*`` headers; True for a new :class:`RateLimiter`, or a
+                limiter to share between clients (optional)
+            concurrency_limiter: Adapt the number of requests in flight (AIMD) to what the
+                API sustains, making tasks beyond it wait; True for a new
+                :class:`ConcurrencyLimiter`, or a limiter to share (optional)
+            circuit_breaker: Track failures per endpoint and fail fast with
+                :class:`DevoCircuitOpenException` while an endpoint's circuit is open; True
+                for a new :class:`CircuitBreaker`, or a breaker to share (optional)
+            hedging: Send a second copy of a GET that is slower than most recent requests,
+                use whichever reply arrives first and cancel the other; True for a new
+                :class:`HedgingPolicy`, or a policy to share (optional)
+            compression: Send JSON, form and text bodies above a size threshold
+                gzip-compressed; True for a new :class:`RequestCompression`, or
+                compression settings to share (optional)
+            codec: JSON library that encodes request bodies and decodes responses
+                (``response.json()``): ``"json"`` (default), ``"orjson"``, ``"msgspec"``
+                or a custom :class:`JSONCodec` (optional)
+
+        Raises:
+            DevoMissingAPIKeyException: If API key is not provided
+            DevoConfigurationException: If httpx (or h2 for HTTP/2), or the codec's library,
+                is not installed
+        """
+        if httpx is None:
+            raise DevoConfigurationException(
+                "httpx is required for AsyncDevoClient. Install it with: pip install devhub-python[async]"
+            )
+
+        super().__init__(
+            api_key,
+            sandbox_api_key=sandbox_api_key,
+            timeout=timeout,
+            max_retries=max_retries,
+            retry_policy=retry_policy,
+            idempotency_journal=idempotency_journal,
+            rate_limiter=rate_limiter,
+            concurrency_limiter=concurrency_limiter,
+            circuit_breaker=circuit_breaker,
+            hedging=hedging,
+            compression=compression,
+            codec=codec,
+        )
+        self.http2 = http2
+        self._http2_stats = HTTP2Stats()
+
+        # Set up the shared connection pool
+        self.http_client = http_client or self._create_http_client(max_connections, max_keepalive_connections)
+
+        self._init_resources()
+
+    def _init_resources(self) -> None:
+        """Create the resource namespaces, bound to this client."""
+        # Initialize messaging resources
+        self.sms = AsyncSMSResource(self)
+        self.email = AsyncEmailResource(self)
+        self.whatsapp = AsyncWhatsAppResource(self)
+        self.rcs = AsyncRCSResource(self)
+        self.contacts = AsyncContactsResource(self)
+        self.messages = AsyncMessagesResource(self)
+
+        # Initialize services namespace
+        self.services = AsyncServicesNamespace(self)
+
+    def _create_http_client(self, max_connections: int, max_keepalive_connections: int) -> "httpx.AsyncClient":
+        """Create an httpx async client with a bounded connection pool."""
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+        )
+        timeout = self._attempt_timeout(Timeout.coerce(self.timeout), None)
+        return create_httpx_client(http2=self.http2, async_client=True, limits=limits, timeout=timeout)
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        files: Optional[Dict[str, Any]] = None,
+        sandbox: bool = False,
+        idempotency_key: Optional[str] = None,
+        timeout: Union[float, Timeout, None] = None,
+        stream: bool = False,
+    ) -> "httpx.Response":
+        """
+        Make an authenticated request to the API.
+
+        Failed requests are retried per the client's :class:`RetryPolicy`, as
+        :class:`DevoClient` does, and POST and PATCH requests
+        get the same stable ``Idempotency-Key`` and journal handling.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE, etc.)
+            path: API endpoint path (without base URL)
+            params: Query parameters
+            data: Form data
+            json: JSON data
+            headers: Additional headers
+            files: Multipart files to upload
+            sandbox: Use sandbox API key for this request (default: False)
+            idempotency_key: Idempotency key for a POST or PATCH (default: a new random key)
+            timeout: Timeout for this call, overriding the client's (optional)
+            stream: Return once the response headers arrive, leaving a successful
+                response's body to be read with ``aiter_bytes()`` (default: False).
+                Streamed requests aren't hedged; close the response when done.
+
+        Returns:
+            httpx.Response: The API response (a :class:`TransportResponse` when replayed
+            from the journal)
+
+        Raises:
+            DevoAPIException: If the API returns an error
+            DevoCircuitOpenException: If the endpoint's circuit breaker is open
+            DevoTimeoutException: If the request timed out or the call's deadline passed
+            DevoConnectionException: If the API couldn't be reached
+            DevoNetworkException: For other request errors
+        """
+        call_timeout = Timeout.coerce(timeout if timeout is not None else self.timeout)
+        expires_at = call_timeout.expires_at()
+        method = method.upper()
+        url = self._build_url(path)
+        request_headers = self._build_headers(headers, sandbox=sandbox)
+
+        content = None
+        if not files and (json is not None or (data and self.compression is not None)):
+            # Encode the body here, instead of in httpx, with the client's codec and so it can be compressed
+            content, content_type = encode_body(data=data, json=json, dumps=self.codec.dumps)
+            if not any(name.lower() == "content-type" for name in request_headers):
+                request_headers["Content-Type"] = content_type  # type: ignore[assignment]
+
+        lookup = entry = None
+        if method in self.IDEMPOTENCY_KEY_METHODS:
+            # httpx encodes the body itself, so only encode it here when the journal needs it
+            body = None
+            full_url = url
+            if self.idempotency_journal is not None:
+                body = content if content is not None else encode_body(data=data, json=json, files=files)[0]
+                query_string = build_query_string(params)
+                full_url = f"{url}?{query_string}" if query_string else url
+            lookup, entry = self._start_send(method, full_url, request_headers, body, idempotency_key, sandbox)
+            if entry is not None and entry.completed:
+                return self.codec.bind(entry.to_response(url))
+        if content is not None:
+            if self.compression is not None:
+                content = self.compression.compress(content, request_headers)
+            data = json = None
+
+        self._check_deadline(expires_at)
+        circuit = self._enter_circuit(method, path)
+        try:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async(timeout=remaining(expires_at))
+            if self.concurrency_limiter is not None:
+                try:
+                    await self.concurrency_limiter.acquire_async(timeout=remaining(expires_at))
+                except BaseException:
+                    if self.rate_limiter is not None:
+                        self.rate_limiter.update(None)
+                    raise
+        except BaseException:
+            # Timed out or cancelled while waiting: a half-open trial slot must not stay taken
+            self._abandon_circuit(circuit)
+            raise
+
+        self.metrics.request_started()
+        timings = SendTimings()
+        status_code = None
+        response_headers = None
+        try:
+            response = await self._send_with_retries(
+                method,
+                path,
+                url,
+                params,
+                data,
+                json,
+                files,
+                content,
+                request_headers,
+                call_timeout,
+                expires_at,
+                timings,
+                stream=stream,
+            )
+            self.codec.bind(response)
+            status_code = response.status_code
+            response_headers = response.headers
+        finally:
+            self._finish_send(status_code, response_headers, timings, circuit)
+
+        # Check for API errors; like requests' ``ok``, only 4xx and 5xx responses are errors
+        if response.is_error:
+            if stream:
+                await response.aread()
+            self._handle_error_response(response)
+
+        if method in self.IDEMPOTENCY_KEY_METHODS:
+            response.idempotency_key = request_headers[IDEMPOTENCY_KEY_HEADER]
+            if entry is not None:
+                self.idempotency_journal.complete(lookup, entry, response)  # type: ignore[union-attr]
+
+        return response
+
+    async def _send_with_retries(
+        self,
+        method: str,
+        path: str,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        data: Optional[Dict[str, Any]],
+        json: Optional[Dict[str, Any]],
+        files: Optional[Dict[str, Any]],
+        content: Optional[bytes],
+        headers: Dict[str, str],
+        timeout: Timeout,
+        expires_at: Optional[float],
+        timings: SendTimings,
+        stream: bool = False,
+    ) -> "httpx.Response":
+        """
+        Send a request, retrying it as the client's :class:`RetryPolicy` says.
+
+        Each attempt is hedged on its own if the method is safe, and its time in
+        the transport is added to ``timings``. No attempt or backoff sleep runs
+        past ``expires_at``.
+        """
+        hedging = (
+            self.hedging if self.hedging is not None and method in self.hedging.HEDGE_METHODS and not stream else None
+        )
+
+        def send() -> Awaitable["httpx.Response"]:
+            request = self.http_client.build_request(
+                method,
+                url,
+                params=params,
+                data=data,
+                json=json,
+                files=files,
+                content=content,
+                headers=headers,
+                timeout=self._attempt_timeout(timeout, expires_at),
+                extensions={"trace": self._http2_stats.async_trace},
+            )
+            return self.http_client.send(request, stream=stream)
+
+        retries = self.retry_policy.begin(method, path)
+        while True:
+            status_code = None
+            timings.start()
+            try:
+                response = await (hedging.run_async(send) if hedging is not None else send())
+                self._http2_stats.increment("requests")
+            except httpx.TimeoutException as e:
+                timings.stop()
+                delay = retries.next_delay()
+                if delay is None:
+                    raise DevoTimeoutException(original_exception=e) from e
+            except httpx.TransportError as e:
+                timings.stop()
+                delay = retries.next_delay()
+                if delay is None:
+                    raise DevoConnectionException(original_exception=e) from e
+            except httpx.HTTPError as e:
+                timings.stop()
+                raise DevoNetworkException(f"Request failed: {str(e)}", original_exception=e) from e
+            else:
+                timings.stop()
+                status_code = response.status_code
+                delay = retries.next_delay(status_code, response.headers)
+                if delay is None:
+                    return response
+                await response.aclose()
+            self._check_retry_fits(delay, expires_at)
+            await self._backoff(delay, timings, status_code, expires_at)
+
+    async def _backoff(
+        self, delay: float, timings: SendTimings, status_code: Optional[int], expires_at: Optional[float]
+    ) -> None:
+        """Sleep before a retry, giving the concurrency limiter slot back meanwhile. See :meth:`DevoClient._backoff`."""
+        if self.concurrency_limiter is not None:
+            self._release_slot(timings, status_code)
+        await asyncio.sleep(delay)
+        if self.concurrency_limiter is not None:
+            await self.concurrency_limiter.acquire_async(timeout=remaining(expires_at))
+            timings.holds_slot = True
+
+    @staticmethod
+    def _attempt_timeout(timeout: Timeout, expires_at: Optional[float]) -> "httpx.Timeout":
+        """Build one attempt's httpx timeout, cut to the time left before ``expires_at``."""
+        connect, read = timeout.connect, timeout.read
+        left = remaining(expires_at)
+        if left is not None:
+            # A tiny positive timeout fails the last attempt fast instead of not bounding it
+            left = max(left, 0.001)
+            connect = left if connect is None else min(connect, left)
+            read = left if read is None else min(read, left)
+        return httpx.Timeout(read, connect=connect)
+
+    def http2_stats(self) -> Dict[str, Union[int, float]]:
+        """
+        Get connection and stream counters for this client's connection pool.
+
+        Returns:
+            Dict[str, Union[int, float]]: Counts of TCP connections, TLS handshakes,
+            HTTP/2 connections and streams, plus ``streams_per_connection``
+        """
+        return self._http2_stats.as_dict()
+
+    async def get(self, path: str, **kwargs) -> "httpx.Response":
+        """Make a GET request."""
+        return await self.request("GET", path, **kwargs)
+
+    async def post(self, path: str, **kwargs) -> "httpx.Response":
+        """Make a POST request."""
+        return await self.request("POST", path, **kwargs)
+
+    async def put(self, path: str, **kwargs) -> "httpx.Response":
+        """Make a PUT request."""
+        return await self.request("PUT", path, **kwargs)
+
+    async def delete(self, path: str, **kwargs) -> "httpx.Response":
+        """Make a DELETE request."""
+        return await self.request("DELETE", path, **kwargs)
+
+    async def patch(self, path: str, **kwargs) -> "httpx.Response":
+        """Make a PATCH request."""
+        return await self.request("PATCH", path, **kwargs)
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool."""
+        await self.http_client.aclose()
+
+    async def __aenter__(self) -> "AsyncDevoClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
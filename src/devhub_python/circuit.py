@@ -0,0 +1,245 @@
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+from .exceptions import DevoCircuitOpenException
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# on_state_change(endpoint, old_state, new_state)
+StateChangeCallback = Callable[[str, str, str], None]
+
+
+def endpoint_key(method: str, path: str) -> str:
+    """
+    Name the endpoint a request goes to, e.g. ``"POST user-api/sms/quick-send"``.
+
+    The query string and the ``/api/v1`` prefix some resources pass are dropped,
+    and path segments containing digits (IDs) become ``{id}``, so every
+    ``GET messages/<id>`` shares one circuit.
+    """
+    path = path.split("?", 1)[0].strip("/")
+    if path.startswith("api/v1/"):
+        path = path[len("api/v1/") :]
+    segments = ["{id}" if any(char.isdigit() for char in segment) else segment for segment in path.split("/")]
+    return f"{method.upper()} {'/'.join(segments)}"
+
+
+class _Circuit:
+    """State of one endpoint's circuit."""
+
+    def __init__(self) -> None:
+        self.state = CLOSED
+        # Consecutive failures while closed, consecutive successful trials while half-open
+        self.failures = 0
+        self.successes = 0
+        self.opened_at = 0.0
+        self.trial_calls = 0
+        self.opens = 0
+        self.rejected = 0
+
+
+class CircuitBreaker:
+    """
+    Thread-safe circuit breaker with one circuit per API endpoint.
+
+    A circuit starts closed. After ``failure_threshold`` consecutive failures
+    (a 5xx response, or no response at all) it opens, and calls to that
+    endpoint raise :class:`DevoCircuitOpenException` at once instead of
+    waiting for timeouts and retries. After ``recovery_timeout`` seconds the
+    circuit turns half-open and lets ``half_open_max_calls`` trial requests
+    through: ``success_threshold`` successful trials close it again, a failed
+    one reopens it. Other endpoints are unaffected, so a degraded channel
+    doesn't hold up healthy ones.
+
+    4xx responses, including 429, say nothing about the endpoint's health and
+    count as successes.
+    """
+
+    FAILURE_STATUS_CODES = frozenset({500, 502, 503, 504})
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        success_threshold: int = 1,
+        on_state_change: Optional[StateChangeCallback] = None,
+    ):
+        """
+        Initialize the circuit breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open an endpoint's circuit
+            recovery_timeout: Seconds an open circuit fails fast before trying the endpoint again
+            half_open_max_calls: Trial requests let through at once while half-open
+            success_threshold: Successful trials needed to close the circuit
+            on_state_change: Called as ``on_state_change(endpoint, old_state, new_state)``
+                whenever a circuit changes state (optional)
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.success_threshold = success_threshold
+        self.on_state_change = on_state_change
+        self._circuits: Dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def _transition(
+        self, endpoint: str, circuit: _Circuit, state: str, transitions: List[Tuple[str, str, str]]
+    ) -> None:
+        """Move a circuit to ``state``; call with the lock held and notify afterwards."""
+        transitions.append((endpoint, circuit.state, state))
+        circuit.state = state
+        circuit.failures = 0
+        circuit.successes = 0
+        circuit.trial_calls = 0
+        if state == OPEN:
+            circuit.opened_at = time.monotonic()
+            circuit.opens += 1
+
+    def _notify(self, transitions: List[Tuple[str, str, str]]) -> None:
+        """Report state changes, outside the lock so the callback may use the breaker."""
+        if self.on_state_change is not None:
+            for transition in transitions:
+                self.on_state_change(*transition)
+
+    def before_request(self, endpoint: str) -> bool:
+        """
+        Check that a request to ``endpoint`` may be sent.
+
+        Every call that doesn't raise must be followed by :meth:`record`, or by
+        :meth:`abandon` if the request is never sent.
+
+        Args:
+            endpoint: Endpoint name, see :func:`endpoint_key`
+
+        Returns:
+            bool: Whether the request is a half-open trial
+
+        Raises:
+            DevoCircuitOpenException: If the endpoint's circuit is open
+        """
+        transitions: List[Tuple[str, str, str]] = []
+        error = None
+        trial = False
+        with self._lock:
+            circuit = self._circuits.get(endpoint)
+            if circuit is not None and circuit.state == OPEN:
+                waited = time.monotonic() - circuit.opened_at
+                if waited < self.recovery_timeout:
+                    error = DevoCircuitOpenException(endpoint, retry_after=self.recovery_timeout - waited)
+                else:
+                    self._transition(endpoint, circuit, HALF_OPEN, transitions)
+            if circuit is not None and circuit.state == HALF_OPEN:
+                if circuit.trial_calls >= self.half_open_max_calls:
+                    # Another trial is already in flight
+                    error = DevoCircuitOpenException(endpoint)
+                else:
+                    circuit.trial_calls += 1
+                    trial = True
+            if error is not None:
+                circuit.rejected += 1  # type: ignore[union-attr]
+
+        self._notify(transitions)
+        if error is not None:
+            raise error
+        return trial
+
+    def record(self, endpoint: str, status_code: Optional[int], trial: bool = False) -> None:
+        """
+        Record how a request to ``endpoint`` went.
+
+        Args:
+            endpoint: Endpoint name, see :func:`endpoint_key`
+            status_code: Response status code, or None if the request failed without a response
+            trial: The value :meth:`before_request` returned for this request
+        """
+        failed = status_code is None or status_code in self.FAILURE_STATUS_CODES
+        transitions: List[Tuple[str, str, str]] = []
+        with self._lock:
+            circuit = self._circuits.get(endpoint)
+            if circuit is None:
+                if not failed:
+                    return
+                circuit = self._circuits[endpoint] = _Circuit()
+
+            if circuit.state == HALF_OPEN:
+                # Requests sent before the circuit opened don't decide the trial
+                if trial:
+                    circuit.trial_calls = max(circuit.trial_calls - 1, 0)
+                    if failed:
+                        self._transition(endpoint, circuit, OPEN, transitions)
+                    else:
+                        circuit.successes += 1
+                        if circuit.successes >= self.success_threshold:
+                            self._transition(endpoint, circuit, CLOSED, transitions)
+            elif circuit.state == CLOSED:
+                circuit.failures = circuit.failures + 1 if failed else 0
+                if circuit.failures >= self.failure_threshold:
+                    self._transition(endpoint, circuit, OPEN, transitions)
+
+        self._notify(transitions)
+
+    def abandon(self, endpoint: str, trial: bool) -> None:
+        """Give back a trial slot taken by :meth:`before_request` for a request that was never sent."""
+        if not trial:
+            return
+        with self._lock:
+            circuit = self._circuits.get(endpoint)
+            if circuit is not None and circuit.state == HALF_OPEN:
+                circuit.trial_calls = max(circuit.trial_calls - 1, 0)
+
+    def state(self, endpoint: str) -> str:
+        """Return an endpoint's circuit state: ``"closed"``, ``"open"`` or ``"half_open"``."""
+        with self._lock:
+            circuit = self._circuits.get(endpoint)
+            return circuit.state if circuit is not None else CLOSED
+
+    @property
+    def open_circuits(self) -> int:
+        """Number of circuits currently open or half-open."""
+        with self._lock:
+            return sum(1 for circuit in self._circuits.values() if circuit.state != CLOSED)
+
+    def reset(self, endpoint: Optional[str] = None) -> None:
+        """Close one endpoint's circuit, or every circuit, and forget its failures."""
+        with self._lock:
+            if endpoint is None:
+                self._circuits = {}
+            else:
+                self._circuits.pop(endpoint, None)
+
+    def after_fork(self) -> None:
+        """Forget trial requests that were in flight in the parent process when it forked."""
+        # A fresh lock, since another parent thread may have held the old one at fork time
+        self._lock = threading.Lock()
+        for circuit in self._circuits.values():
+            circuit.trial_calls = 0
+
+    def as_dict(self) -> Dict[str, Dict[str, Union[str, int]]]:
+        """
+        Return a snapshot of every endpoint that has failed.
+
+        Maps each endpoint to its ``state``, consecutive ``failures``, the number
+        of times it has opened (``opens``) and the calls ``rejected`` while open.
+        """
+        with self._lock:
+            return {
+                endpoint: {
+                    "state": circuit.state,
+                    "failures": circuit.failures,
+                    "opens": circuit.opens,
+                    "rejected": circuit.rejected,
+                }
+                for endpoint, circuit in self._circuits.items()
+            }
+
+
+def create_circuit_breaker(circuit_breaker: Union[bool, CircuitBreaker, None]) -> Optional[CircuitBreaker]:
+    """Resolve a client's ``circuit_breaker`` argument into a CircuitBreaker instance."""
+    if isinstance(circuit_breaker, CircuitBreaker):
+        return circuit_breaker
+    return CircuitBreaker() if circuit_breaker else None
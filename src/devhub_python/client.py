@@ -1,22 +1,413 @@
-from typing import Any, Dict, Optional
+import copy
+import os
+import time
+import weakref
+from typing import Any, Dict, List, Optional, Tuple, TypeVar, Union
 
 import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
 
 from . import __version__
 from .auth import APIKeyAuth
-from .exceptions import DevoAPIException, DevoAuthenticationException, DevoException, DevoMissingAPIKeyException
+from .circuit import CircuitBreaker, create_circuit_breaker, endpoint_key
+from .codec import JSONCodec, create_codec
+from .compression import RequestCompression, create_request_compression
+from .concurrency import ConcurrencyLimiter, create_concurrency_limiter
+from .exceptions import (
+    DevoAPIException,
+    DevoAuthenticationException,
+    DevoConfigurationException,
+    DevoException,
+    DevoMissingAPIKeyException,
+    DevoNetworkException,
+    DevoTimeoutException,
+)
+from .hedging import HedgingPolicy, create_hedging_policy
+from .http2 import HTTP2Adapter
+from .idempotency import IDEMPOTENCY_KEY_HEADER, IdempotencyJournal, JournalEntry, generate_idempotency_key
+from .metrics import ClientMetrics
+from .pool import ConnectionPoolStats, PooledHTTPAdapter, TrackedPoolManager
+from .ratelimit import RateLimiter, create_rate_limiter
 from .resources.contacts import ContactsResource
 from .resources.email import EmailResource
 from .resources.messages import MessagesResource
 from .resources.rcs import RCSResource
 from .resources.sms import SMSResource
 from .resources.whatsapp import WhatsAppResource
+from .retry import RetryPolicy, RetryRule
 from .services import ServicesNamespace
+from .timeout import Timeout, remaining
+from .transport import (
+    RequestsTransport,
+    ThreadLocalRequestsTransport,
+    Transport,
+    Urllib3Transport,
+    build_query_string,
+    encode_body,
+)
 
+# Every live DevoClient, so forked children can reset them before first use
+_clients: "weakref.WeakSet[DevoClient]" = weakref.WeakSet()
 
-class DevoClient:
+
+def _after_fork_in_child() -> None:
+    """Reset every live client in a freshly forked child process."""
+    for client in list(_clients):
+        client.after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+
+ClientT = TypeVar("ClientT", bound="BaseClient")
+
+
+class SendTimings:
+    """
+    Time one call spent in the transport, across its retries.
+
+    Backoff sleeps between attempts are left out, so the metrics and the
+    concurrency limiter see how long the API took rather than the client's
+    own retry delays.
+    """
+
+    def __init__(self) -> None:
+        self.total = 0.0
+        self.last = 0.0
+        # Whether the call holds a concurrency limiter slot; it is given back during backoff sleeps
+        self.holds_slot = True
+        self._started = 0.0
+
+    def start(self) -> None:
+        """Mark the start of an attempt."""
+        self._started = time.perf_counter()
+
+    def stop(self) -> None:
+        """Mark the end of an attempt."""
+        self.last = time.perf_counter() - self._started
+        self.total += self.last
+
+
+class BaseClient:
+    """
+    Shared configuration and request preparation for the sync and async clients.
+
+    Holds the API keys, base URL and timeout, and knows how to build request
+    URLs and headers and how to turn error responses into SDK exceptions.
+    Subclasses only add the HTTP layer and the resource namespaces.
+    """
+
+    DEFAULT_BASE_URL = "https://global-api-development.devotel.io/api/v1"
+    DEFAULT_TIMEOUT = 30.0
+
+    # Default retry rule shared by both clients; see RetryPolicy for per-endpoint rules
+    RETRY_STATUS_FORCELIST = [429, 500, 502, 503, 504]
+    RETRY_ALLOWED_METHODS = ["HEAD", "GET", "OPTIONS", "POST"]
+
+    # Methods that get an Idempotency-Key, since retrying them could repeat a send
+    IDEMPOTENCY_KEY_METHODS = ("POST", "PATCH")
+
+    USER_AGENT = f"devo-python-sdk/{__version__}"
+    URL_CACHE_SIZE = 1024
+
+    def __init__(
+        self,
+        api_key: str,
+        sandbox_api_key: Optional[str] = None,
+        timeout: Union[float, Timeout] = DEFAULT_TIMEOUT,
+        max_retries: int = 3,
+        retry_policy: Optional[RetryPolicy] = None,
+        idempotency_journal: Optional[IdempotencyJournal] = None,
+        rate_limiter: Union[bool, RateLimiter, None] = None,
+        concurrency_limiter: Union[bool, ConcurrencyLimiter, None] = None,
+        circuit_breaker: Union[bool, CircuitBreaker, None] = None,
+        hedging: Union[bool, HedgingPolicy, None] = None,
+        compression: Union[bool, RequestCompression, None] = None,
+        codec: Union[str, JSONCodec, None] = None,
+    ):
+        """
+        Initialize the shared client configuration.
+
+        Args:
+            api_key: API key for authentication
+            sandbox_api_key: Optional sandbox API key for testing environments
+            timeout: Timeout in seconds, or a :class:`Timeout`
+            max_retries: Maximum number of retries for failed requests, unless ``retry_policy`` is given
+            retry_policy: Per-endpoint retry rules and the retry budget (optional)
+            idempotency_journal: Journal used to suppress duplicate sends (optional)
+            rate_limiter: Pace requests to the account's rate limit; True for a new
+                :class:`RateLimiter`, or a limiter to share (optional)
+            concurrency_limiter: Adapt the number of requests in flight to what the API
+                sustains; True for a new :class:`ConcurrencyLimiter`, or a limiter to share (optional)
+            circuit_breaker: Fail fast on endpoints that keep failing; True for a new
+                :class:`CircuitBreaker`, or a breaker to share (optional)
+            hedging: Resend slow GET requests and use the first reply; True for a new
+                :class:`HedgingPolicy`, or a policy to share (optional)
+            compression: Gzip large request bodies; True for a new :class:`RequestCompression`,
+                or compression settings to share (optional)
+            codec: JSON library for request and response bodies: ``"json"`` (default),
+                ``"orjson"``, ``"msgspec"`` or a :class:`JSONCodec` (optional)
+
+        Raises:
+            DevoMissingAPIKeyException: If API key is not provided
+            DevoConfigurationException: If the codec's library is not installed
+        """
+        if not api_key or not api_key.strip():
+            raise DevoMissingAPIKeyException()
+
+        self.api_key = api_key.strip()
+        self.sandbox_api_key = sandbox_api_key.strip() if sandbox_api_key else None
+        self.base_url = self.DEFAULT_BASE_URL
+        self.timeout = timeout
+        self.retry_policy = retry_policy or RetryPolicy(
+            RetryRule(max_retries, status_codes=self.RETRY_STATUS_FORCELIST, methods=self.RETRY_ALLOWED_METHODS)
+        )
+        self.idempotency_journal = idempotency_journal
+        self.rate_limiter = create_rate_limiter(rate_limiter)
+        self.concurrency_limiter = create_concurrency_limiter(concurrency_limiter)
+        self.circuit_breaker = create_circuit_breaker(circuit_breaker)
+        self.hedging = create_hedging_policy(hedging)
+        self.compression = create_request_compression(compression)
+        self.codec = create_codec(codec)
+
+        # Set up authentication
+        self.auth = APIKeyAuth(api_key.strip())
+
+        # Request counters shared by every thread and task using this client
+        self.metrics = ClientMetrics()
+
+        # Precomputed (default headers, auth headers) per (sandbox, API key)
+        self._header_cache: Dict[Tuple[bool, Optional[str]], Tuple[Dict[str, str], Dict[str, str]]] = {}
+
+    def _init_resources(self) -> None:
+        """Create the resource namespaces, bound to this client."""
+
+    def with_options(self: ClientT, timeout: Union[float, Timeout, None] = None) -> ClientT:
+        """
+        Get a copy of the client with different options, for individual calls.
+
+        The copy shares the connection pool, metrics, limiters and every other
+        piece of state with this client, so it is cheap to create per call.
+
+        Args:
+            timeout: Timeout in seconds, or a :class:`Timeout` (optional)
+
+        Returns:
+            A client whose resources use the given options
+
+        Example:
+            >>> client.with_options(timeout=Timeout(connect=1, read=3, deadline=5)).sms.send_sms(...)
+        """
+        client = copy.copy(self)
+        if timeout is not None:
+            client.timeout = timeout
+        client._init_resources()
+        return client
+
+    @property
+    def base_url(self) -> str:
+        """Base URL that endpoint paths are joined onto."""
+        return self._base_url
+
+    @base_url.setter
+    def base_url(self, value: str) -> None:
+        self._base_url = value
+        self._url_cache: Dict[str, str] = {}
+
+    def _build_url(self, path: str) -> str:
+        """Join an API endpoint path onto the base URL, caching the result per path."""
+        url = self._url_cache.get(path)
+        if url is None:
+            url = f"{self._base_url.rstrip('/')}/{path.lstrip('/')}"
+            # Paths with embedded IDs are unbounded, so stop caching once full
+            if len(self._url_cache) < self.URL_CACHE_SIZE:
+                self._url_cache[path] = url
+        return url
+
+    def _build_headers(self, headers: Optional[Dict[str, str]] = None, sandbox: bool = False) -> Dict[str, str]:
+        """
+        Build the headers for an authenticated request.
+
+        Args:
+            headers: Additional headers
+            sandbox: Use sandbox API key for this request
+
+        Returns:
+            Dict[str, str]: The request headers
+
+        Raises:
+            DevoException: If sandbox is requested without a sandbox API key
+        """
+        # Validate sandbox usage
+        if sandbox and not self.sandbox_api_key:
+            raise DevoException("Sandbox API key required when sandbox=True")
+
+        default_headers, auth_headers = self._get_cached_headers(sandbox)
+
+        # Copy the precomputed headers; callers and transports may mutate the result
+        request_headers = dict(default_headers)
+        if headers:
+            request_headers.update(headers)
+            # Authentication headers always take precedence
+            request_headers.update(auth_headers)
+
+        return request_headers
+
+    def _get_cached_headers(self, sandbox: bool) -> Tuple[Dict[str, str], Dict[str, str]]:
+        """Get the precomputed default and authentication headers for the active API key."""
+        api_key = self.sandbox_api_key if sandbox else self.auth.api_key
+        cached = self._header_cache.get((sandbox, api_key))
+        if cached is None:
+            if sandbox:
+                # Use sandbox API key for this request
+                auth_headers = APIKeyAuth(api_key).get_headers()
+            else:
+                # Use regular API key
+                auth_headers = self.auth.get_headers()
+            default_headers = {"User-Agent": self.USER_AGENT, "Accept": "application/json"}
+            default_headers.update(auth_headers)
+            cached = self._header_cache[(sandbox, api_key)] = (default_headers, auth_headers)
+        return cached
+
+    def _start_send(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        body: Optional[bytes],
+        idempotency_key: Optional[str] = None,
+        sandbox: bool = False,
+    ) -> Tuple[Optional[str], Optional[JournalEntry]]:
+        """
+        Attach an idempotency key to a POST or PATCH and look the send up in the journal.
+
+        The key is stored in ``headers``, so every retry of the request carries it.
+
+        Args:
+            method: Upper-case HTTP method
+            url: Full URL including the query string
+            headers: Request headers, updated in place
+            body: Encoded request body, used to recognise repeated sends
+            idempotency_key: Key chosen by the caller (default: an ``Idempotency-Key``
+                header from the caller, or a new random key)
+            sandbox: Whether the sandbox API key is used
+
+        Returns:
+            Tuple[Optional[str], Optional[JournalEntry]]: The journal lookup key and entry,
+            or (None, None) without a journal
+        """
+        if method not in self.IDEMPOTENCY_KEY_METHODS:
+            return None, None
+
+        if idempotency_key is None:
+            for name in list(headers):
+                if name.lower() == IDEMPOTENCY_KEY_HEADER.lower():
+                    idempotency_key = headers.pop(name)
+
+        journal = self.idempotency_journal
+        if journal is None:
+            headers[IDEMPOTENCY_KEY_HEADER] = idempotency_key or generate_idempotency_key()
+            return None, None
+
+        api_key = (self.sandbox_api_key if sandbox else self.auth.api_key) or ""
+        lookup = idempotency_key or journal.fingerprint(api_key, method, url, body)
+        entry = journal.begin(lookup, idempotency_key)
+        headers[IDEMPOTENCY_KEY_HEADER] = entry.key
+        return lookup, entry
+
+    def _enter_circuit(self, method: str, path: str) -> Optional[Tuple[str, bool]]:
+        """
+        Check the circuit breaker before sending a request.
+
+        Returns:
+            Optional[Tuple[str, bool]]: The endpoint and whether the request is a half-open
+            trial, for :meth:`_finish_send`; None without a circuit breaker
+
+        Raises:
+            DevoCircuitOpenException: If the endpoint's circuit is open
+        """
+        if self.circuit_breaker is None:
+            return None
+        endpoint = endpoint_key(method, path)
+        try:
+            return endpoint, self.circuit_breaker.before_request(endpoint)
+        finally:
+            self.metrics.set_gauge("open_circuits", self.circuit_breaker.open_circuits)
+
+    def _abandon_circuit(self, circuit: Optional[Tuple[str, bool]]) -> None:
+        """Release a half-open trial slot taken by :meth:`_enter_circuit` for a request that wasn't sent."""
+        if self.circuit_breaker is not None and circuit is not None:
+            self.circuit_breaker.abandon(*circuit)
+
+    @staticmethod
+    def _check_deadline(expires_at: Optional[float]) -> None:
+        """Raise DevoTimeoutException if the call's deadline has passed."""
+        if expires_at is not None and not remaining(expires_at):
+            raise DevoTimeoutException()
+
+    @staticmethod
+    def _check_retry_fits(delay: float, expires_at: Optional[float]) -> None:
+        """Raise DevoTimeoutException if sleeping ``delay`` seconds before a retry would pass the deadline."""
+        left = remaining(expires_at)
+        if left is not None and delay >= left:
+            raise DevoTimeoutException()
+
+    def _finish_send(
+        self,
+        status_code: Optional[int],
+        headers: Any,
+        timings: SendTimings,
+        circuit: Optional[Tuple[str, bool]] = None,
+    ) -> None:
+        """
+        Record a finished request in the metrics, limiters and circuit breaker.
+
+        Args:
+            status_code: Response status code, or None if the request failed without a response
+            headers: Response headers, or None without a response
+            timings: Time the request spent in the transport
+            circuit: What :meth:`_enter_circuit` returned for the request
+        """
+        self.metrics.request_finished(status_code, timings.total)
+        if self.circuit_breaker is not None and circuit is not None:
+            self.circuit_breaker.record(circuit[0], status_code, trial=circuit[1])
+            self.metrics.set_gauge("open_circuits", self.circuit_breaker.open_circuits)
+        if self.concurrency_limiter is not None and timings.holds_slot:
+            self._release_slot(timings, status_code)
+        if self.rate_limiter is not None:
+            self.rate_limiter.update(headers, status_code)
+
+    def _release_slot(self, timings: SendTimings, status_code: Optional[int]) -> None:
+        """Give the concurrency limiter slot back, with the latency and status of the last attempt."""
+        self.concurrency_limiter.release(timings.last, status_code)  # type: ignore[union-attr]
+        self.metrics.set_gauge("concurrency_limit", self.concurrency_limiter.limit)  # type: ignore[union-attr]
+        timings.holds_slot = False
+
+    def _handle_error_response(self, response: Any) -> None:
+        """Handle error responses from the API."""
+        try:
+            error_data = response.json()
+            error_message = error_data.get("message", "Unknown error")
+            error_code = error_data.get("code")
+        except ValueError:
+            error_message = response.text or f"HTTP {response.status_code}"
+            error_code = None
+
+        if response.status_code == 401:
+            raise DevoAuthenticationException(error_message)
+        elif response.status_code == 429:
+            from .exceptions import DevoRateLimitException
+
+            raise DevoRateLimitException(error_message)
+        else:
+            raise DevoAPIException(
+                message=error_message,
+                status_code=response.status_code,
+                error_code=error_code,
+                response=response,
+            )
+
+
+class DevoClient(BaseClient):
     """
     Main client for interacting with the DevHub API.
 
@@ -49,16 +440,33 @@ class DevoClient:
         ... ))
     """
 
-    DEFAULT_BASE_URL = "https://global-api-development.devotel.io/api/v1"
-    DEFAULT_TIMEOUT = 30.0
+    DEFAULT_POOL_MAXSIZE = 10
+    POOL_UNAVAILABLE_MESSAGE = (
+        "Connection pool management is only available for the client's own HTTP/1.1 connection pool"
+    )
 
     def __init__(
         self,
         api_key: str,
         sandbox_api_key: Optional[str] = None,
-        timeout: float = DEFAULT_TIMEOUT,
+        timeout: Union[float, Timeout] = BaseClient.DEFAULT_TIMEOUT,
         max_retries: int = 3,
+        retry_policy: Optional[RetryPolicy] = None,
         session: Optional[requests.Session] = None,
+        http2: bool = False,
+        transport: Union[str, Transport, None] = None,
+        trust_env: bool = True,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = False,
+        pool_idle_timeout: Optional[float] = None,
+        thread_safe: bool = False,
+        idempotency_journal: Optional[IdempotencyJournal] = None,
+        rate_limiter: Union[bool, RateLimiter, None] = None,
+        concurrency_limiter: Union[bool, ConcurrencyLimiter, None] = None,
+        circuit_breaker: Union[bool, CircuitBreaker, None] = None,
+        hedging: Union[bool, HedgingPolicy, None] = None,
+        compression: Union[bool, RequestCompression, None] = None,
+        codec: Union[str, JSONCodec, None] = None,
     ):
         """
         Initialize the Devo client.
@@ -66,27 +474,107 @@ class DevoClient:
         Args:
             api_key: API key for authentication
             sandbox_api_key: Optional sandbox API key for testing environments
-            timeout: Request timeout in seconds
-            max_retries: Maximum number of retries for failed requests
+            timeout: Timeout in seconds for connecting and for each read, or a :class:`Timeout`
+                with separate connect and read timeouts and an overall deadline
+            max_retries: Maximum number of retries for failed requests, unless ``retry_policy`` is given
+            retry_policy: Per-endpoint retry rules with jittered backoff, sharing a budget that
+                caps retries at a share of recent successful calls (default: ``max_retries``
+                retries of the default :class:`RetryRule`)
             session: Custom requests session (optional)
+            http2: Send requests over multiplexed HTTP/2 connections instead of
+                HTTP/1.1 (requires the ``http2`` extra)
+            transport: HTTP transport to send requests through: ``"requests"``
+                (default), ``"urllib3"`` or a custom :class:`Transport` instance
+            trust_env: Read proxy settings, ``.netrc`` credentials and CA bundles from
+                the environment on every request. Set to False to skip that per-call
+                lookup when the environment doesn't configure any of them
+            pool_maxsize: Maximum number of keep-alive connections kept per host
+            pool_block: When all ``pool_maxsize`` connections are in use, wait for one
+                to be released instead of opening (and later discarding) an extra one
+            pool_idle_timeout: Close pooled connections that have been idle for longer
+                than this many seconds (default: keep them until the server closes them)
+            thread_safe: Give every thread that uses this client its own requests session
+                and connection pool, while sharing configuration, auth and metrics
+            idempotency_journal: Journal that recognises repeated POST and PATCH sends,
+                reusing their idempotency key and replaying recorded responses (optional)
+            rate_limiter: Pace requests to the rate limit the API reports in its
+                ``X-RateLimit-*`` headers; True for a new :class:`RateLimiter`, or a
+                limiter to share between clients (optional)
+            concurrency_limiter: Adapt the number of requests in flight (AIMD) to what the
+                API sustains, blocking callers beyond it; True for a new
+                :class:`ConcurrencyLimiter`, or a limiter to share (optional)
+            circuit_breaker: Track failures per endpoint and fail fast with
+                :class:`DevoCircuitOpenException` while an endpoint's circuit is open; True
+                for a new :class:`CircuitBreaker`, or a breaker to share (optional)
+            hedging: Send a second copy of a GET that is slower than most recent requests
+                and return whichever reply arrives first; True for a new
+                :class:`HedgingPolicy`, or a policy to share (optional). Attempts are sent
+                from the policy's threads, so this needs ``thread_safe=True`` or
+                ``transport="urllib3"``. With ``thread_safe=True`` each of those threads has
+                its own connection pool, which :meth:`warm_up` doesn't warm and
+                :meth:`pool_stats` only counts while the thread is alive
+            compression: Send JSON, form and text bodies above a size threshold
+                gzip-compressed; True for a new :class:`RequestCompression`, or
+                compression settings to share (optional)
+            codec: JSON library that encodes request bodies and decodes responses
+                (``response.json()``): ``"json"`` (default), ``"orjson"``, ``"msgspec"``
+                or a custom :class:`JSONCodec` (optional)
 
         Raises:
             DevoMissingAPIKeyException: If API key is not provided
+            DevoConfigurationException: If the codec's library is not installed,
+                if http2 is requested but httpx/h2 are not installed,
+                the transport is not supported, thread_safe is combined with a custom session,
+                or hedging is used with a transport that can't be shared across threads
         """
-        if not api_key or not api_key.strip():
-            raise DevoMissingAPIKeyException()
-
-        self.api_key = api_key.strip()
-        self.sandbox_api_key = sandbox_api_key.strip() if sandbox_api_key else None
-        self.base_url = self.DEFAULT_BASE_URL
-        self.timeout = timeout
+        super().__init__(
+            api_key,
+            sandbox_api_key=sandbox_api_key,
+            timeout=timeout,
+            max_retries=max_retries,
+            retry_policy=retry_policy,
+            idempotency_journal=idempotency_journal,
+            rate_limiter=rate_limiter,
+            concurrency_limiter=concurrency_limiter,
+            circuit_breaker=circuit_breaker,
+            hedging=hedging,
+            compression=compression,
+            codec=codec,
+        )
+        self.trust_env = trust_env
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.pool_idle_timeout = pool_idle_timeout
+        self.thread_safe = thread_safe
+
+        # Connection counters shared by every pool this client creates
+        self._connection_stats = ConnectionPoolStats()
+
+        # Optionally route all traffic through the HTTP/2 adapter
+        self._http2_adapter: Optional[HTTP2Adapter] = None
+        if http2:
+            if transport not in (None, "requests"):
+                raise DevoConfigurationException("http2=True is only supported by the requests transport")
+            self._http2_adapter = HTTP2Adapter()
+
+        # Set up the transport (and, for requests, the session); retries happen in request(), not here
+        self.transport = self._create_transport(transport, session)
+        if session is not None:
+            self._configure_session(session)
+        if self.hedging is not None and not getattr(self.transport, "thread_safe", True):
+            raise DevoConfigurationException(
+                "hedging sends attempts from several threads, which can't share one requests session; "
+                "create the client with thread_safe=True or transport='urllib3'"
+            )
 
-        # Set up authentication
-        self.auth = APIKeyAuth(api_key.strip())
+        self._init_resources()
 
-        # Set up session with retry strategy
-        self.session = session or self._create_session(max_retries)
+        # Process the pooled connections belong to; see after_fork()
+        self._pid = os.getpid()
+        _clients.add(self)
 
+    def _init_resources(self) -> None:
+        """Create the resource namespaces, bound to this client."""
         # Initialize messaging resources
         self.sms = SMSResource(self)
         self.email = EmailResource(self)
@@ -98,23 +586,68 @@ class DevoClient:
         # Initialize services namespace
         self.services = ServicesNamespace(self)
 
-    def _create_session(self, max_retries: int) -> requests.Session:
-        """Create a requests session with retry strategy."""
+    def _create_session(self) -> requests.Session:
+        """Create a requests session with a pooled adapter."""
         session = requests.Session()
 
-        retry_strategy = Retry(
-            total=max_retries,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["HEAD", "GET", "OPTIONS", "POST"],
-            backoff_factor=1,
+        adapter = PooledHTTPAdapter(
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+            idle_timeout=self.pool_idle_timeout,
+            stats=self._connection_stats,
         )
-
-        adapter = HTTPAdapter(max_retries=retry_strategy)
         session.mount("http://", adapter)
         session.mount("https://", adapter)
 
+        return self._configure_session(session)
+
+    def _configure_session(self, session: requests.Session) -> requests.Session:
+        """Apply the client's environment and HTTP/2 settings to a session."""
+        if not self.trust_env:
+            session.trust_env = False
+        if self._http2_adapter is not None:
+            session.mount("http://", self._http2_adapter)
+            session.mount("https://", self._http2_adapter)
         return session
 
+    def _create_transport(
+        self,
+        transport: Union[str, Transport, None],
+        session: Optional[requests.Session],
+    ) -> Transport:
+        """Resolve the ``transport`` argument into a Transport instance."""
+        if isinstance(transport, Transport):
+            return transport
+        if transport is None or transport == "requests":
+            if self.thread_safe:
+                if session is not None:
+                    raise DevoConfigurationException(
+                        "thread_safe=True creates a session per thread and can't use a custom session"
+                    )
+                return ThreadLocalRequestsTransport(self._create_session)
+            return RequestsTransport(session or self._create_session())
+        if transport == "urllib3":
+            # urllib3's PoolManager is thread-safe, so it is shared in thread-safe mode too
+            pool_manager = TrackedPoolManager(
+                idle_timeout=self.pool_idle_timeout,
+                stats=self._connection_stats,
+                maxsize=self.pool_maxsize,
+                block=self.pool_block,
+            )
+            return Urllib3Transport(pool_manager=pool_manager)
+        raise DevoConfigurationException(
+            f"Unsupported transport: {transport!r}. Use 'requests', 'urllib3' or a Transport instance"
+        )
+
+    @property
+    def session(self) -> Optional[requests.Session]:
+        """
+        The requests session used by the calling thread.
+
+        None when the client uses a transport other than requests.
+        """
+        return getattr(self.transport, "session", None)
+
     def request(
         self,
         method: str,
@@ -123,11 +656,23 @@ class DevoClient:
         data: Optional[Dict[str, Any]] = None,
         json: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
+        files: Optional[Dict[str, Any]] = None,
         sandbox: bool = False,
+        idempotency_key: Optional[str] = None,
+        timeout: Union[float, Timeout, None] = None,
+        stream: bool = False,
     ) -> requests.Response:
         """
         Make an authenticated request to the API.
 
+        The URL, headers and body are prepared here and handed to the
+        configured transport, so every resource works on any transport.
+
+        POST and PATCH requests carry an ``Idempotency-Key`` header that stays
+        the same across retries and is exposed as ``response.idempotency_key``.
+        With an idempotency journal, a send that already succeeded is replayed
+        from the journal (``response.replayed``) instead of being sent again.
+
         Args:
             method: HTTP method (GET, POST, PUT, DELETE, etc.)
             path: API endpoint path (without base URL)
@@ -135,86 +680,280 @@ class DevoClient:
             data: Form data
             json: JSON data
             headers: Additional headers
+            files: Multipart files to upload
             sandbox: Use sandbox API key for this request (default: False)
+            idempotency_key: Idempotency key for a POST or PATCH (default: a new random key)
+            timeout: Timeout for this call, overriding the client's (optional)
+            stream: Return once the response headers arrive, leaving a successful
+                response's body to be read with ``iter_content()`` (default: False).
+                Streamed requests aren't hedged; close the response when done.
 
         Returns:
-            requests.Response: The API response
+            requests.Response: The API response (a :class:`TransportResponse`
+            on transports other than requests, or when replayed from the journal)
 
         Raises:
             DevoAPIException: If the API returns an error
+            DevoCircuitOpenException: If the endpoint's circuit breaker is open
+            DevoTimeoutException: If an attempt or the call's deadline timed out
             DevoException: For other request errors
         """
-        url = f"{self.base_url.rstrip('/')}/{path.lstrip('/')}"
+        call_timeout = Timeout.coerce(timeout if timeout is not None else self.timeout)
+        expires_at = call_timeout.expires_at()
+        if self._pid != os.getpid():
+            self.after_fork()
+
+        url = self._build_url(path)
+        query_string = build_query_string(params)
+        if query_string:
+            url = f"{url}{'&' if '?' in url else '?'}{query_string}"
+
+        method = method.upper()
+        request_headers = self._build_headers(headers, sandbox=sandbox)
+        body, content_type = encode_body(data=data, json=json, files=files, dumps=self.codec.dumps)
+        if content_type and not any(name.lower() == "content-type" for name in request_headers):
+            request_headers["Content-Type"] = content_type
+
+        lookup, entry = self._start_send(method, url, request_headers, body, idempotency_key, sandbox)
+        if entry is not None and entry.completed:
+            return self.codec.bind(entry.to_response(url))
+        if self.compression is not None:
+            body = self.compression.compress(body, request_headers)
+
+        self._check_deadline(expires_at)
+        circuit = self._enter_circuit(method, path)
+        try:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(timeout=remaining(expires_at))
+            if self.concurrency_limiter is not None:
+                try:
+                    self.concurrency_limiter.acquire(timeout=remaining(expires_at))
+                except BaseException:
+                    if self.rate_limiter is not None:
+                        self.rate_limiter.update(None)
+                    raise
+        except BaseException:
+            self._abandon_circuit(circuit)
+            raise
+
+        self.metrics.request_started()
+        timings = SendTimings()
+        status_code = None
+        response_headers = None
+        try:
+            response = self._send_with_retries(
+                method, path, url, request_headers, body, call_timeout, expires_at, timings, stream=stream
+            )
+            self.codec.bind(response)
+            status_code = response.status_code
+            response_headers = response.headers
+        finally:
+            self._finish_send(status_code, response_headers, timings, circuit)
 
-        # Validate sandbox usage
-        if sandbox and not self.sandbox_api_key:
-            raise DevoException("Sandbox API key required when sandbox=True")
+        # Check for API errors
+        if not response.ok:
+            self._handle_error_response(response)
 
-        # Prepare headers
-        request_headers = {
-            "User-Agent": f"devo-python-sdk/{__version__}",
-            "Accept": "application/json",
-        }
-        if headers:
-            request_headers.update(headers)
+        if method in self.IDEMPOTENCY_KEY_METHODS:
+            response.idempotency_key = request_headers[IDEMPOTENCY_KEY_HEADER]
+            if entry is not None:
+                self.idempotency_journal.complete(lookup, entry, response)  # type: ignore[union-attr]
+
+        return response
 
-        # Add authentication headers
-        if sandbox and self.sandbox_api_key:
-            # Use sandbox API key for this request
-            sandbox_auth = APIKeyAuth(self.sandbox_api_key)
-            auth_headers = sandbox_auth.get_headers()
+    def _send_with_retries(
+        self,
+        method: str,
+        path: str,
+        url: str,
+        headers: Dict[str, str],
+        body: Optional[bytes],
+        timeout: Timeout,
+        expires_at: Optional[float],
+        timings: SendTimings,
+        stream: bool = False,
+    ) -> Any:
+        """
+        Send a request, retrying it as the client's :class:`RetryPolicy` says.
+
+        Each attempt's time in the transport is added to ``timings``. No attempt
+        or backoff sleep runs past ``expires_at``.
+        """
+        retries = self.retry_policy.begin(method, path)
+        while True:
+            status_code = None
+            timings.start()
+            try:
+                response = self._send(method, url, headers, body, timeout.for_attempt(expires_at), stream=stream)
+            except DevoNetworkException as e:
+                timings.stop()
+                delay = retries.next_delay()
+                if delay is None:
+                    raise
+                try:
+                    self._check_retry_fits(delay, expires_at)
+                except DevoTimeoutException:
+                    raise DevoTimeoutException(original_exception=e) from e
+            else:
+                timings.stop()
+                status_code = response.status_code
+                delay = retries.next_delay(status_code, response.headers)
+                if delay is None:
+                    return response
+                if stream:
+                    response.close()
+                self._check_retry_fits(delay, expires_at)
+            self._backoff(delay, timings, status_code, expires_at)
+
+    def _backoff(
+        self, delay: float, timings: SendTimings, status_code: Optional[int], expires_at: Optional[float]
+    ) -> None:
+        """Sleep before a retry, giving the concurrency limiter slot back meanwhile so other calls can use it."""
+        if self.concurrency_limiter is not None:
+            self._release_slot(timings, status_code)
+        time.sleep(delay)
+        if self.concurrency_limiter is not None:
+            self.concurrency_limiter.acquire(timeout=remaining(expires_at))
+            timings.holds_slot = True
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        body: Optional[bytes],
+        timeout: Any,
+        stream: bool = False,
+    ) -> Any:
+        """Send a prepared request through the transport, hedging it if the method is safe."""
+        if stream:
+            return self.transport.open(method, url, headers, body=body, timeout=timeout)
+        if self.hedging is None or method not in self.hedging.HEDGE_METHODS:
+            return self.transport.send(method, url, headers, body=body, timeout=timeout)
+        # Each attempt gets its own headers, since attempts may run concurrently
+        return self.hedging.run(lambda: self.transport.send(method, url, dict(headers), body=body, timeout=timeout))
+
+    def http2_stats(self) -> Dict[str, Union[int, float]]:
+        """
+        Get connection and stream counters for the HTTP/2 transport.
+
+        Returns:
+            Dict[str, Union[int, float]]: Counts of TCP connections, TLS handshakes,
+            HTTP/2 connections and streams, plus ``streams_per_connection``
+
+        Raises:
+            DevoConfigurationException: If the client was not created with http2=True
+        """
+        if self._http2_adapter is None:
+            raise DevoConfigurationException("HTTP/2 is not enabled. Create the client with http2=True")
+        return self._http2_adapter.stats.as_dict()
+
+    def _get_connection_pools(self) -> List[Union[PooledHTTPAdapter, TrackedPoolManager]]:
+        """Get the client-managed connection pools serving the base URL (one per thread in thread-safe mode)."""
+        if isinstance(self.transport, ThreadLocalRequestsTransport):
+            pools: List[Any] = [session.get_adapter(self.base_url) for session in self.transport.sessions]
+        elif self.session is not None:
+            pools = [self.session.get_adapter(self.base_url)]
         else:
-            # Use regular API key
-            auth_headers = self.auth.get_headers()
-        request_headers.update(auth_headers)
+            pools = [getattr(self.transport, "pool_manager", None)]
 
-        try:
-            response = self.session.request(
-                method=method,
-                url=url,
-                params=params,
-                data=data,
-                json=json,
-                headers=request_headers,
-                timeout=self.timeout,
-            )
+        if not all(isinstance(pool, (PooledHTTPAdapter, TrackedPoolManager)) for pool in pools):
+            raise DevoConfigurationException(self.POOL_UNAVAILABLE_MESSAGE)
+        return pools
 
-            # Check for API errors
-            if not response.ok:
-                self._handle_error_response(response)
+    def warm_up(self, n: int = 1) -> int:
+        """
+        Open and TLS-handshake connections to the API ahead of the first requests.
 
-            return response
+        At most ``pool_maxsize`` connections are opened; connections that are
+        already open count towards ``n``.
 
-        except requests.exceptions.Timeout:
-            raise DevoException("Request timed out")
-        except requests.exceptions.ConnectionError:
-            raise DevoException("Connection error")
-        except requests.exceptions.RequestException as e:
-            raise DevoException(f"Request failed: {str(e)}")
+        Args:
+            n: Number of connections to have ready
 
-    def _handle_error_response(self, response: requests.Response) -> None:
-        """Handle error responses from the API."""
-        try:
-            error_data = response.json()
-            error_message = error_data.get("message", "Unknown error")
-            error_code = error_data.get("code")
-        except ValueError:
-            error_message = response.text or f"HTTP {response.status_code}"
-            error_code = None
+        Returns:
+            int: Number of new connections opened
 
-        if response.status_code == 401:
-            raise DevoAuthenticationException(error_message)
-        elif response.status_code == 429:
-            from .exceptions import DevoRateLimitException
+        Raises:
+            DevoConnectionException: If a connection could not be established
+            DevoConfigurationException: If the client uses a custom session, custom transport or HTTP/2
 
-            raise DevoRateLimitException(error_message)
+        Note:
+            In thread-safe mode this warms the calling thread's connection pool.
+
+        Example:
+            >>> client = DevoClient(api_key="your-api-key", pool_maxsize=50)
+            >>> client.warm_up(50)
+        """
+        session = self.session
+        if session is not None:
+            pool = session.get_adapter(self.base_url)
         else:
-            raise DevoAPIException(
-                message=error_message,
-                status_code=response.status_code,
-                error_code=error_code,
-                response=response,
-            )
+            pool = getattr(self.transport, "pool_manager", None)
+
+        if isinstance(pool, PooledHTTPAdapter) and session is not None:
+            # Resolve TLS settings exactly like a request would, so the same host pool is warmed
+            settings = session.merge_environment_settings(self.base_url, {}, None, None, None)
+            return pool.warm_up(self.base_url, n, verify=settings["verify"], cert=settings["cert"])
+        if isinstance(pool, TrackedPoolManager):
+            return pool.warm_up(self.base_url, n)
+        raise DevoConfigurationException(self.POOL_UNAVAILABLE_MESSAGE)
+
+    def pool_stats(self) -> Dict[str, int]:
+        """
+        Get live connection pool counters.
+
+        Returns:
+            Dict[str, int]: ``in_use`` and ``idle`` connections right now, plus the
+            total number of connections ``created`` and ``discarded`` so far
+
+        Raises:
+            DevoConfigurationException: If the client uses a custom session, custom transport or HTTP/2
+        """
+        pools = self._get_connection_pools()
+        stats = self._connection_stats
+        return {
+            "in_use": stats.in_use,
+            "idle": sum(pool.idle_connections() for pool in pools),
+            "created": stats.created,
+            "discarded": stats.discarded,
+        }
+
+    def close(self) -> None:
+        """Close the transport and release its pooled connections."""
+        self.transport.close()
+        if self.hedging is not None:
+            self.hedging.close()
+
+    def after_fork(self) -> None:
+        """
+        Reset the client in a forked child process.
+
+        Drops the pooled connections inherited from the parent, so the child
+        never reads from or writes to the parent's sockets, and zeroes the
+        connection stats and metrics. Configuration, auth and the header and
+        URL caches are kept, so a client created before forking (e.g. in a
+        gunicorn ``--preload`` app or a Celery prefork worker) stays ready to use.
+
+        Runs automatically in the child after ``os.fork()``, and before the
+        first request in any process other than the one the client was
+        created in. Call it directly when forking some other way.
+        """
+        self._pid = os.getpid()
+        self.metrics.reset()
+        self._connection_stats.reset()
+        if self.rate_limiter is not None:
+            self.rate_limiter.after_fork()
+        if self.concurrency_limiter is not None:
+            self.concurrency_limiter.after_fork()
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.after_fork()
+        if self.hedging is not None:
+            self.hedging.after_fork()
+        if self.compression is not None:
+            self.compression.after_fork()
+        self.retry_policy.after_fork()
+        self.transport.after_fork()
 
     def get(self, path: str, **kwargs) -> requests.Response:
         """Make a GET request."""
@@ -0,0 +1,123 @@
+import json
+from typing import Any, Union
+
+from .exceptions import DevoConfigurationException
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without the optional dependency
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - exercised only without the optional dependency
+    msgspec = None  # type: ignore[assignment]
+
+
+class JSONCodec:
+    """
+    Encodes request bodies and decodes response bodies.
+
+    The default implementation uses the standard library's ``json`` module.
+    Subclasses plug in faster libraries; ``loads`` must raise ``ValueError``
+    for malformed JSON, as ``json.loads`` does, since error handling relies on it.
+    """
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode ``obj`` as UTF-8 JSON."""
+        return json.dumps(obj, allow_nan=False).encode("utf-8")
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """Decode a JSON document."""
+        return json.loads(data)
+
+    def bind(self, response: Any) -> Any:
+        """
+        Make ``response.json()`` decode with this codec.
+
+        Callers use ``response.json()`` on whatever the transport returned
+        (``requests``, ``httpx`` or :class:`TransportResponse`), so the codec is
+        attached to the response rather than threaded through every resource.
+        Resources that return models parse the body bytes with Pydantic
+        directly and don't go through the codec.
+        Calls that pass keyword arguments for ``json.loads`` keep the
+        response's own decoder.
+        """
+        if type(self) is JSONCodec:
+            return response
+        loads = self.loads
+        original = response.json
+
+        def decode(**kwargs: Any) -> Any:
+            if kwargs:
+                return original(**kwargs)
+            return loads(response.content)
+
+        response.json = decode
+        return response
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self.name!r}>"
+
+
+class OrjsonCodec(JSONCodec):
+    """JSON codec backed by `orjson <https://github.com/ijl/orjson>`_."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        if orjson is None:
+            raise DevoConfigurationException(
+                "orjson is required for codec='orjson'. Install it with: pip install devhub-python[orjson]"
+            )
+
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        # orjson.JSONDecodeError subclasses ValueError
+        return orjson.loads(data)
+
+
+class MsgspecCodec(JSONCodec):
+    """JSON codec backed by `msgspec <https://jcristharif.com/msgspec/>`_."""
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        if msgspec is None:
+            raise DevoConfigurationException(
+                "msgspec is required for codec='msgspec'. Install it with: pip install devhub-python[msgspec]"
+            )
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+
+
+CODECS = {"json": JSONCodec, "orjson": OrjsonCodec, "msgspec": MsgspecCodec}
+
+
+def create_codec(codec: Union[str, JSONCodec, None]) -> JSONCodec:
+    """
+    Resolve a client's ``codec`` argument into a JSONCodec instance.
+
+    Raises:
+        DevoConfigurationException: If the codec is unknown or its library isn't installed
+    """
+    if isinstance(codec, JSONCodec):
+        return codec
+    if codec is None:
+        return JSONCodec()
+    if codec not in CODECS:
+        raise DevoConfigurationException(f"Unsupported codec: {codec!r}. Use one of {', '.join(CODECS)}")
+    return CODECS[codec]()
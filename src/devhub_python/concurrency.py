@@ -0,0 +1,217 @@
+import asyncio
+import collections
+import threading
+import time
+from typing import Callable, Deque, Dict, Optional, Union
+
+from .exceptions import DevoTimeoutException
+
+
+class _Waiter:
+    """A thread or task waiting for a slot; ``wake`` hands it one."""
+
+    def __init__(self, wake: Callable[[], None]):
+        self.wake = wake
+        self.cancelled = False
+
+
+class ConcurrencyLimiter:
+    """
+    Adaptive (AIMD) limit on the number of requests in flight.
+
+    While responses come back without congestion signals the limit grows
+    additively, by up to one request per round trip, but only while the
+    limit is actually being used. A 429 or 503, a request that failed
+    without a response, or a latency spike (smoothed latency above
+    ``latency_tolerance`` times the fastest recent latency) cuts the limit
+    by ``backoff_ratio``, at most once per round trip so a burst of
+    failures counts as one. The limit settles just under what the API
+    sustains.
+
+    Threads block in :meth:`acquire` and asyncio tasks wait in
+    :meth:`acquire_async`; slots are handed out in arrival order.
+    """
+
+    CONGESTION_STATUS_CODES = frozenset({429, 503})
+
+    def __init__(
+        self,
+        initial_limit: int = 10,
+        min_limit: int = 1,
+        max_limit: int = 500,
+        backoff_ratio: float = 0.5,
+        latency_tolerance: float = 2.0,
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            initial_limit: Requests allowed in flight at first
+            min_limit: Lowest the limit is ever cut to
+            max_limit: Highest the limit ever grows to
+            backoff_ratio: Factor the limit is multiplied by on congestion
+            latency_tolerance: Latency, as a multiple of the baseline, that counts as a spike
+        """
+        self.limit = float(initial_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff_ratio = backoff_ratio
+        self.latency_tolerance = latency_tolerance
+        self.in_flight = 0
+        self.increases = 0
+        self.decreases = 0
+        # Lowest latency seen recently (drifts up slowly so it tracks the API) and a smoothed latency
+        self.baseline_latency: Optional[float] = None
+        self.smoothed_latency: Optional[float] = None
+        self._last_decrease = 0.0
+        self._lock = threading.Lock()
+        self._waiters: Deque[_Waiter] = collections.deque()
+
+    def _try_take(self) -> bool:
+        """Take a free slot if there is one; call with the lock held."""
+        if self.in_flight < max(int(self.limit), self.min_limit):
+            self.in_flight += 1
+            return True
+        return False
+
+    def _wake_waiters(self) -> None:
+        """Hand free slots to waiters in arrival order; call with the lock held."""
+        while self._waiters and self.in_flight < max(int(self.limit), self.min_limit):
+            waiter = self._waiters.popleft()
+            if waiter.cancelled:
+                continue
+            self.in_flight += 1
+            try:
+                waiter.wake()
+            except RuntimeError:
+                # The waiting task's event loop has been closed
+                self.in_flight -= 1
+
+    def acquire(self, timeout: Optional[float] = None) -> None:
+        """
+        Block until a request may be sent.
+
+        Every call that returns must be followed by :meth:`release`.
+
+        Args:
+            timeout: Most seconds to wait for a slot (optional, default: as long as it takes)
+
+        Raises:
+            DevoTimeoutException: If no slot became free within ``timeout``
+        """
+        with self._lock:
+            if self._try_take():
+                return
+            event = threading.Event()
+            waiter = _Waiter(event.set)
+            self._waiters.append(waiter)
+        if event.wait(timeout):
+            return
+        with self._lock:
+            # A slot may have been handed over just as the wait timed out
+            if event.is_set():
+                return
+            waiter.cancelled = True
+        raise DevoTimeoutException(timeout)
+
+    async def acquire_async(self, timeout: Optional[float] = None) -> None:
+        """Async version of :meth:`acquire` that waits without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def hand_over() -> None:
+            if future.cancelled():
+                # The task gave up after this slot was handed to it
+                self._return_slot()
+            else:
+                future.set_result(None)
+
+        with self._lock:
+            if self._try_take():
+                return
+            waiter = _Waiter(lambda: loop.call_soon_threadsafe(hand_over))
+            self._waiters.append(waiter)
+
+        try:
+            # A cancelled or timed out future hands any slot it is given straight back
+            await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            with self._lock:
+                waiter.cancelled = True
+            raise DevoTimeoutException(timeout)
+        except asyncio.CancelledError:
+            with self._lock:
+                waiter.cancelled = True
+            raise
+
+    def _return_slot(self) -> None:
+        """Give back a slot without a latency sample."""
+        with self._lock:
+            self.in_flight = max(self.in_flight - 1, 0)
+            self._wake_waiters()
+
+    def release(self, latency: float, status_code: Optional[int] = None) -> None:
+        """
+        Finish a request and adapt the limit to how it went.
+
+        Args:
+            latency: Seconds the request took
+            status_code: Response status code, or None if the request failed without a response
+        """
+        with self._lock:
+            in_use = self.in_flight
+            self.in_flight = max(self.in_flight - 1, 0)
+            now = time.monotonic()
+
+            if self.baseline_latency is None or self.smoothed_latency is None:
+                self.baseline_latency = self.smoothed_latency = latency
+            else:
+                self.smoothed_latency += 0.1 * (latency - self.smoothed_latency)
+                self.baseline_latency = min(latency, self.baseline_latency * 1.001)
+
+            congested = (
+                status_code is None
+                or status_code in self.CONGESTION_STATUS_CODES
+                or self.smoothed_latency > self.baseline_latency * self.latency_tolerance
+            )
+            if congested:
+                # Only one decrease per round trip: requests already in flight saw the same congestion
+                if now - self._last_decrease >= self.smoothed_latency:
+                    self.limit = max(self.limit * self.backoff_ratio, float(self.min_limit))
+                    self._last_decrease = now
+                    self.decreases += 1
+            elif in_use >= self.limit / 2:
+                # Grow by up to one slot per round trip, and only while the limit is being used
+                self.limit = min(self.limit + 1 / self.limit, float(self.max_limit))
+                self.increases += 1
+
+            self._wake_waiters()
+
+    def after_fork(self) -> None:
+        """Forget slots and waiters of the parent process."""
+        # A fresh lock, since another parent thread may have held the old one at fork time
+        self._lock = threading.Lock()
+        self._waiters = collections.deque()
+        self.in_flight = 0
+
+    def as_dict(self) -> Dict[str, Union[int, float, None]]:
+        """Return a snapshot of the current limit, slots in use and latency estimates."""
+        with self._lock:
+            return {
+                "limit": self.limit,
+                "in_flight": self.in_flight,
+                "waiting": sum(1 for waiter in self._waiters if not waiter.cancelled),
+                "increases": self.increases,
+                "decreases": self.decreases,
+                "baseline_latency": self.baseline_latency,
+                "smoothed_latency": self.smoothed_latency,
+            }
+
+
+def create_concurrency_limiter(
+    concurrency_limiter: Union[bool, ConcurrencyLimiter, None],
+) -> Optional[ConcurrencyLimiter]:
+    """Resolve a client's ``concurrency_limiter`` argument into a ConcurrencyLimiter instance."""
+    if isinstance(concurrency_limiter, ConcurrencyLimiter):
+        return concurrency_limiter
+    return ConcurrencyLimiter() if concurrency_limiter else None
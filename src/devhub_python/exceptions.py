@@ -351,6 +351,23 @@ class DevoSSLException(DevoConnectionException):
         super().__init__(message, **kwargs)
 
 
+class DevoCircuitOpenException(DevoNetworkException):
+    """
+    Exception raised without sending when an endpoint's circuit breaker is open.
+
+    The endpoint failed repeatedly; calls fail fast until ``retry_after`` seconds
+    have passed and a trial request succeeds.
+    """
+
+    def __init__(self, endpoint: str, retry_after: Optional[float] = None, **kwargs):
+        message = f"Circuit open for {endpoint}"
+        if retry_after:
+            message += f"; retry in {retry_after:.1f} seconds"
+        super().__init__(message, **kwargs)
+        self.endpoint = endpoint
+        self.retry_after = retry_after
+
+
 # Configuration Exceptions
 
 
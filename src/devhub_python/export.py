@@ -0,0 +1,342 @@
+import csv
+import io
+import json
+import os
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional, Sequence
+
+from .codec import JSONCodec
+from .exceptions import DevoException, DevoValidationException
+from .pagination import has_more_pages, last_page, page_items
+
+EXPORT_FORMATS = {".csv": "csv", ".ndjson": "ndjson", ".jsonl": "ndjson"}
+
+# Prefix of the CSV columns holding one custom field each, e.g. "custom_fields.plan"
+CUSTOM_FIELD_PREFIX = "custom_fields."
+
+
+def export_format(path: str, format: Optional[str] = None) -> str:
+    """
+    Get the format to export to ``path`` in.
+
+    Args:
+        path: Output file
+        format: ``"csv"`` or ``"ndjson"``; taken from the file extension when omitted
+
+    Returns:
+        str: ``"csv"`` or ``"ndjson"``
+
+    Raises:
+        DevoValidationException: If the format is unknown
+    """
+    if format is None:
+        format = EXPORT_FORMATS.get(os.path.splitext(path)[1].lower())
+        if format is None:
+            raise DevoValidationException(f"Can't tell the export format of {path!r}; pass format='csv' or 'ndjson'")
+    if format not in ("csv", "ndjson"):
+        raise DevoValidationException(f"Unknown export format: {format!r}")
+    return format
+
+
+def model_columns(model_class: Any, flatten: Sequence[str] = ()) -> List[str]:
+    """
+    Get CSV columns for the fields of a model, named as in the API's JSON.
+
+    Args:
+        model_class: Pydantic model of the exported items
+        flatten: Fields left out because they are exported as columns of their own, e.g. ``custom_fields``
+
+    Returns:
+        List[str]: Column names
+    """
+    return [field.alias or name for name, field in model_class.model_fields.items() if name not in flatten]
+
+
+def _column_value(row: Mapping[str, Any], column: str) -> Any:
+    if column.startswith(CUSTOM_FIELD_PREFIX):
+        return (row.get("custom_fields") or {}).get(column[len(CUSTOM_FIELD_PREFIX) :])
+    return row.get(column)
+
+
+def _cell(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (str, int, float)):
+        return value
+    return json.dumps(value, default=str)
+
+
+class ExportProgress:
+    """
+    Progress of an export, as reported after each page.
+
+    ``rows`` and ``pages`` include those written before a resume, while
+    ``rows_per_second`` covers this run only. ``eta`` is None until the
+    number of pages is known.
+    """
+
+    def __init__(self, rows: int, pages: int, last_page: Optional[int], elapsed: float, session_rows: int):
+        self.rows = rows
+        self.pages = pages
+        self.last_page = last_page
+        self.elapsed = elapsed
+        self.rows_per_second = session_rows / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def eta(self) -> Optional[float]:
+        """Estimated seconds left, from this run's pace and the pages left."""
+        if self.last_page is None or not self.rows_per_second:
+            return None
+        rows_per_page = self.rows / self.pages if self.pages else 0
+        return max(self.last_page - self.pages, 0) * rows_per_page / self.rows_per_second
+
+    def __repr__(self) -> str:
+        pages = f"{self.pages}/{self.last_page}" if self.last_page is not None else str(self.pages)
+        eta = f", ETA {self.eta:.0f}s" if self.eta is not None else ""
+        return f"<ExportProgress {self.rows} rows, {pages} pages, {self.rows_per_second:.0f} rows/s{eta}>"
+
+
+class ExportCheckpoint:
+    """
+    Progress of an export, used to resume it after a failure.
+
+    Holds the next page to fetch and the size of the output file after the
+    last complete page. It is written next to the output, replacing the
+    previous one atomically after each page, and removed once the export
+    is complete.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialize the checkpoint, loading it if ``path`` exists.
+
+        Args:
+            path: Checkpoint file
+        """
+        self.path = path
+        self.export: Optional[Dict[str, Any]] = None
+        self.page = 1
+        self.rows = 0
+        self.size = 0
+        self.columns: Optional[List[str]] = None
+
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as checkpoint_file:
+                state = json.load(checkpoint_file)
+            self.export = state["export"]
+            self.page = state["page"]
+            self.rows = state["rows"]
+            self.size = state["size"]
+            self.columns = state.get("columns")
+
+    @property
+    def started(self) -> bool:
+        """Whether a page has been recorded."""
+        return self.export is not None
+
+    def save(self) -> None:
+        """Write the checkpoint, replacing the previous one in one step."""
+        state = {"export": self.export, "page": self.page, "rows": self.rows, "size": self.size}
+        if self.columns is not None:
+            state["columns"] = self.columns
+        temporary = f"{self.path}.tmp"
+        with open(temporary, "w", encoding="utf-8") as checkpoint_file:
+            json.dump(state, checkpoint_file)
+        os.replace(temporary, self.path)
+
+    def remove(self) -> None:
+        """Delete the checkpoint file."""
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+class _Export:
+    """Writes pages to an output file and records a checkpoint after each, shared by the sync and async drivers."""
+
+    def __init__(
+        self,
+        path: str,
+        format: Optional[str],
+        export: Dict[str, Any],
+        limit: int,
+        field: Optional[str],
+        columns: Optional[List[str]],
+        checkpoint_path: Optional[str],
+        on_progress: Optional[Callable[[ExportProgress], Any]],
+        fsync: bool,
+        codec: Optional[JSONCodec],
+    ):
+        if limit < 1:
+            raise DevoValidationException("limit must be at least 1")
+        self.format = export_format(path, format)
+        self.limit = limit
+        self.field = field
+        self.on_progress = on_progress
+        self.fsync = fsync
+        self.codec = codec or JSONCodec()
+        self.checkpoint = ExportCheckpoint(checkpoint_path or f"{path}.checkpoint")
+        # Round-trip through JSON so a description loaded from the checkpoint compares equal
+        export = json.loads(json.dumps(dict(export, format=self.format, limit=limit), default=str))
+
+        if self.checkpoint.started:
+            if self.checkpoint.export != export:
+                raise DevoValidationException(f"The checkpoint belongs to a different export: {self.checkpoint.export}")
+            try:
+                self.file = open(path, "r+b")
+            except FileNotFoundError:
+                raise DevoException(
+                    f"{path} is missing, but {self.checkpoint.path} records {self.checkpoint.size} bytes of it; "
+                    "can't resume"
+                )
+            self.file.seek(0, os.SEEK_END)
+            if self.file.tell() < self.checkpoint.size:
+                self.file.close()
+                raise DevoException(
+                    f"{path} is shorter than its checkpoint records ({self.checkpoint.size} bytes); can't resume"
+                )
+            # Drop whatever was written after the last recorded page
+            self.file.truncate(self.checkpoint.size)
+            self.file.seek(self.checkpoint.size)
+        else:
+            # A resumed CSV export keeps the columns recorded in its checkpoint
+            if self.format == "csv" and not columns:
+                raise DevoValidationException("A CSV export needs its columns")
+            self.checkpoint.export = export
+            self.checkpoint.columns = columns if self.format == "csv" else None
+            self.file = open(path, "wb")
+            if self.checkpoint.columns is not None:
+                self._write_csv([self.checkpoint.columns])
+        self.columns = self.checkpoint.columns
+        self.started = time.monotonic()
+        self.session_rows = 0
+        self.last_page: Optional[int] = None
+
+    @property
+    def page(self) -> int:
+        """Next page to fetch."""
+        return self.checkpoint.page
+
+    def write(self, page: Any) -> bool:
+        """Write a page, record it, and tell whether pages follow."""
+        items = page_items(page, self.field)
+        rows = getattr(items, "raw", items)
+        if self.columns is not None:
+            self._write_csv([[_cell(_column_value(row, column)) for column in self.columns] for row in rows])
+        else:
+            self.file.write(b"".join(self.codec.dumps(row) + b"\n" for row in rows))
+        self.file.flush()
+        if self.fsync:
+            os.fsync(self.file.fileno())
+
+        self.last_page = last_page(page, self.limit) or self.last_page
+        more = has_more_pages(page, items, self.checkpoint.page, self.limit)
+        self.checkpoint.page += 1
+        self.checkpoint.rows += len(rows)
+        self.checkpoint.size = self.file.tell()
+        self.checkpoint.save()
+        self.session_rows += len(rows)
+        if self.on_progress is not None:
+            self.on_progress(self.progress())
+        return more
+
+    def progress(self) -> ExportProgress:
+        """Report the export's progress."""
+        elapsed = time.monotonic() - self.started
+        pages = self.checkpoint.page - 1
+        return ExportProgress(self.checkpoint.rows, pages, self.last_page, elapsed, self.session_rows)
+
+    def finish(self) -> ExportProgress:
+        """Close the output and remove the checkpoint of a complete export."""
+        self.file.close()
+        self.checkpoint.remove()
+        return self.progress()
+
+    def close(self) -> None:
+        """Close the output, keeping the checkpoint to resume from."""
+        self.file.close()
+
+    def _write_csv(self, rows: Sequence[Sequence[Any]]) -> None:
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(rows)
+        self.file.write(buffer.getvalue().encode("utf-8"))
+
+
+def export_pages(
+    fetch: Callable[[int], Any],
+    path: str,
+    export: Dict[str, Any],
+    limit: int,
+    field: Optional[str] = None,
+    format: Optional[str] = None,
+    columns: Optional[List[str]] = None,
+    checkpoint_path: Optional[str] = None,
+    on_progress: Optional[Callable[[ExportProgress], Any]] = None,
+    fsync: bool = False,
+    codec: Optional[JSONCodec] = None,
+) -> ExportProgress:
+    """
+    Write every item of a paged endpoint to a CSV or NDJSON file, resuming an interrupted export.
+
+    Pages are fetched one at a time and written straight to ``path``, so
+    memory use doesn't grow with the export. After each page the file is
+    flushed and a checkpoint records the next page and the file's size.
+    If the checkpoint exists when the export starts, the file is cut back
+    to that size, dropping any page written only in part, and the export
+    carries on from the next page. The checkpoint is removed when the
+    export is complete.
+
+    Args:
+        fetch: Fetches a page by number, starting at 1
+        path: Output file
+        export: Description of the export (source and filters), recorded in the checkpoint
+        limit: Items per page
+        field: Attribute of a page that holds the items (see :func:`~devhub_python.pagination.page_items`)
+        format: ``"csv"`` or ``"ndjson"`` (default: from the file extension)
+        columns: CSV columns; ``custom_fields.<name>`` columns read a custom field. Not
+            needed to resume, which uses the columns recorded in the checkpoint
+        checkpoint_path: Checkpoint file (default: ``path`` + ``".checkpoint"``)
+        on_progress: Called with an :class:`ExportProgress` after each page
+        fsync: Also sync the output to disk after each page, to survive power loss
+        codec: Encodes NDJSON rows (default: the standard library)
+
+    Returns:
+        ExportProgress: Rows and pages written, and the pace of this run
+
+    Raises:
+        DevoValidationException: If the format is unknown, or the checkpoint records a different export
+        DevoException: If the output is missing or shorter than its checkpoint
+    """
+    state = _Export(path, format, export, limit, field, columns, checkpoint_path, on_progress, fsync, codec)
+    try:
+        while state.write(fetch(state.page)):
+            pass
+    except BaseException:
+        state.close()
+        raise
+    return state.finish()
+
+
+async def export_pages_async(
+    fetch: Callable[[int], Awaitable[Any]],
+    path: str,
+    export: Dict[str, Any],
+    limit: int,
+    field: Optional[str] = None,
+    format: Optional[str] = None,
+    columns: Optional[List[str]] = None,
+    checkpoint_path: Optional[str] = None,
+    on_progress: Optional[Callable[[ExportProgress], Any]] = None,
+    fsync: bool = False,
+    codec: Optional[JSONCodec] = None,
+) -> ExportProgress:
+    """Write every item of a paged endpoint to a CSV or NDJSON file. See :func:`export_pages`."""
+    state = _Export(path, format, export, limit, field, columns, checkpoint_path, on_progress, fsync, codec)
+    try:
+        while state.write(await fetch(state.page)):
+            pass
+    except BaseException:
+        state.close()
+        raise
+    return state.finish()
@@ -0,0 +1,240 @@
+import asyncio
+import collections
+import contextvars
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Awaitable, Callable, Deque, Dict, List, Optional, Tuple, TypeVar, Union
+
+T = TypeVar("T")
+
+
+class HedgingPolicy:
+    """
+    Hedged requests for safe, idempotent calls.
+
+    A hedge-eligible request (``GET`` or ``HEAD``) that has no response after
+    the ``percentile``-th percentile of recent latencies is sent a second time;
+    whichever reply arrives first is returned and the other attempt is
+    cancelled. This cuts the tail latency a single slow connection or server
+    adds, at the price of a few extra requests: at most ``max_hedge_ratio`` of
+    the recent requests are hedged, so the extra load stays bounded even when
+    the whole API slows down.
+
+    Hedges bypass the rate and concurrency limiters, which count the logical
+    request once. The sync client runs attempts on the policy's worker
+    threads; an attempt that is already on the wire can't be interrupted
+    there, so its late response is discarded. The async client cancels the
+    losing task.
+    """
+
+    HEDGE_METHODS = ("GET", "HEAD")
+
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        max_hedge_ratio: float = 0.05,
+        delay: Optional[float] = None,
+        min_samples: int = 20,
+        window: int = 1000,
+        max_workers: int = 64,
+    ):
+        """
+        Initialize the policy.
+
+        Args:
+            percentile: Percentile of recent latencies to wait for before hedging
+            max_hedge_ratio: Highest fraction of recent requests that may be hedged
+            delay: Fixed seconds to wait before hedging instead of the percentile (optional)
+            min_samples: Latencies needed before the percentile is trusted; requests aren't
+                hedged until then (ignored with a fixed ``delay``)
+            window: Number of recent requests the percentile and hedge ratio are computed over
+            max_workers: Worker threads the sync client sends attempts from
+        """
+        self.percentile = percentile
+        self.max_hedge_ratio = max_hedge_ratio
+        self.delay = delay
+        self.min_samples = min_samples
+        self.max_workers = max_workers
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self._latencies: Deque[float] = collections.deque(maxlen=window)
+        # Whether each of the recent requests was hedged, for the hedge ratio
+        self._hedged: Deque[bool] = collections.deque(maxlen=window)
+        self._recent_hedges = 0
+        self._hedge_delay: Optional[float] = None
+        self._unsorted = 0
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _delay_for_next_request(self) -> Optional[float]:
+        """Count a new request and return how long to wait before hedging it, or None not to hedge."""
+        with self._lock:
+            self.requests += 1
+            if len(self._hedged) == self._hedged.maxlen and self._hedged[0]:
+                self._recent_hedges -= 1
+            self._hedged.append(False)
+            if self.delay is not None:
+                return self.delay
+            if len(self._latencies) < self.min_samples:
+                return None
+            # Sorting the window on every request would cost more than it saves, so refresh periodically
+            if self._hedge_delay is None or self._unsorted >= 16:
+                latencies = sorted(self._latencies)
+                index = min(int(len(latencies) * self.percentile / 100), len(latencies) - 1)
+                self._hedge_delay = latencies[index]
+                self._unsorted = 0
+            return self._hedge_delay
+
+    def _take_hedge(self) -> bool:
+        """Use up hedge budget for the latest request, if there is any left."""
+        with self._lock:
+            if self._recent_hedges + 1 > self.max_hedge_ratio * len(self._hedged):
+                return False
+            self._recent_hedges += 1
+            self._hedged[-1] = True
+            self.hedges += 1
+            return True
+
+    def _finished(self, latency: float, hedge_won: bool) -> None:
+        """Record the latency of the attempt that answered."""
+        with self._lock:
+            self._latencies.append(latency)
+            self._unsorted += 1
+            if hedge_won:
+                self.hedge_wins += 1
+
+    @staticmethod
+    def _timed(send: Callable[[], T]) -> Tuple[float, T]:
+        """Run one attempt and measure it."""
+        started = time.perf_counter()
+        result = send()
+        return time.perf_counter() - started, result
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the worker pool, creating it on first use."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="devhub-hedge")
+            return self._executor
+
+    def run(self, send: Callable[[], T]) -> T:
+        """
+        Send a request, hedging it if it is slow.
+
+        Args:
+            send: Sends one attempt and returns its response; called at most twice,
+                possibly concurrently
+
+        Returns:
+            The first response to arrive
+
+        Raises:
+            Exception: What the attempt raised, or the first attempt's error if both failed
+        """
+        delay = self._delay_for_next_request()
+        if delay is None:
+            latency, result = self._timed(send)
+            self._finished(latency, hedge_won=False)
+            return result
+
+        executor = self._get_executor()
+        # Attempts run in a copy of the caller's context, so they see its deadline
+        attempts: List["Future[Tuple[float, T]]"] = [executor.submit(contextvars.copy_context().run, self._timed, send)]
+        done, pending = wait(attempts, timeout=delay)
+        if not done and self._take_hedge():
+            attempts.append(executor.submit(contextvars.copy_context().run, self._timed, send))
+            pending.add(attempts[1])
+
+        error: Optional[BaseException] = None
+        while True:
+            for future in sorted(done, key=attempts.index):
+                if future.exception() is None:
+                    for loser in pending:
+                        loser.cancel()
+                    latency, result = future.result()
+                    self._finished(latency, hedge_won=future is not attempts[0])
+                    return result
+                error = error or future.exception()
+            if not pending:
+                raise error  # type: ignore[misc]
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+    async def run_async(self, send: Callable[[], Awaitable[T]]) -> T:
+        """
+        Async version of :meth:`run`; the losing attempt's task is cancelled.
+
+        Args:
+            send: Returns a new coroutine sending one attempt each time it is called
+        """
+
+        async def timed() -> Tuple[float, T]:
+            started = time.perf_counter()
+            result = await send()
+            return time.perf_counter() - started, result
+
+        delay = self._delay_for_next_request()
+        if delay is None:
+            latency, result = await timed()
+            self._finished(latency, hedge_won=False)
+            return result
+
+        attempts: List["asyncio.Future[Tuple[float, T]]"] = [asyncio.ensure_future(timed())]
+        try:
+            done, pending = await asyncio.wait(attempts, timeout=delay)
+            if not done and self._take_hedge():
+                attempts.append(asyncio.ensure_future(timed()))
+                pending.add(attempts[1])
+
+            error: Optional[BaseException] = None
+            while True:
+                for task in sorted(done, key=attempts.index):
+                    if task.exception() is None:
+                        latency, result = task.result()
+                        self._finished(latency, hedge_won=task is not attempts[0])
+                        return result
+                    error = error or task.exception()
+                if not pending:
+                    raise error  # type: ignore[misc]
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in attempts:
+                if not task.done():
+                    task.cancel()
+
+    def close(self) -> None:
+        """Shut down the sync client's worker threads."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def after_fork(self) -> None:
+        """Drop the parent's worker threads, which don't exist in a forked child."""
+        # A fresh lock, since another parent thread may have held the old one at fork time
+        self._lock = threading.Lock()
+        self._executor = None
+
+    def as_dict(self) -> Dict[str, Union[int, float, None]]:
+        """
+        Return a snapshot of the policy's counters.
+
+        Includes the current hedge ``delay`` in seconds (None while too few
+        latencies are known), and how many ``requests`` were eligible, how many
+        ``hedges`` were sent and how many of those answered first (``hedge_wins``).
+        """
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "hedges": self.hedges,
+                "hedge_wins": self.hedge_wins,
+                "delay": self.delay if self.delay is not None else self._hedge_delay,
+            }
+
+
+def create_hedging_policy(hedging: Union[bool, HedgingPolicy, None]) -> Optional[HedgingPolicy]:
+    """Resolve a client's ``hedging`` argument into a HedgingPolicy instance."""
+    if isinstance(hedging, HedgingPolicy):
+        return hedging
+    return HedgingPolicy() if hedging else None
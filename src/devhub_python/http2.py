@@ -0,0 +1,294 @@
+import io
+import threading
+from typing import Any, Dict, Mapping, Optional, Tuple, Union
+
+import requests
+import urllib3
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from urllib3.exceptions import MaxRetryError
+from urllib3.util.retry import Retry
+
+from .exceptions import DevoConfigurationException
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - exercised only without the optional dependency
+    httpx = None  # type: ignore[assignment]
+
+
+class HTTP2Stats:
+    """
+    Thread-safe connection and stream counters for the HTTP/2 transport.
+
+    Counters are fed from httpcore's ``trace`` request extension, so they
+    reflect what actually happened on the wire: how many TCP connections and
+    TLS handshakes were needed, and how many requests were multiplexed as
+    HTTP/2 streams over them.
+    """
+
+    # httpcore trace event -> counter name
+    EVENTS = {
+        "connection.connect_tcp.complete": "connections_opened",
+        "connection.start_tls.complete": "tls_handshakes",
+        "http2.send_connection_init.complete": "http2_connections",
+        "http2.send_request_headers.complete": "streams_opened",
+        "http11.send_request_headers.complete": "http11_requests",
+    }
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counters: Dict[str, int] = {name: 0 for name in self.EVENTS.values()}
+        self._counters["requests"] = 0
+
+    def trace(self, event_name: str, info: Mapping[str, Any]) -> None:
+        """Sync ``trace`` extension callback."""
+        counter = self.EVENTS.get(event_name)
+        if counter is not None:
+            self.increment(counter)
+
+    async def async_trace(self, event_name: str, info: Mapping[str, Any]) -> None:
+        """Async ``trace`` extension callback."""
+        self.trace(event_name, info)
+
+    def increment(self, counter: str, amount: int = 1) -> None:
+        """Increment a counter by ``amount``."""
+        with self._lock:
+            self._counters[counter] = self._counters.get(counter, 0) + amount
+
+    def reset(self) -> None:
+        """Zero every counter, e.g. in a forked child that inherited the parent's counts."""
+        # A fresh lock, since another parent thread may have held the old one at fork time
+        self._lock = threading.Lock()
+        self._counters = {name: 0 for name in self.EVENTS.values()}
+        self._counters["requests"] = 0
+
+    def as_dict(self) -> Dict[str, Union[int, float]]:
+        """
+        Return a snapshot of the counters.
+
+        Includes ``streams_per_connection``, the average number of HTTP/2
+        streams multiplexed over each HTTP/2 connection.
+        """
+        with self._lock:
+            snapshot: Dict[str, Union[int, float]] = dict(self._counters)
+
+        http2_connections = snapshot["http2_connections"]
+        snapshot["streams_per_connection"] = (
+            snapshot["streams_opened"] / http2_connections if http2_connections else 0.0
+        )
+        return snapshot
+
+
+def create_httpx_client(
+    http2: bool = True,
+    max_connections: Optional[int] = None,
+    async_client: bool = False,
+    **kwargs: Any,
+) -> Any:
+    """
+    Create an httpx client, raising a configuration error if dependencies are missing.
+
+    Args:
+        http2: Negotiate HTTP/2 via ALPN
+        max_connections: Maximum number of connections in the pool (optional)
+        async_client: Build an ``httpx.AsyncClient`` instead of an ``httpx.Client``
+        **kwargs: Extra keyword arguments for the httpx client
+
+    Returns:
+        httpx.Client or httpx.AsyncClient
+
+    Raises:
+        DevoConfigurationException: If httpx (or h2 for HTTP/2) is not installed
+    """
+    if httpx is None:
+        raise DevoConfigurationException(
+            "httpx is required for the HTTP/2 transport. Install it with: pip install devhub-python[http2]"
+        )
+
+    if max_connections is not None:
+        kwargs["limits"] = httpx.Limits(max_connections=max_connections)
+
+    client_class = httpx.AsyncClient if async_client else httpx.Client
+    try:
+        return client_class(http2=http2, **kwargs)
+    except ImportError as e:
+        raise DevoConfigurationException(
+            "The h2 package is required for HTTP/2. Install it with: pip install devhub-python[http2]",
+            original_exception=e,
+        )
+
+
+class _ResponseStream(io.RawIOBase):
+    """File-like view over a streaming httpx response, used as ``requests.Response.raw``."""
+
+    def __init__(self, response: Any):
+        self._response = response
+        self._chunks = response.iter_bytes()
+        self._buffer = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        while not self._buffer:
+            try:
+                self._buffer = next(self._chunks)
+            except StopIteration:
+                return 0
+        size = min(len(buffer), len(self._buffer))
+        buffer[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return size
+
+    def close(self) -> None:
+        self._response.close()
+        super().close()
+
+
+class HTTP2Adapter(BaseAdapter):
+    """
+    requests transport adapter that sends over a shared, multiplexing httpx client.
+
+    Mounted on a ``requests.Session``, it lets many concurrent requests share a
+    handful of HTTP/2 connections instead of opening one HTTP/1.1 connection
+    each, while the rest of the SDK keeps working with ``requests`` objects.
+    Applies the same urllib3 ``Retry`` policy as the default ``HTTPAdapter``.
+    """
+
+    def __init__(
+        self,
+        max_retries: Union[Retry, int, None] = 0,
+        max_connections: int = 10,
+        http_client: Optional[Any] = None,
+        stats: Optional[HTTP2Stats] = None,
+    ):
+        """
+        Initialize the adapter.
+
+        Args:
+            max_retries: urllib3 Retry policy or number of retries
+            max_connections: Maximum number of connections in the pool
+            http_client: Custom httpx.Client (optional)
+            stats: Counters to record into (optional)
+        """
+        super().__init__()
+        self.max_retries = max_retries if isinstance(max_retries, Retry) else Retry.from_int(max_retries)
+        self.stats = stats or HTTP2Stats()
+        self.max_connections = max_connections
+        self._owns_http_client = http_client is None
+        self.http_client = http_client or create_httpx_client(http2=True, max_connections=max_connections)
+
+    def send(
+        self,
+        request: requests.PreparedRequest,
+        stream: bool = False,
+        timeout: Union[None, float, Tuple[float, float], urllib3.Timeout] = None,
+        verify: Union[bool, str] = True,
+        cert: Optional[Any] = None,
+        proxies: Optional[Mapping[str, str]] = None,
+    ) -> requests.Response:
+        """Send a prepared request over the httpx client, retrying per ``max_retries``."""
+        retries = self.max_retries
+        method = (request.method or "GET").upper()
+
+        while True:
+            try:
+                httpx_response = self._send_once(request, timeout)
+            except httpx.TransportError as e:
+                retryable = isinstance(e, (httpx.ConnectError, httpx.ConnectTimeout)) or (
+                    method in (retries.allowed_methods or ())
+                )
+                if not retryable:
+                    raise self._translate_error(e, request)
+                try:
+                    retries = retries.increment(method, request.url, error=e)
+                except MaxRetryError:
+                    raise self._translate_error(e, request)
+                retries.sleep()
+                continue
+
+            has_retry_after = "Retry-After" in httpx_response.headers
+            if retries.is_retry(method, httpx_response.status_code, has_retry_after):
+                try:
+                    retries = retries.increment(method, request.url)
+                except MaxRetryError as e:
+                    httpx_response.close()
+                    raise requests.exceptions.RetryError(e, request=request)
+                httpx_response.close()
+                retries.sleep(httpx_response)
+                continue
+
+            return self.build_response(request, httpx_response, stream)
+
+    def _send_once(self, request: requests.PreparedRequest, timeout: Any) -> Any:
+        """Send a single attempt and return the streaming httpx response."""
+        if isinstance(timeout, urllib3.Timeout):
+            # Cloning starts a fresh attempt, which a deadline may cut short
+            timeout = timeout.clone()
+            httpx_timeout = httpx.Timeout(timeout.read_timeout, connect=timeout.connect_timeout)
+        elif isinstance(timeout, tuple):
+            connect, read = timeout
+            httpx_timeout = httpx.Timeout(read, connect=connect)
+        else:
+            httpx_timeout = httpx.Timeout(timeout)
+
+        httpx_request = self.http_client.build_request(
+            request.method or "GET",
+            request.url or "",
+            headers=dict(request.headers),
+            content=request.body,
+            timeout=httpx_timeout,
+            extensions={"trace": self.stats.trace},
+        )
+        self.stats.increment("requests")
+        return self.http_client.send(httpx_request, stream=True)
+
+    def build_response(self, request: requests.PreparedRequest, httpx_response: Any, stream: bool) -> requests.Response:
+        """Build a ``requests.Response`` from an httpx response."""
+        response = requests.Response()
+        response.status_code = httpx_response.status_code
+        response.headers = CaseInsensitiveDict(httpx_response.headers.multi_items())
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.reason = httpx_response.reason_phrase
+        response.url = request.url or ""
+        response.request = request
+        response.connection = self  # type: ignore[attr-defined]
+
+        if stream:
+            response.raw = _ResponseStream(httpx_response)
+        else:
+            try:
+                content = httpx_response.read()
+            finally:
+                httpx_response.close()
+            response.raw = io.BytesIO(content)
+        return response
+
+    @staticmethod
+    def _translate_error(error: Exception, request: requests.PreparedRequest) -> requests.exceptions.RequestException:
+        """Map an httpx exception onto the equivalent requests exception."""
+        if isinstance(error, httpx.ConnectTimeout):
+            return requests.exceptions.ConnectTimeout(error, request=request)
+        if isinstance(error, httpx.TimeoutException):
+            return requests.exceptions.ReadTimeout(error, request=request)
+        if isinstance(error, httpx.TransportError):
+            return requests.exceptions.ConnectionError(error, request=request)
+        return requests.exceptions.RequestException(error, request=request)
+
+    def after_fork(self) -> None:
+        """
+        Replace the httpx client a forked child inherited from its parent process.
+
+        The inherited client is dropped rather than closed: closing would send
+        GOAWAY frames on HTTP/2 connections the parent is still using. A custom
+        ``http_client`` is kept as is.
+        """
+        if self._owns_http_client:
+            self.http_client = create_httpx_client(http2=True, max_connections=self.max_connections)
+        self.stats.reset()
+
+    def close(self) -> None:
+        """Close the underlying httpx client."""
+        self.http_client.close()
@@ -0,0 +1,246 @@
+import base64
+import hashlib
+import json
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Dict, Mapping, Optional
+
+from .transport import TransportResponse
+
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+
+
+def generate_idempotency_key() -> str:
+    """Generate a new random idempotency key."""
+    return str(uuid.uuid4())
+
+
+class JournalEntry:
+    """
+    One logical send recorded in an :class:`IdempotencyJournal`.
+
+    ``status_code``, ``headers`` and ``content`` are filled in once a
+    successful response has been recorded.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        created: float,
+        status_code: Optional[int] = None,
+        headers: Optional[Dict[str, str]] = None,
+        content: Optional[bytes] = None,
+    ):
+        self.key = key
+        self.created = created
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.content = content
+
+    @property
+    def completed(self) -> bool:
+        """Whether a successful response has been recorded."""
+        return self.status_code is not None
+
+    def to_response(self, url: str = "") -> TransportResponse:
+        """Rebuild the recorded response, marked with ``replayed = True``."""
+        response = TransportResponse(
+            status_code=self.status_code or 0,
+            headers=self.headers,
+            content=self.content or b"",
+            url=url,
+        )
+        response.idempotency_key = self.key  # type: ignore[attr-defined]
+        response.replayed = True  # type: ignore[attr-defined]
+        return response
+
+    def to_dict(self, lookup: str) -> Dict[str, Any]:
+        """Serialize the entry as a journal file record."""
+        record: Dict[str, Any] = {"lookup": lookup, "key": self.key, "created": self.created}
+        if self.completed:
+            record["status_code"] = self.status_code
+            record["headers"] = self.headers
+            record["content"] = base64.b64encode(self.content or b"").decode("ascii")
+        return record
+
+    @classmethod
+    def from_dict(cls, record: Mapping[str, Any]) -> "JournalEntry":
+        """Deserialize a journal file record."""
+        content = record.get("content")
+        return cls(
+            key=record["key"],
+            created=record["created"],
+            status_code=record.get("status_code"),
+            headers=record.get("headers"),
+            content=base64.b64decode(content) if content is not None else None,
+        )
+
+
+class IdempotencyJournal:
+    """
+    Local record of logical sends, used to suppress duplicate deliveries.
+
+    Every POST and PATCH is looked up by its idempotency key or, when the
+    caller didn't pass one, by a fingerprint of the API key, method, URL and
+    body. A send seen within ``ttl`` seconds reuses the first attempt's
+    idempotency key, so the API can deduplicate it, and once a successful
+    response has been recorded that response is replayed without sending
+    anything. Retrying a send after a timeout or connection error is then
+    safe; sending an identical message twice on purpose within ``ttl``
+    needs two distinct idempotency keys.
+
+    With ``path``, entries are also appended to a JSON-lines file and
+    reloaded on start, so they survive a process restart. The file is
+    compacted to the unexpired entries when it is loaded, and again whenever
+    it has grown to ``COMPACT_RATIO`` times its size after the last
+    compaction, so it doesn't grow with every send. Since compacting replaces
+    the file, processes running at the same time need journal files of their own.
+
+    Example:
+        >>> journal = IdempotencyJournal(ttl=3600, path="sends.journal")
+        >>> client = DevoClient(api_key="your-api-key", idempotency_journal=journal, max_retries=10)
+    """
+
+    DEFAULT_TTL = 600.0
+    DEFAULT_MAX_ENTRIES = 100_000
+    # The journal file is rewritten once it holds this many times the records it was last compacted to,
+    # and at least COMPACT_MIN_RECORDS
+    COMPACT_RATIO = 2
+    COMPACT_MIN_RECORDS = 1000
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_TTL,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        path: Optional[str] = None,
+    ):
+        """
+        Initialize the journal.
+
+        Args:
+            ttl: Seconds during which a repeated send counts as a retry
+            max_entries: Maximum number of sends remembered; the least recently used are dropped
+            path: JSON-lines file to persist entries to (optional)
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.path = path
+        self.suppressed = 0
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, JournalEntry]" = OrderedDict()
+        # Records in the journal file, including expired and superseded ones, and how many it was last compacted to
+        self._records = 0
+        self._compacted_records = 0
+
+        if path is not None and os.path.exists(path):
+            self._load(path)
+            if self._records > len(self._entries):
+                self._compact()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def fingerprint(api_key: str, method: str, url: str, body: Optional[bytes]) -> str:
+        """
+        Identify a send by what it delivers.
+
+        Args:
+            api_key: API key the send is authenticated with
+            method: HTTP method
+            url: Full URL including the query string
+            body: Encoded request body
+
+        Returns:
+            str: Hex digest identifying the send
+        """
+        digest = hashlib.sha256()
+        for part in (api_key.encode(), method.upper().encode(), url.encode(), body or b""):
+            # Length-prefix each part so different splits can't collide
+            digest.update(len(part).to_bytes(8, "big"))
+            digest.update(part)
+        return digest.hexdigest()
+
+    def begin(self, lookup: str, key: Optional[str] = None) -> JournalEntry:
+        """
+        Start a logical send, or resume one seen within ``ttl``.
+
+        Args:
+            lookup: The caller's idempotency key, or the send's :meth:`fingerprint`
+            key: Idempotency key for a new entry (default: a random one)
+
+        Returns:
+            JournalEntry: The send's entry. If it is ``completed``, replay it instead of sending
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(lookup)
+            if entry is not None and now - entry.created <= self.ttl:
+                self._entries.move_to_end(lookup)
+                if entry.completed:
+                    self.suppressed += 1
+                return entry
+
+            entry = self._entries[lookup] = JournalEntry(key or generate_idempotency_key(), now)
+            self._entries.move_to_end(lookup)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self._append(lookup, entry)
+        return entry
+
+    def complete(self, lookup: str, entry: JournalEntry, response: Any) -> None:
+        """
+        Record the successful response to a send.
+
+        Args:
+            lookup: The lookup the entry was started with
+            entry: Entry returned by :meth:`begin`
+            response: Response with ``status_code``, ``headers`` and ``content``
+        """
+        with self._lock:
+            entry.status_code = response.status_code
+            entry.headers = dict(response.headers)
+            entry.content = response.content
+            self._append(lookup, entry)
+
+    def _append(self, lookup: str, entry: JournalEntry) -> None:
+        """Append an entry to the journal file, if there is one, compacting the file once it has grown."""
+        if self.path is not None:
+            with open(self.path, "a", encoding="utf-8") as journal_file:
+                journal_file.write(json.dumps(entry.to_dict(lookup)) + "\n")
+            self._records += 1
+            if self._records > max(self.COMPACT_MIN_RECORDS, self.COMPACT_RATIO * self._compacted_records):
+                self._compact()
+
+    def _compact(self) -> None:
+        """Drop expired entries and rewrite the journal file with the rest, replacing it in one step."""
+        now = time.time()
+        for lookup in [lookup for lookup, entry in self._entries.items() if now - entry.created > self.ttl]:
+            del self._entries[lookup]
+        temporary = f"{self.path}.tmp"
+        with open(temporary, "w", encoding="utf-8") as journal_file:
+            journal_file.writelines(json.dumps(entry.to_dict(lookup)) + "\n" for lookup, entry in self._entries.items())
+        os.replace(temporary, self.path)  # type: ignore[arg-type]
+        self._records = self._compacted_records = len(self._entries)
+
+    def _load(self, path: str) -> None:
+        """Load unexpired entries from a journal file; later records win."""
+        now = time.time()
+        with open(path, encoding="utf-8") as journal_file:
+            for line in journal_file:
+                self._records += 1
+                try:
+                    record = json.loads(line)
+                    entry = JournalEntry.from_dict(record)
+                except (ValueError, KeyError, TypeError):
+                    # Skip a record torn by a crash mid-write
+                    continue
+                if now - entry.created <= self.ttl:
+                    self._entries[record["lookup"]] = entry
+                    self._entries.move_to_end(record["lookup"])
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
@@ -0,0 +1,78 @@
+import threading
+from typing import Any, Dict, Optional
+
+
+class ClientMetrics:
+    """
+    Thread-safe request counters shared by everything using one client.
+
+    ``requests`` counts requests handed to the transport, ``errors`` counts
+    requests that failed without an HTTP response (timeouts, connection
+    errors), and ``status_codes`` counts responses by HTTP status code.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.total_latency = 0.0
+        self.status_codes: Dict[int, int] = {}
+        self.gauges: Dict[str, float] = {}
+
+    def reset(self) -> None:
+        """Zero every counter, e.g. in a forked child that inherited the parent's counts."""
+        # A fresh lock, since another parent thread may have held the old one at fork time
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.total_latency = 0.0
+        self.status_codes = {}
+        self.gauges = {}
+
+    def request_started(self) -> None:
+        """Record a request being handed to the transport."""
+        with self._lock:
+            self.requests += 1
+            self.in_flight += 1
+
+    def request_finished(self, status_code: Optional[int], latency: float) -> None:
+        """
+        Record a finished request.
+
+        Args:
+            status_code: HTTP status code, or None if the request failed without a response
+            latency: Seconds spent in the transport
+        """
+        with self._lock:
+            self.in_flight -= 1
+            self.total_latency += latency
+            if status_code is None:
+                self.errors += 1
+            else:
+                self.status_codes[status_code] = self.status_codes.get(status_code, 0) + 1
+
+    def set_gauge(self, name: str, value: float) -> None:
+        """Record the current value of a gauge, e.g. ``concurrency_limit``."""
+        with self._lock:
+            self.gauges[name] = value
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Return a snapshot of the counters.
+
+        Includes ``average_latency``, the mean seconds per finished request,
+        and the latest value of every gauge that has been set.
+        """
+        with self._lock:
+            finished = self.requests - self.in_flight
+            snapshot = {
+                "requests": self.requests,
+                "errors": self.errors,
+                "in_flight": self.in_flight,
+                "status_codes": dict(self.status_codes),
+                "average_latency": self.total_latency / finished if finished else 0.0,
+            }
+            snapshot.update(self.gauges)
+            return snapshot
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Any, Dict, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional
 
 from pydantic import BaseModel, Field
 
@@ -99,3 +99,11 @@ class Message(BaseModel):
     class Config:
         allow_population_by_field_name = True
         json_encoders = {datetime: lambda v: v.isoformat() if v else None}
+
+
+class MessageListResponse(BaseModel):
+    """
+    Envelope of a message list response.
+    """
+
+    messages: List[Message] = Field(default_factory=list, description="Messages matching the filters")
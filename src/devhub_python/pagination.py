@@ -0,0 +1,271 @@
+import asyncio
+import collections
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Iterator, Optional, Sequence, Tuple
+
+from .exceptions import DevoValidationException
+
+
+def page_items(page: Any, field: Optional[str] = None) -> Sequence[Any]:
+    """
+    Get the items of a page.
+
+    Args:
+        page: A page model or view, a decoded JSON array, or a decoded JSON object
+        field: Attribute of a page model that holds the items (e.g. ``"contacts"``)
+
+    Returns:
+        Sequence[Any]: The items; for a JSON object, its first array member
+    """
+    if field is not None and not isinstance(page, (list, dict)):
+        return getattr(page, field) or []
+    if isinstance(page, list):
+        return page
+    if isinstance(page, dict):
+        if field is not None and field in page:
+            return page[field] or []
+        return next((value for value in page.values() if isinstance(value, list)), [])
+    return page
+
+
+def _page_value(page: Any, name: str) -> Any:
+    if isinstance(page, dict):
+        return page.get(name)
+    if isinstance(page, list):
+        return None
+    return getattr(page, name, None)
+
+
+def has_more_pages(page: Any, items: Sequence[Any], page_number: int, page_size: int) -> bool:
+    """
+    Tell whether pages follow ``page``, the ``page_number``-th page of ``page_size`` items.
+
+    Stops on an empty or short page, and on the page's ``has_next``,
+    ``total_pages`` or ``total`` where the API returns them.
+    """
+    if len(items) < page_size:
+        return False
+    has_next = _page_value(page, "has_next")
+    if has_next is not None:
+        return bool(has_next)
+    total_pages = _page_value(page, "total_pages")
+    if total_pages is not None:
+        return page_number < total_pages
+    total = _page_value(page, "total")
+    if total is not None:
+        return page_number * page_size < total
+    return True
+
+
+def last_page(page: Any, page_size: int) -> Optional[int]:
+    """Get the number of the last page from a page's ``total_pages`` or ``total``, or None if it has neither."""
+    total_pages = _page_value(page, "total_pages")
+    if total_pages is not None:
+        return total_pages
+    total = _page_value(page, "total")
+    if total is not None:
+        return -(-total // page_size)
+    return None
+
+
+def _check(page_size: int, start_page: int, max_items: Optional[int], workers: int, read_ahead: Optional[int]) -> None:
+    if page_size < 1:
+        raise DevoValidationException("limit must be at least 1")
+    if start_page < 1:
+        raise DevoValidationException("start_page must be at least 1")
+    if max_items is not None and max_items < 0:
+        raise DevoValidationException("max_items must not be negative")
+    if workers < 1:
+        raise DevoValidationException("workers must be at least 1")
+    if read_ahead is not None and read_ahead < 1:
+        raise DevoValidationException("read_ahead must be at least 1")
+
+
+def _page_range(
+    page_size: int, start_page: int, max_items: Optional[int], first_page: Any, first_items: Sequence[Any]
+) -> Tuple[int, Optional[int]]:
+    """
+    Get the pages left to fetch after the first one, as ``(next page, last page)``.
+
+    The last page is None when the first page doesn't tell how many there are,
+    and the next page lies past the last one when nothing is left.
+    """
+    if not has_more_pages(first_page, first_items, start_page, page_size):
+        return start_page + 1, start_page
+    end = last_page(first_page, page_size)
+    if max_items is not None:
+        needed = start_page - 1 - (-max_items // page_size)
+        end = needed if end is None else min(end, needed)
+    return start_page + 1, end
+
+
+def paginate(
+    fetch: Callable[[int], Any],
+    page_size: int,
+    field: Optional[str] = None,
+    start_page: int = 1,
+    max_items: Optional[int] = None,
+    workers: int = 1,
+    read_ahead: Optional[int] = None,
+) -> Iterator[Any]:
+    """
+    Yield the items of consecutive pages.
+
+    With one worker, each page is fetched when the previous one runs out, so
+    only one page is held at a time. With more, the first page's
+    ``total_pages`` (or ``total``) tells which pages are left, and they are
+    fetched by that many threads at once. Up to ``read_ahead`` pages are
+    fetched ahead of the one being read; items are still yielded in order.
+    Without totals on the first page, the remaining pages are fetched one by one.
+
+    With more than one worker, ``fetch`` is called from several threads at
+    once, so it must be thread-safe: a :class:`DevoClient` it sends through
+    must be created with ``thread_safe=True`` or ``transport="urllib3"``.
+
+    Args:
+        fetch: Fetches a page by number, starting at 1
+        page_size: Items requested per page
+        field: Attribute of a page model that holds the items (see :func:`page_items`)
+        start_page: Page to start from, e.g. to resume an interrupted scan
+        max_items: Stop after this many items (optional)
+        workers: Pages fetched at once (default: 1)
+        read_ahead: Most pages fetched ahead of the one being read (default: twice ``workers``)
+
+    Yields:
+        The items, in order
+    """
+    _check(page_size, start_page, max_items, workers, read_ahead)
+    if max_items == 0:
+        return
+    remaining = max_items
+    pages = _pages(fetch, page_size, field, start_page, max_items, workers, read_ahead or 2 * workers)
+    try:
+        for items in pages:
+            for item in items[:remaining] if remaining is not None else items:
+                yield item
+            if remaining is not None:
+                remaining -= len(items)
+                if remaining <= 0:
+                    return
+    finally:
+        # Stops the prefetching threads when the caller stops early
+        pages.close()
+
+
+def _pages(
+    fetch: Callable[[int], Any],
+    page_size: int,
+    field: Optional[str],
+    start_page: int,
+    max_items: Optional[int],
+    workers: int,
+    read_ahead: int,
+) -> Iterator[Sequence[Any]]:
+    """Yield the items of each page, prefetching pages when ``workers`` is above 1."""
+    page = fetch(start_page)
+    items = page_items(page, field)
+    yield items
+    page_number, end = _page_range(page_size, start_page, max_items, page, items)
+
+    if workers == 1 or end is None:
+        while end is None or page_number <= end:
+            page = fetch(page_number)
+            items = page_items(page, field)
+            yield items
+            if not has_more_pages(page, items, page_number, page_size):
+                return
+            page_number += 1
+        return
+
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="devhub-prefetch")
+    pending: Deque[Any] = collections.deque()
+    try:
+        while page_number <= end or pending:
+            while page_number <= end and len(pending) < read_ahead:
+                # Pages are fetched in a copy of the caller's context, so they see its deadline
+                pending.append(executor.submit(contextvars.copy_context().run, fetch, page_number))
+                page_number += 1
+            items = page_items(pending.popleft().result(), field)
+            yield items
+            # A short page means the collection shrank since the first page was read
+            if len(items) < page_size:
+                return
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+async def paginate_async(
+    fetch: Callable[[int], Awaitable[Any]],
+    page_size: int,
+    field: Optional[str] = None,
+    start_page: int = 1,
+    max_items: Optional[int] = None,
+    workers: int = 1,
+    read_ahead: Optional[int] = None,
+) -> AsyncIterator[Any]:
+    """Yield the items of consecutive pages, fetching up to ``workers`` pages at once. See :func:`paginate`."""
+    _check(page_size, start_page, max_items, workers, read_ahead)
+    if max_items == 0:
+        return
+    remaining = max_items
+    pages = _pages_async(fetch, page_size, field, start_page, max_items, workers, read_ahead or 2 * workers)
+    try:
+        async for items in pages:
+            for item in items[:remaining] if remaining is not None else items:
+                yield item
+            if remaining is not None:
+                remaining -= len(items)
+                if remaining <= 0:
+                    return
+    finally:
+        await pages.aclose()  # type: ignore[attr-defined]
+
+
+async def _pages_async(
+    fetch: Callable[[int], Awaitable[Any]],
+    page_size: int,
+    field: Optional[str],
+    start_page: int,
+    max_items: Optional[int],
+    workers: int,
+    read_ahead: int,
+) -> AsyncIterator[Sequence[Any]]:
+    """Yield the items of each page, prefetching pages in tasks when ``workers`` is above 1."""
+    page = await fetch(start_page)
+    items = page_items(page, field)
+    yield items
+    page_number, end = _page_range(page_size, start_page, max_items, page, items)
+
+    if workers == 1 or end is None:
+        while end is None or page_number <= end:
+            page = await fetch(page_number)
+            items = page_items(page, field)
+            yield items
+            if not has_more_pages(page, items, page_number, page_size):
+                return
+            page_number += 1
+        return
+
+    slots = asyncio.Semaphore(workers)
+
+    async def fetch_in_slot(number: int) -> Any:
+        async with slots:
+            return await fetch(number)
+
+    pending: Deque["asyncio.Task[Any]"] = collections.deque()
+    try:
+        while page_number <= end or pending:
+            while page_number <= end and len(pending) < read_ahead:
+                pending.append(asyncio.ensure_future(fetch_in_slot(page_number)))
+                page_number += 1
+            items = page_items(await pending.popleft(), field)
+            yield items
+            if len(items) < page_size:
+                return
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
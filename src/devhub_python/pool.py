@@ -0,0 +1,371 @@
+import threading
+import time
+import weakref
+from typing import Any, Dict, Optional, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import HTTPError
+from urllib3.poolmanager import PoolManager
+
+from .exceptions import DevoConnectionException
+
+
+class ConnectionPoolStats:
+    """
+    Thread-safe connection counters shared by every host pool of a client.
+
+    ``created`` counts sockets opened (TCP connect plus TLS handshake for
+    HTTPS), ``discarded`` counts sockets closed, whether because they sat idle
+    too long, the pool was full, the server dropped them or the pool was
+    closed. ``in_use`` is the number of connections currently checked out.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.created = 0
+        self.discarded = 0
+        self.in_use = 0
+
+    def increment(self, counter: str, amount: int = 1) -> None:
+        """Increment a counter by ``amount``."""
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + amount)
+
+    def reset(self) -> None:
+        """Zero every counter, e.g. in a forked child that inherited the parent's counts."""
+        # A fresh lock, since another parent thread may have held the old one at fork time
+        self._lock = threading.Lock()
+        self.created = 0
+        self.discarded = 0
+        self.in_use = 0
+
+
+class _TrackedConnectionMixin:
+    """Reports socket opens and closes to the owning pool's stats."""
+
+    _devo_stats: Optional[ConnectionPoolStats] = None
+    _devo_released_at: Optional[float] = None
+
+    def connect(self) -> None:
+        super().connect()  # type: ignore[misc]
+        if self._devo_stats is not None:
+            self._devo_stats.increment("created")
+
+    def close(self) -> None:
+        was_open = getattr(self, "sock", None) is not None
+        super().close()  # type: ignore[misc]
+        if was_open and self._devo_stats is not None:
+            self._devo_stats.increment("discarded")
+
+
+class TrackedHTTPConnection(_TrackedConnectionMixin, HTTPConnection):
+    """HTTP connection that reports to :class:`ConnectionPoolStats`."""
+
+
+class TrackedHTTPSConnection(_TrackedConnectionMixin, HTTPSConnection):
+    """HTTPS connection that reports to :class:`ConnectionPoolStats`."""
+
+
+class _TrackedPoolMixin:
+    """Tracks checkouts and closes connections that sat idle longer than ``idle_timeout``."""
+
+    # Minimum seconds between sweeps of the whole pool for idle connections
+    REAP_INTERVAL = 1.0
+
+    _devo_stats: ConnectionPoolStats
+    idle_timeout: Optional[float] = None
+    _last_reap = 0.0
+
+    def _new_conn(self) -> Any:
+        conn = super()._new_conn()  # type: ignore[misc]
+        conn._devo_stats = self._devo_stats
+        return conn
+
+    def _get_conn(self, timeout: Optional[float] = None) -> Any:
+        if self.idle_timeout is not None and time.monotonic() - self._last_reap >= self.REAP_INTERVAL:
+            self.reap_idle()
+
+        conn = super()._get_conn(timeout)  # type: ignore[misc]
+        if self._is_stale(conn):
+            conn.close()
+            # The pool is LIFO, so every connection behind the most recently used one is stale too
+            self.reap_idle()
+        conn._devo_released_at = None
+        self._devo_stats.increment("in_use")
+        return conn
+
+    def _put_conn(self, conn: Any) -> None:
+        self._devo_stats.increment("in_use", -1)
+        if conn is not None:
+            conn._devo_released_at = time.monotonic()
+        super()._put_conn(conn)  # type: ignore[misc]
+
+    def _is_stale(self, conn: Any) -> bool:
+        """Whether an open connection has been idle longer than ``idle_timeout``."""
+        released_at = getattr(conn, "_devo_released_at", None)
+        return (
+            self.idle_timeout is not None
+            and released_at is not None
+            and getattr(conn, "sock", None) is not None
+            and time.monotonic() - released_at > self.idle_timeout
+        )
+
+    def idle_connections(self) -> int:
+        """Number of pooled connections with an open socket."""
+        pool = self.pool  # type: ignore[attr-defined]
+        if pool is None:
+            return 0
+        return sum(1 for conn in list(pool.queue) if conn is not None and getattr(conn, "sock", None) is not None)
+
+    def warm_up(self, n: int) -> int:
+        """
+        Open (and for HTTPS, TLS-handshake) up to ``n`` connections.
+
+        The number of connections is capped at the pool's ``maxsize``, since
+        extra connections would be discarded as soon as they were returned.
+
+        Args:
+            n: Number of connections to open
+
+        Returns:
+            int: Number of new connections opened
+
+        Raises:
+            DevoConnectionException: If a connection could not be established
+        """
+        pool = self.pool  # type: ignore[attr-defined]
+        n = min(n, pool.maxsize) if pool is not None else 0
+
+        conns = []
+        opened = 0
+        try:
+            for _ in range(n):
+                conn = self._get_conn()
+                conns.append(conn)
+                if getattr(conn, "sock", None) is None:
+                    conn.connect()
+                    opened += 1
+        except (HTTPError, OSError) as e:
+            raise DevoConnectionException(f"Failed to warm up connection pool: {str(e)}", original_exception=e)
+        finally:
+            for conn in conns:
+                self._put_conn(conn)
+        return opened
+
+    def reap_idle(self) -> int:
+        """
+        Close pooled connections that have been idle longer than ``idle_timeout``.
+
+        Closed connections stay in the pool and reconnect on their next use.
+
+        Returns:
+            int: Number of connections closed
+        """
+        self._last_reap = time.monotonic()
+        pool = self.pool  # type: ignore[attr-defined]
+        if pool is None:
+            return 0
+
+        reaped = 0
+        for conn in list(pool.queue):
+            if conn is not None and self._is_stale(conn):
+                conn.close()
+                reaped += 1
+        return reaped
+
+
+class TrackedHTTPConnectionPool(_TrackedPoolMixin, HTTPConnectionPool):
+    """HTTP connection pool with checkout tracking and idle reaping."""
+
+    ConnectionCls = TrackedHTTPConnection
+
+
+class TrackedHTTPSConnectionPool(_TrackedPoolMixin, HTTPSConnectionPool):
+    """HTTPS connection pool with checkout tracking and idle reaping."""
+
+    ConnectionCls = TrackedHTTPSConnection
+
+
+class TrackedPoolManager(PoolManager):
+    """
+    urllib3 PoolManager whose host pools report to one :class:`ConnectionPoolStats`.
+
+    Adds keep-alive idle reaping and the ability to pre-open connections.
+    """
+
+    def __init__(
+        self,
+        idle_timeout: Optional[float] = None,
+        stats: Optional[ConnectionPoolStats] = None,
+        **kwargs: Any,
+    ):
+        """
+        Initialize the pool manager.
+
+        Args:
+            idle_timeout: Close connections idle for longer than this many seconds
+                (optional, default: keep them open until the server closes them)
+            stats: Counters to record into, e.g. shared with other pool managers (optional)
+            **kwargs: Extra keyword arguments for ``urllib3.PoolManager``
+        """
+        super().__init__(**kwargs)
+        self.pool_classes_by_scheme = {"http": TrackedHTTPConnectionPool, "https": TrackedHTTPSConnectionPool}
+        self.idle_timeout = idle_timeout
+        self.stats = stats or ConnectionPoolStats()
+        self._tracked_pools: "weakref.WeakSet[Any]" = weakref.WeakSet()
+
+    def _new_pool(self, scheme: str, host: str, port: int, request_context: Optional[Dict[str, Any]] = None) -> Any:
+        pool = super()._new_pool(scheme, host, port, request_context=request_context)
+        pool._devo_stats = self.stats
+        pool.idle_timeout = self.idle_timeout
+        self._tracked_pools.add(pool)
+        return pool
+
+    def warm_up(self, url: str, n: int) -> int:
+        """
+        Open up to ``n`` connections to ``url``'s host.
+
+        Args:
+            url: URL on the host to connect to
+            n: Number of connections to open
+
+        Returns:
+            int: Number of new connections opened
+        """
+        return self.connection_from_url(url).warm_up(n)
+
+    def reap_idle(self) -> int:
+        """
+        Close connections idle for longer than ``idle_timeout`` in every host pool.
+
+        Returns:
+            int: Number of connections closed
+        """
+        return sum(pool.reap_idle() for pool in list(self._tracked_pools))
+
+    def idle_connections(self) -> int:
+        """Number of pooled connections with an open socket, across every host pool."""
+        return sum(pool.idle_connections() for pool in list(self._tracked_pools))
+
+    def pool_stats(self) -> Dict[str, int]:
+        """
+        Get a snapshot of the connection counters.
+
+        Returns:
+            Dict[str, int]: ``in_use``, ``idle``, ``created`` and ``discarded`` connections
+        """
+        return {
+            "in_use": self.stats.in_use,
+            "idle": self.idle_connections(),
+            "created": self.stats.created,
+            "discarded": self.stats.discarded,
+        }
+
+
+def reset_pool_manager_after_fork(pool_manager: PoolManager) -> None:
+    """
+    Drop every host pool a forked child inherited from its parent process.
+
+    Idle sockets are closed, which only releases the child's copy of the file
+    descriptor and sends nothing, so the parent's connections stay usable.
+    No pool locks are taken, since a lock another parent thread held at fork
+    time is never released in the child. New connections open on demand.
+
+    Args:
+        pool_manager: urllib3 PoolManager (or ProxyManager) to reset
+    """
+    pools = pool_manager.pools
+    for pool in list(pools._container.values()):
+        queue = getattr(pool, "pool", None)
+        for conn in list(queue.queue) if queue is not None else []:
+            sock = getattr(conn, "sock", None)
+            if sock is not None:
+                sock.close()
+                conn.sock = None
+
+    pool_manager.pools = type(pools)(pools._maxsize, dispose_func=pools.dispose_func)
+    if isinstance(pool_manager, TrackedPoolManager):
+        pool_manager._tracked_pools = weakref.WeakSet()
+
+
+def reset_adapter_after_fork(adapter: HTTPAdapter) -> None:
+    """
+    Drop the connections a requests adapter inherited from its parent process.
+
+    See :func:`reset_pool_manager_after_fork`.
+
+    Args:
+        adapter: requests HTTPAdapter to reset
+    """
+    reset_pool_manager_after_fork(adapter.poolmanager)
+    for proxy_manager in list(adapter.proxy_manager.values()):
+        reset_pool_manager_after_fork(proxy_manager)
+    adapter.proxy_manager = {}
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """requests adapter backed by a :class:`TrackedPoolManager`."""
+
+    __attrs__ = HTTPAdapter.__attrs__ + ["idle_timeout"]
+
+    def __init__(
+        self,
+        idle_timeout: Optional[float] = None,
+        stats: Optional[ConnectionPoolStats] = None,
+        **kwargs: Any,
+    ):
+        """
+        Initialize the adapter.
+
+        Args:
+            idle_timeout: Close connections idle for longer than this many seconds (optional)
+            stats: Counters to record into, e.g. shared with other adapters (optional)
+            **kwargs: Extra keyword arguments for ``requests.adapters.HTTPAdapter``
+        """
+        self.idle_timeout = idle_timeout
+        self.stats = stats
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, connections: int, maxsize: int, block: bool = False, **pool_kwargs: Any) -> None:
+        self._pool_connections = connections
+        self._pool_maxsize = maxsize
+        self._pool_block = block
+        self.poolmanager = TrackedPoolManager(
+            idle_timeout=self.idle_timeout,
+            stats=getattr(self, "stats", None),
+            num_pools=connections,
+            maxsize=maxsize,
+            block=block,
+            **pool_kwargs,
+        )
+
+    def warm_up(self, url: str, n: int, verify: Union[bool, str] = True, cert: Optional[Any] = None) -> int:
+        """
+        Open up to ``n`` connections in the host pool requests will use for ``url``.
+
+        Args:
+            url: URL on the host to connect to
+            n: Number of connections to open
+            verify: TLS verification setting requests would send with
+            cert: Client certificate requests would send with (optional)
+
+        Returns:
+            int: Number of new connections opened
+        """
+        request = requests.Request("GET", url).prepare()
+        if hasattr(self, "get_connection_with_tls_context"):
+            pool = self.get_connection_with_tls_context(request, verify, cert=cert)
+        else:  # pragma: no cover - requests < 2.32
+            pool = self.get_connection(url)
+        return pool.warm_up(n)
+
+    def idle_connections(self) -> int:
+        """Number of pooled connections with an open socket."""
+        return self.poolmanager.idle_connections()
+
+    def pool_stats(self) -> Dict[str, int]:
+        """Get a snapshot of the connection counters. See :meth:`TrackedPoolManager.pool_stats`."""
+        return self.poolmanager.pool_stats()
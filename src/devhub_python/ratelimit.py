@@ -0,0 +1,237 @@
+import asyncio
+import threading
+import time
+from typing import Dict, Mapping, Optional, Union
+
+from .exceptions import DevoTimeoutException
+
+# X-RateLimit-Reset values above this are Unix timestamps rather than seconds from now
+_EPOCH_THRESHOLD = 1_000_000_000
+
+
+def _parse_number(value: Optional[str]) -> Optional[float]:
+    """Parse a numeric header value, ignoring anything malformed."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        return None
+
+
+def parse_rate_limit_headers(headers: Mapping[str, str]) -> Dict[str, Optional[float]]:
+    """
+    Read the rate limit headers of a response.
+
+    Args:
+        headers: Case-insensitive response headers
+
+    Returns:
+        Dict[str, Optional[float]]: ``limit``, ``remaining``, ``reset`` (seconds from
+        now until the window resets) and ``retry_after``; None when not sent
+    """
+    reset = _parse_number(headers.get("X-RateLimit-Reset"))
+    if reset is not None and reset > _EPOCH_THRESHOLD:
+        reset = max(reset - time.time(), 0.0)
+    return {
+        "limit": _parse_number(headers.get("X-RateLimit-Limit")),
+        "remaining": _parse_number(headers.get("X-RateLimit-Remaining")),
+        "reset": reset,
+        "retry_after": _parse_number(headers.get("Retry-After")),
+    }
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket that paces requests to the account's rate limit.
+
+    The limiter learns the budget from every response. ``X-RateLimit-Limit``
+    requests per ``window`` seconds set the bucket's refill rate and burst
+    size, so bulk sends are spread evenly instead of bursting into a 429.
+    When the API also reports ``X-RateLimit-Remaining`` and
+    ``X-RateLimit-Reset``, the limiter counts the requests left in the
+    current window (minus those still in flight) and defers anything beyond
+    them to the next window. A 429's ``Retry-After`` holds all requests.
+    Until the first rate limit headers arrive, requests are only paced by an
+    explicit ``rate``.
+
+    One limiter is shared by every resource of a client; share one instance
+    between clients that use the same API key.
+    """
+
+    def __init__(self, window: float = 1.0, rate: Optional[float] = None, burst: Optional[int] = None):
+        """
+        Initialize the limiter.
+
+        Args:
+            window: Seconds that ``X-RateLimit-Limit`` applies to
+            rate: Requests per second to allow before the API reports a limit (optional,
+                default: unlimited)
+            burst: Maximum number of requests sent back to back (optional, default:
+                the reported limit)
+        """
+        self.window = window
+        self.burst = burst
+        self.limit: Optional[float] = None
+        self.rate = rate
+        self.capacity = float(burst or max(rate or 1.0, 1.0))
+        self.tokens = self.capacity
+        self.in_flight = 0
+        self.throttled = 0
+        self.total_wait = 0.0
+        self._updated_at = time.monotonic()
+        self._blocked_until = 0.0
+        # Server window accounting, once the API reports remaining requests and a reset time
+        self._reset_at: Optional[float] = None
+        self._window_left = 0.0
+        self._deferred = 0
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take a token and return how long to wait before sending."""
+        with self._lock:
+            now = time.monotonic()
+            self.in_flight += 1
+            send_at = max(now, self._blocked_until)
+
+            if self.rate is not None:
+                self.tokens = min(self.capacity, self.tokens + (now - self._updated_at) * self.rate)
+                self._updated_at = now
+                self.tokens -= 1
+                send_at = max(send_at, now - self.tokens / self.rate)
+
+            if self._reset_at is not None and self.limit:
+                per_window = max(int(self.limit), 1)
+                if now >= self._reset_at:
+                    # Roll over the windows that have ended; deferred requests use up the new ones first
+                    passed = int((now - self._reset_at) // self.window) + 1
+                    self._reset_at += passed * self.window
+                    self._deferred = max(self._deferred - per_window * (passed - 1), 0)
+                    self._window_left = per_window - min(self._deferred, per_window)
+                    self._deferred = max(self._deferred - per_window, 0)
+
+                if send_at < self._reset_at and self._window_left >= 1:
+                    self._window_left -= 1
+                else:
+                    windows_ahead = self._deferred // per_window
+                    send_at = max(send_at, self._reset_at + windows_ahead * self.window)
+                    self._deferred += 1
+
+            wait = send_at - now
+            if wait > 0:
+                self.throttled += 1
+                self.total_wait += wait
+            return wait
+
+    def _reserve_within(self, timeout: Optional[float]) -> float:
+        """Reserve a slot, failing at once if the wait would outlast ``timeout``."""
+        wait = self._reserve()
+        if timeout is not None and wait > timeout:
+            # The slot stays used up, which only makes the limiter more careful
+            self.update(None)
+            raise DevoTimeoutException(timeout)
+        return wait
+
+    def acquire(self, timeout: Optional[float] = None) -> float:
+        """
+        Wait until a request may be sent.
+
+        Every call that returns must be followed by :meth:`update` once the request finishes.
+
+        Args:
+            timeout: Most seconds to wait (optional, default: as long as it takes)
+
+        Returns:
+            float: Seconds waited
+
+        Raises:
+            DevoTimeoutException: If the request couldn't be sent within ``timeout``
+        """
+        wait = self._reserve_within(timeout)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, timeout: Optional[float] = None) -> float:
+        """Async version of :meth:`acquire` that waits without blocking the event loop."""
+        wait = self._reserve_within(timeout)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def update(self, headers: Optional[Mapping[str, str]] = None, status_code: Optional[int] = None) -> None:
+        """
+        Finish a request and learn from its response.
+
+        Args:
+            headers: Response headers, or None if the request failed without a response
+            status_code: Response status code (optional)
+        """
+        info = parse_rate_limit_headers(headers) if headers is not None else {}
+        with self._lock:
+            now = time.monotonic()
+            self.in_flight = max(self.in_flight - 1, 0)
+
+            limit = info.get("limit")
+            if limit:
+                if self.rate is None:
+                    # First budget learned: start with a full bucket, trimmed below
+                    self.tokens = limit
+                    self._updated_at = now
+                self.limit = limit
+                self.rate = limit / self.window
+                self.capacity = float(self.burst or limit)
+
+            remaining = info.get("remaining")
+            reset = info.get("reset")
+            if remaining is not None and self.rate is not None:
+                # Requests still in flight may not be counted in ``remaining`` yet
+                left = remaining - self.in_flight
+                self.tokens = min(self.tokens, left)
+                if reset is not None:
+                    reset_at = now + reset
+                    if self._reset_at is None or reset_at > self._reset_at + self.window / 2:
+                        # The server moved on to a new window; requests deferred to it are in flight
+                        self._reset_at = reset_at
+                        self._window_left = left
+                        self._deferred = 0
+                    else:
+                        self._window_left = min(self._window_left, left)
+                elif remaining == 0:
+                    self._blocked_until = max(self._blocked_until, now + self.window)
+
+            if status_code == 429:
+                retry_after = info.get("retry_after")
+                self._blocked_until = max(self._blocked_until, now + (retry_after or reset or self.window))
+                self.tokens = min(self.tokens, 0.0)
+                self._window_left = 0.0
+
+    def after_fork(self) -> None:
+        """Forget requests that were in flight in the parent process when it forked."""
+        # A fresh lock, since another parent thread may have held the old one at fork time
+        self._lock = threading.Lock()
+        self.in_flight = 0
+
+    def as_dict(self) -> Dict[str, Union[int, float, None]]:
+        """
+        Return a snapshot of the limiter's state.
+
+        Includes the learned ``limit`` and ``rate``, and how many requests were
+        ``throttled`` for a ``total_wait`` of how many seconds.
+        """
+        with self._lock:
+            return {
+                "limit": self.limit,
+                "rate": self.rate,
+                "tokens": self.tokens,
+                "in_flight": self.in_flight,
+                "throttled": self.throttled,
+                "total_wait": self.total_wait,
+            }
+
+
+def create_rate_limiter(rate_limiter: Union[bool, RateLimiter, None]) -> Optional[RateLimiter]:
+    """Resolve a client's ``rate_limiter`` argument into a RateLimiter instance."""
+    if isinstance(rate_limiter, RateLimiter):
+        return rate_limiter
+    return RateLimiter() if rate_limiter else None
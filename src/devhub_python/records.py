@@ -0,0 +1,105 @@
+import collections
+import functools
+import importlib
+from typing import Any, Dict, Iterable, List, Tuple, Type, TypeVar
+
+from pydantic import BaseModel
+from pydantic_core import PydanticUndefined
+
+M = TypeVar("M", bound=BaseModel)
+R = TypeVar("R", bound="Record")
+
+# Public record types, by name: (module under devhub_python.models, model class)
+RECORD_TYPES = {
+    "ContactRecord": ("contacts", "ContactSerializer"),
+    "MessageRecord": ("messages", "Message"),
+    "ContactsGroupRecord": ("contact_groups", "ContactsGroup"),
+    "WhatsAppTemplateRecord": ("whatsapp", "WhatsAppTemplate"),
+    "RcsMessageRecord": ("rcs", "RcsSendMessageSerializer"),
+}
+
+
+class Record:
+    """
+    Compact, read-only record of one API object.
+
+    Records are named tuples with one item per field of their model, so a
+    record costs a few hundred bytes less than a model instance, which keeps
+    its fields in a dict and tracks which were set. Use them to hold large
+    numbers of objects, e.g. when mirroring contacts or messages.
+
+    Values are kept as decoded from JSON, without validation: timestamps stay
+    ISO strings and nested objects stay dicts. Missing fields hold their
+    model default, or None. Call :meth:`to_model` for the full model.
+    """
+
+    __slots__ = ()
+
+    # Set on each record type
+    _model: Type[BaseModel]
+    _keys: Tuple[str, ...]
+    _defaults: Tuple[Any, ...]
+
+    @classmethod
+    def from_dict(cls: Type[R], data: Dict[str, Any]) -> R:
+        """Build a record from a decoded JSON object."""
+        return tuple.__new__(cls, map(data.get, cls._keys, cls._defaults))  # type: ignore[arg-type]
+
+    @classmethod
+    def from_list(cls: Type[R], items: Iterable[Dict[str, Any]]) -> List[R]:
+        """Build records from a decoded JSON array of objects."""
+        keys, defaults = cls._keys, cls._defaults
+        return [tuple.__new__(cls, map(item.get, keys, defaults)) for item in items]  # type: ignore[misc]
+
+    def to_model(self) -> Any:
+        """Validate the record into its full model."""
+        return self._model.model_validate(dict(zip(self._keys, self)))  # type: ignore[arg-type]
+
+
+@functools.lru_cache(maxsize=None)
+def record_type(model_class: Type[BaseModel]) -> Type[Record]:
+    """
+    Get the record type of a model, with the model's fields in order.
+
+    The types listed in :data:`RECORD_TYPES` get their public names, e.g.
+    ``ContactRecord`` for ``ContactSerializer``; others are named after the
+    model, e.g. ``SMSMessageRecord``.
+    """
+    name = f"{model_class.__name__}Record"
+    for record_name, (_, model_name) in RECORD_TYPES.items():
+        if model_name == model_class.__name__:
+            name = record_name
+    fields = model_class.model_fields
+    keys = tuple(field.alias or field_name for field_name, field in fields.items())
+    defaults = tuple(
+        None if field.default is PydanticUndefined or field.default_factory is not None else field.default
+        for field in fields.values()
+    )
+    namespace = {"__slots__": (), "_model": model_class, "_keys": keys, "_defaults": defaults}
+    base = collections.namedtuple(name, list(fields))  # type: ignore[misc]
+    record_class = type(name, (Record, base), namespace)
+    record_class.__module__ = __name__
+    return record_class
+
+
+def records(model_class: Type[M], items: Iterable[Dict[str, Any]]) -> List[Any]:
+    """Build records of ``model_class`` from a decoded JSON array of objects."""
+    return record_type(model_class).from_list(items)
+
+
+def records_page(page_class: Type[M], items_field: str, item_model: Type[BaseModel], data: Dict[str, Any]) -> M:
+    """
+    Build a page model whose items are records instead of item models.
+
+    The page's other fields (total, page, ...) are taken as decoded, without validation.
+    """
+    return page_class.model_construct(**{**data, items_field: records(item_model, data.get(items_field) or [])})
+
+
+def __getattr__(name: str) -> Type[Record]:
+    # The record types are created on first use, so importing this module doesn't import every model
+    if name not in RECORD_TYPES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, model_name = RECORD_TYPES[name]
+    module = importlib.import_module(f".models.{module_name}", __package__)
+    return record_type(getattr(module, model_name))
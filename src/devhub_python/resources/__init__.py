@@ -1,10 +1,10 @@
-from .contact_groups import ContactGroupsResource
-from .contacts import ContactsResource
-from .email import EmailResource
-from .messages import MessagesResource
-from .rcs import RCSResource
-from .sms import SMSResource
-from .whatsapp import WhatsAppResource
+from .contact_groups import AsyncContactGroupsResource, ContactGroupsResource
+from .contacts import AsyncContactsResource, ContactsResource
+from .email import AsyncEmailResource, EmailResource
+from .messages import AsyncMessagesResource, MessagesResource
+from .rcs import AsyncRCSResource, RCSResource
+from .sms import AsyncSMSResource, SMSResource
+from .whatsapp import AsyncWhatsAppResource, WhatsAppResource
 
 __all__ = [
     "SMSResource",
@@ -14,4 +14,12 @@ __all__ = [
     "ContactsResource",
     "ContactGroupsResource",
     "MessagesResource",
+    # Async resources
+    "AsyncSMSResource",
+    "AsyncEmailResource",
+    "AsyncWhatsAppResource",
+    "AsyncRCSResource",
+    "AsyncContactsResource",
+    "AsyncContactGroupsResource",
+    "AsyncMessagesResource",
 ]
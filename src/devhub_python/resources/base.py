@@ -1,7 +1,13 @@
 from abc import ABC
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Dict, Optional, Type
+
+from pydantic import BaseModel
+
+from ..exceptions import DevoConfigurationException
+from ..streaming import AsyncItemStream, ItemStream, item_converter
 
 if TYPE_CHECKING:
+    from ..async_client import AsyncDevoClient
     from ..client import DevoClient
 
 
@@ -28,3 +34,74 @@ class BaseResource(ABC):
             str: The joined path
         """
         return "/".join(str(part).strip("/") for part in path_parts if part)
+
+    def _check_workers(self, workers: int) -> None:
+        """
+        Make sure the client can fetch ``workers`` pages at once from as many threads.
+
+        Args:
+            workers: Pages fetched at once
+
+        Raises:
+            DevoConfigurationException: If ``workers`` is above 1 and the client's transport
+                can't be shared across threads
+        """
+        if workers > 1 and not getattr(self.client.transport, "thread_safe", True):
+            raise DevoConfigurationException(
+                f"workers={workers} fetches pages from several threads, which can't share one requests session; "
+                "create the client with thread_safe=True or transport='urllib3'"
+            )
+
+    def _stream_list(
+        self,
+        path: str,
+        params: Dict[str, Any],
+        model_class: Type[BaseModel],
+        items_key: Optional[str] = None,
+        lazy: bool = False,
+        records: bool = False,
+    ) -> ItemStream[Any]:
+        """
+        GET a list endpoint and stream its items as the response downloads.
+
+        Args:
+            path: API endpoint path
+            params: Query parameters
+            model_class: Model of each item
+            items_key: Member of a response object that holds the items (None for an array)
+            lazy: Yield :class:`RecordView` objects instead of models
+            records: Yield compact :class:`Record` tuples instead of models
+
+        Returns:
+            ItemStream: The items, parsed one at a time
+        """
+        response = self.client.get(path, params=params, stream=True)
+        return ItemStream(response, item_converter(model_class, lazy=lazy, records=records), items_key)
+
+
+class AsyncBaseResource(BaseResource):
+    """Base class for all async API resources."""
+
+    client: "AsyncDevoClient"
+
+    def __init__(self, client: "AsyncDevoClient"):
+        """
+        Initialize the resource.
+
+        Args:
+            client: The async Devo client instance
+        """
+        self.client = client
+
+    async def _stream_list(  # type: ignore[override]
+        self,
+        path: str,
+        params: Dict[str, Any],
+        model_class: Type[BaseModel],
+        items_key: Optional[str] = None,
+        lazy: bool = False,
+        records: bool = False,
+    ) -> AsyncItemStream[Any]:
+        """GET a list endpoint and stream its items as the response downloads. See :meth:`BaseResource._stream_list`."""
+        response = await self.client.get(path, params=params, stream=True)
+        return AsyncItemStream(response, item_converter(model_class, lazy=lazy, records=records), items_key)
@@ -1,7 +1,9 @@
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, Any, AsyncIterator, Iterator, List, Optional
 
+from ..pagination import paginate, paginate_async
+from ..records import records_page
 from ..utils import validate_required_string, validate_response
-from .base import BaseResource
+from .base import AsyncBaseResource, BaseResource
 
 if TYPE_CHECKING:
     from ..models.contact_groups import (
@@ -27,6 +29,7 @@ class ContactGroupsResource(BaseResource):
         limit: Optional[int] = None,
         search: Optional[str] = None,
         search_fields: Optional[List[str]] = None,
+        records: bool = False,
     ) -> "ContactsGroupListResponse":
         """
         Get contact groups by user ID with pagination and search.
@@ -36,6 +39,8 @@ class ContactGroupsResource(BaseResource):
             limit: Number of items per page
             search: Search term to filter groups
             search_fields: Fields to search in
+            records: Fill the page with compact, read-only :class:`ContactsGroupRecord`
+                tuples instead of models
 
         Returns:
             ContactsGroupListResponse with groups and pagination info
@@ -55,10 +60,50 @@ class ContactGroupsResource(BaseResource):
 
         response = self.client.get("contacts-groups", params=params)
 
-        from ..models.contact_groups import ContactsGroupListResponse
+        from ..models.contact_groups import ContactsGroup, ContactsGroupListResponse
 
+        if records:
+            return records_page(ContactsGroupListResponse, "groups", ContactsGroup, response.json())
         return validate_response(response, ContactsGroupListResponse)
 
+    def iter_groups(
+        self,
+        limit: int = 50,
+        start_page: int = 1,
+        max_items: Optional[int] = None,
+        workers: int = 1,
+        read_ahead: Optional[int] = None,
+        records: bool = False,
+        **filters: Any,
+    ) -> Iterator["ContactsGroup"]:
+        """
+        Iterate over every contact group matching the filters, page by page.
+
+        Args:
+            limit: Number of groups per page
+            start_page: Page to start from, e.g. to resume an interrupted scan
+            max_items: Stop after this many groups (optional)
+            workers: Pages fetched at once; above 1, the pages after the first are
+                fetched in parallel threads and still yielded in order, which needs a
+                client created with ``thread_safe=True`` or ``transport="urllib3"`` (default: 1)
+            read_ahead: Most pages fetched ahead of the one being read (default: twice ``workers``)
+            records: Yield compact, read-only :class:`ContactsGroupRecord` tuples instead of models
+            **filters: Filters of :meth:`list`, e.g. ``search``
+
+        Yields:
+            ContactsGroup: The groups, in order
+        """
+        self._check_workers(workers)
+        return paginate(
+            lambda page: self.list(page=page, limit=limit, records=records, **filters),
+            limit,
+            "groups",
+            start_page,
+            max_items,
+            workers=workers,
+            read_ahead=read_ahead,
+        )
+
     def create(self, data: "CreateContactsGroupDto") -> "ContactsGroup":
         """
         Create a new contact group.
@@ -222,3 +267,124 @@ class ContactGroupsResource(BaseResource):
             )
         """
         return self.list(page=page, limit=limit, search=query, search_fields=fields)
+
+
+class AsyncContactGroupsResource(AsyncBaseResource):
+    """
+    Async contact groups resource for managing contact group operations.
+
+    Provides the same operations as :class:`ContactGroupsResource` as coroutines.
+    """
+
+    async def list(
+        self,
+        page: Optional[int] = None,
+        limit: Optional[int] = None,
+        search: Optional[str] = None,
+        search_fields: Optional[List[str]] = None,
+        records: bool = False,
+    ) -> "ContactsGroupListResponse":
+        """Get contact groups with pagination and search. See :meth:`ContactGroupsResource.list`."""
+        params = {}
+        if page is not None:
+            params["page"] = page
+        if limit is not None:
+            params["limit"] = limit
+        if search:
+            params["search"] = search
+        if search_fields:
+            params["search_fields"] = search_fields
+
+        response = await self.client.get("contacts-groups", params=params)
+
+        from ..models.contact_groups import ContactsGroup, ContactsGroupListResponse
+
+        if records:
+            return records_page(ContactsGroupListResponse, "groups", ContactsGroup, response.json())
+        return validate_response(response, ContactsGroupListResponse)
+
+    def iter_groups(
+        self,
+        limit: int = 50,
+        start_page: int = 1,
+        max_items: Optional[int] = None,
+        workers: int = 1,
+        read_ahead: Optional[int] = None,
+        records: bool = False,
+        **filters: Any,
+    ) -> AsyncIterator["ContactsGroup"]:
+        """Iterate over every contact group matching the filters. See :meth:`ContactGroupsResource.iter_groups`."""
+        return paginate_async(
+            lambda page: self.list(page=page, limit=limit, records=records, **filters),
+            limit,
+            "groups",
+            start_page,
+            max_items,
+            workers=workers,
+            read_ahead=read_ahead,
+        )
+
+    async def create(self, data: "CreateContactsGroupDto") -> "ContactsGroup":
+        """Create a new contact group."""
+        response = await self.client.post("contacts-groups", data=data.model_dump(exclude_none=True))
+
+        from ..models.contact_groups import ContactsGroup
+
+        return validate_response(response, ContactsGroup)
+
+    async def update(self, group_id: str, data: "UpdateContactsGroupDto") -> "ContactsGroup":
+        """Update an existing contact group."""
+        group_id = validate_required_string(group_id, "group_id")
+        response = await self.client.put(f"contacts-groups/{group_id}", data=data.model_dump(exclude_none=True))
+
+        from ..models.contact_groups import ContactsGroup
+
+        return validate_response(response, ContactsGroup)
+
+    async def delete_by_id(self, group_id: str, approve: Optional[str] = None) -> "ContactsGroup":
+        """Delete a single contact group by ID."""
+        group_id = validate_required_string(group_id, "group_id")
+        params = {}
+        if approve:
+            params["approve"] = approve
+
+        response = await self.client.delete(f"contacts-groups/{group_id}", params=params)
+
+        from ..models.contact_groups import ContactsGroup
+
+        return validate_response(response, ContactsGroup)
+
+    async def delete_bulk(self, data: "DeleteContactsGroupsDto", approve: Optional[str] = None) -> "ContactsGroup":
+        """Delete multiple contact groups in bulk."""
+        params = {}
+        if approve:
+            params["approve"] = approve
+
+        response = await self.client.delete(
+            "contacts-groups",
+            params=params,
+            data=data.model_dump(exclude_none=True),
+        )
+
+        from ..models.contact_groups import ContactsGroup
+
+        return validate_response(response, ContactsGroup)
+
+    async def get_by_id(self, group_id: str) -> "ContactsGroup":
+        """Get a specific contact group by ID."""
+        group_id = validate_required_string(group_id, "group_id")
+        response = await self.client.get(f"contacts-groups/{group_id}")
+
+        from ..models.contact_groups import ContactsGroup
+
+        return validate_response(response, ContactsGroup)
+
+    async def search(
+        self,
+        query: str,
+        fields: Optional[List[str]] = None,
+        page: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> "ContactsGroupListResponse":
+        """Search contact groups with specific criteria."""
+        return await self.list(page=page, limit=limit, search=query, search_fields=fields)
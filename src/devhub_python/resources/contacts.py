@@ -1,7 +1,20 @@
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
-
-from ..utils import validate_required_string
-from .base import BaseResource
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Union
+
+from ..export import (
+    CUSTOM_FIELD_PREFIX,
+    ExportCheckpoint,
+    ExportProgress,
+    export_format,
+    export_pages,
+    export_pages_async,
+    model_columns,
+)
+from ..pagination import paginate, paginate_async
+from ..records import records_page
+from ..streaming import AsyncItemStream, ItemStream
+from ..utils import parse_response, validate_required_string
+from ..views import RecordView
+from .base import AsyncBaseResource, BaseResource
 
 if TYPE_CHECKING:
     from ..models.contacts import (
@@ -21,6 +34,11 @@ if TYPE_CHECKING:
     )
 
 
+def _resuming(path: str, checkpoint_path: Optional[str]) -> bool:
+    """Tell whether an export to ``path`` has a checkpoint to resume from."""
+    return ExportCheckpoint(checkpoint_path or f"{path}.checkpoint").started
+
+
 class ContactsResource(BaseResource):
     """
     Contacts resource for managing contact information and custom fields.
@@ -49,7 +67,10 @@ class ContactsResource(BaseResource):
         is_mms_subscribed: Optional[bool] = None,
         is_rcs_subscribed: Optional[bool] = None,
         tags: Optional[List[str]] = None,
-    ) -> "GetContactsSerializer":
+        lazy: bool = False,
+        records: bool = False,
+        stream: bool = False,
+    ) -> Union["GetContactsSerializer", "RecordView[GetContactsSerializer]", "ItemStream[ContactSerializer]"]:
         """
         List contacts with advanced filtering options.
 
@@ -66,6 +87,13 @@ class ContactsResource(BaseResource):
             is_mms_subscribed: Filter by MMS subscription status
             is_rcs_subscribed: Filter by RCS subscription status
             tags: Filter by tags
+            lazy: Return a :class:`RecordView` of the page that parses contacts and
+                their fields only when they are read, instead of validating them all
+            records: Fill the page with compact, read-only :class:`ContactRecord` tuples
+                instead of models
+            stream: Return an :class:`ItemStream` that yields the contacts while the page
+                downloads, instead of the whole page; ``lazy`` and ``records`` choose what
+                it yields, and the page's ``total`` ends up in its ``rest``
 
         Returns:
             GetContactsSerializer: Paginated list of contacts
@@ -93,11 +121,121 @@ class ContactsResource(BaseResource):
         if tags:
             params["tags"] = tags
 
+        from ..models.contacts import ContactSerializer, GetContactsSerializer
+
+        if stream:
+            return self._stream_list("user-api/contacts", params, ContactSerializer, "contacts", lazy, records)
         response = self.client.get("user-api/contacts", params=params)
 
-        from ..models.contacts import GetContactsSerializer
+        if lazy:
+            return RecordView(GetContactsSerializer, response.json())
+        if records:
+            return records_page(GetContactsSerializer, "contacts", ContactSerializer, response.json())
+        return parse_response(response, GetContactsSerializer)
+
+    def iter_contacts(
+        self,
+        limit: int = 50,
+        start_page: int = 1,
+        max_items: Optional[int] = None,
+        workers: int = 1,
+        read_ahead: Optional[int] = None,
+        lazy: bool = False,
+        records: bool = False,
+        **filters: Any,
+    ) -> Iterator["ContactSerializer"]:
+        """
+        Iterate over every contact matching the filters, page by page.
 
-        return GetContactsSerializer.model_validate(response.json())
+        Stops after the last page, as told by ``total_pages``, ``total`` or a short page.
+
+        Args:
+            limit: Number of contacts per page
+            start_page: Page to start from, e.g. to resume an interrupted scan
+            max_items: Stop after this many contacts (optional)
+            workers: Pages fetched at once; above 1, the pages after the first are
+                fetched in parallel threads and still yielded in order, which needs a
+                client created with ``thread_safe=True`` or ``transport="urllib3"`` (default: 1)
+            read_ahead: Most pages fetched ahead of the one being read (default: twice ``workers``)
+            lazy: Yield :class:`RecordView` objects instead of models
+            records: Yield compact, read-only :class:`ContactRecord` tuples instead of models
+            **filters: Filters of :meth:`list`, e.g. ``tags=["vip"]``
+
+        Yields:
+            ContactSerializer: The contacts, in order
+
+        Example:
+            >>> for contact in client.contacts.iter_contacts(is_sms_subscribed=True):
+            ...     print(contact.phone_number)
+        """
+        self._check_workers(workers)
+        return paginate(
+            lambda page: self.list(page=page, limit=limit, lazy=lazy, records=records, **filters),
+            limit,
+            "contacts",
+            start_page,
+            max_items,
+            workers=workers,
+            read_ahead=read_ahead,
+        )
+
+    def export(
+        self,
+        path: str,
+        format: Optional[str] = None,
+        limit: int = 100,
+        columns: Optional[List[str]] = None,
+        checkpoint_path: Optional[str] = None,
+        on_progress: Optional[Callable[[ExportProgress], Any]] = None,
+        fsync: bool = False,
+        **filters: Any,
+    ) -> ExportProgress:
+        """
+        Export every contact matching the filters to a CSV or NDJSON file, resuming an interrupted export.
+
+        Contacts are written page by page as the API returns them, without
+        validating them into models. A checkpoint next to the file records each
+        page; if the export fails, calling this again with the same arguments
+        carries on after the last recorded page. See
+        :func:`~devhub_python.export.export_pages`.
+
+        Args:
+            path: Output file
+            format: ``"csv"`` or ``"ndjson"`` (default: from the file extension)
+            limit: Number of contacts per page
+            columns: CSV columns (default: every contact field, with one
+                ``custom_fields.<name>`` column per custom field instead of ``custom_fields``)
+            checkpoint_path: Checkpoint file (default: ``path`` + ``".checkpoint"``)
+            on_progress: Called with an :class:`ExportProgress` after each page,
+                reporting rows written, throughput and ETA
+            fsync: Also sync the file to disk after each page, to survive power loss
+            **filters: Filters of :meth:`list`, e.g. ``tags=["vip"]``
+
+        Returns:
+            ExportProgress: Rows and pages written
+
+        Example:
+            client.contacts.export("contacts.csv", on_progress=print)
+        """
+        # A resumed export keeps the columns in its checkpoint, so custom fields are only listed for a new one
+        if columns is None and export_format(path, format) == "csv" and not _resuming(path, checkpoint_path):
+            from ..models.contacts import ContactSerializer
+
+            columns = model_columns(ContactSerializer, flatten=["custom_fields"])
+            columns += [CUSTOM_FIELD_PREFIX + field.name for field in self.iter_custom_fields(limit=100)]
+        return export_pages(
+            lambda page: self.list(page=page, limit=limit, lazy=True, **filters),
+            path,
+            {"source": "contacts", "filters": filters},
+            limit,
+            "contacts",
+            format=format,
+            columns=columns,
+            checkpoint_path=checkpoint_path,
+            on_progress=on_progress,
+            fsync=fsync,
+            codec=self.client.codec,
+        )
 
     def create(self, contact_data: "CreateContactDto") -> "ContactSerializer":
         """
@@ -113,7 +251,7 @@ class ContactsResource(BaseResource):
 
         from ..models.contacts import ContactSerializer
 
-        return ContactSerializer.model_validate(response.json())
+        return parse_response(response, ContactSerializer)
 
     def update(self, contact_id: str, contact_data: "UpdateContactDto") -> "ContactSerializer":
         """
@@ -132,7 +270,7 @@ class ContactsResource(BaseResource):
 
         from ..models.contacts import ContactSerializer
 
-        return ContactSerializer.model_validate(response.json())
+        return parse_response(response, ContactSerializer)
 
     def delete_bulk(self, delete_data: "DeleteContactsDto", approve: Optional[str] = None) -> "ContactSerializer":
         """
@@ -153,7 +291,7 @@ class ContactsResource(BaseResource):
 
         from ..models.contacts import ContactSerializer
 
-        return ContactSerializer.model_validate(response.json())
+        return parse_response(response, ContactSerializer)
 
     # Contact Group Management
 
@@ -198,7 +336,7 @@ class ContactsResource(BaseResource):
 
         from ..models.contacts import CreateContactsFromCsvRespDto
 
-        return CreateContactsFromCsvRespDto.model_validate(response.json())
+        return parse_response(response, CreateContactsFromCsvRespDto)
 
     # Custom Fields Management
 
@@ -232,7 +370,43 @@ class ContactsResource(BaseResource):
 
         from ..models.contacts import GetCustomFieldsSerializer
 
-        return GetCustomFieldsSerializer.model_validate(response.json())
+        return parse_response(response, GetCustomFieldsSerializer)
+
+    def iter_custom_fields(
+        self,
+        limit: int = 50,
+        start_page: int = 1,
+        max_items: Optional[int] = None,
+        workers: int = 1,
+        read_ahead: Optional[int] = None,
+        **filters: Any,
+    ) -> Iterator["CustomFieldSerializer"]:
+        """
+        Iterate over every custom field matching the filters, page by page.
+
+        Args:
+            limit: Number of custom fields per page
+            start_page: Page to start from, e.g. to resume an interrupted scan
+            max_items: Stop after this many custom fields (optional)
+            workers: Pages fetched at once; above 1, the pages after the first are
+                fetched in parallel threads and still yielded in order, which needs a
+                client created with ``thread_safe=True`` or ``transport="urllib3"`` (default: 1)
+            read_ahead: Most pages fetched ahead of the one being read (default: twice ``workers``)
+            **filters: Filters of :meth:`list_custom_fields`, e.g. ``search``
+
+        Yields:
+            CustomFieldSerializer: The custom fields, in order
+        """
+        self._check_workers(workers)
+        return paginate(
+            lambda page: self.list_custom_fields(page=page, limit=limit, **filters),
+            limit,
+            "custom_fields",
+            start_page,
+            max_items,
+            workers=workers,
+            read_ahead=read_ahead,
+        )
 
     def create_custom_field(self, field_data: "CreateCustomFieldDto") -> "CustomFieldSerializer":
         """
@@ -248,7 +422,7 @@ class ContactsResource(BaseResource):
 
         from ..models.contacts import CustomFieldSerializer
 
-        return CustomFieldSerializer.model_validate(response.json())
+        return parse_response(response, CustomFieldSerializer)
 
     def update_custom_field(self, field_id: str, field_data: "UpdateCustomFieldDto") -> None:
         """
@@ -274,3 +448,242 @@ class ContactsResource(BaseResource):
             raise ValueError("Approval is required for deleting custom fields")
 
         self.client.delete("user-api/contacts/custom-fields", json=delete_data.dict(), params={"approve": approve})
+
+
+class AsyncContactsResource(AsyncBaseResource):
+    """
+    Async contacts resource for managing contact information and custom fields.
+
+    Provides the same operations as :class:`ContactsResource` as coroutines.
+    """
+
+    # Contact CRUD Operations
+
+    async def list(
+        self,
+        page: int = 1,
+        limit: int = 50,
+        contacts_group_ids: Optional[List[str]] = None,
+        country_codes: Optional[List[str]] = None,
+        search: Optional[str] = None,
+        search_fields: Optional[List[str]] = None,
+        is_whatsapp_subscribed: Optional[bool] = None,
+        is_email_subscribed: Optional[bool] = None,
+        is_sms_subscribed: Optional[bool] = None,
+        is_mms_subscribed: Optional[bool] = None,
+        is_rcs_subscribed: Optional[bool] = None,
+        tags: Optional[List[str]] = None,
+        lazy: bool = False,
+        records: bool = False,
+        stream: bool = False,
+    ) -> Union["GetContactsSerializer", "RecordView[GetContactsSerializer]", "AsyncItemStream[ContactSerializer]"]:
+        """List contacts with advanced filtering options. See :meth:`ContactsResource.list`."""
+        params: Dict[str, Any] = {"page": page, "limit": limit}
+
+        if contacts_group_ids:
+            params["contacts_group_ids"] = contacts_group_ids
+        if country_codes:
+            params["country_codes"] = country_codes
+        if search:
+            params["search"] = search
+        if search_fields:
+            params["search_fields"] = search_fields
+        if is_whatsapp_subscribed is not None:
+            params["is_whatsapp_subscribed"] = is_whatsapp_subscribed
+        if is_email_subscribed is not None:
+            params["is_email_subscribed"] = is_email_subscribed
+        if is_sms_subscribed is not None:
+            params["is_sms_subscribed"] = is_sms_subscribed
+        if is_mms_subscribed is not None:
+            params["is_mms_subscribed"] = is_mms_subscribed
+        if is_rcs_subscribed is not None:
+            params["is_rcs_subscribed"] = is_rcs_subscribed
+        if tags:
+            params["tags"] = tags
+
+        from ..models.contacts import ContactSerializer, GetContactsSerializer
+
+        if stream:
+            return await self._stream_list("user-api/contacts", params, ContactSerializer, "contacts", lazy, records)
+        response = await self.client.get("user-api/contacts", params=params)
+
+        if lazy:
+            return RecordView(GetContactsSerializer, response.json())
+        if records:
+            return records_page(GetContactsSerializer, "contacts", ContactSerializer, response.json())
+        return parse_response(response, GetContactsSerializer)
+
+    def iter_contacts(
+        self,
+        limit: int = 50,
+        start_page: int = 1,
+        max_items: Optional[int] = None,
+        workers: int = 1,
+        read_ahead: Optional[int] = None,
+        lazy: bool = False,
+        records: bool = False,
+        **filters: Any,
+    ) -> AsyncIterator["ContactSerializer"]:
+        """Iterate over every contact matching the filters. See :meth:`ContactsResource.iter_contacts`."""
+        return paginate_async(
+            lambda page: self.list(page=page, limit=limit, lazy=lazy, records=records, **filters),
+            limit,
+            "contacts",
+            start_page,
+            max_items,
+            workers=workers,
+            read_ahead=read_ahead,
+        )
+
+    async def export(
+        self,
+        path: str,
+        format: Optional[str] = None,
+        limit: int = 100,
+        columns: Optional[List[str]] = None,
+        checkpoint_path: Optional[str] = None,
+        on_progress: Optional[Callable[[ExportProgress], Any]] = None,
+        fsync: bool = False,
+        **filters: Any,
+    ) -> ExportProgress:
+        """Export every contact to a CSV or NDJSON file. See :meth:`ContactsResource.export`."""
+        if columns is None and export_format(path, format) == "csv" and not _resuming(path, checkpoint_path):
+            from ..models.contacts import ContactSerializer
+
+            columns = model_columns(ContactSerializer, flatten=["custom_fields"])
+            columns += [CUSTOM_FIELD_PREFIX + field.name async for field in self.iter_custom_fields(limit=100)]
+        return await export_pages_async(
+            lambda page: self.list(page=page, limit=limit, lazy=True, **filters),
+            path,
+            {"source": "contacts", "filters": filters},
+            limit,
+            "contacts",
+            format=format,
+            columns=columns,
+            checkpoint_path=checkpoint_path,
+            on_progress=on_progress,
+            fsync=fsync,
+            codec=self.client.codec,
+        )
+
+    async def create(self, contact_data: "CreateContactDto") -> "ContactSerializer":
+        """Create a new contact."""
+        response = await self.client.post("user-api/contacts", json=contact_data.dict(exclude_none=True))
+
+        from ..models.contacts import ContactSerializer
+
+        return parse_response(response, ContactSerializer)
+
+    async def update(self, contact_id: str, contact_data: "UpdateContactDto") -> "ContactSerializer":
+        """Update an existing contact."""
+        contact_id = validate_required_string(contact_id, "contact_id")
+
+        response = await self.client.put(f"user-api/contacts/{contact_id}", json=contact_data.dict(exclude_none=True))
+
+        from ..models.contacts import ContactSerializer
+
+        return parse_response(response, ContactSerializer)
+
+    async def delete_bulk(self, delete_data: "DeleteContactsDto", approve: Optional[str] = None) -> "ContactSerializer":
+        """Delete multiple contacts."""
+        params = {}
+        if approve:
+            params["approve"] = approve
+
+        response = await self.client.delete("user-api/contacts", json=delete_data.dict(), params=params)
+
+        from ..models.contacts import ContactSerializer
+
+        return parse_response(response, ContactSerializer)
+
+    # Contact Group Management
+
+    async def assign_to_group(self, assignment_data: "AssignToContactsGroupDto") -> None:
+        """Assign contacts to a contact group."""
+        await self.client.patch("user-api/contacts/assign-to-group", json=assignment_data.dict())
+
+    async def unassign_from_group(self, assignment_data: "AssignToContactsGroupDto") -> None:
+        """Unassign contacts from a contact group."""
+        await self.client.patch("user-api/contacts/unassign-from-group", json=assignment_data.dict())
+
+    # CSV Import
+
+    async def import_from_csv(
+        self, csv_data: "CreateContactsFromCsvDto", approve: Optional[str] = None
+    ) -> "CreateContactsFromCsvRespDto":
+        """Import contacts from CSV data."""
+        params = {}
+        if approve:
+            params["approve"] = approve
+
+        response = await self.client.post("user-api/contacts/csv", json=csv_data.dict(), params=params)
+
+        from ..models.contacts import CreateContactsFromCsvRespDto
+
+        return parse_response(response, CreateContactsFromCsvRespDto)
+
+    # Custom Fields Management
+
+    async def list_custom_fields(
+        self,
+        id: Optional[str] = None,
+        page: int = 1,
+        limit: int = 50,
+        search: Optional[str] = None,
+    ) -> "GetCustomFieldsSerializer":
+        """List custom fields."""
+        params: Dict[str, Any] = {"page": page, "limit": limit}
+
+        if id:
+            params["id"] = id
+        if search:
+            params["search"] = search
+
+        response = await self.client.get("user-api/contacts/custom-fields", params=params)
+
+        from ..models.contacts import GetCustomFieldsSerializer
+
+        return parse_response(response, GetCustomFieldsSerializer)
+
+    def iter_custom_fields(
+        self,
+        limit: int = 50,
+        start_page: int = 1,
+        max_items: Optional[int] = None,
+        workers: int = 1,
+        read_ahead: Optional[int] = None,
+        **filters: Any,
+    ) -> AsyncIterator["CustomFieldSerializer"]:
+        """Iterate over every custom field matching the filters. See :meth:`ContactsResource.iter_custom_fields`."""
+        return paginate_async(
+            lambda page: self.list_custom_fields(page=page, limit=limit, **filters),
+            limit,
+            "custom_fields",
+            start_page,
+            max_items,
+            workers=workers,
+            read_ahead=read_ahead,
+        )
+
+    async def create_custom_field(self, field_data: "CreateCustomFieldDto") -> "CustomFieldSerializer":
+        """Create a new custom field."""
+        response = await self.client.post("user-api/contacts/custom-fields", json=field_data.dict())
+
+        from ..models.contacts import CustomFieldSerializer
+
+        return parse_response(response, CustomFieldSerializer)
+
+    async def update_custom_field(self, field_id: str, field_data: "UpdateCustomFieldDto") -> None:
+        """Update an existing custom field."""
+        field_id = validate_required_string(field_id, "field_id")
+
+        await self.client.put(f"user-api/contacts/custom-fields/{field_id}", json=field_data.dict(exclude_none=True))
+
+    async def delete_custom_field(self, delete_data: "CommonDeleteDto", approve: str) -> None:
+        """Delete custom fields."""
+        if not approve:
+            raise ValueError("Approval is required for deleting custom fields")
+
+        await self.client.delete(
+            "user-api/contacts/custom-fields", json=delete_data.dict(), params={"approve": approve}
+        )
@@ -1,7 +1,7 @@
 from typing import TYPE_CHECKING
 
-from ..utils import validate_email, validate_required_string
-from .base import BaseResource
+from ..utils import parse_response, validate_email, validate_required_string
+from .base import AsyncBaseResource, BaseResource
 
 if TYPE_CHECKING:
     from ..models.email import EmailSendResponse
@@ -61,4 +61,46 @@ class EmailResource(BaseResource):
 
         from ..models.email import EmailSendResponse
 
-        return EmailSendResponse.model_validate(response.json())
+        return parse_response(response, EmailSendResponse)
+
+
+class AsyncEmailResource(AsyncBaseResource):
+    """
+    Async email resource for sending and managing email messages.
+
+    Example:
+        >>> response = await client.email.send_email(
+        ...     subject="Hello, World!",
+        ...     body="This is a test email.",
+        ...     sender="sender@example.com",
+        ...     recipient="recipient@example.com"
+        ... )
+    """
+
+    async def send_email(
+        self,
+        subject: str,
+        body: str,
+        sender: str,
+        recipient: str,
+        sandbox: bool = False,
+    ) -> "EmailSendResponse":
+        """Send an email. See :meth:`EmailResource.send_email`."""
+        # Validate inputs
+        subject = validate_required_string(subject, "subject")
+        body = validate_required_string(body, "body")
+        sender = validate_email(sender)
+        recipient = validate_email(recipient)
+
+        data = {
+            "subject": subject,
+            "body": body,
+            "sender": sender,
+            "recipient": recipient,
+        }
+
+        response = await self.client.post("user-api/email/send", json=data)
+
+        from ..models.email import EmailSendResponse
+
+        return parse_response(response, EmailSendResponse)
@@ -1,7 +1,14 @@
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
-
-from ..utils import validate_required_string, validate_response
-from .base import BaseResource
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Union
+
+from ..export import ExportProgress, export_format, export_pages, export_pages_async, model_columns
+from ..pagination import paginate, paginate_async
+from ..records import Record, record_type
+from ..scanning import DEFAULT_MIN_SPAN, ScanCheckpoint, Timestamp, scan_time_range, scan_time_range_async
+from ..streaming import AsyncItemStream, ItemStream
+from ..utils import parse_response, validate_required_string, validate_response
+from ..views import ListView, RecordView
+from .base import AsyncBaseResource, BaseResource
 
 if TYPE_CHECKING:
     from ..models.messages import Message, SendMessageDto, SendMessageSerializer
@@ -93,7 +100,7 @@ class MessagesResource(BaseResource):
 
         from ..models.messages import Message
 
-        return Message.model_validate(response.json())
+        return parse_response(response, Message)
 
     def list(
         self,
@@ -105,7 +112,10 @@ class MessagesResource(BaseResource):
         date_sent_before: Optional[str] = None,
         limit: int = 50,
         offset: int = 0,
-    ) -> List["Message"]:
+        lazy: bool = False,
+        records: bool = False,
+        stream: bool = False,
+    ) -> Union[List["Message"], "ListView[Message]", List[Record], "ItemStream[Message]"]:
         """
         List messages across all channels with optional filtering.
 
@@ -118,6 +128,11 @@ class MessagesResource(BaseResource):
             date_sent_before: Filter messages sent before this date
             limit: Maximum number of messages to return (default: 50)
             offset: Number of messages to skip (default: 0)
+            lazy: Return a :class:`ListView` that parses messages and their fields
+                only when they are read, instead of validating them all
+            records: Return compact, read-only :class:`MessageRecord` tuples instead of models
+            stream: Return an :class:`ItemStream` that yields the messages while the response
+                downloads; ``lazy`` and ``records`` choose what it yields
 
         Returns:
             List[Message]: List of messages
@@ -137,12 +152,171 @@ class MessagesResource(BaseResource):
         if date_sent_before:
             params["date_sent_before"] = date_sent_before
 
+        from ..models.messages import Message, MessageListResponse
+
+        if stream:
+            return self._stream_list("messages", params, Message, "messages", lazy, records)
         response = self.client.get("messages", params=params)
-        data = response.json()
 
-        from ..models.messages import Message
+        if lazy:
+            return RecordView(MessageListResponse, response.json()).messages
+        if records:
+            return record_type(Message).from_list(response.json().get("messages") or [])
+        return parse_response(response, MessageListResponse).messages
 
-        return [Message.model_validate(item) for item in data.get("messages", [])]
+    def iter_messages(
+        self,
+        limit: int = 50,
+        start_page: int = 1,
+        max_items: Optional[int] = None,
+        lazy: bool = False,
+        records: bool = False,
+        **filters: Any,
+    ) -> Iterator["Message"]:
+        """
+        Iterate over every message matching the filters, fetching one page at a time.
+
+        Pages are requested by offset; page ``n`` starts at offset ``(n - 1) * limit``.
+        Stops at the first short page.
+
+        Args:
+            limit: Number of messages per page
+            start_page: Page to start from, e.g. to resume an interrupted scan
+            max_items: Stop after this many messages (optional)
+            lazy: Yield :class:`RecordView` objects instead of models
+            records: Yield compact, read-only :class:`MessageRecord` tuples instead of models
+            **filters: Filters of :meth:`list`, e.g. ``channel="sms"``
+
+        Yields:
+            Message: The messages, in order
+        """
+        return paginate(
+            lambda page: self.list(limit=limit, offset=(page - 1) * limit, lazy=lazy, records=records, **filters),
+            limit,
+            None,
+            start_page,
+            max_items,
+        )
+
+    def scan(
+        self,
+        start: Timestamp,
+        end: Timestamp,
+        shards: int = 8,
+        workers: Optional[int] = None,
+        limit: int = 100,
+        split_threshold: Optional[int] = None,
+        min_span: timedelta = DEFAULT_MIN_SPAN,
+        checkpoint: Optional[ScanCheckpoint] = None,
+        lazy: bool = False,
+        records: bool = False,
+        **filters: Any,
+    ) -> Iterator["Message"]:
+        """
+        Iterate over every message sent in ``[start, end)``, reading time shards of the range in parallel.
+
+        The range is split into ``shards`` shards, ``workers`` of which are listed
+        at once with ``date_sent_after``/``date_sent_before``. Shards holding more
+        than ``split_threshold`` messages are split in two before being read, so
+        offsets stay shallow. Every message of the range is yielded exactly once,
+        but messages of different shards are interleaved. On the synchronous client
+        the shards are read from threads; see :func:`~devhub_python.scanning.scan_time_range`.
+
+        Args:
+            start: Start of the range, inclusive, as a datetime or ISO 8601 string; naive times are UTC
+            end: End of the range, exclusive
+            shards: Number of shards to split the range into at first
+            workers: Shards read at once, from as many threads; above 1, needs a client created
+                with ``thread_safe=True`` or ``transport="urllib3"`` (default: 4 on such a client, 1 otherwise)
+            limit: Number of messages per page
+            split_threshold: Split shards holding more messages than this (default: ten pages)
+            min_span: Don't split shards shorter than twice this
+            checkpoint: Records each shard's progress, and resumes the scan it recorded (optional)
+            lazy: Yield :class:`RecordView` objects instead of models
+            records: Yield compact, read-only :class:`MessageRecord` tuples instead of models
+            **filters: Other filters of :meth:`list`, e.g. ``channel="sms"``
+
+        Returns:
+            Iterator[Message]: The messages
+
+        Example:
+            checkpoint = ScanCheckpoint(path="march.checkpoint")
+            for message in client.messages.scan("2024-03-01", "2024-04-01", channel="sms", checkpoint=checkpoint):
+                store(message)
+        """
+        if workers is None:
+            workers = 4 if getattr(self.client.transport, "thread_safe", True) else 1
+        self._check_workers(workers)
+        return scan_time_range(
+            lambda after, before, size, offset: self.list(
+                date_sent_after=after,
+                date_sent_before=before,
+                limit=size,
+                offset=offset,
+                lazy=lazy,
+                records=records,
+                **filters,
+            ),
+            start,
+            end,
+            shards=shards,
+            workers=workers,
+            limit=limit,
+            split_threshold=split_threshold,
+            min_span=min_span,
+            checkpoint=checkpoint,
+            filters=filters,
+        )
+
+    def export(
+        self,
+        path: str,
+        format: Optional[str] = None,
+        limit: int = 100,
+        columns: Optional[List[str]] = None,
+        checkpoint_path: Optional[str] = None,
+        on_progress: Optional[Callable[[ExportProgress], Any]] = None,
+        fsync: bool = False,
+        **filters: Any,
+    ) -> ExportProgress:
+        """
+        Export every message matching the filters to a CSV or NDJSON file, resuming an interrupted export.
+
+        Messages are written page by page, by offset, as the API returns them.
+        A checkpoint next to the file records each page; if the export fails,
+        calling this again with the same arguments carries on after the last
+        recorded page. See :func:`~devhub_python.export.export_pages`.
+
+        Args:
+            path: Output file
+            format: ``"csv"`` or ``"ndjson"`` (default: from the file extension)
+            limit: Number of messages per page
+            columns: CSV columns (default: every message field)
+            checkpoint_path: Checkpoint file (default: ``path`` + ``".checkpoint"``)
+            on_progress: Called with an :class:`ExportProgress` after each page,
+                reporting rows written and throughput
+            fsync: Also sync the file to disk after each page, to survive power loss
+            **filters: Filters of :meth:`list`, e.g. ``date_sent_after="2024-03-01"``
+
+        Returns:
+            ExportProgress: Rows and pages written
+        """
+        if columns is None and export_format(path, format) == "csv":
+            from ..models.messages import Message
+
+            columns = model_columns(Message)
+        return export_pages(
+            lambda page: self.list(limit=limit, offset=(page - 1) * limit, lazy=True, **filters),
+            path,
+            {"source": "messages", "filters": filters},
+            limit,
+            format=format,
+            columns=columns,
+            checkpoint_path=checkpoint_path,
+            on_progress=on_progress,
+            fsync=fsync,
+            codec=self.client.codec,
+        )
 
     def get_delivery_status(self, message_id: str) -> Dict[str, Any]:
         """
@@ -173,4 +347,168 @@ class MessagesResource(BaseResource):
 
         from ..models.messages import Message
 
-        return Message.model_validate(response.json())
+        return parse_response(response, Message)
+
+
+class AsyncMessagesResource(AsyncBaseResource):
+    """
+    Async unified messages resource for managing messages across all channels.
+
+    Provides the same operations as :class:`MessagesResource` as coroutines.
+    """
+
+    async def send(self, data: "SendMessageDto", sandbox: bool = False) -> "SendMessageSerializer":
+        """Send a message through any channel. See :meth:`MessagesResource.send`."""
+        from ..models.messages import SendMessageSerializer
+
+        response = await self.client.post("messages/send", data=data.model_dump(by_alias=True, exclude_none=True))
+        return validate_response(response, SendMessageSerializer)
+
+    async def get(self, message_id: str) -> "Message":
+        """Retrieve a message by ID from any channel."""
+        message_id = validate_required_string(message_id, "message_id")
+        response = await self.client.get(f"messages/{message_id}")
+
+        from ..models.messages import Message
+
+        return parse_response(response, Message)
+
+    async def list(
+        self,
+        channel: Optional[str] = None,
+        to: Optional[str] = None,
+        from_: Optional[str] = None,
+        status: Optional[str] = None,
+        date_sent_after: Optional[str] = None,
+        date_sent_before: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0,
+        lazy: bool = False,
+        records: bool = False,
+        stream: bool = False,
+    ) -> Union[List["Message"], "ListView[Message]", List[Record], "AsyncItemStream[Message]"]:
+        """List messages across all channels. See :meth:`MessagesResource.list`."""
+        params = {"limit": limit, "offset": offset}
+
+        if channel:
+            params["channel"] = channel
+        if to:
+            params["to"] = to
+        if from_:
+            params["from"] = from_
+        if status:
+            params["status"] = status
+        if date_sent_after:
+            params["date_sent_after"] = date_sent_after
+        if date_sent_before:
+            params["date_sent_before"] = date_sent_before
+
+        from ..models.messages import Message, MessageListResponse
+
+        if stream:
+            return await self._stream_list("messages", params, Message, "messages", lazy, records)
+        response = await self.client.get("messages", params=params)
+
+        if lazy:
+            return RecordView(MessageListResponse, response.json()).messages
+        if records:
+            return record_type(Message).from_list(response.json().get("messages") or [])
+        return parse_response(response, MessageListResponse).messages
+
+    def iter_messages(
+        self,
+        limit: int = 50,
+        start_page: int = 1,
+        max_items: Optional[int] = None,
+        lazy: bool = False,
+        records: bool = False,
+        **filters: Any,
+    ) -> AsyncIterator["Message"]:
+        """Iterate over every message matching the filters. See :meth:`MessagesResource.iter_messages`."""
+        return paginate_async(
+            lambda page: self.list(limit=limit, offset=(page - 1) * limit, lazy=lazy, records=records, **filters),
+            limit,
+            None,
+            start_page,
+            max_items,
+        )
+
+    def scan(
+        self,
+        start: Timestamp,
+        end: Timestamp,
+        shards: int = 8,
+        workers: int = 4,
+        limit: int = 100,
+        split_threshold: Optional[int] = None,
+        min_span: timedelta = DEFAULT_MIN_SPAN,
+        checkpoint: Optional[ScanCheckpoint] = None,
+        lazy: bool = False,
+        records: bool = False,
+        **filters: Any,
+    ) -> AsyncIterator["Message"]:
+        """Iterate over every message sent in ``[start, end)`` by time shards. See :meth:`MessagesResource.scan`."""
+        return scan_time_range_async(
+            lambda after, before, size, offset: self.list(
+                date_sent_after=after,
+                date_sent_before=before,
+                limit=size,
+                offset=offset,
+                lazy=lazy,
+                records=records,
+                **filters,
+            ),
+            start,
+            end,
+            shards=shards,
+            workers=workers,
+            limit=limit,
+            split_threshold=split_threshold,
+            min_span=min_span,
+            checkpoint=checkpoint,
+            filters=filters,
+        )
+
+    async def export(
+        self,
+        path: str,
+        format: Optional[str] = None,
+        limit: int = 100,
+        columns: Optional[List[str]] = None,
+        checkpoint_path: Optional[str] = None,
+        on_progress: Optional[Callable[[ExportProgress], Any]] = None,
+        fsync: bool = False,
+        **filters: Any,
+    ) -> ExportProgress:
+        """Export every message to a CSV or NDJSON file. See :meth:`MessagesResource.export`."""
+        if columns is None and export_format(path, format) == "csv":
+            from ..models.messages import Message
+
+            columns = model_columns(Message)
+        return await export_pages_async(
+            lambda page: self.list(limit=limit, offset=(page - 1) * limit, lazy=True, **filters),
+            path,
+            {"source": "messages", "filters": filters},
+            limit,
+            format=format,
+            columns=columns,
+            checkpoint_path=checkpoint_path,
+            on_progress=on_progress,
+            fsync=fsync,
+            codec=self.client.codec,
+        )
+
+    async def get_delivery_status(self, message_id: str) -> Dict[str, Any]:
+        """Get detailed delivery status for a message."""
+        message_id = validate_required_string(message_id, "message_id")
+        response = await self.client.get(f"messages/{message_id}/delivery-status")
+        return response.json()
+
+    async def resend(self, message_id: str) -> "Message":
+        """Resend a failed message."""
+        message_id = validate_required_string(message_id, "message_id")
+        response = await self.client.post(f"messages/{message_id}/resend")
+
+        from ..models.messages import Message
+
+        return parse_response(response, Message)
@@ -1,12 +1,43 @@
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
-
-from ..utils import validate_phone_number, validate_required_string
-from .base import BaseResource
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Iterator, List, Optional, Union
+
+from ..pagination import paginate, paginate_async
+from ..records import Record, record_type
+from ..streaming import AsyncItemStream, ItemStream
+from ..utils import (
+    parse_response,
+    parse_response_list,
+    response_is_array,
+    validate_phone_number,
+    validate_required_string,
+)
+from ..views import ListView
+from .base import AsyncBaseResource, BaseResource
 
 if TYPE_CHECKING:
     from ..models.rcs import RcsAccountSerializer, RCSMessage, RcsSendMessageSerializer, SuccessSerializer
 
 
+def _parse_accounts(response: Any) -> List["RcsAccountSerializer"]:
+    """Parse an RCS accounts response into RcsAccountSerializer objects."""
+    from ..models.rcs import RcsAccountSerializer
+
+    # The API returns a direct array, parsed straight from the body bytes
+    if response_is_array(response):
+        return parse_response_list(response, RcsAccountSerializer)
+
+    # If the response contains a nested structure (like {"rcsAccounts": [...]}),
+    # extract the accounts list for backward compatibility
+    data = response.json()
+    accounts_data = data.get("rcsAccounts") if isinstance(data, dict) else None
+
+    # Ensure we have a list to work with
+    if not isinstance(accounts_data, list):
+        accounts_data = []
+
+    # Parse each account into RcsAccountSerializer objects
+    return [RcsAccountSerializer.model_validate(account) for account in accounts_data]
+
+
 class RCSResource(BaseResource):
     """RCS (Rich Communication Services) resource for managing accounts, templates, brands, and messaging."""
 
@@ -17,7 +48,7 @@ class RCSResource(BaseResource):
 
         from ..models.rcs import RcsAccountSerializer
 
-        return RcsAccountSerializer.model_validate(response.json())
+        return parse_response(response, RcsAccountSerializer)
 
     def get_accounts(
         self,
@@ -38,26 +69,35 @@ class RCSResource(BaseResource):
             params["isApproved"] = is_approved
 
         response = self.client.get("user-api/rcs/accounts", params=params)
-        data = response.json()
-
-        # If the response contains a nested structure (like {"rcsAccounts": [...]}),
-        # extract the accounts list for backward compatibility
-        if isinstance(data, dict) and "rcsAccounts" in data:
-            accounts_data = data["rcsAccounts"]
-        elif isinstance(data, list):
-            accounts_data = data
-        else:
-            # Fallback - use the data as-is
-            accounts_data = data
-
-        # Ensure we have a list to work with
-        if not isinstance(accounts_data, list):
-            accounts_data = []
-
-        # Parse each account into RcsAccountSerializer objects
-        from ..models.rcs import RcsAccountSerializer
 
-        return [RcsAccountSerializer.model_validate(account) for account in accounts_data]
+        return _parse_accounts(response)
+
+    def iter_accounts(
+        self,
+        limit: int = 50,
+        start_page: int = 1,
+        max_items: Optional[int] = None,
+        **filters: Any,
+    ) -> Iterator["RcsAccountSerializer"]:
+        """
+        Iterate over every RCS account matching the filters, fetching one page at a time.
+
+        Args:
+            limit: Number of accounts per page
+            start_page: Page to start from, e.g. to resume an interrupted scan
+            max_items: Stop after this many accounts (optional)
+            **filters: Filters of :meth:`get_accounts`, e.g. ``is_approved``
+
+        Yields:
+            RcsAccountSerializer: The accounts, in order
+        """
+        return paginate(
+            lambda page: self.get_accounts(page=page, limit=limit, **filters),
+            limit,
+            None,
+            start_page,
+            max_items,
+        )
 
     def verify_account(self, verification_data: Dict[str, Any]) -> "SuccessSerializer":
         """Verify RCS Account."""
@@ -65,7 +105,7 @@ class RCSResource(BaseResource):
 
         from ..models.rcs import SuccessSerializer
 
-        return SuccessSerializer.model_validate(response.json())
+        return parse_response(response, SuccessSerializer)
 
     def update_account(self, account_id: str, account_data: Dict[str, Any]) -> Dict[str, Any]:
         """Update RCS Account."""
@@ -86,7 +126,7 @@ class RCSResource(BaseResource):
 
         from ..models.rcs import RcsSendMessageSerializer
 
-        return RcsSendMessageSerializer.model_validate(response.json())
+        return parse_response(response, RcsSendMessageSerializer)
 
     def list_messages(
         self,
@@ -95,8 +135,17 @@ class RCSResource(BaseResource):
         id: Optional[str] = None,
         type: Optional[str] = None,
         search: Optional[str] = None,
-    ) -> List["RcsSendMessageSerializer"]:
-        """List Messages."""
+        lazy: bool = False,
+        records: bool = False,
+        stream: bool = False,
+    ) -> Union[List["RcsSendMessageSerializer"], "ListView[RcsSendMessageSerializer]", List[Record], "ItemStream[Any]"]:
+        """
+        List Messages.
+
+        With ``lazy``, return a :class:`ListView` that parses messages only when they are
+        read; with ``records``, compact, read-only :class:`RcsMessageRecord` tuples. With
+        ``stream``, return an :class:`ItemStream` that yields them while the response downloads.
+        """
         params = {}
         if page is not None:
             params["page"] = page
@@ -109,11 +158,19 @@ class RCSResource(BaseResource):
         if search is not None:
             params["search"] = search
 
-        response = self.client.get("/api/v1/user-api/rcs/messages", params=params)
-
         from ..models.rcs import RcsSendMessageSerializer
 
-        return [RcsSendMessageSerializer.model_validate(message) for message in response.json()]
+        if stream:
+            return self._stream_list(
+                "/api/v1/user-api/rcs/messages", params, RcsSendMessageSerializer, None, lazy, records
+            )
+        response = self.client.get("/api/v1/user-api/rcs/messages", params=params)
+
+        if lazy:
+            return ListView(RcsSendMessageSerializer, response.json())
+        if records:
+            return record_type(RcsSendMessageSerializer).from_list(response.json())
+        return parse_response_list(response, RcsSendMessageSerializer)
 
     # Template Management Endpoints
     def create_template(self, template_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -176,6 +233,33 @@ class RCSResource(BaseResource):
         response = self.client.get("user-api/rcs/brands", params=params)
         return response.json()
 
+    def iter_brands(
+        self,
+        limit: int = 50,
+        start_page: int = 1,
+        max_items: Optional[int] = None,
+        **filters: Any,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over every brand matching the filters, fetching one page at a time.
+
+        Args:
+            limit: Number of brands per page
+            start_page: Page to start from, e.g. to resume an interrupted scan
+            max_items: Stop after this many brands (optional)
+            **filters: Filters of :meth:`get_brands`, e.g. ``search``
+
+        Yields:
+            Dict[str, Any]: The brands, in order
+        """
+        return paginate(
+            lambda page: self.get_brands(page=page, limit=limit, **filters),
+            limit,
+            "brands",
+            start_page,
+            max_items,
+        )
+
     def create_brand(self, brand_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create RCS Brands."""
         response = self.client.post("/api/v1/user-api/rcs/brands", json=brand_data)
@@ -216,6 +300,35 @@ class RCSResource(BaseResource):
         response = self.client.get("/api/v1/user-api/rcs/testers", params=params)
         return response.json()
 
+    def iter_testers(
+        self,
+        account_id: str,
+        limit: int = 50,
+        start_page: int = 1,
+        max_items: Optional[int] = None,
+        **filters: Any,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over every tester of an account matching the filters, fetching one page at a time.
+
+        Args:
+            account_id: RCS account ID (required)
+            limit: Number of testers per page
+            start_page: Page to start from, e.g. to resume an interrupted scan
+            max_items: Stop after this many testers (optional)
+            **filters: Filters of :meth:`get_testers`, e.g. ``search``
+
+        Yields:
+            Dict[str, Any]: The testers, in order
+        """
+        return paginate(
+            lambda page: self.get_testers(account_id, page=page, limit=limit, **filters),
+            limit,
+            "testers",
+            start_page,
+            max_items,
+        )
+
     # Legacy methods for backward compatibility
     def send_text(
         self,
@@ -238,7 +351,7 @@ class RCSResource(BaseResource):
 
         from ..models.rcs import RCSMessage
 
-        return RCSMessage.model_validate(response.json())
+        return parse_response(response, RCSMessage)
 
     def send_rich_card(
         self,
@@ -277,7 +390,7 @@ class RCSResource(BaseResource):
 
         from ..models.rcs import RCSMessage
 
-        return RCSMessage.model_validate(response.json())
+        return parse_response(response, RCSMessage)
 
     def get(self, message_id: str) -> "RCSMessage":
         """Retrieve an RCS message by ID."""
@@ -286,4 +399,336 @@ class RCSResource(BaseResource):
 
         from ..models.rcs import RCSMessage
 
-        return RCSMessage.model_validate(response.json())
+        return parse_response(response, RCSMessage)
+
+
+class AsyncRCSResource(AsyncBaseResource):
+    """Async RCS resource. Provides the same operations as :class:`RCSResource` as coroutines."""
+
+    # Account Management Endpoints
+    async def create_account(self, account_data: Dict[str, Any]) -> "RcsAccountSerializer":
+        """Submit RCS Account."""
+        response = await self.client.post("user-api/rcs/accounts", json=account_data)
+
+        from ..models.rcs import RcsAccountSerializer
+
+        return parse_response(response, RcsAccountSerializer)
+
+    async def get_accounts(
+        self,
+        page: Optional[int] = None,
+        limit: Optional[int] = None,
+        id: Optional[str] = None,
+        is_approved: Optional[str] = None,
+    ) -> List["RcsAccountSerializer"]:
+        """Get all RCS Accounts."""
+        params = {}
+        if page is not None:
+            params["page"] = page
+        if limit is not None:
+            params["limit"] = limit
+        if id is not None:
+            params["id"] = id
+        if is_approved is not None:
+            params["isApproved"] = is_approved
+
+        response = await self.client.get("user-api/rcs/accounts", params=params)
+
+        return _parse_accounts(response)
+
+    def iter_accounts(
+        self,
+        limit: int = 50,
+        start_page: int = 1,
+        max_items: Optional[int] = None,
+        **filters: Any,
+    ) -> AsyncIterator["RcsAccountSerializer"]:
+        """Iterate over every RCS account matching the filters. See :meth:`RCSResource.iter_accounts`."""
+        return paginate_async(
+            lambda page: self.get_accounts(page=page, limit=limit, **filters),
+            limit,
+            None,
+            start_page,
+            max_items,
+        )
+
+    async def verify_account(self, verification_data: Dict[str, Any]) -> "SuccessSerializer":
+        """Verify RCS Account."""
+        response = await self.client.post("/api/v1/user-api/rcs/accounts/verify", json=verification_data)
+
+        from ..models.rcs import SuccessSerializer
+
+        return parse_response(response, SuccessSerializer)
+
+    async def update_account(self, account_id: str, account_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Update RCS Account."""
+        account_id = validate_required_string(account_id, "account_id")
+        response = await self.client.put(f"/api/v1/user-api/rcs/accounts/{account_id}", json=account_data)
+        return response.json()
+
+    async def get_account_details(self, account_id: str) -> Dict[str, Any]:
+        """Get Account Details."""
+        account_id = validate_required_string(account_id, "account_id")
+        response = await self.client.get(f"/api/v1/user-api/rcs/accounts/{account_id}")
+        return response.json()
+
+    # Messaging Endpoints
+    async def send_message(self, message_data: Dict[str, Any]) -> "RcsSendMessageSerializer":
+        """Send RCS message."""
+        response = await self.client.post("/api/v1/user-api/rcs/send", json=message_data)
+
+        from ..models.rcs import RcsSendMessageSerializer
+
+        return parse_response(response, RcsSendMessageSerializer)
+
+    async def list_messages(
+        self,
+        page: Optional[int] = None,
+        limit: Optional[int] = None,
+        id: Optional[str] = None,
+        type: Optional[str] = None,
+        search: Optional[str] = None,
+        lazy: bool = False,
+        records: bool = False,
+        stream: bool = False,
+    ) -> Union[
+        List["RcsSendMessageSerializer"], "ListView[RcsSendMessageSerializer]", List[Record], "AsyncItemStream[Any]"
+    ]:
+        """
+        List Messages.
+
+        With ``lazy``, return a :class:`ListView` that parses messages only when they are
+        read; with ``records``, compact, read-only :class:`RcsMessageRecord` tuples. With
+        ``stream``, return an :class:`AsyncItemStream` that yields them while the response downloads.
+        """
+        params = {}
+        if page is not None:
+            params["page"] = page
+        if limit is not None:
+            params["limit"] = limit
+        if id is not None:
+            params["id"] = id
+        if type is not None:
+            params["type"] = type
+        if search is not None:
+            params["search"] = search
+
+        from ..models.rcs import RcsSendMessageSerializer
+
+        if stream:
+            return await self._stream_list(
+                "/api/v1/user-api/rcs/messages", params, RcsSendMessageSerializer, None, lazy, records
+            )
+        response = await self.client.get("/api/v1/user-api/rcs/messages", params=params)
+
+        if lazy:
+            return ListView(RcsSendMessageSerializer, response.json())
+        if records:
+            return record_type(RcsSendMessageSerializer).from_list(response.json())
+        return parse_response_list(response, RcsSendMessageSerializer)
+
+    # Template Management Endpoints
+    async def create_template(self, template_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Create RCS templates."""
+        response = await self.client.post("/api/v1/user-api/rcs/templates", json=template_data)
+        return response.json()
+
+    async def get_templates(
+        self,
+        page: Optional[int] = None,
+        limit: Optional[int] = None,
+        id: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Get all RCS templates."""
+        params = {}
+        if page is not None:
+            params["page"] = page
+        if limit is not None:
+            params["limit"] = limit
+        if id is not None:
+            params["id"] = id
+
+        response = await self.client.get("user-api/rcs/templates", params=params)
+        return response.json()
+
+    async def delete_template(self, delete_data: Dict[str, Any], approve: Optional[str] = None) -> Dict[str, Any]:
+        """Delete RCS templates."""
+        params = {}
+        if approve is not None:
+            params["approve"] = approve
+
+        response = await self.client.delete("/api/v1/user-api/rcs/templates", json=delete_data, params=params)
+        return response.json()
+
+    async def update_template(self, template_id: str, template_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Update RCS templates."""
+        template_id = validate_required_string(template_id, "template_id")
+        response = await self.client.put(f"/api/v1/user-api/rcs/templates/{template_id}", json=template_data)
+        return response.json()
+
+    # Brand Management Endpoints
+    async def get_brands(
+        self,
+        id: Optional[str] = None,
+        page: Optional[int] = None,
+        limit: Optional[int] = None,
+        search: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Get all RCS Brands."""
+        params = {}
+        if id is not None:
+            params["id"] = id
+        if page is not None:
+            params["page"] = page
+        if limit is not None:
+            params["limit"] = limit
+        if search is not None:
+            params["search"] = search
+
+        response = await self.client.get("user-api/rcs/brands", params=params)
+        return response.json()
+
+    def iter_brands(
+        self,
+        limit: int = 50,
+        start_page: int = 1,
+        max_items: Optional[int] = None,
+        **filters: Any,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over every brand matching the filters. See :meth:`RCSResource.iter_brands`."""
+        return paginate_async(
+            lambda page: self.get_brands(page=page, limit=limit, **filters),
+            limit,
+            "brands",
+            start_page,
+            max_items,
+        )
+
+    async def create_brand(self, brand_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Create RCS Brands."""
+        response = await self.client.post("/api/v1/user-api/rcs/brands", json=brand_data)
+        return response.json()
+
+    async def update_brand(self, brand_id: str, brand_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Update RCS Brands."""
+        brand_id = validate_required_string(brand_id, "brand_id")
+        response = await self.client.put(f"/api/v1/user-api/rcs/brands/{brand_id}", json=brand_data)
+        return response.json()
+
+    # Tester Management Endpoints
+    async def add_tester(self, tester_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Add RCS Tester."""
+        response = await self.client.post("/api/v1/user-api/rcs/testers", json=tester_data)
+        return response.json()
+
+    async def get_testers(
+        self,
+        account_id: str,
+        id: Optional[str] = None,
+        page: Optional[int] = None,
+        limit: Optional[int] = None,
+        search: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Get RCS Testers."""
+        account_id = validate_required_string(account_id, "account_id")
+        params = {"account_id": account_id}
+        if id is not None:
+            params["id"] = id
+        if page is not None:
+            params["page"] = page
+        if limit is not None:
+            params["limit"] = limit
+        if search is not None:
+            params["search"] = search
+
+        response = await self.client.get("/api/v1/user-api/rcs/testers", params=params)
+        return response.json()
+
+    def iter_testers(
+        self,
+        account_id: str,
+        limit: int = 50,
+        start_page: int = 1,
+        max_items: Optional[int] = None,
+        **filters: Any,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over every tester of an account matching the filters. See :meth:`RCSResource.iter_testers`."""
+        return paginate_async(
+            lambda page: self.get_testers(account_id, page=page, limit=limit, **filters),
+            limit,
+            "testers",
+            start_page,
+            max_items,
+        )
+
+    # Legacy methods for backward compatibility
+    async def send_text(
+        self,
+        to: str,
+        text: str,
+        callback_url: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> "RCSMessage":
+        """Send an RCS text message."""
+        to = validate_phone_number(to)
+        text = validate_required_string(text, "text")
+
+        data = {"to": to, "type": "text", "text": text}
+        if callback_url:
+            data["callback_url"] = callback_url
+        if metadata:
+            data["metadata"] = metadata
+
+        response = await self.client.post("rcs/messages", json=data)
+
+        from ..models.rcs import RCSMessage
+
+        return parse_response(response, RCSMessage)
+
+    async def send_rich_card(
+        self,
+        to: str,
+        title: str,
+        description: str,
+        media_url: Optional[str] = None,
+        actions: Optional[List[Dict[str, Any]]] = None,
+        callback_url: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> "RCSMessage":
+        """Send an RCS rich card message."""
+        to = validate_phone_number(to)
+        title = validate_required_string(title, "title")
+        description = validate_required_string(description, "description")
+
+        data = {
+            "to": to,
+            "type": "rich_card",
+            "rich_card": {
+                "title": title,
+                "description": description,
+            },
+        }
+
+        if media_url:
+            data["rich_card"]["media_url"] = media_url
+        if actions:
+            data["rich_card"]["actions"] = actions
+        if callback_url:
+            data["callback_url"] = callback_url
+        if metadata:
+            data["metadata"] = metadata
+
+        response = await self.client.post("rcs/messages", json=data)
+
+        from ..models.rcs import RCSMessage
+
+        return parse_response(response, RCSMessage)
+
+    async def get(self, message_id: str) -> "RCSMessage":
+        """Retrieve an RCS message by ID."""
+        message_id = validate_required_string(message_id, "message_id")
+        response = await self.client.get(f"rcs/messages/{message_id}")
+
+        from ..models.rcs import RCSMessage
+
+        return parse_response(response, RCSMessage)
@@ -1,13 +1,27 @@
 import logging
 from datetime import datetime
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, List, Optional, Union
 
 from ..exceptions import DevoValidationException
-from ..utils import validate_email, validate_phone_number, validate_required_string
-from .base import BaseResource
+from ..streaming import AsyncItemStream, ItemStream
+from ..utils import (
+    parse_response,
+    parse_response_list,
+    response_is_array,
+    validate_email,
+    validate_phone_number,
+    validate_required_string,
+)
+from .base import AsyncBaseResource, BaseResource
 
 if TYPE_CHECKING:
-    from ..models.sms import AvailableNumbersResponse, NumberPurchaseResponse, SendersListResponse, SMSQuickSendResponse
+    from ..models.sms import (
+        AvailableNumber,
+        AvailableNumbersResponse,
+        NumberPurchaseResponse,
+        SendersListResponse,
+        SMSQuickSendResponse,
+    )
 
 logger = logging.getLogger(__name__)
 
@@ -109,7 +123,7 @@ class SMSResource(BaseResource):
         # Parse response according to API spec
         from ..models.sms import SMSQuickSendResponse
 
-        result = SMSQuickSendResponse.model_validate(response.json())
+        result = parse_response(response, SMSQuickSendResponse)
         logger.info(f"SMS sent successfully with ID: {result.id}")
 
         return result
@@ -141,7 +155,7 @@ class SMSResource(BaseResource):
         # Parse response according to API spec
         from ..models.sms import SendersListResponse
 
-        result = SendersListResponse.model_validate(response.json())
+        result = parse_response(response, SendersListResponse)
         logger.info(f"Retrieved {len(result.senders)} senders")
 
         return result
@@ -220,7 +234,7 @@ class SMSResource(BaseResource):
         # Parse response according to API spec
         from ..models.sms import NumberPurchaseResponse
 
-        result = NumberPurchaseResponse.model_validate(response.json())
+        result = parse_response(response, NumberPurchaseResponse)
         feature_count = len(result.features) if result.features else 0
         logger.info(f"Number purchased successfully with {feature_count} features")
 
@@ -235,7 +249,8 @@ class SMSResource(BaseResource):
         prefix: Optional[str] = None,
         region: str = "US",
         sandbox: bool = False,
-    ) -> "AvailableNumbersResponse":
+        stream: bool = False,
+    ) -> Union["AvailableNumbersResponse", "ItemStream[AvailableNumber]"]:
         """
         Get available phone numbers for purchase.
 
@@ -247,6 +262,8 @@ class SMSResource(BaseResource):
             prefix: Filter by prefix (optional)
             region: Filter by region (Country ISO Code), default: "US"
             sandbox: Use sandbox environment for testing (default: False)
+            stream: Return an :class:`ItemStream` that yields each ``AvailableNumber`` while
+                the response downloads, instead of the whole list (default: False)
 
         Returns:
             AvailableNumbersResponse: List of available numbers with their features
@@ -282,19 +299,23 @@ class SMSResource(BaseResource):
         if prefix is not None:
             params["prefix"] = prefix
 
+        from ..models.sms import AvailableNumber, AvailableNumbersResponse
+
+        if stream:
+            # The API returns a direct array; a {"numbers": [...]} object streams too
+            return self._stream_list("user-api/numbers", params, AvailableNumber, "numbers")
+
         # Send request to the exact API endpoint
         response = self.client.get("user-api/numbers", params=params)
 
         # Parse response according to API spec - API returns direct array
-        from ..models.sms import AvailableNumbersResponse
 
-        response_data = response.json()
-        if isinstance(response_data, list):
-            # API returns direct array, use custom parser
-            result = AvailableNumbersResponse.parse_from_list(response_data)
+        if response_is_array(response):
+            # API returns direct array, parsed straight from the body bytes
+            result = AvailableNumbersResponse(numbers=parse_response_list(response, AvailableNumber))
         else:
             # Fallback to normal parsing if API changes
-            result = AvailableNumbersResponse.model_validate(response_data)
+            result = parse_response(response, AvailableNumbersResponse)
 
         logger.info(f"Retrieved {len(result.numbers)} available numbers")
 
@@ -329,3 +350,165 @@ class SMSResource(BaseResource):
             sender=from_,
             hlrvalidation=kwargs.get("hlrvalidation", True),
         )
+
+
+class AsyncSMSResource(AsyncBaseResource):
+    """
+    Async SMS resource for sending messages and managing phone numbers.
+
+    Provides the same operations as :class:`SMSResource` as coroutines.
+
+    Example:
+        >>> response = await client.sms.send_sms(
+        ...     recipient="+1234567890",
+        ...     message="Hello World!",
+        ...     sender="+0987654321"
+        ... )
+    """
+
+    async def send_sms(
+        self,
+        recipient: str,
+        message: str,
+        sender: str,
+        hlrvalidation: bool = True,
+        sandbox: bool = False,
+    ) -> "SMSQuickSendResponse":
+        """Send an SMS message using the quick-send API. See :meth:`SMSResource.send_sms`."""
+        # Validate inputs
+        recipient = validate_phone_number(recipient)
+        message = validate_required_string(message, "message")
+        sender = validate_required_string(sender, "sender")
+
+        logger.info(f"Sending SMS to {recipient} from {sender}")
+
+        from ..models.sms import SMSQuickSendRequest, SMSQuickSendResponse
+
+        request_data = SMSQuickSendRequest(
+            sender=sender,
+            recipient=recipient,
+            message=message,
+            hlrvalidation=hlrvalidation,
+        )
+
+        response = await self.client.post("user-api/sms/quick-send", json=request_data.dict(), sandbox=sandbox)
+
+        result = parse_response(response, SMSQuickSendResponse)
+        logger.info(f"SMS sent successfully with ID: {result.id}")
+
+        return result
+
+    async def get_senders(self, sandbox: bool = False) -> "SendersListResponse":
+        """Retrieve the list of available senders. See :meth:`SMSResource.get_senders`."""
+        logger.info("Fetching available senders")
+
+        response = await self.client.get("user-api/me/senders", sandbox=sandbox)
+
+        from ..models.sms import SendersListResponse
+
+        result = parse_response(response, SendersListResponse)
+        logger.info(f"Retrieved {len(result.senders)} senders")
+
+        return result
+
+    async def buy_number(
+        self,
+        region: str,
+        number: str,
+        number_type: str,
+        agency_authorized_representative: str,
+        agency_representative_email: str,
+        is_longcode: bool = True,
+        agreement_last_sent_date: Optional[datetime] = None,
+        is_automated_enabled: bool = True,
+        sandbox: bool = False,
+    ) -> "NumberPurchaseResponse":
+        """Purchase a phone number. See :meth:`SMSResource.buy_number`."""
+        # Validate inputs
+        region = validate_required_string(region, "region")
+        number = validate_phone_number(number)
+        number_type = validate_required_string(number_type, "number_type")
+        agency_authorized_representative = validate_required_string(
+            agency_authorized_representative, "agency_authorized_representative"
+        )
+        agency_representative_email = validate_email(agency_representative_email)
+
+        logger.info(f"Purchasing number {number} in region {region}")
+
+        from ..models.sms import NumberPurchaseRequest, NumberPurchaseResponse
+
+        request_data = NumberPurchaseRequest(
+            region=region,
+            number=number,
+            number_type=number_type,
+            is_longcode=is_longcode,
+            agreement_last_sent_date=agreement_last_sent_date,
+            agency_authorized_representative=agency_authorized_representative,
+            agency_representative_email=agency_representative_email,
+            is_automated_enabled=is_automated_enabled,
+        )
+
+        response = await self.client.post("user-api/numbers/buy", json=request_data.dict(exclude_none=True))
+
+        result = parse_response(response, NumberPurchaseResponse)
+        feature_count = len(result.features) if result.features else 0
+        logger.info(f"Number purchased successfully with {feature_count} features")
+
+        return result
+
+    async def get_available_numbers(
+        self,
+        page: Optional[int] = None,
+        limit: Optional[int] = None,
+        capabilities: Optional[List[str]] = None,
+        type: Optional[str] = None,
+        prefix: Optional[str] = None,
+        region: str = "US",
+        sandbox: bool = False,
+        stream: bool = False,
+    ) -> Union["AvailableNumbersResponse", "AsyncItemStream[AvailableNumber]"]:
+        """Get available phone numbers for purchase. See :meth:`SMSResource.get_available_numbers`."""
+        logger.info(f"Fetching available numbers for region {region}")
+
+        params = {"region": region}
+
+        if page is not None:
+            params["page"] = page
+        if limit is not None:
+            params["limit"] = limit
+        if capabilities is not None:
+            params["capabilities"] = capabilities
+        if type is not None:
+            params["type"] = type
+        if prefix is not None:
+            params["prefix"] = prefix
+
+        from ..models.sms import AvailableNumber, AvailableNumbersResponse
+
+        if stream:
+            return await self._stream_list("user-api/numbers", params, AvailableNumber, "numbers")
+        response = await self.client.get("user-api/numbers", params=params)
+
+        if response_is_array(response):
+            result = AvailableNumbersResponse(numbers=parse_response_list(response, AvailableNumber))
+        else:
+            result = parse_response(response, AvailableNumbersResponse)
+
+        logger.info(f"Retrieved {len(result.numbers)} available numbers")
+
+        return result
+
+    # Legacy methods for backward compatibility
+    async def send(
+        self, to: str, body: str, from_: Optional[str] = None, sandbox: bool = False, **kwargs
+    ) -> "SMSQuickSendResponse":
+        """Legacy method for sending SMS. Use send_sms() instead."""
+        if not from_:
+            raise DevoValidationException("Sender (from_) is required for SMS sending")
+
+        return await self.send_sms(
+            recipient=to,
+            message=body,
+            sender=from_,
+            hlrvalidation=kwargs.get("hlrvalidation", True),
+        )
@@ -1,12 +1,15 @@
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Iterator, List, Optional
 
-from ..utils import validate_phone_number, validate_required_string
-from .base import BaseResource
+from ..pagination import paginate, paginate_async
+from ..records import records_page
+from ..utils import parse_response, validate_phone_number, validate_required_string
+from .base import AsyncBaseResource, BaseResource
 
 if TYPE_CHECKING:
     from ..models.whatsapp import (
         GetWhatsAppAccountsResponse,
         GetWhatsAppTemplatesResponse,
+        WhatsAppAccount,
         WhatsAppMessage,
         WhatsAppSendMessageResponse,
         WhatsAppTemplate,
@@ -91,7 +94,43 @@ class WhatsAppResource(BaseResource):
 
         from ..models.whatsapp import GetWhatsAppAccountsResponse
 
-        return GetWhatsAppAccountsResponse.model_validate(response.json())
+        return parse_response(response, GetWhatsAppAccountsResponse)
+
+    def iter_accounts(
+        self,
+        limit: int = 50,
+        start_page: int = 1,
+        max_items: Optional[int] = None,
+        workers: int = 1,
+        read_ahead: Optional[int] = None,
+        **filters: Any,
+    ) -> Iterator["WhatsAppAccount"]:
+        """
+        Iterate over every shared WhatsApp account matching the filters, page by page.
+
+        Args:
+            limit: Number of accounts per page
+            start_page: Page to start from, e.g. to resume an interrupted scan
+            max_items: Stop after this many accounts (optional)
+            workers: Pages fetched at once; above 1, the pages after the first are
+                fetched in parallel threads and still yielded in order, which needs a
+                client created with ``thread_safe=True`` or ``transport="urllib3"`` (default: 1)
+            read_ahead: Most pages fetched ahead of the one being read (default: twice ``workers``)
+            **filters: Filters of :meth:`get_accounts`, e.g. ``is_approved``
+
+        Yields:
+            WhatsAppAccount: The accounts, in order
+        """
+        self._check_workers(workers)
+        return paginate(
+            lambda page: self.get_accounts(page=page, limit=limit, **filters),
+            limit,
+            "accounts",
+            start_page,
+            max_items,
+            workers=workers,
+            read_ahead=read_ahead,
+        )
 
     def get_template(self, name: str, sandbox: bool = False) -> "WhatsAppTemplate":
         """
@@ -120,7 +159,7 @@ class WhatsAppResource(BaseResource):
 
         from ..models.whatsapp import WhatsAppTemplate
 
-        return WhatsAppTemplate.model_validate(response.json())
+        return parse_response(response, WhatsAppTemplate)
 
     def upload_file(
         self,
@@ -172,7 +211,7 @@ class WhatsAppResource(BaseResource):
 
         from ..models.whatsapp import WhatsAppUploadFileResponse
 
-        return WhatsAppUploadFileResponse.model_validate(response.json())
+        return parse_response(response, WhatsAppUploadFileResponse)
 
     def send_normal_message(
         self,
@@ -225,7 +264,7 @@ class WhatsAppResource(BaseResource):
 
         from ..models.whatsapp import WhatsAppSendMessageResponse
 
-        return WhatsAppSendMessageResponse.model_validate(response.json())
+        return parse_response(response, WhatsAppSendMessageResponse)
 
     def create_template(
         self,
@@ -281,7 +320,7 @@ class WhatsAppResource(BaseResource):
 
         from ..models.whatsapp import WhatsAppTemplateResponse
 
-        return WhatsAppTemplateResponse.model_validate(response.json())
+        return parse_response(response, WhatsAppTemplateResponse)
 
     def get_templates(
         self,
@@ -290,6 +329,7 @@ class WhatsAppResource(BaseResource):
         limit: Optional[int] = None,
         category: Optional[str] = None,
         search: Optional[str] = None,
+        records: bool = False,
     ) -> "GetWhatsAppTemplatesResponse":
         """
         Get WhatsApp templates for an account.
@@ -300,6 +340,8 @@ class WhatsAppResource(BaseResource):
             limit: Number of templates per page (optional)
             category: Filter by template category (AUTHENTICATION, MARKETING, UTILITY)
             search: Search templates by name (optional)
+            records: Fill the page with compact, read-only :class:`WhatsAppTemplateRecord`
+                tuples instead of models (optional)
 
         Returns:
             GetWhatsAppTemplatesResponse: Paginated list of templates
@@ -345,9 +387,51 @@ class WhatsAppResource(BaseResource):
         # Send request to the exact API endpoint
         response = self.client.get("user-api/whatsapp/templates", params=params)
 
-        from ..models.whatsapp import GetWhatsAppTemplatesResponse
+        from ..models.whatsapp import GetWhatsAppTemplatesResponse, WhatsAppTemplate
 
-        return GetWhatsAppTemplatesResponse.model_validate(response.json())
+        if records:
+            return records_page(GetWhatsAppTemplatesResponse, "templates", WhatsAppTemplate, response.json())
+        return parse_response(response, GetWhatsAppTemplatesResponse)
+
+    def iter_templates(
+        self,
+        account_id: str,
+        limit: int = 50,
+        start_page: int = 1,
+        max_items: Optional[int] = None,
+        workers: int = 1,
+        read_ahead: Optional[int] = None,
+        records: bool = False,
+        **filters: Any,
+    ) -> Iterator["WhatsAppTemplate"]:
+        """
+        Iterate over every template of an account matching the filters, page by page.
+
+        Args:
+            account_id: WhatsApp account ID (required)
+            limit: Number of templates per page
+            start_page: Page to start from, e.g. to resume an interrupted scan
+            max_items: Stop after this many templates (optional)
+            workers: Pages fetched at once; above 1, the pages after the first are
+                fetched in parallel threads and still yielded in order, which needs a
+                client created with ``thread_safe=True`` or ``transport="urllib3"`` (default: 1)
+            read_ahead: Most pages fetched ahead of the one being read (default: twice ``workers``)
+            records: Yield compact, read-only :class:`WhatsAppTemplateRecord` tuples instead of models
+            **filters: Filters of :meth:`get_templates`, e.g. ``category``
+
+        Yields:
+            WhatsAppTemplate: The templates, in order
+        """
+        self._check_workers(workers)
+        return paginate(
+            lambda page: self.get_templates(account_id, page=page, limit=limit, records=records, **filters),
+            limit,
+            "templates",
+            start_page,
+            max_items,
+            workers=workers,
+            read_ahead=read_ahead,
+        )
 
     def send_template_message(
         self,
@@ -416,7 +500,7 @@ class WhatsAppResource(BaseResource):
 
         from ..models.whatsapp import WhatsAppTemplateMessageResponse
 
-        return WhatsAppTemplateMessageResponse.model_validate(response.json())
+        return parse_response(response, WhatsAppTemplateMessageResponse)
 
     def send_text(
         self,
@@ -439,7 +523,7 @@ class WhatsAppResource(BaseResource):
 
         from ..models.whatsapp import WhatsAppMessage
 
-        return WhatsAppMessage.model_validate(response.json())
+        return parse_response(response, WhatsAppMessage)
 
     def send_template(
         self,
@@ -480,7 +564,7 @@ class WhatsAppResource(BaseResource):
 
         from ..models.whatsapp import WhatsAppMessage
 
-        return WhatsAppMessage.model_validate(response.json())
+        return parse_response(response, WhatsAppMessage)
 
     def get(self, message_id: str) -> "WhatsAppMessage":
         """Retrieve a WhatsApp message by ID."""
@@ -489,4 +573,298 @@ class WhatsAppResource(BaseResource):
 
         from ..models.whatsapp import WhatsAppMessage
 
-        return WhatsAppMessage.model_validate(response.json())
+        return parse_response(response, WhatsAppMessage)
+
+
+class AsyncWhatsAppResource(AsyncBaseResource):
+    """
+    Async WhatsApp resource for sending and managing WhatsApp messages.
+
+    Provides the same operations as :class:`WhatsAppResource` as coroutines.
+
+    Example:
+        >>> response = await client.whatsapp.send_normal_message(
+        ...     to="+1234567890",
+        ...     message="Hello from WhatsApp!"
+        ... )
+    """
+
+    async def get_accounts(
+        self,
+        page: Optional[int] = None,
+        limit: Optional[int] = None,
+        is_approved: Optional[bool] = None,
+        search: Optional[str] = None,
+        sandbox: bool = False,
+    ) -> "GetWhatsAppAccountsResponse":
+        """Get all shared WhatsApp accounts. See :meth:`WhatsAppResource.get_accounts`."""
+        params = {}
+
+        if page is not None:
+            params["page"] = page
+        if limit is not None:
+            params["limit"] = limit
+        if is_approved is not None:
+            params["isApproved"] = is_approved
+        if search is not None:
+            params["search"] = search
+
+        response = await self.client.get("user-api/whatsapp/accounts", params=params)
+
+        from ..models.whatsapp import GetWhatsAppAccountsResponse
+
+        return parse_response(response, GetWhatsAppAccountsResponse)
+
+    def iter_accounts(
+        self,
+        limit: int = 50,
+        start_page: int = 1,
+        max_items: Optional[int] = None,
+        workers: int = 1,
+        read_ahead: Optional[int] = None,
+        **filters: Any,
+    ) -> AsyncIterator["WhatsAppAccount"]:
+        """Iterate over every shared WhatsApp account. See :meth:`WhatsAppResource.iter_accounts`."""
+        return paginate_async(
+            lambda page: self.get_accounts(page=page, limit=limit, **filters),
+            limit,
+            "accounts",
+            start_page,
+            max_items,
+            workers=workers,
+            read_ahead=read_ahead,
+        )
+
+    async def get_template(self, name: str, sandbox: bool = False) -> "WhatsAppTemplate":
+        """Get a WhatsApp template by name."""
+        name = validate_required_string(name, "name")
+
+        response = await self.client.get(f"user-api/whatsapp/templates/{name}")
+
+        from ..models.whatsapp import WhatsAppTemplate
+
+        return parse_response(response, WhatsAppTemplate)
+
+    async def upload_file(
+        self,
+        file_content: bytes,
+        filename: str,
+        content_type: str,
+        sandbox: bool = False,
+    ) -> "WhatsAppUploadFileResponse":
+        """Upload a file for WhatsApp messaging. See :meth:`WhatsAppResource.upload_file`."""
+        filename = validate_required_string(filename, "filename")
+        content_type = validate_required_string(content_type, "content_type")
+
+        if not file_content:
+            from ..exceptions import DevoValidationException
+
+            raise DevoValidationException("File content cannot be empty")
+
+        files = {
+            "file": (filename, file_content, content_type),
+        }
+
+        response = await self.client.post("user-api/whatsapp/upload", files=files)
+
+        from ..models.whatsapp import WhatsAppUploadFileResponse
+
+        return parse_response(response, WhatsAppUploadFileResponse)
+
+    async def send_normal_message(
+        self,
+        to: str,
+        message: str,
+        account_id: Optional[str] = None,
+        sandbox: bool = False,
+    ) -> "WhatsAppSendMessageResponse":
+        """Send a normal WhatsApp message. See :meth:`WhatsAppResource.send_normal_message`."""
+        # Validate inputs
+        to = validate_phone_number(to)
+        message = validate_required_string(message, "message")
+
+        from ..models.whatsapp import WhatsAppNormalMessageRequest, WhatsAppSendMessageResponse
+
+        request_data = WhatsAppNormalMessageRequest(
+            to=to,
+            message=message,
+            account_id=account_id,
+        )
+
+        response = await self.client.post(
+            "user-api/whatsapp/send-normal-message", json=request_data.model_dump(exclude_none=True)
+        )
+
+        return parse_response(response, WhatsAppSendMessageResponse)
+
+    async def create_template(
+        self,
+        account_id: str,
+        template: "WhatsAppTemplateRequest",
+        sandbox: bool = False,
+    ) -> "WhatsAppTemplateResponse":
+        """Create a WhatsApp template. See :meth:`WhatsAppResource.create_template`."""
+        account_id = validate_required_string(account_id, "account_id")
+
+        params = {"account_id": account_id}
+
+        response = await self.client.post(
+            "user-api/whatsapp/templates", params=params, json=template.model_dump(exclude_none=True)
+        )
+
+        from ..models.whatsapp import WhatsAppTemplateResponse
+
+        return parse_response(response, WhatsAppTemplateResponse)
+
+    async def get_templates(
+        self,
+        account_id: str,
+        page: Optional[int] = None,
+        limit: Optional[int] = None,
+        category: Optional[str] = None,
+        search: Optional[str] = None,
+        records: bool = False,
+    ) -> "GetWhatsAppTemplatesResponse":
+        """Get WhatsApp templates for an account. See :meth:`WhatsAppResource.get_templates`."""
+        account_id = validate_required_string(account_id, "account_id")
+
+        params = {"id": account_id}  # Note: API uses 'id' parameter name for account_id
+
+        if page is not None:
+            params["page"] = page
+        if limit is not None:
+            params["limit"] = limit
+        if category is not None:
+            valid_categories = ["AUTHENTICATION", "MARKETING", "UTILITY"]
+            if category not in valid_categories:
+                from ..exceptions import DevoValidationException
+
+                raise DevoValidationException(
+                    f"Invalid category '{category}'. Must be one of: {', '.join(valid_categories)}"
+                )
+            params["category"] = category
+        if search is not None:
+            params["search"] = search
+
+        response = await self.client.get("user-api/whatsapp/templates", params=params)
+
+        from ..models.whatsapp import GetWhatsAppTemplatesResponse, WhatsAppTemplate
+
+        if records:
+            return records_page(GetWhatsAppTemplatesResponse, "templates", WhatsAppTemplate, response.json())
+        return parse_response(response, GetWhatsAppTemplatesResponse)
+
+    def iter_templates(
+        self,
+        account_id: str,
+        limit: int = 50,
+        start_page: int = 1,
+        max_items: Optional[int] = None,
+        workers: int = 1,
+        read_ahead: Optional[int] = None,
+        records: bool = False,
+        **filters: Any,
+    ) -> AsyncIterator["WhatsAppTemplate"]:
+        """Iterate over every template of an account. See :meth:`WhatsAppResource.iter_templates`."""
+        return paginate_async(
+            lambda page: self.get_templates(account_id, page=page, limit=limit, records=records, **filters),
+            limit,
+            "templates",
+            start_page,
+            max_items,
+            workers=workers,
+            read_ahead=read_ahead,
+        )
+
+    async def send_template_message(
+        self,
+        account_id: str,
+        template_message: "WhatsAppTemplateMessageRequest",
+    ) -> "WhatsAppTemplateMessageResponse":
+        """Send a WhatsApp template message. See :meth:`WhatsAppResource.send_template_message`."""
+        account_id = validate_required_string(account_id, "account_id")
+
+        params = {"account_id": account_id}
+
+        response = await self.client.post(
+            "user-api/whatsapp/send-message-by-template",
+            params=params,
+            json=template_message.model_dump(exclude_none=True),
+        )
+
+        from ..models.whatsapp import WhatsAppTemplateMessageResponse
+
+        return parse_response(response, WhatsAppTemplateMessageResponse)
+
+    async def send_text(
+        self,
+        to: str,
+        text: str,
+        callback_url: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> "WhatsAppMessage":
+        """Send a WhatsApp text message."""
+        to = validate_phone_number(to)
+        text = validate_required_string(text, "text")
+
+        data = {"to": to, "type": "text", "text": {"body": text}}
+        if callback_url:
+            data["callback_url"] = callback_url
+        if metadata:
+            data["metadata"] = metadata
+
+        response = await self.client.post("whatsapp/messages", json=data)
+
+        from ..models.whatsapp import WhatsAppMessage
+
+        return parse_response(response, WhatsAppMessage)
+
+    async def send_template(
+        self,
+        to: str,
+        template_name: str,
+        language: str = "en",
+        parameters: Optional[List[str]] = None,
+        callback_url: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> "WhatsAppMessage":
+        """Send a WhatsApp template message."""
+        to = validate_phone_number(to)
+        template_name = validate_required_string(template_name, "template_name")
+
+        data = {
+            "to": to,
+            "type": "template",
+            "template": {
+                "name": template_name,
+                "language": {"code": language},
+            },
+        }
+
+        if parameters:
+            data["template"]["components"] = [
+                {
+                    "type": "body",
+                    "parameters": [{"type": "text", "text": p} for p in parameters],
+                }
+            ]
+
+        if callback_url:
+            data["callback_url"] = callback_url
+        if metadata:
+            data["metadata"] = metadata
+
+        response = await self.client.post("whatsapp/messages", json=data)
+
+        from ..models.whatsapp import WhatsAppMessage
+
+        return parse_response(response, WhatsAppMessage)
+
+    async def get(self, message_id: str) -> "WhatsAppMessage":
+        """Retrieve a WhatsApp message by ID."""
+        message_id = validate_required_string(message_id, "message_id")
+        response = await self.client.get(f"whatsapp/messages/{message_id}")
+
+        from ..models.whatsapp import WhatsAppMessage
+
+        return parse_response(response, WhatsAppMessage)
@@ -0,0 +1,265 @@
+import collections
+import email.utils
+import fnmatch
+import random
+import threading
+import time
+from typing import Collection, Deque, Dict, List, Mapping, Optional
+
+from .circuit import endpoint_key
+
+
+def parse_retry_after(headers: Optional[Mapping[str, str]]) -> Optional[float]:
+    """
+    Read a ``Retry-After`` header, in seconds or as an HTTP date.
+
+    Returns:
+        Optional[float]: Seconds to wait, or None if the header is missing or malformed
+    """
+    value = headers.get("Retry-After") if headers is not None else None
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(retry_at.timestamp() - time.time(), 0.0)
+
+
+class RetryRule:
+    """
+    How requests to an endpoint are retried.
+
+    Backoff uses decorrelated jitter: each delay is drawn between
+    ``base_delay`` and three times the previous delay, capped at ``max_delay``,
+    so clients that failed together don't retry in lockstep. A ``Retry-After``
+    header replaces the drawn delay; if it asks for more than
+    ``max_retry_after`` seconds the response is returned without retrying.
+    """
+
+    DEFAULT_STATUS_CODES = (429, 500, 502, 503, 504)
+    # POST is included since every POST carries an idempotency key
+    DEFAULT_METHODS = ("HEAD", "GET", "OPTIONS", "POST")
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        status_codes: Collection[int] = DEFAULT_STATUS_CODES,
+        methods: Collection[str] = DEFAULT_METHODS,
+        base_delay: float = 0.2,
+        max_delay: float = 20.0,
+        max_retry_after: float = 60.0,
+        retry_network_errors: bool = True,
+    ):
+        """
+        Initialize the rule.
+
+        Args:
+            max_retries: Most retries after the first attempt
+            status_codes: Response status codes that are retried
+            methods: HTTP methods that are retried
+            base_delay: Shortest delay before a retry, in seconds
+            max_delay: Longest delay before a retry, in seconds
+            max_retry_after: Longest ``Retry-After`` to wait for; longer ones aren't retried
+            retry_network_errors: Retry requests that failed without a response
+        """
+        self.max_retries = max_retries
+        self.status_codes = frozenset(status_codes)
+        self.methods = frozenset(method.upper() for method in methods)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_retry_after = max_retry_after
+        self.retry_network_errors = retry_network_errors
+
+    def __repr__(self) -> str:
+        return f"RetryRule(max_retries={self.max_retries!r}, base_delay={self.base_delay!r})"
+
+
+class RetryBudget:
+    """
+    Client-wide limit on retries, as a share of recent successful calls.
+
+    Within any ``window`` seconds at most ``min_retries`` plus ``ratio`` times
+    the number of successful calls are retried. When an outage makes most
+    calls fail, successes dry up and so do retries, so retrying can't multiply
+    the load on a struggling API.
+    """
+
+    def __init__(self, ratio: float = 0.2, window: float = 10.0, min_retries: int = 10):
+        """
+        Initialize the budget.
+
+        Args:
+            ratio: Retries allowed per successful call
+            window: Seconds of history the budget is computed over
+            min_retries: Retries always allowed per window, so quiet clients can still retry
+        """
+        self.ratio = ratio
+        self.window = window
+        self.min_retries = min_retries
+        self.exhausted = 0
+        # One [second, successes, retries] bucket per second of the window
+        self._buckets: Deque[List[int]] = collections.deque()
+        self._lock = threading.Lock()
+
+    def _current_bucket(self) -> List[int]:
+        """Get the bucket for this second, dropping buckets older than the window; call with the lock held."""
+        now = int(time.monotonic())
+        while self._buckets and self._buckets[0][0] <= now - self.window:
+            self._buckets.popleft()
+        if not self._buckets or self._buckets[-1][0] != now:
+            self._buckets.append([now, 0, 0])
+        return self._buckets[-1]
+
+    def record_success(self) -> None:
+        """Record a call that needed no (more) retries."""
+        with self._lock:
+            self._current_bucket()[1] += 1
+
+    def try_spend(self) -> bool:
+        """Take one retry from the budget, returning False if it is used up."""
+        with self._lock:
+            bucket = self._current_bucket()
+            successes = sum(entry[1] for entry in self._buckets)
+            retries = sum(entry[2] for entry in self._buckets)
+            if retries >= self.min_retries + self.ratio * successes:
+                self.exhausted += 1
+                return False
+            bucket[2] += 1
+            return True
+
+    def after_fork(self) -> None:
+        """Forget the parent process's history."""
+        # A fresh lock, since another parent thread may have held the old one at fork time
+        self._lock = threading.Lock()
+        self._buckets = collections.deque()
+
+    def as_dict(self) -> Dict[str, int]:
+        """Return the ``successes`` and ``retries`` in the window, and how often the budget was ``exhausted``."""
+        with self._lock:
+            self._current_bucket()
+            return {
+                "successes": sum(entry[1] for entry in self._buckets),
+                "retries": sum(entry[2] for entry in self._buckets),
+                "exhausted": self.exhausted,
+            }
+
+
+class RetryState:
+    """Retry bookkeeping for one call; see :meth:`RetryPolicy.begin`."""
+
+    def __init__(self, rule: RetryRule, method: str, budget: Optional[RetryBudget]):
+        self.rule = rule
+        self.method = method
+        self.budget = budget
+        self.retries = 0
+        self._delay = rule.base_delay
+
+    def next_delay(
+        self, status_code: Optional[int] = None, headers: Optional[Mapping[str, str]] = None
+    ) -> Optional[float]:
+        """
+        Decide whether to retry after an attempt.
+
+        Args:
+            status_code: The attempt's status code, or None if it failed without a response
+            headers: The attempt's response headers (optional)
+
+        Returns:
+            Optional[float]: Seconds to wait before retrying, or None not to retry
+        """
+        rule = self.rule
+        if status_code is not None and status_code not in rule.status_codes:
+            if self.budget is not None:
+                self.budget.record_success()
+            return None
+        if status_code is None and not rule.retry_network_errors:
+            return None
+        if self.method not in rule.methods or self.retries >= rule.max_retries:
+            return None
+
+        retry_after = parse_retry_after(headers)
+        if retry_after is not None:
+            if retry_after > rule.max_retry_after:
+                return None
+            delay = retry_after
+        else:
+            self._delay = min(rule.max_delay, random.uniform(rule.base_delay, self._delay * 3))
+            delay = self._delay
+
+        if self.budget is not None and not self.budget.try_spend():
+            return None
+        self.retries += 1
+        return delay
+
+
+class RetryPolicy:
+    """
+    Retry rules per endpoint, sharing one client-wide :class:`RetryBudget`.
+
+    ``rules`` maps glob patterns to rules. A pattern is matched against the
+    endpoint name, e.g. ``"POST user-api/whatsapp/*"`` (see
+    :func:`~devhub_python.circuit.endpoint_key`), or against the path alone,
+    e.g. ``"*rcs*"``. The first matching pattern wins; other endpoints use
+    ``default``.
+
+    Example:
+        >>> policy = RetryPolicy(
+        ...     default=RetryRule(max_retries=3),
+        ...     rules={"POST user-api/sms/*": RetryRule(max_retries=1, max_delay=1.0)},
+        ...     budget=RetryBudget(ratio=0.1),
+        ... )
+        >>> client = DevoClient(api_key="your-api-key", retry_policy=policy)
+    """
+
+    RULE_CACHE_SIZE = 1024
+
+    def __init__(
+        self,
+        default: Optional[RetryRule] = None,
+        rules: Optional[Mapping[str, RetryRule]] = None,
+        budget: Optional[RetryBudget] = None,
+    ):
+        """
+        Initialize the policy.
+
+        Args:
+            default: Rule for endpoints no pattern matches (default: ``RetryRule()``)
+            rules: Rules for endpoints matching glob patterns, tried in order (optional)
+            budget: Client-wide retry budget (default: ``RetryBudget()``)
+        """
+        self.default = default or RetryRule()
+        self.rules = dict(rules or {})
+        self.budget = budget if budget is not None else RetryBudget()
+        self._rule_cache: Dict[str, RetryRule] = {}
+
+    def rule_for(self, method: str, path: str) -> RetryRule:
+        """Find the rule for a request."""
+        endpoint = endpoint_key(method, path)
+        rule = self._rule_cache.get(endpoint)
+        if rule is None:
+            endpoint_path = endpoint.split(" ", 1)[1]
+            rule = next(
+                (
+                    rule
+                    for pattern, rule in self.rules.items()
+                    if fnmatch.fnmatchcase(endpoint, pattern) or fnmatch.fnmatchcase(endpoint_path, pattern)
+                ),
+                self.default,
+            )
+            if len(self._rule_cache) < self.RULE_CACHE_SIZE:
+                self._rule_cache[endpoint] = rule
+        return rule
+
+    def begin(self, method: str, path: str) -> RetryState:
+        """Start retry bookkeeping for a call."""
+        method = method.upper()
+        return RetryState(self.rule_for(method, path), method, self.budget)
+
+    def after_fork(self) -> None:
+        """Forget the parent process's retry history."""
+        self.budget.after_fork()
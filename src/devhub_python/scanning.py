@@ -0,0 +1,412 @@
+import asyncio
+import collections
+import contextvars
+import json
+import os
+import re
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import datetime, timedelta, timezone
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from .exceptions import DevoValidationException
+
+Timestamp = Union[datetime, str]
+
+# Fetches ``(date_sent_after, date_sent_before, limit, offset)`` and returns the page's items
+Fetch = Callable[[str, str, int, int], Sequence[Any]]
+AsyncFetch = Callable[[str, str, int, int], Awaitable[Sequence[Any]]]
+
+# Shards are queried this much wider than their range, so whether the API's date
+# filters include their bounds doesn't matter; items are then kept by their own range
+BOUNDARY_MARGIN = timedelta(seconds=1)
+DEFAULT_MIN_SPAN = timedelta(minutes=1)
+
+_FRACTION = re.compile(r"\.(\d+)")
+
+
+def parse_timestamp(value: Optional[Timestamp]) -> Optional[datetime]:
+    """
+    Parse an API timestamp.
+
+    Args:
+        value: A datetime or an ISO 8601 string such as ``"2024-01-01T12:00:00.123Z"``
+
+    Returns:
+        Optional[datetime]: A timezone-aware datetime (naive values are taken as UTC), or None if ``value`` is empty
+
+    Raises:
+        DevoValidationException: If ``value`` isn't a timestamp
+    """
+    if value is None or value == "":
+        return None
+    if isinstance(value, str):
+        text = value.strip()
+        if text[-1:] in ("Z", "z"):
+            text = text[:-1] + "+00:00"
+        # datetime.fromisoformat only takes 3 or 6 fraction digits before Python 3.11
+        text = _FRACTION.sub(lambda match: "." + (match.group(1) + "000000")[:6], text, count=1)
+        try:
+            value = datetime.fromisoformat(text)
+        except ValueError:
+            raise DevoValidationException(f"Invalid timestamp: {value!r}")
+    if not isinstance(value, datetime):
+        raise DevoValidationException(f"Invalid timestamp: {value!r}")
+    return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+
+
+def _sent_at(item: Any) -> Optional[datetime]:
+    return parse_timestamp(item.get("date_sent") if isinstance(item, dict) else getattr(item, "date_sent", None))
+
+
+class TimeShard:
+    """
+    A slice ``[start, end)`` of a scanned time range.
+
+    ``offset`` counts the items read from the shard so far, and ``done`` is
+    set once its last page has been read (or once it was split).
+    """
+
+    def __init__(self, start: datetime, end: datetime, offset: int = 0, done: bool = False):
+        self.start = start
+        self.end = end
+        self.offset = offset
+        self.done = done
+
+    def __repr__(self) -> str:
+        return f"TimeShard({self.start.isoformat()}, {self.end.isoformat()}, offset={self.offset}, done={self.done})"
+
+    @property
+    def key(self) -> str:
+        """Identify the shard by its range."""
+        return f"{self.start.isoformat()}/{self.end.isoformat()}"
+
+    @property
+    def span(self) -> timedelta:
+        """Length of the shard's range."""
+        return self.end - self.start
+
+    def contains(self, moment: Optional[datetime]) -> bool:
+        """Whether ``moment`` falls in the shard's range."""
+        return moment is not None and self.start <= moment < self.end
+
+    def split(self, parts: int) -> List["TimeShard"]:
+        """Split the shard into ``parts`` shards of equal span."""
+        step = self.span / parts
+        bounds = [self.start + step * part for part in range(parts)] + [self.end]
+        return [TimeShard(start, end) for start, end in zip(bounds, bounds[1:])]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the shard as a checkpoint file record."""
+        return {"start": self.start.isoformat(), "end": self.end.isoformat(), "offset": self.offset, "done": self.done}
+
+    @classmethod
+    def from_dict(cls, record: Mapping[str, Any]) -> "TimeShard":
+        """Deserialize a checkpoint file record."""
+        return cls(
+            start=parse_timestamp(record["start"]),  # type: ignore[arg-type]
+            end=parse_timestamp(record["end"]),  # type: ignore[arg-type]
+            offset=record.get("offset", 0),
+            done=record.get("done", False),
+        )
+
+
+class ScanCheckpoint:
+    """
+    Progress of a time-sharded scan, used to resume it after a failure.
+
+    A shard's offset is recorded once every item of a page it returned has
+    been yielded, so a resumed scan repeats at most the page that was being
+    read. With ``path``, records are also appended to a JSON-lines file and
+    reloaded on start, so a scan can be resumed by a new process.
+
+    Example:
+        >>> checkpoint = ScanCheckpoint(path="march.checkpoint")
+        >>> for message in client.messages.scan("2024-03-01", "2024-04-01", checkpoint=checkpoint):
+        ...     store(message)
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Initialize the checkpoint.
+
+        Args:
+            path: JSON-lines file to persist progress to (optional)
+        """
+        self.path = path
+        self.scan: Optional[Dict[str, Any]] = None
+        self.shards: Dict[str, TimeShard] = {}
+
+        if path is not None and os.path.exists(path):
+            self._load(path)
+
+    @property
+    def done(self) -> bool:
+        """Whether a scan was started and every one of its shards has been read."""
+        return self.scan is not None and not self.pending()
+
+    def begin(self, scan: Dict[str, Any], shards: List[TimeShard]) -> List[TimeShard]:
+        """
+        Start a scan, or resume the one recorded.
+
+        Args:
+            scan: Description of the scan (range and filters), JSON-serializable
+            shards: Shards to start a new scan with
+
+        Returns:
+            List[TimeShard]: Shards left to read
+
+        Raises:
+            DevoValidationException: If the checkpoint records a different scan
+        """
+        if self.scan is None:
+            self.scan = scan
+            self._append({"scan": scan})
+            for shard in shards:
+                self.record(shard)
+        elif self.scan != scan:
+            raise DevoValidationException(f"The checkpoint belongs to a different scan: {self.scan}")
+        return self.pending()
+
+    def record(self, shard: TimeShard, children: Sequence[TimeShard] = ()) -> None:
+        """
+        Record a shard's progress.
+
+        Args:
+            shard: The shard
+            children: Shards the shard was split into, recorded along with it
+        """
+        record = shard.to_dict()
+        if children:
+            record["children"] = [child.to_dict() for child in children]
+        for item in [shard, *children]:
+            self.shards[item.key] = item
+        self._append(record)
+
+    def pending(self) -> List[TimeShard]:
+        """Get the shards left to read."""
+        return [shard for shard in self.shards.values() if not shard.done]
+
+    def _append(self, record: Dict[str, Any]) -> None:
+        """Append a record to the checkpoint file, if there is one."""
+        if self.path is not None:
+            with open(self.path, "a", encoding="utf-8") as checkpoint_file:
+                checkpoint_file.write(json.dumps(record) + "\n")
+
+    def _load(self, path: str) -> None:
+        """Load the scan and its shards from a checkpoint file; later records win."""
+        with open(path, encoding="utf-8") as checkpoint_file:
+            for line in checkpoint_file:
+                try:
+                    record = json.loads(line)
+                    if "scan" in record:
+                        self.scan = record["scan"]
+                        continue
+                    shards = [TimeShard.from_dict(item) for item in [record, *record.get("children", ())]]
+                except (ValueError, KeyError, TypeError, DevoValidationException):
+                    # Skip a record torn by a crash mid-write
+                    continue
+                for shard in shards:
+                    self.shards[shard.key] = shard
+
+
+class _TimeScan:
+    """Bookkeeping of a time-sharded scan, shared by the sync and async drivers."""
+
+    def __init__(
+        self,
+        start: Timestamp,
+        end: Timestamp,
+        shards: int,
+        workers: int,
+        limit: int,
+        split_threshold: Optional[int],
+        min_span: timedelta,
+        checkpoint: Optional[ScanCheckpoint],
+        filters: Optional[Mapping[str, Any]],
+    ):
+        begin, finish = parse_timestamp(start), parse_timestamp(end)
+        if begin is None or finish is None or begin >= finish:
+            raise DevoValidationException("start must be before end")
+        if shards < 1:
+            raise DevoValidationException("shards must be at least 1")
+        if workers < 1:
+            raise DevoValidationException("workers must be at least 1")
+        if limit < 1:
+            raise DevoValidationException("limit must be at least 1")
+        if split_threshold is not None and split_threshold < limit:
+            raise DevoValidationException("split_threshold must be at least limit")
+        if min_span <= timedelta(0):
+            raise DevoValidationException("min_span must be positive")
+
+        self.workers = workers
+        self.limit = limit
+        self.split_threshold = split_threshold if split_threshold is not None else 10 * limit
+        self.min_span = min_span
+        self.checkpoint = checkpoint if checkpoint is not None else ScanCheckpoint()
+        # Round-trip through JSON so a description loaded from a checkpoint file compares equal
+        scan = json.loads(
+            json.dumps({"start": begin.isoformat(), "end": finish.isoformat(), "filters": filters or {}}, default=str)
+        )
+        initial = TimeShard(begin, finish).split(shards)
+        self.queue: Deque[TimeShard] = collections.deque(self.checkpoint.begin(scan, initial))
+
+    def query(self, shard: TimeShard) -> Tuple[str, str]:
+        """Get the ``date_sent_after`` and ``date_sent_before`` filters to read a shard with."""
+        return (shard.start - BOUNDARY_MARGIN).isoformat(), (shard.end + BOUNDARY_MARGIN).isoformat()
+
+    def should_probe(self, shard: TimeShard) -> bool:
+        """Whether to check that a shard isn't too dense before reading it."""
+        return shard.offset == 0 and shard.span >= 2 * self.min_span
+
+    def apply(
+        self, shard: TimeShard, dense: bool, items: Sequence[Any]
+    ) -> Tuple[List[Any], TimeShard, List[TimeShard]]:
+        """
+        Work out a step's result, leaving ``shard`` as recorded until :meth:`commit`.
+
+        Returns:
+            The items in the shard's range, the shard as it stands after the step,
+            and the shards to read next
+        """
+        if dense:
+            return [], TimeShard(shard.start, shard.end, shard.offset, done=True), shard.split(2)
+        advanced = TimeShard(shard.start, shard.end, shard.offset + len(items), done=len(items) < self.limit)
+        kept = [item for item in items if shard.contains(_sent_at(item))]
+        return kept, advanced, [] if advanced.done else [advanced]
+
+    def commit(self, shard: TimeShard, follow: List[TimeShard]) -> None:
+        """Record a step once all of its items have been yielded, and queue the shards to read next."""
+        self.checkpoint.record(shard, [child for child in follow if child is not shard])
+        self.queue.extend(follow)
+
+    def step(self, fetch: Fetch, shard: TimeShard) -> Tuple[bool, Sequence[Any]]:
+        """Read a shard's next page, or find that it is too dense to read without splitting it."""
+        after, before = self.query(shard)
+        if self.should_probe(shard) and fetch(after, before, 1, self.split_threshold):
+            return True, []
+        return False, fetch(after, before, self.limit, shard.offset)
+
+    async def step_async(self, fetch: AsyncFetch, shard: TimeShard) -> Tuple[bool, Sequence[Any]]:
+        """Read a shard's next page. See :meth:`step`."""
+        after, before = self.query(shard)
+        if self.should_probe(shard) and await fetch(after, before, 1, self.split_threshold):
+            return True, []
+        return False, await fetch(after, before, self.limit, shard.offset)
+
+
+def scan_time_range(
+    fetch: Fetch,
+    start: Timestamp,
+    end: Timestamp,
+    shards: int = 8,
+    workers: int = 4,
+    limit: int = 100,
+    split_threshold: Optional[int] = None,
+    min_span: timedelta = DEFAULT_MIN_SPAN,
+    checkpoint: Optional[ScanCheckpoint] = None,
+    filters: Optional[Mapping[str, Any]] = None,
+) -> Iterator[Any]:
+    """
+    Yield every item sent in ``[start, end)``, reading time shards of the range in parallel.
+
+    The range is split into ``shards`` shards of equal span, and up to
+    ``workers`` of them are read at once, page by page. Before reading a
+    shard, a one-item request at offset ``split_threshold`` tells whether
+    it holds more items than that; if so, it is split in two instead, down
+    to shards of ``min_span``. Offsets therefore stay shallow. Each shard is
+    queried slightly wider than its range, and only the items whose
+    ``date_sent`` falls in the shard are kept, so every item of the range is
+    yielded exactly once. Items of different shards are interleaved.
+
+    Args:
+        fetch: Fetches ``(date_sent_after, date_sent_before, limit, offset)`` and returns the page's items
+        start: Start of the range, inclusive; naive times are UTC
+        end: End of the range, exclusive
+        shards: Number of shards to split the range into at first
+        workers: Shards read at once
+        limit: Items per page
+        split_threshold: Split shards holding more items than this (default: ten pages)
+        min_span: Don't split shards shorter than twice this
+        checkpoint: Records each shard's progress and resumes a scan it recorded (optional)
+        filters: Other filters of the scan, recorded in the checkpoint (optional)
+
+    Returns:
+        Iterator[Any]: The items, as ``fetch`` returns them
+
+    Raises:
+        DevoValidationException: If the arguments are invalid, or ``checkpoint`` records a different scan
+    """
+    scan = _TimeScan(start, end, shards, workers, limit, split_threshold, min_span, checkpoint, filters)
+    return _scan(scan, fetch)
+
+
+def _scan(scan: _TimeScan, fetch: Fetch) -> Iterator[Any]:
+    executor = ThreadPoolExecutor(max_workers=scan.workers, thread_name_prefix="devhub-scan")
+    running: Dict["Future[Tuple[bool, Sequence[Any]]]", TimeShard] = {}
+    try:
+        while scan.queue or running:
+            while scan.queue and len(running) < scan.workers:
+                shard = scan.queue.popleft()
+                # Shards are read in a copy of the caller's context, so they see its deadline
+                running[executor.submit(contextvars.copy_context().run, scan.step, fetch, shard)] = shard
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                shard = running.pop(future)
+                items, advanced, follow = scan.apply(shard, *future.result())
+                yield from items
+                scan.commit(advanced, follow)
+    finally:
+        for future in running:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+def scan_time_range_async(
+    fetch: AsyncFetch,
+    start: Timestamp,
+    end: Timestamp,
+    shards: int = 8,
+    workers: int = 4,
+    limit: int = 100,
+    split_threshold: Optional[int] = None,
+    min_span: timedelta = DEFAULT_MIN_SPAN,
+    checkpoint: Optional[ScanCheckpoint] = None,
+    filters: Optional[Mapping[str, Any]] = None,
+) -> AsyncIterator[Any]:
+    """Yield every item sent in ``[start, end)``, reading shards in tasks. See :func:`scan_time_range`."""
+    scan = _TimeScan(start, end, shards, workers, limit, split_threshold, min_span, checkpoint, filters)
+    return _scan_async(scan, fetch)
+
+
+async def _scan_async(scan: _TimeScan, fetch: AsyncFetch) -> AsyncIterator[Any]:
+    running: Dict["asyncio.Task[Tuple[bool, Sequence[Any]]]", TimeShard] = {}
+    try:
+        while scan.queue or running:
+            while scan.queue and len(running) < scan.workers:
+                shard = scan.queue.popleft()
+                running[asyncio.ensure_future(scan.step_async(fetch, shard))] = shard
+            finished, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in finished:
+                shard = running.pop(task)
+                items, advanced, follow = scan.apply(shard, *task.result())
+                for item in items:
+                    yield item
+                scan.commit(advanced, follow)
+    finally:
+        for task in running:
+            task.cancel()
+        await asyncio.gather(*running, return_exceptions=True)
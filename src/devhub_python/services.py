@@ -1,9 +1,10 @@
 from typing import TYPE_CHECKING
 
-from .resources.contact_groups import ContactGroupsResource
-from .resources.contacts import ContactsResource
+from .resources.contact_groups import AsyncContactGroupsResource, ContactGroupsResource
+from .resources.contacts import AsyncContactsResource, ContactsResource
 
 if TYPE_CHECKING:
+    from .async_client import AsyncDevoClient
     from .client import DevoClient
 
 
@@ -39,3 +40,30 @@ class ServicesNamespace:
     def __repr__(self) -> str:
         """String representation of the services namespace."""
         return f"<ServicesNamespace for {self._client.__class__.__name__}>"
+
+
+class AsyncServicesNamespace:
+    """
+    Namespace for accessing service-related resources on the async client.
+
+    Example:
+        >>> async with AsyncDevoClient(api_key="your-api-key") as client:
+        ...     groups = await client.services.contact_groups.list()
+    """
+
+    def __init__(self, client: "AsyncDevoClient"):
+        """
+        Initialize the services namespace.
+
+        Args:
+            client: The AsyncDevoClient instance
+        """
+        self._client = client
+
+        # Initialize service resources
+        self.contact_groups = AsyncContactGroupsResource(client)
+        self.contacts = AsyncContactsResource(client)
+
+    def __repr__(self) -> str:
+        """String representation of the services namespace."""
+        return f"<AsyncServicesNamespace for {self._client.__class__.__name__}>"
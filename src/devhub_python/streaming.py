@@ -0,0 +1,303 @@
+import codecs
+import json
+import re
+from typing import Any, AsyncIterator, Callable, Dict, Generic, Iterator, List, Optional, Type, TypeVar
+
+from pydantic import BaseModel
+
+from .exceptions import DevoException, DevoNetworkException, DevoValidationException
+from .records import record_type
+from .views import RecordView
+
+T = TypeVar("T")
+
+# Bytes read from the connection at a time
+CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+# Characters that may continue a number, e.g. "1500" in "1500.0"
+_NUMBER_TAIL = re.compile(r"[0-9.eE+-]*")
+
+# Parser states
+_START = "start"
+_FIRST_KEY = "first_key"
+_KEY = "key"
+_COLON = "colon"
+_VALUE = "value"
+_AFTER_MEMBER = "after_member"
+_FIRST_ITEM = "first_item"
+_ITEM = "item"
+_AFTER_ITEM = "after_item"
+_DONE = "done"
+
+_NEED_MORE = object()
+
+# Incomplete values longer than this are only rescanned once the buffer has doubled
+_RESCAN_THRESHOLD = 64 * 1024
+
+
+class JSONArrayParser:
+    """
+    Incremental parser that pulls the items out of a JSON array as its bytes arrive.
+
+    The array is either the whole document or, in a top-level object, the
+    member named ``items_key`` (e.g. ``"contacts"`` in a page of contacts).
+    Each item is decoded as soon as it is complete, so memory holds one chunk
+    and the item being read rather than the whole document. The object's
+    other members, such as ``total`` or ``page``, are collected in
+    :attr:`rest`.
+    """
+
+    def __init__(self, items_key: Optional[str] = None):
+        """
+        Initialize the parser.
+
+        Args:
+            items_key: Member of a top-level object that holds the array (optional)
+        """
+        self.items_key = items_key
+        self.rest: Dict[str, Any] = {}
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._scanner = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._state = _START
+        self._key: Optional[str] = None
+        self._in_object = False
+        self._final = False
+        # Buffer length at which an incomplete value is decoded again, keeping huge values linear
+        self._retry_at = 0
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """
+        Parse the next chunk of the document.
+
+        Returns:
+            List[Any]: The items completed by this chunk
+
+        Raises:
+            ValueError: If the document isn't valid JSON of the expected shape
+        """
+        self._buffer = self._buffer[self._pos :] + self._decoder.decode(chunk)
+        self._retry_at -= self._pos
+        self._pos = 0
+        if len(self._buffer) < self._retry_at:
+            return []
+        return self._parse()
+
+    def close(self) -> List[Any]:
+        """
+        Finish parsing once the whole document has been fed.
+
+        Returns:
+            List[Any]: The remaining items
+
+        Raises:
+            ValueError: If the document is incomplete or isn't valid JSON
+        """
+        self._buffer = self._buffer[self._pos :] + self._decoder.decode(b"", final=True)
+        self._pos = 0
+        self._final = True
+        items = self._parse()
+        if self._state is not _DONE:
+            raise ValueError("Incomplete JSON document")
+        if self._buffer[self._skip_whitespace() :]:
+            raise ValueError("Extra data after the JSON document")
+        return items
+
+    def _skip_whitespace(self) -> int:
+        return _WHITESPACE.match(self._buffer, self._pos).end()  # type: ignore[union-attr]
+
+    def _next_char(self) -> Optional[str]:
+        """Skip whitespace and return the next character, without consuming it (None if none has arrived)."""
+        self._pos = self._skip_whitespace()
+        return self._buffer[self._pos] if self._pos < len(self._buffer) else None
+
+    def _value(self) -> Any:
+        """Decode the value at the current position, or return _NEED_MORE if it hasn't fully arrived."""
+        try:
+            value, end = self._scanner.raw_decode(self._buffer, self._pos)
+        except json.JSONDecodeError:
+            if self._final:
+                raise
+            if len(self._buffer) - self._pos > _RESCAN_THRESHOLD:
+                self._retry_at = len(self._buffer) * 2
+            return _NEED_MORE
+        # A value running up to the end of the buffer, such as a number, may continue in the next chunk
+        tail = _NUMBER_TAIL.match(self._buffer, end)
+        if not self._final and tail.end() == len(self._buffer):  # type: ignore[union-attr]
+            return _NEED_MORE
+        self._pos = end
+        return value
+
+    def _expect(self, char: Optional[str], expected: str) -> None:
+        if char is None or char not in expected:
+            found = "end of document" if char is None else repr(char)
+            raise ValueError(f"Expected one of {expected!r} at position {self._pos}, found {found}")
+
+    def _parse(self) -> List[Any]:
+        items: List[Any] = []
+        while self._state is not _DONE:
+            char = self._next_char()
+            if char is None:
+                if self._final:
+                    self._expect(None, "]}" if self._state is not _START else "[{")
+                return items
+            state = self._state
+            if state is _START:
+                self._expect(char, "[{")
+                self._pos += 1
+                self._in_object = char == "{"
+                self._state = _FIRST_KEY if self._in_object else _FIRST_ITEM
+            elif state is _FIRST_KEY or state is _KEY:
+                if state is _FIRST_KEY and char == "}":
+                    self._pos += 1
+                    self._state = _DONE
+                    continue
+                self._expect(char, '"')
+                key = self._value()
+                if key is _NEED_MORE:
+                    return items
+                self._key = key
+                self._state = _COLON
+            elif state is _COLON:
+                self._expect(char, ":")
+                self._pos += 1
+                self._state = _VALUE
+            elif state is _VALUE:
+                if self._key == self.items_key and char == "[":
+                    self._pos += 1
+                    self._state = _FIRST_ITEM
+                    continue
+                value = self._value()
+                if value is _NEED_MORE:
+                    return items
+                self.rest[self._key] = value  # type: ignore[index]
+                self._state = _AFTER_MEMBER
+            elif state is _AFTER_MEMBER:
+                self._expect(char, ",}")
+                self._pos += 1
+                self._state = _KEY if char == "," else _DONE
+            elif state is _FIRST_ITEM and char == "]" or state is _AFTER_ITEM:
+                self._expect(char, ",]")
+                self._pos += 1
+                if char == ",":
+                    self._state = _ITEM
+                else:
+                    self._state = _AFTER_MEMBER if self._in_object else _DONE
+            else:
+                item = self._value()
+                if item is _NEED_MORE:
+                    return items
+                items.append(item)
+                self._state = _AFTER_ITEM
+        return items
+
+
+def item_converter(model_class: Type[BaseModel], lazy: bool = False, records: bool = False) -> Callable[[Any], Any]:
+    """Get the function that turns a decoded item into a model, a :class:`RecordView` or a :class:`Record`."""
+    if lazy:
+        return lambda item: RecordView(model_class, item)
+    if records:
+        return record_type(model_class).from_dict
+    return model_class.model_validate
+
+
+class _BaseItemStream(Generic[T]):
+    """State shared by the sync and async item streams."""
+
+    def __init__(self, response: Any, convert: Callable[[Any], T], items_key: Optional[str] = None):
+        self.response = response
+        self._convert = convert
+        self._parser = JSONArrayParser(items_key)
+        self._started = False
+
+    @property
+    def rest(self) -> Dict[str, Any]:
+        """Members of the response object other than the items (e.g. ``total``), as far as read."""
+        return self._parser.rest
+
+    def _start(self) -> None:
+        if self._started:
+            raise DevoException("A streamed response can only be iterated once")
+        self._started = True
+
+    def _parse(self, chunk: Optional[bytes]) -> List[T]:
+        """Parse the next chunk, or finish parsing when ``chunk`` is None."""
+        try:
+            items = self._parser.close() if chunk is None else self._parser.feed(chunk)
+        except ValueError as e:
+            raise DevoValidationException(f"Failed to parse response: {str(e)}")
+        return [self._convert(item) for item in items]
+
+
+class ItemStream(_BaseItemStream[T]):
+    """
+    Items of a list response, parsed one at a time as the body downloads.
+
+    Iterate it once; the connection is released when the items run out, when
+    the stream is closed, or when a ``with`` block around it exits. Memory
+    stays flat however long the list is, and work can start on the first
+    items before the rest have arrived.
+    """
+
+    def __iter__(self) -> Iterator[T]:
+        self._start()
+        chunks = iter(self.response.iter_content(CHUNK_SIZE))
+        try:
+            while True:
+                try:
+                    chunk = next(chunks, None)
+                except DevoException:
+                    raise
+                except Exception as e:
+                    raise DevoNetworkException(f"Reading the response failed: {str(e)}", original_exception=e)
+                yield from self._parse(chunk)
+                if chunk is None:
+                    return
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Release the connection, discarding whatever hasn't been read."""
+        self.response.close()
+
+    def __enter__(self) -> "ItemStream[T]":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+class AsyncItemStream(_BaseItemStream[T]):
+    """Items of a list response, parsed one at a time as the body downloads. See :class:`ItemStream`."""
+
+    async def __aiter__(self) -> AsyncIterator[T]:
+        self._start()
+        chunks = self.response.aiter_bytes(CHUNK_SIZE).__aiter__()
+        try:
+            while True:
+                try:
+                    chunk: Optional[bytes] = await chunks.__anext__()
+                except StopAsyncIteration:
+                    chunk = None
+                except DevoException:
+                    raise
+                except Exception as e:
+                    raise DevoNetworkException(f"Reading the response failed: {str(e)}", original_exception=e)
+                for item in self._parse(chunk):
+                    yield item
+                if chunk is None:
+                    return
+        finally:
+            await self.aclose()
+
+    async def aclose(self) -> None:
+        """Release the connection, discarding whatever hasn't been read."""
+        await self.response.aclose()
+
+    async def __aenter__(self) -> "AsyncItemStream[T]":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
@@ -0,0 +1,125 @@
+import contextlib
+import contextvars
+import time
+from typing import Iterator, Optional, Union
+
+import urllib3
+
+# Absolute time.monotonic() by which the current call must finish
+_deadline: "contextvars.ContextVar[Optional[float]]" = contextvars.ContextVar("devhub_deadline", default=None)
+
+# Smallest timeout handed to a socket once the deadline has (almost) passed
+_MIN_TIMEOUT = 0.001
+
+
+class Timeout:
+    """
+    Timeouts for API calls.
+
+    ``connect`` and ``read`` bound each attempt: establishing the connection,
+    and waiting for the server between bytes of the response. ``deadline``
+    bounds the whole call, including retries, backoff sleeps and waits in the
+    rate and concurrency limiters; every attempt's timeouts are cut to the time
+    that is left, and no retry starts once the budget is spent.
+
+    Example:
+        >>> client = DevoClient(api_key="your-api-key", timeout=Timeout(connect=3.05, read=10, deadline=20))
+    """
+
+    def __init__(
+        self,
+        timeout: Optional[float] = None,
+        connect: Optional[float] = None,
+        read: Optional[float] = None,
+        deadline: Optional[float] = None,
+    ):
+        """
+        Initialize the timeouts.
+
+        Args:
+            timeout: Seconds for both the connect and read timeouts, unless given separately
+            connect: Seconds to wait for a connection (optional)
+            read: Seconds to wait for the server to send data (optional)
+            deadline: Seconds the whole call may take, retries included (optional)
+        """
+        self.connect = connect if connect is not None else timeout
+        self.read = read if read is not None else timeout
+        self.deadline = deadline
+
+    @classmethod
+    def coerce(cls, timeout: Union[float, "Timeout", None]) -> "Timeout":
+        """Turn a client's ``timeout`` argument, a number of seconds or a Timeout, into a Timeout."""
+        if isinstance(timeout, Timeout):
+            return timeout
+        return cls(timeout)
+
+    def expires_at(self) -> Optional[float]:
+        """Return when a call starting now must finish, taking any enclosing :func:`deadline` into account."""
+        expires_at = _deadline.get()
+        if self.deadline is not None:
+            own = time.monotonic() + self.deadline
+            expires_at = own if expires_at is None else min(expires_at, own)
+        return expires_at
+
+    def for_attempt(self, expires_at: Optional[float] = None) -> Union[float, urllib3.Timeout, None]:
+        """
+        Build the ``timeout`` argument for a transport.
+
+        Returns a plain number when connect and read are equal and there is no
+        deadline, so custom transports keep receiving what they always have.
+        Otherwise returns a ``urllib3.Timeout``, which requests passes through
+        unchanged; with a deadline, each attempt's copy is cut to the time left.
+        """
+        if expires_at is not None:
+            return _DeadlineTimeout(self.connect, self.read, expires_at)
+        if self.connect == self.read:
+            return self.read
+        return urllib3.Timeout(connect=self.connect, read=self.read)
+
+    def __repr__(self) -> str:
+        return f"Timeout(connect={self.connect!r}, read={self.read!r}, deadline={self.deadline!r})"
+
+
+class _DeadlineTimeout(urllib3.Timeout):
+    """urllib3 timeout whose per-attempt copies never outlast the deadline."""
+
+    def __init__(self, connect: Optional[float], read: Optional[float], expires_at: float):
+        super().__init__(connect=connect, read=read)
+        self.expires_at = expires_at
+
+    def clone(self) -> urllib3.Timeout:
+        # urllib3 clones the timeout for every attempt, retries included
+        left = max(self.expires_at - time.monotonic(), _MIN_TIMEOUT)
+        connect, read = self._connect, self._read
+        return urllib3.Timeout(
+            connect=min(connect, left) if isinstance(connect, (int, float)) else left,
+            read=min(read, left) if isinstance(read, (int, float)) else left,
+        )
+
+
+def remaining(expires_at: Optional[float]) -> Optional[float]:
+    """Seconds left until ``expires_at`` (never negative), or None without a deadline."""
+    if expires_at is None:
+        return None
+    return max(expires_at - time.monotonic(), 0.0)
+
+
+@contextlib.contextmanager
+def deadline(seconds: float) -> Iterator[None]:
+    """
+    Bound every API call made inside the block, retries included, to ``seconds`` from now.
+
+    Nested deadlines never extend an outer one. The deadline is kept in a
+    ``contextvars`` variable, so asyncio tasks created inside the block inherit it.
+
+    Example:
+        >>> with deadline(2.0):
+        ...     client.sms.send_sms(recipient=number, message=f"Your code is {code}", sender=sender)
+    """
+    expires_at = time.monotonic() + seconds
+    current = _deadline.get()
+    token = _deadline.set(expires_at if current is None else min(current, expires_at))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
@@ -0,0 +1,484 @@
+import json as jsonlib
+import threading
+import weakref
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Tuple, Union
+from urllib.parse import urlencode
+
+import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from urllib3.filepost import encode_multipart_formdata
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+
+from .exceptions import DevoConnectionException, DevoNetworkException, DevoTimeoutException
+from .pool import reset_adapter_after_fork, reset_pool_manager_after_fork
+
+
+def build_query_string(params: Optional[Mapping[str, Any]]) -> str:
+    """
+    Encode query parameters the way ``requests`` does.
+
+    ``None`` values are dropped and list values are repeated per item.
+
+    Args:
+        params: Query parameters
+
+    Returns:
+        str: The encoded query string (without a leading ``?``)
+    """
+    if not params:
+        return ""
+
+    pairs = []
+    for key, values in params.items():
+        if isinstance(values, (str, bytes)) or not hasattr(values, "__iter__"):
+            values = [values]
+        pairs.extend((key, value) for value in values if value is not None)
+    return urlencode(pairs)
+
+
+def encode_body(
+    data: Optional[Mapping[str, Any]] = None,
+    json: Optional[Any] = None,
+    files: Optional[Mapping[str, Any]] = None,
+    dumps: Optional[Callable[[Any], bytes]] = None,
+) -> Tuple[Optional[bytes], Optional[str]]:
+    """
+    Serialize a request body once, independently of the transport.
+
+    Args:
+        data: Form data
+        json: JSON data
+        files: Multipart files, as ``{"field": (filename, content, content_type)}``
+        dumps: Function encoding ``json`` to bytes (default: the standard library's ``json``)
+
+    Returns:
+        Tuple[Optional[bytes], Optional[str]]: The body and its content type
+    """
+    if files:
+        fields: Dict[str, Any] = {key: str(value) for key, value in (data or {}).items() if value is not None}
+        fields.update(files)
+        return encode_multipart_formdata(fields)
+    if data:
+        return build_query_string(data).encode("utf-8"), "application/x-www-form-urlencoded"
+    if json is not None:
+        if dumps is not None:
+            return dumps(json), "application/json"
+        return jsonlib.dumps(json, allow_nan=False).encode("utf-8"), "application/json"
+    return None, None
+
+
+class TransportResponse:
+    """
+    Minimal response returned by transports that don't produce ``requests.Response`` objects.
+
+    Exposes the subset of the ``requests.Response`` API that the SDK and its
+    resources rely on.
+    """
+
+    def __init__(self, status_code: int, headers: Mapping[str, str], content: bytes, url: str = "", reason: str = ""):
+        self.status_code = status_code
+        self.headers = CaseInsensitiveDict(headers)
+        self.content = content
+        self.url = url
+        self.reason = reason
+
+    @property
+    def ok(self) -> bool:
+        """Whether the status code is below 400."""
+        return self.status_code < 400
+
+    @property
+    def text(self) -> str:
+        """The body decoded with the charset from Content-Type (UTF-8 by default)."""
+        encoding = get_encoding_from_headers(self.headers) or "utf-8"
+        return self.content.decode(encoding, errors="replace")
+
+    def json(self, **kwargs: Any) -> Any:
+        """Decode the body as JSON."""
+        return jsonlib.loads(self.content, **kwargs)
+
+    def iter_content(self, chunk_size: int = 1) -> Iterator[bytes]:
+        """Iterate over the body in chunks of up to ``chunk_size`` bytes."""
+        content = self.content
+        for start in range(0, len(content), chunk_size):
+            yield content[start : start + chunk_size]
+
+    def close(self) -> None:
+        """Release the connection (nothing to do once the body is read)."""
+
+    def __repr__(self) -> str:
+        return f"<TransportResponse [{self.status_code}]>"
+
+
+class Urllib3StreamResponse(TransportResponse):
+    """
+    :class:`TransportResponse` whose body is read from the connection on demand.
+
+    Returned by :meth:`Urllib3Transport.open`. ``iter_content()`` reads the
+    body chunk by chunk; ``content`` reads whatever is left at once.
+    """
+
+    def __init__(self, response: "urllib3.BaseHTTPResponse", url: str = ""):
+        self.status_code = response.status
+        self.headers = CaseInsensitiveDict(response.headers)
+        self.url = url
+        self.reason = response.reason or ""
+        self._response = response
+        self._content: Optional[bytes] = None
+
+    @property  # type: ignore[override]
+    def content(self) -> bytes:
+        """The body, read from the connection on first access."""
+        if self._content is None:
+            try:
+                self._content = self._response.data
+            except urllib3.exceptions.HTTPError as e:
+                raise Urllib3Transport._translate_error(e)
+        return self._content
+
+    def iter_content(self, chunk_size: int = 1) -> Iterator[bytes]:
+        """Read the body from the connection in chunks of up to ``chunk_size`` bytes."""
+        if self._content is not None:
+            yield from super().iter_content(chunk_size)
+            return
+        try:
+            yield from self._response.stream(chunk_size)
+        except urllib3.exceptions.HTTPError as e:
+            raise Urllib3Transport._translate_error(e)
+
+    def close(self) -> None:
+        """Release the connection, dropping it if the body wasn't read to the end."""
+        self._response.close()
+        self._response.release_conn()
+
+
+class Transport:
+    """
+    Interface for the HTTP layer under :meth:`DevoClient.request`.
+
+    The client prepares the method, full URL, headers and body bytes; a
+    transport only has to put them on the wire and hand back an object with
+    ``status_code``, ``headers``, ``content``, ``text``, ``ok`` and ``json()``.
+    Network failures must be raised as :class:`DevoNetworkException` subclasses.
+    Transports that can't send from several threads at once set ``thread_safe``
+    to False.
+    """
+
+    thread_safe = True
+
+    def send(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        body: Optional[bytes] = None,
+        timeout: Union[float, urllib3.Timeout, None] = None,
+    ) -> Any:
+        """
+        Send a prepared request.
+
+        Args:
+            method: HTTP method
+            url: Full URL including the query string
+            headers: Request headers
+            body: Encoded request body (optional)
+            timeout: Timeout in seconds, or a ``urllib3.Timeout`` when the connect and
+                read timeouts differ or the call has a deadline (optional)
+
+        Returns:
+            The response
+
+        Raises:
+            DevoTimeoutException: If the request timed out
+            DevoConnectionException: If the connection failed
+            DevoNetworkException: For other transport errors
+        """
+        raise NotImplementedError
+
+    def open(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        body: Optional[bytes] = None,
+        timeout: Union[float, urllib3.Timeout, None] = None,
+    ) -> Any:
+        """
+        Send a prepared request, returning once the response headers arrive.
+
+        The body is left on the connection, to be read in chunks with
+        ``iter_content(chunk_size)``; ``close()`` releases the connection.
+        Transports that can't stream may read the whole body, as this
+        default implementation does by calling :meth:`send`.
+
+        Args:
+            method: HTTP method
+            url: Full URL including the query string
+            headers: Request headers
+            body: Encoded request body (optional)
+            timeout: Timeout in seconds or a ``urllib3.Timeout`` (optional)
+
+        Returns:
+            The response, with ``iter_content()`` and ``close()``
+
+        Raises:
+            DevoTimeoutException: If the request timed out
+            DevoConnectionException: If the connection failed
+            DevoNetworkException: For other transport errors
+        """
+        return self.send(method, url, headers, body=body, timeout=timeout)
+
+    def close(self) -> None:
+        """Release any pooled connections."""
+
+    def after_fork(self) -> None:
+        """
+        Drop connections inherited from the parent process.
+
+        Called in a forked child before it sends its first request. The
+        inherited sockets are shared with the parent, so they must never be
+        read from, written to or shut down in the child.
+        """
+
+
+def _reset_sessions_after_fork(sessions: List[requests.Session]) -> None:
+    """Reset every distinct adapter mounted on ``sessions`` after a fork."""
+    adapters = {id(adapter): adapter for session in sessions for adapter in session.adapters.values()}
+    for adapter in adapters.values():
+        if hasattr(adapter, "after_fork"):
+            adapter.after_fork()
+        elif isinstance(adapter, HTTPAdapter):
+            reset_adapter_after_fork(adapter)
+
+
+class RequestsTransport(Transport):
+    """Transport backed by a ``requests.Session``; returns ``requests.Response`` objects."""
+
+    # requests.Session isn't documented as thread-safe
+    thread_safe = False
+
+    def __init__(self, session: Optional[requests.Session] = None):
+        """
+        Initialize the transport.
+
+        Args:
+            session: requests session to send through (optional)
+        """
+        self.session = session or requests.Session()
+
+    def send(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        body: Optional[bytes] = None,
+        timeout: Union[float, urllib3.Timeout, None] = None,
+    ) -> requests.Response:
+        """Send a prepared request through the session."""
+        return self._request(method, url, headers, body, timeout)
+
+    def open(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        body: Optional[bytes] = None,
+        timeout: Union[float, urllib3.Timeout, None] = None,
+    ) -> requests.Response:
+        """Send a prepared request through the session, leaving the body to be streamed."""
+        return self._request(method, url, headers, body, timeout, stream=True)
+
+    def _request(
+        self, method: str, url: str, headers: Dict[str, str], body: Optional[bytes], timeout: Any, **kwargs: Any
+    ) -> requests.Response:
+        try:
+            return self.session.request(method=method, url=url, headers=headers, data=body, timeout=timeout, **kwargs)
+        except requests.exceptions.Timeout as e:
+            raise DevoTimeoutException(original_exception=e)
+        except requests.exceptions.ConnectionError as e:
+            raise DevoConnectionException(original_exception=e)
+        except requests.exceptions.RequestException as e:
+            raise DevoNetworkException(f"Request failed: {str(e)}", original_exception=e)
+
+    def close(self) -> None:
+        """Close the session."""
+        self.session.close()
+
+    def after_fork(self) -> None:
+        """Drop the connections the session's adapters inherited from the parent process."""
+        _reset_sessions_after_fork([self.session])
+
+
+class ThreadLocalRequestsTransport(RequestsTransport):
+    """
+    requests transport that gives every thread its own ``requests.Session``.
+
+    ``requests.Session`` is not documented as thread-safe, and one session
+    funnels every thread through a single adapter and connection pool. Here
+    each thread lazily gets a session from ``session_factory`` on its first
+    request, so threads never share session state or pooled connections.
+    """
+
+    thread_safe = True
+
+    def __init__(self, session_factory: Callable[[], requests.Session]):
+        """
+        Initialize the transport.
+
+        Args:
+            session_factory: Creates a new, fully configured session
+        """
+        self.session_factory = session_factory
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._sessions: "weakref.WeakSet[requests.Session]" = weakref.WeakSet()
+
+    @property
+    def session(self) -> requests.Session:  # type: ignore[override]
+        """The calling thread's session, created on first use."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = self.session_factory()
+            with self._lock:
+                self._sessions.add(session)
+        return session
+
+    @property
+    def sessions(self) -> List[requests.Session]:
+        """Sessions of all threads that are still alive."""
+        with self._lock:
+            return list(self._sessions)
+
+    def close(self) -> None:
+        """Close every thread's session."""
+        for session in self.sessions:
+            session.close()
+
+    def after_fork(self) -> None:
+        """
+        Forget every thread's session, dropping their inherited connections.
+
+        Only the forking thread survives in the child, so threads start over
+        with new sessions. The lock is replaced without being taken, since
+        another parent thread may have held it at fork time.
+        """
+        _reset_sessions_after_fork(list(self._sessions))
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._sessions = weakref.WeakSet()
+
+
+class Urllib3Transport(Transport):
+    """
+    Transport that talks to a ``urllib3.PoolManager`` directly.
+
+    Skips the ``requests`` session, adapter and hook machinery, which is
+    noticeable when sending many small requests.
+    """
+
+    # Advertise every response encoding urllib3 can decode here (brotli and zstd when installed)
+    DEFAULT_HEADERS = {"Accept-Encoding": ACCEPT_ENCODING, "Connection": "keep-alive"}
+
+    def __init__(
+        self,
+        max_retries: Union[Retry, int, None] = 0,
+        pool_manager: Optional[urllib3.PoolManager] = None,
+        num_pools: int = 10,
+        maxsize: int = 10,
+    ):
+        """
+        Initialize the transport.
+
+        Args:
+            max_retries: urllib3 Retry policy or number of retries
+            pool_manager: Custom urllib3 PoolManager (optional)
+            num_pools: Number of per-host connection pools to keep
+            maxsize: Maximum number of connections kept per host
+        """
+        self.retries = max_retries if isinstance(max_retries, Retry) else Retry.from_int(max_retries)
+        self.pool_manager = pool_manager or urllib3.PoolManager(num_pools=num_pools, maxsize=maxsize)
+
+    def send(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        body: Optional[bytes] = None,
+        timeout: Union[float, urllib3.Timeout, None] = None,
+    ) -> TransportResponse:
+        """Send a prepared request through the pool manager."""
+        response = self._request(method, url, headers, body, timeout, preload_content=True)
+        return TransportResponse(
+            status_code=response.status,
+            headers=response.headers,
+            content=response.data,
+            url=url,
+            reason=response.reason or "",
+        )
+
+    def open(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        body: Optional[bytes] = None,
+        timeout: Union[float, urllib3.Timeout, None] = None,
+    ) -> Urllib3StreamResponse:
+        """Send a prepared request through the pool manager, leaving the body to be streamed."""
+        return Urllib3StreamResponse(self._request(method, url, headers, body, timeout, preload_content=False), url)
+
+    def _request(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        body: Optional[bytes],
+        timeout: Union[float, urllib3.Timeout, None],
+        preload_content: bool,
+    ) -> "urllib3.BaseHTTPResponse":
+        request_headers = dict(self.DEFAULT_HEADERS)
+        request_headers.update(headers)
+
+        try:
+            response = self.pool_manager.request(
+                method,
+                url,
+                body=body,
+                headers=request_headers,
+                timeout=(
+                    timeout if isinstance(timeout, urllib3.Timeout) else urllib3.Timeout(connect=timeout, read=timeout)
+                ),
+                retries=self.retries,
+                redirect=False,
+                preload_content=preload_content,
+            )
+        except urllib3.exceptions.MaxRetryError as e:
+            raise self._translate_error(e.reason or e)
+        except urllib3.exceptions.HTTPError as e:
+            raise self._translate_error(e)
+        return response
+
+    @staticmethod
+    def _translate_error(error: Exception) -> DevoNetworkException:
+        """Map a urllib3 exception onto the SDK's network exceptions."""
+        # NewConnectionError subclasses ConnectTimeoutError, so check it first
+        if isinstance(
+            error,
+            (urllib3.exceptions.NewConnectionError, urllib3.exceptions.ProtocolError, urllib3.exceptions.SSLError),
+        ):
+            return DevoConnectionException(original_exception=error)
+        if isinstance(error, urllib3.exceptions.TimeoutError):
+            return DevoTimeoutException(original_exception=error)
+        return DevoNetworkException(f"Request failed: {str(error)}", original_exception=error)
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        self.pool_manager.clear()
+
+    def after_fork(self) -> None:
+        """Drop the host pools inherited from the parent process."""
+        reset_pool_manager_after_fork(self.pool_manager)
@@ -1,7 +1,8 @@
+import functools
 import re
-from typing import Optional, Type, TypeVar
+from typing import Any, List, Optional, Type, TypeVar
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 from .exceptions import DevoInvalidEmailException, DevoInvalidPhoneNumberException, DevoValidationException
 
@@ -106,12 +107,71 @@ def format_datetime(dt) -> str:
     return dt.isoformat()
 
 
-def validate_response(response, model_class: Type[T]) -> T:
+def _body_bytes(response: Any) -> Optional[bytes]:
+    """Return the raw response body, or None if the response has none (e.g. a test double)."""
+    content = getattr(response, "content", None)
+    return content if isinstance(content, (bytes, bytearray)) and content else None
+
+
+@functools.lru_cache(maxsize=None)
+def _list_adapter(model_class: Type[T]) -> "TypeAdapter[List[T]]":
+    """Get the (cached) validator for a JSON array of ``model_class``."""
+    return TypeAdapter(List[model_class])  # type: ignore[valid-type]
+
+
+def response_is_array(response: Any) -> bool:
+    """Tell whether a response body is a JSON array, without decoding it when the raw bytes are available."""
+    content = _body_bytes(response)
+    if content is None:
+        return isinstance(response.json(), list)
+    return content.lstrip()[:1] == b"["
+
+
+def parse_response(response: Any, model_class: Type[T]) -> T:
+    """
+    Parse an API response straight from its body bytes into a Pydantic model.
+
+    Uses ``model_validate_json``, which validates while parsing instead of
+    building a dict tree for ``model_validate`` to walk again; that is faster
+    and needs far less memory for large list responses. Responses without a
+    bytes body fall back to ``model_validate(response.json())``.
+
+    Args:
+        response: HTTP response object
+        model_class: Pydantic model class to parse response into
+
+    Returns:
+        Parsed model instance
+    """
+    content = _body_bytes(response)
+    if content is None:
+        return model_class.model_validate(response.json())
+    return model_class.model_validate_json(content)
+
+
+def parse_response_list(response: Any, model_class: Type[T]) -> List[T]:
+    """
+    Parse an API response holding a JSON array straight into a list of Pydantic models.
+
+    Args:
+        response: HTTP response object
+        model_class: Pydantic model class of the array items
+
+    Returns:
+        List of parsed model instances
+    """
+    content = _body_bytes(response)
+    if content is None:
+        return [model_class.model_validate(item) for item in response.json()]
+    return _list_adapter(model_class).validate_json(content)
+
+
+def validate_response(response: Any, model_class: Type[T]) -> T:
     """
     Validate and parse API response into a Pydantic model.
 
     Args:
-        response: HTTP response object with json() method
+        response: HTTP response object
         model_class: Pydantic model class to parse response into
 
     Returns:
@@ -121,8 +181,7 @@ def validate_response(response, model_class: Type[T]) -> T:
         DevoValidationException: If response parsing fails
     """
     try:
-        data = response.json()
-        return model_class(**data)
+        return parse_response(response, model_class)
     except Exception as e:
         raise DevoValidationException(f"Failed to parse response: {str(e)}")
 
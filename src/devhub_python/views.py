@@ -0,0 +1,206 @@
+import functools
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+    overload,
+)
+
+from pydantic import BaseModel, TypeAdapter
+from pydantic.fields import FieldInfo
+from pydantic_core import PydanticUndefined
+
+from .exceptions import DevoValidationException
+
+T = TypeVar("T", bound=BaseModel)
+
+# Types whose decoded JSON values are already what the field holds
+_PLAIN_TYPES = (str, int, float, bool, type(None), Any)
+
+
+def _is_plain(annotation: Any) -> bool:
+    """Tell whether decoded JSON values of ``annotation`` need no conversion."""
+    if annotation in _PLAIN_TYPES:
+        return True
+    if get_origin(annotation) in (Union, list, dict):
+        return all(_is_plain(arg) for arg in get_args(annotation))
+    return False
+
+
+def _model_in(annotation: Any) -> Tuple[Optional[Type[BaseModel]], bool]:
+    """Find the model a field holds, as ``Model``, ``List[Model]`` or either of them optional."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation, False
+    origin = get_origin(annotation)
+    args = [arg for arg in get_args(annotation) if arg is not type(None)]
+    if origin is Union and len(args) == 1:
+        return _model_in(args[0])
+    if origin is list and len(args) == 1:
+        model_class, is_list = _model_in(args[0])
+        if model_class is not None and not is_list:
+            return model_class, True
+    return None, False
+
+
+def _parser_for(annotation: Any) -> Optional[Callable[[Any], Any]]:
+    """Get the function that turns a decoded value into what the field holds, or None if it is used as is."""
+    model_class, is_list = _model_in(annotation)
+    if model_class is not None:
+        if is_list:
+            return functools.partial(ListView, model_class)
+        return functools.partial(RecordView, model_class)
+    if _is_plain(annotation):
+        return None
+    return TypeAdapter(annotation).validate_python
+
+
+def _field_property(model_class: Type[BaseModel], name: str, field: FieldInfo) -> property:
+    """Build the property that reads field ``name`` from a view's decoded JSON object."""
+    key = field.alias or name
+    default = field.default
+    default_factory = field.default_factory
+    parse = _parser_for(field.annotation)
+
+    def missing(view: "RecordView[Any]") -> Any:
+        if name in view._data:
+            return view._data[name]
+        if default_factory is not None:
+            return default_factory()
+        if default is PydanticUndefined:
+            raise DevoValidationException(f"{model_class.__name__} response is missing {key!r}")
+        return default
+
+    if parse is None:
+
+        def get(view: "RecordView[Any]") -> Any:
+            try:
+                return view._data[key]
+            except KeyError:
+                return missing(view)
+
+    else:
+
+        def get(view: "RecordView[Any]") -> Any:
+            parsed = view._parsed
+            if parsed is None:
+                parsed = view._parsed = {}
+            elif name in parsed:
+                return parsed[name]
+            try:
+                value = view._data[key]
+            except KeyError:
+                value = missing(view)
+            if value is not None:
+                value = parse(value)
+            parsed[name] = value
+            return value
+
+    return property(get, doc=field.description)
+
+
+@functools.lru_cache(maxsize=None)
+def _view_class(model_class: Type[BaseModel]) -> Type["RecordView[Any]"]:
+    """Create the RecordView subclass for ``model_class``, with a property per field."""
+    namespace: Dict[str, Any] = {"__slots__": ()}
+    for name, field in model_class.model_fields.items():
+        namespace[name] = _field_property(model_class, name, field)
+    return type(f"{model_class.__name__}View", (RecordView,), namespace)
+
+
+class RecordView(Generic[T]):
+    """
+    Read-only, dict-backed view of a decoded JSON object as a Pydantic model.
+
+    Fields are read as attributes, like on the model, but nothing is
+    validated up front: values that need no conversion (strings, numbers,
+    booleans and plain lists and dicts such as ``metadata``, ``custom_fields``
+    or ``pricing``) are returned as decoded, and the rest (datetimes, nested
+    models) are parsed on first access. A page of thousands of records costs
+    little more than decoding its JSON when only a few fields are read.
+
+    Views share the decoded data; don't modify what they return. Call
+    :meth:`to_model` to validate the whole record into the full model.
+    """
+
+    __slots__ = ("_model_class", "_data", "_parsed")
+
+    def __new__(cls, model_class: Type[T], data: Dict[str, Any]) -> "RecordView[T]":
+        if cls is RecordView:
+            # Each model gets a subclass whose fields are properties
+            cls = _view_class(model_class)
+        return super().__new__(cls)
+
+    def __init__(self, model_class: Type[T], data: Dict[str, Any]):
+        self._model_class = model_class
+        self._data = data
+        self._parsed: Optional[Dict[str, Any]] = None
+
+    @property
+    def raw(self) -> Dict[str, Any]:
+        """The decoded JSON object."""
+        return self._data
+
+    def to_model(self) -> T:
+        """Validate the record into the full model."""
+        return self._model_class.model_validate(self._data)
+
+    def __repr__(self) -> str:
+        return f"<{self._model_class.__name__} view {self._data!r}>"
+
+
+class ListView(Sequence[RecordView[T]]):
+    """
+    Read-only view of a decoded JSON array of objects as a sequence of :class:`RecordView`.
+
+    Records are wrapped when they are accessed, so nothing is built for
+    records that are never read.
+    """
+
+    __slots__ = ("_model_class", "_view_class", "_items")
+
+    def __init__(self, model_class: Type[T], items: List[Dict[str, Any]]):
+        self._model_class = model_class
+        self._view_class = _view_class(model_class)
+        self._items = items
+
+    @overload
+    def __getitem__(self, index: int) -> RecordView[T]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "ListView[T]": ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[RecordView[T], "ListView[T]"]:
+        if isinstance(index, slice):
+            return ListView(self._model_class, self._items[index])
+        return self._view_class(self._model_class, self._items[index])
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[RecordView[T]]:
+        model_class, view_class = self._model_class, self._view_class
+        for item in self._items:
+            yield view_class(model_class, item)
+
+    @property
+    def raw(self) -> List[Dict[str, Any]]:
+        """The decoded JSON array."""
+        return self._items
+
+    def to_models(self) -> List[T]:
+        """Validate every record into the full model."""
+        return [self._model_class.model_validate(item) for item in self._items]
+
+    def __repr__(self) -> str:
+        return f"<{self._model_class.__name__} list view of {len(self._items)}>"
@@ -1,4 +1,9 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import Mock
+from urllib.parse import parse_qs, urlparse
 
 import pytest
 
@@ -30,3 +35,57 @@ def test_phone_number():
 def test_email():
     """Test email address."""
     return "test@example.com"
+
+
+class _EchoHandler(BaseHTTPRequestHandler):
+    """Echo the request line, headers and body back as JSON over keep-alive HTTP/1.1."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def _echo(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length).decode()
+        delay = parse_qs(urlparse(self.path).query).get("delay")
+        if delay:
+            time.sleep(float(delay[0]))
+
+        payload = json.dumps(
+            {
+                "method": self.command,
+                "path": self.path,
+                "content_type": self.headers.get("Content-Type"),
+                "api_key": self.headers.get("X-API-Key"),
+                "headers": dict(self.headers),
+                "client_port": self.client_address[1],
+                "body": body,
+            }
+        ).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_GET = do_POST = do_PUT = do_DELETE = do_PATCH = _echo
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _EchoServer(ThreadingHTTPServer):
+    """Threaded server with a listen backlog big enough for many concurrent clients."""
+
+    daemon_threads = True
+    request_queue_size = 256
+
+
+@pytest.fixture
+def echo_server():
+    """Run a local HTTP server that echoes requests back; ``?delay=<seconds>`` slows a response."""
+    server = _EchoServer(("127.0.0.1", 0), _EchoHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
@@ -0,0 +1,230 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from devhub_python import AsyncDevoClient
+from devhub_python.exceptions import (
+    DevoAPIException,
+    DevoAuthenticationException,
+    DevoConnectionException,
+    DevoException,
+    DevoMissingAPIKeyException,
+    DevoRateLimitException,
+    DevoTimeoutException,
+)
+from devhub_python.models.contacts import GetContactsSerializer
+from devhub_python.models.sms import SMSQuickSendResponse
+
+
+def make_client(handler, **kwargs):
+    """Create an AsyncDevoClient whose HTTP layer is served by ``handler``."""
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return AsyncDevoClient(api_key="test-api-key", http_client=http_client, **kwargs)
+
+
+class TestAsyncDevoClient:
+    """Test cases for the AsyncDevoClient class."""
+
+    def test_client_initialization(self, api_key):
+        """Test client initialization with API key."""
+        client = AsyncDevoClient(api_key=api_key)
+
+        assert client.base_url == AsyncDevoClient.DEFAULT_BASE_URL
+        assert client.timeout == AsyncDevoClient.DEFAULT_TIMEOUT
+        assert client.auth.api_key == api_key
+        assert isinstance(client.http_client, httpx.AsyncClient)
+
+    def test_client_requires_api_key(self):
+        """Test that a missing API key is rejected."""
+        with pytest.raises(DevoMissingAPIKeyException):
+            AsyncDevoClient(api_key="  ")
+
+    def test_client_has_all_resources(self, api_key):
+        """Test that client has all expected resources."""
+        client = AsyncDevoClient(api_key=api_key)
+
+        for name in ("sms", "email", "whatsapp", "rcs", "contacts", "messages"):
+            assert hasattr(client, name)
+        assert hasattr(client.services, "contacts")
+        assert hasattr(client.services, "contact_groups")
+
+    def test_successful_request_sends_auth_headers(self):
+        """Test that requests carry the SDK and authentication headers."""
+        seen = {}
+
+        def handler(request):
+            seen["url"] = str(request.url)
+            seen["headers"] = request.headers
+            return httpx.Response(200, json={"success": True})
+
+        async def run():
+            async with make_client(handler) as client:
+                return await client.get("test/endpoint", params={"page": 2})
+
+        response = asyncio.run(run())
+
+        assert response.json() == {"success": True}
+        assert seen["url"] == f"{AsyncDevoClient.DEFAULT_BASE_URL}/test/endpoint?page=2"
+        assert seen["headers"]["X-API-Key"] == "test-api-key"
+        assert seen["headers"]["User-Agent"].startswith("devo-python-sdk/")
+
+    def test_sandbox_request_uses_sandbox_api_key(self):
+        """Test that sandbox requests switch to the sandbox API key."""
+        seen = {}
+
+        def handler(request):
+            seen["api_key"] = request.headers["X-API-Key"]
+            return httpx.Response(200, json={"senders": []})
+
+        async def run():
+            async with make_client(handler, sandbox_api_key="sandbox-api-key") as client:
+                await client.sms.get_senders(sandbox=True)
+
+        asyncio.run(run())
+
+        assert seen["api_key"] == "sandbox-api-key"
+
+    def test_sandbox_request_without_sandbox_api_key_raises_error(self):
+        """Test that sandbox requests without a sandbox key fail before sending."""
+
+        async def run():
+            async with make_client(lambda request: httpx.Response(200)) as client:
+                await client.get("test/endpoint", sandbox=True)
+
+        with pytest.raises(DevoException, match="Sandbox API key required"):
+            asyncio.run(run())
+
+    @pytest.mark.parametrize(
+        "status_code,exception_class",
+        [(400, DevoAPIException), (401, DevoAuthenticationException), (429, DevoRateLimitException)],
+    )
+    def test_error_handling(self, status_code, exception_class):
+        """Test that error responses map to the same exceptions as the sync client."""
+
+        def handler(request):
+            return httpx.Response(status_code, json={"message": "Nope", "code": "ERR"})
+
+        async def run():
+            async with make_client(handler, max_retries=0) as client:
+                await client.get("test/endpoint")
+
+        with pytest.raises(exception_class) as exc_info:
+            asyncio.run(run())
+
+        assert "Nope" in str(exc_info.value)
+
+    def test_retries_retryable_status(self):
+        """Test that 5xx responses are retried before succeeding."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) == 1:
+                return httpx.Response(503, json={"message": "Unavailable"})
+            return httpx.Response(200, json={"success": True})
+
+        async def run():
+            async with make_client(handler) as client:
+                return await client.get("test/endpoint")
+
+        response = asyncio.run(run())
+
+        assert response.status_code == 200
+        assert len(calls) == 2
+
+    def test_timeout_error_handling(self):
+        """Test that timeouts surface as a DevoTimeoutException carrying the httpx error."""
+
+        def handler(request):
+            raise httpx.ReadTimeout("timed out", request=request)
+
+        async def run():
+            async with make_client(handler, max_retries=0) as client:
+                await client.get("test/endpoint")
+
+        with pytest.raises(DevoTimeoutException) as exc_info:
+            asyncio.run(run())
+
+        assert "timed out" in str(exc_info.value).lower()
+        assert isinstance(exc_info.value.original_exception, httpx.ReadTimeout)
+        assert exc_info.value.__cause__ is exc_info.value.original_exception
+
+    def test_connection_error_handling(self):
+        """Test that connection failures surface as a DevoConnectionException carrying the httpx error."""
+
+        def handler(request):
+            raise httpx.ConnectError("connection refused", request=request)
+
+        async def run():
+            async with make_client(handler, max_retries=0) as client:
+                await client.get("test/endpoint")
+
+        with pytest.raises(DevoConnectionException) as exc_info:
+            asyncio.run(run())
+
+        assert isinstance(exc_info.value.original_exception, httpx.ConnectError)
+        assert exc_info.value.__cause__ is exc_info.value.original_exception
+
+    def test_redirect_is_not_an_error(self):
+        """Test that 3xx responses are returned, as on the sync client."""
+
+        async def run():
+            async with make_client(lambda request: httpx.Response(304)) as client:
+                return await client.get("test/endpoint")
+
+        assert asyncio.run(run()).status_code == 304
+
+    def test_send_sms(self, test_phone_number):
+        """Test sending an SMS through the async SMS resource."""
+
+        def handler(request):
+            body = json.loads(request.content)
+            return httpx.Response(200, json={"id": "msg_1", "recipient": body["recipient"], "status": "queued"})
+
+        async def run():
+            async with make_client(handler) as client:
+                return await client.sms.send_sms(recipient=test_phone_number, message="Hi", sender="+1987654321")
+
+        result = asyncio.run(run())
+
+        assert isinstance(result, SMSQuickSendResponse)
+        assert result.id == "msg_1"
+        assert result.recipient == test_phone_number
+
+    def test_list_contacts(self):
+        """Test listing contacts through the async contacts resource."""
+
+        def handler(request):
+            assert request.url.params["page"] == "1"
+            return httpx.Response(200, json={"contacts": [], "total": 0, "page": 1, "limit": 50, "total_pages": 0})
+
+        async def run():
+            async with make_client(handler) as client:
+                return await client.services.contacts.list()
+
+        result = asyncio.run(run())
+
+        assert isinstance(result, GetContactsSerializer)
+        assert result.total == 0
+
+    def test_concurrent_sends_share_one_pool(self, test_phone_number):
+        """Test that many sends can be awaited concurrently on one event loop."""
+
+        async def handler(request):
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={"id": request.headers["X-Request-Index"]})
+
+        async def run():
+            async with make_client(handler) as client:
+                return await asyncio.gather(
+                    *(
+                        client.post("user-api/sms/quick-send", json={}, headers={"X-Request-Index": str(i)})
+                        for i in range(200)
+                    )
+                )
+
+        responses = asyncio.run(run())
+
+        assert [response.json()["id"] for response in responses] == [str(i) for i in range(200)]
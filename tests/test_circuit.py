@@ -0,0 +1,197 @@
+import asyncio
+from unittest.mock import Mock
+
+import httpx
+import pytest
+
+from devhub_python import AsyncDevoClient, CircuitBreaker, DevoCircuitOpenException, DevoClient
+from devhub_python.circuit import endpoint_key
+from devhub_python.exceptions import DevoAPIException, DevoTimeoutException
+from devhub_python.transport import Transport, TransportResponse
+
+WHATSAPP = "POST user-api/whatsapp/send-normal-message"
+
+
+@pytest.fixture
+def clock(mocker):
+    """Freeze the breaker's monotonic clock; advance it with ``clock.return_value``."""
+    return mocker.patch("devhub_python.circuit.time.monotonic", return_value=100.0)
+
+
+def fail(breaker, endpoint=WHATSAPP, times=1):
+    """Record ``times`` failed requests to an endpoint."""
+    for _ in range(times):
+        breaker.record(endpoint, 503, trial=breaker.before_request(endpoint))
+
+
+class TestEndpointKey:
+    """Test cases for naming endpoints."""
+
+    def test_ids_and_prefixes_are_normalised(self):
+        """Test that IDs, the /api/v1 prefix and query strings don't create new circuits."""
+        assert endpoint_key("get", "messages/msg_123/delivery-status") == "GET messages/{id}/delivery-status"
+        assert endpoint_key("POST", "/api/v1/user-api/rcs/send") == "POST user-api/rcs/send"
+        assert endpoint_key("GET", "user-api/contacts?page=2") == "GET user-api/contacts"
+
+
+class TestCircuitBreaker:
+    """Test cases for the circuit state machine."""
+
+    def test_opens_after_consecutive_failures(self, clock):
+        """Test that the threshold counts consecutive failures only."""
+        breaker = CircuitBreaker(failure_threshold=3)
+        fail(breaker, times=2)
+        breaker.record(WHATSAPP, 200)
+        fail(breaker, times=2)
+        assert breaker.state(WHATSAPP) == "closed"
+
+        fail(breaker)
+
+        assert breaker.state(WHATSAPP) == "open"
+        with pytest.raises(DevoCircuitOpenException) as error:
+            breaker.before_request(WHATSAPP)
+        assert error.value.endpoint == WHATSAPP
+        assert error.value.retry_after == pytest.approx(30.0)
+
+    def test_client_errors_are_not_failures(self, clock):
+        """Test that 4xx responses, including 429, don't open the circuit."""
+        breaker = CircuitBreaker(failure_threshold=1)
+
+        for status_code in (400, 404, 429):
+            breaker.record(WHATSAPP, status_code)
+
+        assert breaker.state(WHATSAPP) == "closed"
+        assert breaker.as_dict() == {}
+
+    def test_half_open_trial_closes_the_circuit(self, clock):
+        """Test that one trial is let through after the timeout and a success closes the circuit."""
+        changes = []
+        breaker = CircuitBreaker(
+            failure_threshold=1, recovery_timeout=10, on_state_change=lambda *change: changes.append(change)
+        )
+        fail(breaker)
+
+        clock.return_value += 10
+        trial = breaker.before_request(WHATSAPP)
+        with pytest.raises(DevoCircuitOpenException):
+            breaker.before_request(WHATSAPP)
+        breaker.record(WHATSAPP, 200, trial=trial)
+
+        assert trial is True
+        assert breaker.state(WHATSAPP) == "closed"
+        assert changes == [
+            (WHATSAPP, "closed", "open"),
+            (WHATSAPP, "open", "half_open"),
+            (WHATSAPP, "half_open", "closed"),
+        ]
+
+    def test_failed_trial_reopens_the_circuit(self, clock):
+        """Test that a failed trial starts a new recovery timeout."""
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10)
+        fail(breaker)
+        clock.return_value += 10
+
+        trial = breaker.before_request(WHATSAPP)
+        # A request sent before the circuit opened doesn't decide the trial
+        breaker.record(WHATSAPP, 200)
+        assert breaker.state(WHATSAPP) == "half_open"
+        breaker.record(WHATSAPP, None, trial=trial)
+
+        assert breaker.state(WHATSAPP) == "open"
+        assert breaker.as_dict()[WHATSAPP]["opens"] == 2
+        clock.return_value += 9
+        with pytest.raises(DevoCircuitOpenException):
+            breaker.before_request(WHATSAPP)
+
+    def test_abandoned_trial_frees_its_slot(self, clock):
+        """Test that a trial that was never sent lets the next request try."""
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10)
+        fail(breaker)
+        clock.return_value += 10
+
+        breaker.abandon(WHATSAPP, breaker.before_request(WHATSAPP))
+
+        assert breaker.before_request(WHATSAPP) is True
+
+    def test_after_fork_and_reset(self, clock):
+        """Test that parent trials are forgotten after a fork and reset closes circuits."""
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10)
+        fail(breaker)
+        clock.return_value += 10
+        breaker.before_request(WHATSAPP)
+
+        breaker.after_fork()
+        assert breaker.before_request(WHATSAPP) is True
+
+        breaker.reset()
+        assert breaker.state(WHATSAPP) == "closed"
+        assert breaker.open_circuits == 0
+
+
+class TestClientCircuitBreaking:
+    """Test cases for the breaker on the clients."""
+
+    def test_failing_endpoint_fails_fast_while_others_keep_working(self):
+        """Test that an open WhatsApp circuit rejects calls without sending, while SMS goes through."""
+
+        def send(method, url, headers, body=None, timeout=None):
+            if "whatsapp" in url:
+                raise DevoTimeoutException(timeout)
+            return TransportResponse(200, {}, b"{}")
+
+        transport = Mock(spec=Transport)
+        transport.send.side_effect = send
+        client = DevoClient(
+            api_key="test-api-key",
+            transport=transport,
+            max_retries=0,
+            circuit_breaker=CircuitBreaker(failure_threshold=2),
+        )
+
+        for _ in range(2):
+            with pytest.raises(DevoTimeoutException):
+                client.post("user-api/whatsapp/send-normal-message", json={})
+        with pytest.raises(DevoCircuitOpenException):
+            client.post("user-api/whatsapp/send-normal-message", json={})
+        client.post("user-api/sms/quick-send", json={})
+
+        assert transport.send.call_count == 3
+        assert client.circuit_breaker.as_dict()[WHATSAPP]["rejected"] == 1
+        assert client.metrics.as_dict()["open_circuits"] == 1
+
+    def test_error_responses_count(self):
+        """Test that 5xx responses raised as exceptions are recorded as failures."""
+        transport = Mock(spec=Transport)
+        transport.send.return_value = TransportResponse(503, {}, b'{"message": "down"}')
+        client = DevoClient(api_key="test-api-key", transport=transport, circuit_breaker=True)
+
+        for _ in range(5):
+            with pytest.raises(DevoAPIException):
+                client.get("messages/msg_1")
+
+        assert client.circuit_breaker.state("GET messages/{id}") == "open"
+
+    def test_async_client_fails_fast(self):
+        """Test that the async client shares the breaker logic."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(502, json={"message": "bad gateway"})
+
+        async def send():
+            http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with AsyncDevoClient(
+                api_key="test-api-key",
+                http_client=http_client,
+                max_retries=0,
+                circuit_breaker=CircuitBreaker(failure_threshold=1),
+            ) as client:
+                with pytest.raises(DevoAPIException):
+                    await client.post("/api/v1/user-api/rcs/send", json={})
+                with pytest.raises(DevoCircuitOpenException):
+                    await client.post("/api/v1/user-api/rcs/send", json={})
+
+        asyncio.run(send())
+
+        assert len(calls) == 1
@@ -75,6 +75,18 @@ class TestDevoClient:
         assert exc_info.value.status_code == 400
         assert "Bad Request" in str(exc_info.value)
 
+    @patch("requests.Session.request")
+    def test_redirect_is_not_an_error(self, mock_request, api_key):
+        """Test that 3xx responses are returned, as only 4xx and 5xx responses are errors."""
+        response = requests.Response()
+        response.status_code = 304
+        response._content = b""
+        mock_request.return_value = response
+
+        client = DevoClient(api_key=api_key)
+
+        assert client.get("test/endpoint").status_code == 304
+
     @patch("requests.Session.request")
     def test_authentication_error_handling(self, mock_request, api_key):
         """Test authentication error handling."""
@@ -121,3 +133,49 @@ class TestDevoClient:
 
             client.patch("path")
             mock_request.assert_called_with("PATCH", "path")
+
+    def test_build_url_is_cached_per_base_url(self, api_key):
+        """Test that resolved URLs are cached and invalidated when the base URL changes."""
+        client = DevoClient(api_key=api_key)
+
+        assert client._build_url("/user-api/contacts") == f"{DevoClient.DEFAULT_BASE_URL}/user-api/contacts"
+        assert "/user-api/contacts" in client._url_cache
+
+        client.base_url = "https://example.com/api/"
+        assert client._build_url("/user-api/contacts") == "https://example.com/api/user-api/contacts"
+
+    def test_url_cache_is_bounded(self, api_key):
+        """Test that paths with embedded IDs can't grow the URL cache without bound."""
+        client = DevoClient(api_key=api_key)
+        client.URL_CACHE_SIZE = 10
+
+        urls = [client._build_url(f"messages/{i}") for i in range(50)]
+
+        assert urls[-1].endswith("/messages/49")
+        assert len(client._url_cache) == 10
+
+    def test_build_headers_returns_fresh_copy(self, api_key):
+        """Test that precomputed headers are copied so callers can't corrupt the cache."""
+        client = DevoClient(api_key=api_key)
+
+        first = client._build_headers()
+        first["X-Extra"] = "mutated"
+        second = client._build_headers()
+
+        assert "X-Extra" not in second
+        assert second["X-API-Key"] == api_key
+        assert second["User-Agent"] == DevoClient.USER_AGENT
+
+    def test_auth_headers_take_precedence(self, api_key):
+        """Test that custom headers can't override the authentication headers."""
+        client = DevoClient(api_key=api_key, sandbox_api_key="sandbox-key")
+
+        headers = client._build_headers({"X-API-Key": "spoofed", "X-Trace": "1"}, sandbox=True)
+
+        assert headers["X-API-Key"] == "sandbox-key"
+        assert headers["X-Trace"] == "1"
+
+    def test_trust_env_opt_out(self, api_key):
+        """Test that trust_env=False disables the per-request environment lookup."""
+        assert DevoClient(api_key=api_key).session.trust_env is True
+        assert DevoClient(api_key=api_key, trust_env=False).session.trust_env is False
@@ -0,0 +1,113 @@
+import asyncio
+import json
+from unittest.mock import Mock
+
+import httpx
+import pytest
+
+from devhub_python import AsyncDevoClient, DevoClient, JSONCodec
+from devhub_python import codec as codec_module
+from devhub_python.codec import OrjsonCodec, create_codec
+from devhub_python.exceptions import DevoAPIException, DevoConfigurationException
+from devhub_python.transport import Transport, TransportResponse
+
+pytest.importorskip("orjson")
+
+PAGE = {
+    "contacts": [{"id": f"contact_{i}", "first_name": "Ada", "created_at": "2024-01-01T00:00:00Z"} for i in range(3)],
+    "total": 3,
+    "page": 1,
+    "limit": 50,
+    "total_pages": 1,
+}
+
+
+def make_client(response, **kwargs):
+    """Create a client whose transport always returns ``response``."""
+    transport = Mock(spec=Transport)
+    transport.send.return_value = response
+    return DevoClient(api_key="test-api-key", transport=transport, **kwargs), transport
+
+
+class TestCreateCodec:
+    """Test cases for resolving the codec argument."""
+
+    def test_names_and_instances(self):
+        """Test that codecs are looked up by name, instances are used as is, and the default is stdlib."""
+        custom = OrjsonCodec()
+
+        assert type(create_codec(None)) is JSONCodec
+        assert type(create_codec("orjson")) is OrjsonCodec
+        assert create_codec(custom) is custom
+        with pytest.raises(DevoConfigurationException):
+            create_codec("simplejson")
+
+    @pytest.mark.skipif(codec_module.msgspec is not None, reason="msgspec is installed")
+    def test_missing_library(self):
+        """Test that asking for a codec whose library isn't installed fails early."""
+        with pytest.raises(DevoConfigurationException, match="pip install"):
+            DevoClient(api_key="test-api-key", codec="msgspec")
+
+    def test_msgspec_codec(self):
+        """Test that the msgspec codec round-trips and reports bad JSON as ValueError."""
+        pytest.importorskip("msgspec")
+        codec = create_codec("msgspec")
+
+        assert codec.loads(codec.dumps(PAGE)) == PAGE
+        with pytest.raises(ValueError):
+            codec.loads(b"{")
+
+
+class TestClientCodec:
+    """Test cases for the codec on the clients."""
+
+    def test_bodies_and_responses_use_the_codec(self):
+        """Test that request bodies are encoded and responses decoded with the client's codec."""
+        client, transport = make_client(TransportResponse(200, {}, json.dumps(PAGE).encode()), codec="orjson")
+        loads = Mock(wraps=client.codec.loads)
+        client.codec.loads = loads
+
+        response = client.post("user-api/contacts", json={"first_name": "Ada", "tags": ["vip"]})
+        data = response.json()
+
+        assert transport.send.call_args.kwargs["body"] == b'{"first_name":"Ada","tags":["vip"]}'
+        assert data["contacts"][2]["id"] == "contact_2"
+        loads.assert_called_once()
+
+    def test_error_responses(self):
+        """Test that an error body that isn't JSON still raises the API error."""
+        client, _ = make_client(TransportResponse(502, {}, b"<html>Bad Gateway</html>"), codec="orjson")
+
+        with pytest.raises(DevoAPIException, match="Bad Gateway"):
+            client.get("messages")
+
+    def test_keyword_arguments_use_the_response_decoder(self, echo_server):
+        """Test that response.json(**kwargs) keeps the HTTP library's own decoder."""
+        client = DevoClient(api_key="test-api-key", trust_env=False, codec="orjson")
+        client.base_url = echo_server
+
+        response = client.get("messages")
+
+        assert response.json()["method"] == "GET"
+        assert response.json(parse_int=str)["client_port"] == str(response.json()["client_port"])
+
+    def test_async_client(self):
+        """Test that the async client encodes bodies itself and binds the codec to responses."""
+        seen = []
+
+        def handler(request):
+            seen.append(request.content)
+            return httpx.Response(200, json=PAGE)
+
+        async def send():
+            http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with AsyncDevoClient(api_key="test-api-key", http_client=http_client, codec="orjson") as client:
+                response = await client.post("user-api/contacts", json={"first_name": "Ada"})
+                return response, client.codec
+
+        response, codec = asyncio.run(send())
+
+        assert seen == [b'{"first_name":"Ada"}']
+        assert response.json() == PAGE
+        assert response.json.__qualname__.startswith("JSONCodec.bind")
+        assert codec.name == "orjson"
@@ -0,0 +1,136 @@
+import asyncio
+import gzip
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import Mock
+
+import httpx
+import pytest
+
+from devhub_python import AsyncDevoClient, DevoClient, IdempotencyJournal, RequestCompression
+from devhub_python.transport import Transport, TransportResponse
+
+IDS = {"contact_ids": [f"contact_{i:06d}" for i in range(2000)]}
+
+
+@pytest.fixture
+def gzip_server():
+    """Run a local server that accepts gzip request bodies and gzips its replies."""
+    received = []
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers["Content-Length"]))
+            if self.headers.get("Content-Encoding") == "gzip":
+                body = gzip.decompress(body)
+            received.append((self.headers.get("Content-Encoding"), self.headers.get("Accept-Encoding")))
+            payload = gzip.compress(body)
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Encoding", "gzip")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}", received
+    server.shutdown()
+    server.server_close()
+
+
+class TestRequestCompression:
+    """Test cases for deciding which bodies to compress."""
+
+    def test_large_json_is_compressed(self):
+        """Test that a large JSON body is gzipped and marked, and the savings counted."""
+        compression = RequestCompression(threshold=1024)
+        body = json.dumps(IDS).encode()
+        headers = {"Content-Type": "application/json"}
+
+        compressed = compression.compress(body, headers)
+
+        assert gzip.decompress(compressed) == body
+        assert headers["Content-Encoding"] == "gzip"
+        assert compression.as_dict() == {"compressed": 1, "bytes_in": len(body), "bytes_out": len(compressed)}
+        assert len(compressed) < len(body) / 4
+
+    @pytest.mark.parametrize(
+        "body, headers",
+        [
+            (b'{"message": "hi"}', {"Content-Type": "application/json"}),
+            (json.dumps(IDS).encode(), {"Content-Type": "multipart/form-data; boundary=x"}),
+            (json.dumps(IDS).encode(), {"Content-Type": "application/json", "content-encoding": "br"}),
+            (os.urandom(8192), {"Content-Type": "text/csv"}),
+            (None, {}),
+        ],
+        ids=["small", "multipart", "already-encoded", "incompressible", "no-body"],
+    )
+    def test_body_sent_as_is(self, body, headers):
+        """Test that small, multipart, pre-encoded and incompressible bodies are left alone."""
+        compression = RequestCompression(threshold=1024)
+
+        assert compression.compress(body, headers) is body
+        assert "Content-Encoding" not in headers
+        assert compression.compressed == 0
+
+
+class TestClientCompression:
+    """Test cases for compression on the clients."""
+
+    @pytest.mark.parametrize("transport", ["requests", "urllib3"])
+    def test_round_trip(self, gzip_server, transport):
+        """Test that both transports send gzip bodies and decode gzip replies."""
+        base_url, received = gzip_server
+        client = DevoClient(api_key="test-api-key", transport=transport, trust_env=False, compression=True)
+        client.base_url = base_url
+
+        response = client.post("user-api/contacts/bulk-delete", json=IDS)
+
+        assert response.json() == IDS
+        assert received[0][0] == "gzip"
+        assert "gzip" in received[0][1]
+
+    def test_compressed_send_is_replayed(self):
+        """Test that the journal recognises a repeated send whose body went out compressed."""
+        transport = Mock(spec=Transport)
+        transport.send.return_value = TransportResponse(200, {}, b"{}")
+        journal = IdempotencyJournal()
+        client = DevoClient(api_key="test-api-key", transport=transport, idempotency_journal=journal, compression=True)
+
+        client.post("user-api/contacts/bulk-delete", json=IDS)
+        replay = client.post("user-api/contacts/bulk-delete", json=IDS)
+
+        assert replay.replayed is True
+        assert transport.send.call_count == 1
+        assert transport.send.call_args.args[2]["Content-Encoding"] == "gzip"
+
+    def test_async_client_compresses(self):
+        """Test that the async client encodes and gzips large bodies itself."""
+        seen = []
+
+        def handler(request):
+            seen.append(request)
+            return httpx.Response(200, json={})
+
+        async def send():
+            http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with AsyncDevoClient(api_key="test-api-key", http_client=http_client, compression=True) as client:
+                await client.post("user-api/contacts/bulk-delete", json=IDS)
+                await client.post("user-api/sms/quick-send", json={"message": "hi"})
+
+        asyncio.run(send())
+
+        large, small = seen
+        assert large.headers["Content-Encoding"] == "gzip"
+        assert large.headers["Content-Type"] == "application/json"
+        assert json.loads(gzip.decompress(large.content)) == IDS
+        assert "Content-Encoding" not in small.headers
+        assert json.loads(small.content) == {"message": "hi"}
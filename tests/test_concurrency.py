@@ -0,0 +1,269 @@
+import asyncio
+import threading
+import time
+from unittest.mock import Mock
+
+import httpx
+import pytest
+
+from devhub_python import AsyncDevoClient, ConcurrencyLimiter, DevoClient, RetryPolicy, RetryRule
+from devhub_python.transport import Transport, TransportResponse
+
+
+@pytest.fixture
+def clock(mocker):
+    """Freeze the limiter's monotonic clock; advance it with ``clock.return_value``."""
+    return mocker.patch("devhub_python.concurrency.time.monotonic", return_value=100.0)
+
+
+def slow_retries():
+    """Build a retry policy that waits 0.2 seconds before each retry."""
+    return RetryPolicy(RetryRule(base_delay=0.2, max_delay=0.2))
+
+
+def run_round(limiter, status_code=200, latency=0.1):
+    """Fill every slot, then finish all those requests with the same outcome."""
+    slots = int(limiter.limit)
+    for _ in range(slots):
+        limiter.acquire()
+    for _ in range(slots):
+        limiter.release(latency, status_code)
+
+
+class TestConcurrencyLimiter:
+    """Test cases for the AIMD limit."""
+
+    def test_grows_about_one_per_round_trip(self, clock):
+        """Test that a fully used limit grows additively while latency is flat."""
+        limiter = ConcurrencyLimiter(initial_limit=10)
+
+        for _ in range(5):
+            run_round(limiter)
+
+        # Requests finishing late in a round see less than half the limit in use and don't count
+        assert 12 <= limiter.limit <= 15
+        assert limiter.decreases == 0
+
+    def test_does_not_grow_when_underused(self, clock):
+        """Test that the limit only grows while at least half of it is in use."""
+        limiter = ConcurrencyLimiter(initial_limit=10)
+
+        for _ in range(20):
+            limiter.acquire()
+            limiter.release(0.1, 200)
+
+        assert limiter.limit == 10
+
+    def test_congestion_halves_once_per_round_trip(self, clock):
+        """Test that a burst of 429s counts as a single decrease."""
+        limiter = ConcurrencyLimiter(initial_limit=16)
+        run_round(limiter, status_code=429)
+
+        assert limiter.limit == 8
+        assert limiter.decreases == 1
+
+        clock.return_value += 1.0
+        limiter.acquire()
+        limiter.release(0.1, 503)
+        assert limiter.limit == 4
+
+    def test_failures_and_latency_spikes_are_congestion(self, clock):
+        """Test that failed requests and a sustained latency rise cut the limit."""
+        limiter = ConcurrencyLimiter(initial_limit=16, min_limit=2)
+        limiter.acquire()
+        limiter.release(0.1, None)
+        assert limiter.limit == 8
+
+        for _ in range(30):
+            clock.return_value += 1.0
+            limiter.acquire()
+            limiter.release(1.0, 200)
+
+        assert limiter.limit == 2
+        assert limiter.smoothed_latency > 2 * limiter.baseline_latency
+
+    def test_settles_near_server_capacity(self, clock):
+        """Test the AIMD sawtooth against an API that rejects more than 20 concurrent requests."""
+        capacity = 20
+        limiter = ConcurrencyLimiter(initial_limit=1)
+        limits = []
+
+        for _ in range(300):
+            status_code = 503 if int(limiter.limit) > capacity else 200
+            run_round(limiter, status_code=status_code)
+            clock.return_value += 0.1
+            limits.append(limiter.limit)
+
+        steady = limits[100:]
+        # The probe that finds the capacity sends one request too many
+        assert max(steady) < capacity + 2
+        assert min(steady) >= capacity / 2
+        assert sum(steady) / len(steady) > capacity * 0.7
+
+    def test_blocks_beyond_the_limit(self):
+        """Test that a thread waits for a slot and gets it when one is released."""
+        limiter = ConcurrencyLimiter(initial_limit=1)
+        limiter.acquire()
+        acquired = threading.Event()
+
+        thread = threading.Thread(target=lambda: (limiter.acquire(), acquired.set()))
+        thread.start()
+
+        assert not acquired.wait(0.1)
+        assert limiter.as_dict()["waiting"] == 1
+        limiter.release(0.01, 200)
+        assert acquired.wait(1)
+        thread.join()
+        assert limiter.in_flight == 1
+
+    def test_async_waiters_and_cancellation(self):
+        """Test that async waiters are served in order and a cancelled one passes its slot on."""
+        limiter = ConcurrencyLimiter(initial_limit=1)
+        order = []
+
+        async def worker(name):
+            await limiter.acquire_async()
+            order.append(name)
+            await asyncio.sleep(0.01)
+            limiter.release(0.01, 200)
+
+        async def main():
+            await limiter.acquire_async()
+            tasks = [asyncio.ensure_future(worker(name)) for name in "abc"]
+            await asyncio.sleep(0.01)
+            tasks[1].cancel()
+            limiter.release(0.01, 200)
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        asyncio.run(main())
+
+        assert order == ["a", "c"]
+        assert limiter.in_flight == 0
+
+    def test_after_fork(self):
+        """Test that slots held in the parent are forgotten."""
+        limiter = ConcurrencyLimiter(initial_limit=1)
+        limiter.acquire()
+
+        limiter.after_fork()
+
+        assert limiter.as_dict()["in_flight"] == 0
+
+
+class TestClientConcurrencyLimiting:
+    """Test cases for the limiter on the clients."""
+
+    def test_limit_is_exposed_as_a_metric(self):
+        """Test that every request goes through the limiter and updates the gauge."""
+        transport = Mock(spec=Transport)
+        transport.send.return_value = TransportResponse(200, {}, b"{}")
+        client = DevoClient(api_key="test-api-key", transport=transport, concurrency_limiter=True)
+
+        client.get("a")
+
+        assert isinstance(client.concurrency_limiter, ConcurrencyLimiter)
+        assert client.concurrency_limiter.in_flight == 0
+        assert client.metrics.as_dict()["concurrency_limit"] == client.concurrency_limiter.limit
+
+    def test_threads_never_exceed_the_limit(self):
+        """Test that a shared client keeps in-flight requests within the limit."""
+        state = {"current": 0, "peak": 0}
+        lock = threading.Lock()
+
+        def send(*args, **kwargs):
+            with lock:
+                state["current"] += 1
+                state["peak"] = max(state["peak"], state["current"])
+            time.sleep(0.01)
+            with lock:
+                state["current"] -= 1
+            return TransportResponse(503, {}, b"{}")
+
+        transport = Mock(spec=Transport)
+        transport.send.side_effect = send
+        limiter = ConcurrencyLimiter(initial_limit=4)
+        client = DevoClient(api_key="test-api-key", transport=transport, concurrency_limiter=limiter)
+
+        def worker():
+            for _ in range(5):
+                try:
+                    client.get("a")
+                except Exception:
+                    pass
+
+        threads = [threading.Thread(target=worker) for _ in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert state["peak"] <= 4
+        assert limiter.limit < 4
+
+    def test_async_client_uses_the_limiter(self):
+        """Test that the async client acquires and releases slots."""
+
+        def handler(request):
+            return httpx.Response(200, json={})
+
+        async def send():
+            http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with AsyncDevoClient(
+                api_key="test-api-key", http_client=http_client, concurrency_limiter=True
+            ) as client:
+                await asyncio.gather(*(client.get("a") for _ in range(20)))
+                return client
+
+        client = asyncio.run(send())
+
+        assert client.concurrency_limiter.in_flight == 0
+        assert client.metrics.as_dict()["requests"] == 20
+        assert "concurrency_limit" in client.metrics.as_dict()
+
+    def test_backoff_sleeps_are_not_latency(self, mocker):
+        """Test that a retried call gives its slot back while it sleeps, and the sleep isn't counted as latency."""
+        transport = Mock(spec=Transport)
+        transport.send.side_effect = [TransportResponse(503, {}, b"{}"), TransportResponse(200, {}, b"{}")]
+        limiter = ConcurrencyLimiter()
+        client = DevoClient(
+            api_key="test-api-key", transport=transport, concurrency_limiter=limiter, retry_policy=slow_retries()
+        )
+        sleep = time.sleep
+        in_flight_while_sleeping = []
+
+        def backoff(delay):
+            in_flight_while_sleeping.append(limiter.in_flight)
+            sleep(delay)
+
+        mocker.patch("devhub_python.client.time.sleep", side_effect=backoff)
+
+        client.get("a")
+
+        assert in_flight_while_sleeping == [0]
+        assert limiter.in_flight == 0
+        assert limiter.smoothed_latency < 0.1
+        assert client.metrics.as_dict()["average_latency"] < 0.1
+
+    def test_async_backoff_sleeps_are_not_latency(self):
+        """Test that the async client also leaves backoff sleeps out of the latency."""
+        statuses = [503, 200]
+
+        def handler(request):
+            return httpx.Response(statuses.pop(0), json={})
+
+        async def send():
+            http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with AsyncDevoClient(
+                api_key="test-api-key",
+                http_client=http_client,
+                concurrency_limiter=True,
+                retry_policy=slow_retries(),
+            ) as client:
+                await client.get("a")
+                return client
+
+        client = asyncio.run(send())
+
+        assert client.concurrency_limiter.in_flight == 0
+        assert client.concurrency_limiter.smoothed_latency < 0.1
+        assert client.metrics.as_dict()["average_latency"] < 0.1
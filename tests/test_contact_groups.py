@@ -1,5 +1,6 @@
+import asyncio
 from datetime import datetime
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 
@@ -11,7 +12,7 @@ from devhub_python.models.contact_groups import (
     DeleteContactsGroupsDto,
     UpdateContactsGroupDto,
 )
-from devhub_python.resources.contact_groups import ContactGroupsResource
+from devhub_python.resources.contact_groups import AsyncContactGroupsResource, ContactGroupsResource
 
 
 class TestContactGroupsResource:
@@ -522,3 +523,52 @@ class TestServicesNamespace:
         services_repr = repr(self.client.services)
         assert "ServicesNamespace" in services_repr
         assert "DevoClient" in services_repr
+
+
+class TestAsyncContactGroupsResource:
+    """Test cases for the async contact groups resource."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.mock_client = AsyncMock()
+        self.contact_groups = AsyncContactGroupsResource(self.mock_client)
+
+    def test_list_and_search(self):
+        """Test listing and searching contact groups."""
+        mock_response = Mock()
+        mock_response.json.return_value = {
+            "groups": [{"id": "group_1", "name": "Marketing"}],
+            "total": 1,
+            "page": 1,
+            "limit": 10,
+            "total_pages": 1,
+        }
+        self.mock_client.get.return_value = mock_response
+
+        result = asyncio.run(self.contact_groups.search("market", fields=["name"], page=1, limit=10))
+
+        assert isinstance(result, ContactsGroupListResponse)
+        self.mock_client.get.assert_awaited_once_with(
+            "contacts-groups", params={"page": 1, "limit": 10, "search": "market", "search_fields": ["name"]}
+        )
+
+    def test_crud_operations(self):
+        """Test create, update, get and delete operations."""
+        mock_response = Mock()
+        mock_response.json.return_value = {"id": "group_1", "name": "Marketing"}
+        self.mock_client.post.return_value = mock_response
+        self.mock_client.put.return_value = mock_response
+        self.mock_client.get.return_value = mock_response
+        self.mock_client.delete.return_value = mock_response
+
+        created = asyncio.run(self.contact_groups.create(CreateContactsGroupDto(name="Marketing")))
+        updated = asyncio.run(self.contact_groups.update("group_1", UpdateContactsGroupDto(name="Sales")))
+        fetched = asyncio.run(self.contact_groups.get_by_id("group_1"))
+        deleted = asyncio.run(self.contact_groups.delete_by_id("group_1", approve="yes"))
+        bulk = asyncio.run(
+            self.contact_groups.delete_bulk(DeleteContactsGroupsDto(group_ids=["group_1"]), approve="yes")
+        )
+
+        for result in (created, updated, fetched, deleted, bulk):
+            assert isinstance(result, ContactsGroup)
+        self.mock_client.delete.assert_any_await("contacts-groups/group_1", params={"approve": "yes"})
@@ -1,4 +1,5 @@
-from unittest.mock import Mock
+import asyncio
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 
@@ -19,7 +20,7 @@ from devhub_python.models.contacts import (
     UpdateContactDto,
     UpdateCustomFieldDto,
 )
-from devhub_python.resources.contacts import ContactsResource
+from devhub_python.resources.contacts import AsyncContactsResource, ContactsResource
 
 
 class TestContactsResource:
@@ -492,3 +493,127 @@ class TestServicesNamespaceContacts:
         assert "ServicesNamespace" in services_repr
         # Ensure contacts resource is properly initialized
         assert hasattr(self.client.services, "contacts")
+
+
+class TestAsyncContactsResource:
+    """Test cases for the async contacts resource."""
+
+    @pytest.fixture
+    def contacts_resource(self):
+        """Create an async contacts resource backed by a mock async client."""
+        return AsyncContactsResource(AsyncMock())
+
+    def test_list_contacts_with_filters(self, contacts_resource):
+        """Test listing contacts with filters."""
+        mock_response = Mock()
+        mock_response.json.return_value = {
+            "contacts": [{"id": "contact_1", "phone_number": "+1234567890"}],
+            "total": 1,
+            "page": 1,
+            "limit": 50,
+            "total_pages": 1,
+        }
+        contacts_resource.client.get.return_value = mock_response
+
+        result = asyncio.run(
+            contacts_resource.list(
+                contacts_group_ids=["group_1"],
+                country_codes=["US"],
+                search="john",
+                search_fields=["first_name"],
+                is_whatsapp_subscribed=True,
+                is_email_subscribed=False,
+                is_sms_subscribed=True,
+                is_mms_subscribed=False,
+                is_rcs_subscribed=True,
+                tags=["vip"],
+            )
+        )
+
+        assert isinstance(result, GetContactsSerializer)
+        assert result.contacts[0].id == "contact_1"
+        params = contacts_resource.client.get.call_args.kwargs["params"]
+        assert params["tags"] == ["vip"]
+        assert params["is_rcs_subscribed"] is True
+
+    def test_create_update_and_delete(self, contacts_resource):
+        """Test creating, updating and bulk-deleting contacts."""
+        mock_response = Mock()
+        mock_response.json.return_value = {"id": "contact_1", "phone_number": "+1234567890"}
+        contacts_resource.client.post.return_value = mock_response
+        contacts_resource.client.put.return_value = mock_response
+        contacts_resource.client.delete.return_value = mock_response
+
+        created = asyncio.run(contacts_resource.create(CreateContactDto(phone_number="+1234567890")))
+        updated = asyncio.run(contacts_resource.update("contact_1", UpdateContactDto(first_name="John")))
+        deleted = asyncio.run(
+            contacts_resource.delete_bulk(DeleteContactsDto(contact_ids=["contact_1"]), approve="yes")
+        )
+
+        assert isinstance(created, ContactSerializer)
+        assert updated.id == "contact_1"
+        assert deleted.id == "contact_1"
+        contacts_resource.client.delete.assert_awaited_once_with(
+            "user-api/contacts", json={"contact_ids": ["contact_1"]}, params={"approve": "yes"}
+        )
+
+    def test_group_assignment(self, contacts_resource):
+        """Test assigning and unassigning contacts from groups."""
+        assignment = AssignToContactsGroupDto(contact_ids=["contact_1"], contacts_group_id="group_1")
+
+        asyncio.run(contacts_resource.assign_to_group(assignment))
+        asyncio.run(contacts_resource.unassign_from_group(assignment))
+
+        assert contacts_resource.client.patch.await_count == 2
+
+    def test_import_from_csv(self, contacts_resource):
+        """Test importing contacts from CSV."""
+        mock_response = Mock()
+        mock_response.json.return_value = {
+            "total_processed": 1,
+            "successfully_created": 1,
+            "skipped_duplicates": 0,
+            "failed_imports": 0,
+        }
+        contacts_resource.client.post.return_value = mock_response
+
+        result = asyncio.run(
+            contacts_resource.import_from_csv(CreateContactsFromCsvDto(csv_data="phone\n+1234567890"), approve="yes")
+        )
+
+        assert isinstance(result, CreateContactsFromCsvRespDto)
+        assert result.successfully_created == 1
+
+    def test_custom_fields(self, contacts_resource):
+        """Test the custom field operations."""
+        field = {"id": "field_1", "name": "Industry", "field_type": "text"}
+        list_response = Mock()
+        list_response.json.return_value = {
+            "custom_fields": [field],
+            "total": 1,
+            "page": 1,
+            "limit": 50,
+            "total_pages": 1,
+        }
+        field_response = Mock()
+        field_response.json.return_value = field
+        contacts_resource.client.get.return_value = list_response
+        contacts_resource.client.post.return_value = field_response
+
+        fields = asyncio.run(contacts_resource.list_custom_fields(id="field_1", search="Ind"))
+        created = asyncio.run(
+            contacts_resource.create_custom_field(CreateCustomFieldDto(name="Industry", field_type="text"))
+        )
+        asyncio.run(contacts_resource.update_custom_field("field_1", UpdateCustomFieldDto(name="Sector")))
+        asyncio.run(contacts_resource.delete_custom_field(CommonDeleteDto(ids=["field_1"]), approve="yes"))
+
+        assert isinstance(fields, GetCustomFieldsSerializer)
+        assert isinstance(created, CustomFieldSerializer)
+        contacts_resource.client.delete.assert_awaited_once_with(
+            "user-api/contacts/custom-fields", json={"ids": ["field_1"]}, params={"approve": "yes"}
+        )
+
+    def test_delete_custom_field_requires_approval(self, contacts_resource):
+        """Test that deleting custom fields requires approval."""
+        with pytest.raises(ValueError):
+            asyncio.run(contacts_resource.delete_custom_field(CommonDeleteDto(ids=["field_1"]), approve=""))
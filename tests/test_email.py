@@ -1,10 +1,11 @@
+import asyncio
 from datetime import datetime
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 
 from devhub_python.exceptions import DevoValidationException
-from devhub_python.resources.email import EmailResource
+from devhub_python.resources.email import AsyncEmailResource, EmailResource
 
 
 class TestEmailResource:
@@ -296,3 +297,31 @@ class TestEmailResource:
         # Should call with the exact values provided
         assert email_resource.client.post.called
         assert result.success is True
+
+
+class TestAsyncEmailResource:
+    """Test cases for the async Email resource."""
+
+    def test_send_email_success(self):
+        """Test sending an email through the async resource."""
+        email_resource = AsyncEmailResource(AsyncMock())
+        mock_response = Mock()
+        mock_response.json.return_value = {"success": True, "message_id": "email_1"}
+        email_resource.client.post.return_value = mock_response
+
+        result = asyncio.run(
+            email_resource.send_email(
+                subject="Hello", body="Body", sender="sender@example.com", recipient="recipient@example.com"
+            )
+        )
+
+        assert result.message_id == "email_1"
+        email_resource.client.post.assert_awaited_once_with(
+            "user-api/email/send",
+            json={
+                "subject": "Hello",
+                "body": "Body",
+                "sender": "sender@example.com",
+                "recipient": "recipient@example.com",
+            },
+        )
@@ -0,0 +1,231 @@
+import asyncio
+import csv
+import json
+import os
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from devhub_python import DevoClient, ExportProgress
+from devhub_python.codec import JSONCodec
+from devhub_python.exceptions import DevoException, DevoNetworkException, DevoValidationException
+from devhub_python.export import export_pages
+from devhub_python.resources.contacts import AsyncContactsResource
+
+ITEMS = [{"id": f"item_{i}", "n": i, "ok": i % 2 == 0, "tags": ["a"], "note": None} for i in range(25)]
+
+
+def make_pages(items, page_size, fail_at=None, **extra):
+    """Build a fetch function over ``items`` that fails on page ``fail_at``, recording the pages it was asked for."""
+
+    def fetch(page):
+        fetch.pages.append(page)
+        if page == fail_at:
+            raise DevoNetworkException("Connection reset")
+        start = (page - 1) * page_size
+        return {"items": items[start : start + page_size], **extra}
+
+    fetch.pages = []
+    return fetch
+
+
+def read_ndjson(path):
+    """Decode every line of an NDJSON file."""
+    with open(path, encoding="utf-8") as ndjson_file:
+        return [json.loads(line) for line in ndjson_file]
+
+
+def json_response(data):
+    """Create a mock response whose body is ``data``."""
+    response = Mock()
+    response.json.return_value = data
+    return response
+
+
+class TestExportPages:
+    """Test cases for exporting pages to files."""
+
+    def test_ndjson(self, tmp_path):
+        """Test that every item is written as one JSON line, and the checkpoint removed at the end."""
+        path = str(tmp_path / "items.ndjson")
+
+        progress = export_pages(make_pages(ITEMS, 10), path, {"source": "items"}, 10, "items")
+
+        assert read_ndjson(path) == ITEMS
+        assert (progress.rows, progress.pages) == (25, 3)
+        assert not os.path.exists(path + ".checkpoint")
+
+    def test_csv(self, tmp_path):
+        """Test that CSV rows follow the columns, with custom fields, booleans, blanks and JSON for lists."""
+        path = str(tmp_path / "items.csv")
+        items = [dict(item, custom_fields={"plan": "pro"} if item["n"] == 1 else None) for item in ITEMS[:3]]
+        columns = ["id", "ok", "note", "tags", "custom_fields.plan"]
+
+        export_pages(make_pages(items, 2), path, {"source": "items"}, 2, "items", columns=columns)
+
+        with open(path, newline="", encoding="utf-8") as csv_file:
+            rows = list(csv.reader(csv_file))
+        assert rows[0] == columns
+        assert rows[1:] == [
+            ["item_0", "true", "", '["a"]', ""],
+            ["item_1", "false", "", '["a"]', "pro"],
+            ["item_2", "true", "", '["a"]', ""],
+        ]
+
+    def test_resume(self, tmp_path):
+        """Test that a failed export resumes after its last recorded page, dropping a page written in part."""
+        path = str(tmp_path / "items.ndjson")
+        failing = make_pages(ITEMS, 5, fail_at=3)
+
+        with pytest.raises(DevoNetworkException):
+            export_pages(failing, path, {"source": "items"}, 5, "items")
+        with open(path, "ab") as output:
+            output.write(b'{"id": "item_10", "n"')
+        resumed = make_pages(ITEMS, 5)
+        progress = export_pages(resumed, path, {"source": "items"}, 5, "items")
+
+        assert read_ndjson(path) == ITEMS
+        assert resumed.pages == [3, 4, 5, 6]
+        assert (progress.rows, progress.pages) == (25, 6)
+
+    def test_resume_errors(self, tmp_path):
+        """Test that a checkpoint isn't used for another export, nor for an output cut short or missing."""
+        path = str(tmp_path / "items.ndjson")
+        with pytest.raises(DevoNetworkException):
+            export_pages(make_pages(ITEMS, 5, fail_at=3), path, {"source": "items"}, 5, "items")
+
+        with pytest.raises(DevoValidationException, match="different export"):
+            export_pages(make_pages(ITEMS, 5), path, {"source": "items"}, 10, "items")
+        with open(path, "r+b") as output:
+            output.truncate(10)
+        with pytest.raises(DevoException, match="shorter than its checkpoint"):
+            export_pages(make_pages(ITEMS, 5), path, {"source": "items"}, 5, "items")
+        os.remove(path)
+        with pytest.raises(DevoException, match="is missing"):
+            export_pages(make_pages(ITEMS, 5), path, {"source": "items"}, 5, "items")
+
+    def test_progress(self, tmp_path):
+        """Test that progress is reported after each page, with an ETA once the number of pages is known."""
+        reports = []
+
+        export_pages(
+            make_pages(ITEMS, 10, total_pages=3),
+            str(tmp_path / "items.jsonl"),
+            {"source": "items"},
+            10,
+            "items",
+            on_progress=reports.append,
+        )
+
+        assert [(report.rows, report.pages, report.last_page) for report in reports] == [
+            (10, 1, 3),
+            (20, 2, 3),
+            (25, 3, 3),
+        ]
+        assert reports[0].eta is not None and reports[0].eta > 0
+        assert reports[-1].eta == 0
+        assert "rows/s" in repr(reports[0])
+        assert ExportProgress(0, 0, None, 0.0, 0).eta is None
+
+    @pytest.mark.parametrize(
+        "path, kwargs, message",
+        [
+            ("items.txt", {}, "Can't tell the export format"),
+            ("items.csv", {"format": "xml"}, "Unknown export format"),
+            ("items.csv", {}, "needs its columns"),
+        ],
+    )
+    def test_invalid(self, tmp_path, path, kwargs, message):
+        """Test that unknown formats and CSV exports without columns are rejected."""
+        with pytest.raises(DevoValidationException, match=message):
+            export_pages(make_pages(ITEMS, 10), str(tmp_path / path), {"source": "items"}, 10, "items", **kwargs)
+
+
+class TestResourceExports:
+    """Test cases for the contacts and messages exports."""
+
+    def test_contacts_csv(self, tmp_path):
+        """Test that contacts export with a column per custom field, as the API returned them."""
+        path = str(tmp_path / "contacts.csv")
+        contacts = [{"id": "c1", "email": "a@example.com", "custom_fields": {"plan": "pro"}}, {"id": "c2"}]
+        fields = {"custom_fields": [{"id": "f1", "name": "plan", "field_type": "text"}], "total": 1, "page": 1}
+
+        def get(path, params):
+            if path == "user-api/contacts/custom-fields":
+                return json_response(dict(fields, limit=params["limit"], total_pages=1))
+            return json_response({"contacts": contacts, "total": 2, "page": 1, "limit": 100, "total_pages": 1})
+
+        client = DevoClient(api_key="test_api_key")
+        client.get = Mock(side_effect=get)
+
+        progress = client.contacts.export(path, tags=["vip"])
+
+        with open(path, newline="", encoding="utf-8") as csv_file:
+            rows = list(csv.DictReader(csv_file))
+        assert progress.rows == 2
+        assert "custom_fields" not in rows[0]
+        assert (rows[0]["email"], rows[0]["custom_fields.plan"], rows[1]["custom_fields.plan"]) == (
+            "a@example.com",
+            "pro",
+            "",
+        )
+        assert client.get.call_args.kwargs["params"]["tags"] == ["vip"]
+
+    def test_contacts_csv_resume(self, tmp_path):
+        """Test that a resumed contacts export keeps its checkpoint's columns without listing custom fields again."""
+        path = str(tmp_path / "contacts.csv")
+        fields = {"custom_fields": [{"id": "f1", "name": "plan", "field_type": "text"}], "total": 1, "page": 1}
+        pages = {page: [{"id": f"c{page}", "custom_fields": {"plan": "pro"}}] for page in (1, 2)}
+
+        def get(path, params):
+            if path == "user-api/contacts/custom-fields":
+                return json_response(dict(fields, limit=params["limit"], total_pages=1))
+            if params["page"] == 2 and not resumed:
+                raise DevoNetworkException("Connection reset")
+            contacts = pages[params["page"]]
+            return json_response(
+                {"contacts": contacts, "total": 2, "page": params["page"], "limit": 1, "total_pages": 2}
+            )
+
+        client = DevoClient(api_key="test_api_key")
+        client.get = Mock(side_effect=get)
+        resumed = False
+        with pytest.raises(DevoNetworkException):
+            client.contacts.export(path, limit=1)
+        resumed = True
+        client.get.reset_mock()
+
+        client.contacts.export(path, limit=1)
+
+        with open(path, newline="", encoding="utf-8") as csv_file:
+            rows = list(csv.DictReader(csv_file))
+        assert [(row["id"], row["custom_fields.plan"]) for row in rows] == [("c1", "pro"), ("c2", "pro")]
+        assert [call.args[0] for call in client.get.call_args_list] == ["user-api/contacts"]
+
+    def test_messages_ndjson(self, tmp_path):
+        """Test that messages export by offset, keeping each message's JSON."""
+        path = str(tmp_path / "messages.ndjson")
+        messages = [{"id": f"msg_{i}", "from": "+1"} for i in range(3)]
+        client = DevoClient(api_key="test_api_key")
+        client.get = Mock(
+            side_effect=[json_response({"messages": messages[:2]}), json_response({"messages": messages[2:]})]
+        )
+
+        client.messages.export(path, limit=2, channel="sms")
+
+        assert read_ndjson(path) == messages
+        assert [call.kwargs["params"]["offset"] for call in client.get.call_args_list] == [0, 2]
+
+    def test_async_contacts(self, tmp_path):
+        """Test that the async contacts export writes the same file."""
+        path = str(tmp_path / "contacts.ndjson")
+        client = AsyncMock()
+        client.codec = JSONCodec()
+        client.get.return_value = json_response(
+            {"contacts": [{"id": "c1"}], "total": 1, "page": 1, "limit": 100, "total_pages": 1}
+        )
+
+        progress = asyncio.run(AsyncContactsResource(client).export(path))
+
+        assert read_ndjson(path) == [{"id": "c1"}]
+        assert progress.rows == 1
@@ -0,0 +1,206 @@
+import json
+import os
+
+import pytest
+import requests
+
+from devhub_python import DevoClient
+from devhub_python.http2 import HTTP2Adapter
+from devhub_python.metrics import ClientMetrics
+from devhub_python.pool import ConnectionPoolStats, TrackedPoolManager, reset_adapter_after_fork
+
+requires_fork = pytest.mark.skipif(not hasattr(os, "fork"), reason="os.fork() is not available")
+
+
+def make_client(base_url, **kwargs):
+    """Create a client pointed at a local test server."""
+    client = DevoClient(api_key="test-api-key", **kwargs)
+    client.base_url = base_url
+    return client
+
+
+def run_in_child(func):
+    """Fork, run ``func`` in the child and return its JSON-serializable result."""
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:  # pragma: no cover - runs in the child, whose coverage isn't collected
+        os.close(read_fd)
+        try:
+            result = {"ok": True, "value": func()}
+        except BaseException as e:
+            result = {"ok": False, "value": repr(e)}
+        with os.fdopen(write_fd, "w") as pipe:
+            json.dump(result, pipe)
+        os._exit(0)
+
+    os.close(write_fd)
+    with os.fdopen(read_fd) as pipe:
+        result = json.load(pipe)
+    os.waitpid(pid, 0)
+    assert result["ok"], result["value"]
+    return result["value"]
+
+
+class TestForkSafety:
+    """Test cases for using a client created before a fork."""
+
+    @requires_fork
+    @pytest.mark.parametrize(
+        "config",
+        [{}, {"transport": "urllib3"}, {"thread_safe": True}],
+        ids=["requests", "urllib3", "thread_safe"],
+    )
+    def test_child_opens_its_own_connections(self, echo_server, config):
+        """Test that a forked child never reuses the parent's pooled connections."""
+        client = make_client(echo_server, **config)
+        parent_port = client.get("test").json()["client_port"]
+
+        def child():
+            stats_after_fork = client.pool_stats()
+            port = client.get("test").json()["client_port"]
+            return {
+                "stats_after_fork": stats_after_fork,
+                "port": port,
+                "stats": client.pool_stats(),
+                "requests": client.metrics.requests,
+            }
+
+        result = run_in_child(child)
+
+        assert result["stats_after_fork"] == {"in_use": 0, "idle": 0, "created": 0, "discarded": 0}
+        assert result["port"] != parent_port
+        assert result["stats"]["created"] == 1
+        assert result["requests"] == 1
+
+        # The child's cleanup left the parent's connection open and reusable
+        assert client.get("test").json()["client_port"] == parent_port
+        assert client.pool_stats()["created"] == 1
+        assert client.pool_stats()["discarded"] == 0
+
+    def test_pid_change_resets_before_request(self, echo_server, mocker):
+        """Test that a request from a different process resets the client first."""
+        client = make_client(echo_server)
+        first_port = client.get("test").json()["client_port"]
+        spy = mocker.spy(client, "after_fork")
+
+        client._pid = -1
+        second_port = client.get("test").json()["client_port"]
+
+        spy.assert_called_once_with()
+        assert second_port != first_port
+        assert client._pid == os.getpid()
+        assert client.metrics.requests == 1
+        assert client.pool_stats()["created"] == 1
+
+        client.get("test")
+        spy.assert_called_once_with()
+
+    def test_after_fork_keeps_configuration(self, echo_server):
+        """Test that after_fork only drops connections and counters."""
+        client = make_client(echo_server, pool_maxsize=7, max_retries=5)
+        client.get("test")
+        header_cache = dict(client._header_cache)
+
+        client.after_fork()
+
+        adapter = client.session.get_adapter(client.base_url)
+        assert adapter.poolmanager.connection_pool_kw["maxsize"] == 7
+        assert adapter.max_retries.total == 0
+        assert client.retry_policy.default.max_retries == 5
+        assert client._header_cache == header_cache
+        assert client.get("test").json()["api_key"] == "test-api-key"
+
+    def test_thread_local_sessions_are_forgotten(self, echo_server):
+        """Test that thread-safe mode starts over with new sessions."""
+        client = make_client(echo_server, thread_safe=True)
+        client.get("test")
+        parent_session = client.session
+
+        client.after_fork()
+
+        assert client.transport.sessions == []
+        assert client.session is not parent_session
+
+    def test_custom_session_adapters_are_reset(self, echo_server):
+        """Test that plain requests adapters on a custom session are reset too."""
+        session = requests.Session()
+        client = make_client(echo_server, session=session)
+        client.get("test")
+        adapter = session.get_adapter(echo_server)
+        conn = next(iter(adapter.poolmanager.pools._container.values())).pool.queue[-1]
+        sock = conn.sock
+
+        reset_adapter_after_fork(adapter)
+
+        assert conn.sock is None
+        assert sock.fileno() == -1
+        assert len(adapter.poolmanager.pools) == 0
+        assert client.get("test").status_code == 200
+
+    def test_tracked_pool_manager_forgets_pools(self, echo_server):
+        """Test that the urllib3 transport's pool manager drops its host pools."""
+        client = make_client(echo_server, transport="urllib3")
+        client.get("test")
+        manager = client.transport.pool_manager
+
+        client.after_fork()
+
+        assert isinstance(manager, TrackedPoolManager)
+        assert len(manager.pools) == 0
+        assert manager.idle_connections() == 0
+
+
+class TestHTTP2AfterFork:
+    """Test cases for resetting the HTTP/2 adapter in a child."""
+
+    def test_replaces_own_http_client(self):
+        """Test that the adapter's own httpx client is replaced, not closed."""
+        adapter = HTTP2Adapter(max_connections=3)
+        inherited = adapter.http_client
+        adapter.stats.increment("requests")
+
+        adapter.after_fork()
+
+        assert adapter.http_client is not inherited
+        assert not inherited.is_closed
+        assert adapter.stats.as_dict()["requests"] == 0
+
+    def test_keeps_custom_http_client(self, mocker):
+        """Test that a user-supplied httpx client is left alone."""
+        http_client = mocker.Mock()
+        adapter = HTTP2Adapter(http_client=http_client)
+
+        adapter.after_fork()
+
+        assert adapter.http_client is http_client
+        http_client.close.assert_not_called()
+
+
+class TestCounterReset:
+    """Test cases for zeroing counters inherited across a fork."""
+
+    def test_metrics_reset(self):
+        """Test that ClientMetrics.reset zeroes every counter."""
+        metrics = ClientMetrics()
+        metrics.request_started()
+        metrics.request_finished(200, 0.1)
+
+        metrics.reset()
+
+        assert metrics.as_dict() == {
+            "requests": 0,
+            "errors": 0,
+            "in_flight": 0,
+            "status_codes": {},
+            "average_latency": 0.0,
+        }
+
+    def test_connection_stats_reset(self):
+        """Test that ConnectionPoolStats.reset zeroes every counter."""
+        stats = ConnectionPoolStats()
+        stats.increment("created", 3)
+        stats.increment("in_use")
+
+        stats.reset()
+
+        assert (stats.created, stats.discarded, stats.in_use) == (0, 0, 0)
@@ -0,0 +1,203 @@
+import asyncio
+import threading
+import time
+from unittest.mock import Mock
+
+import httpx
+import pytest
+
+from devhub_python import AsyncDevoClient, DevoClient, HedgingPolicy, RetryPolicy, RetryRule
+from devhub_python.exceptions import DevoConfigurationException, DevoConnectionException, DevoTimeoutException
+from devhub_python.transport import Transport, TransportResponse
+
+
+def make_client(send, **kwargs):
+    """Create a client whose transport calls ``send(call_number)`` for every attempt."""
+    calls = []
+    lock = threading.Lock()
+
+    def side_effect(method, url, headers, body=None, timeout=None):
+        with lock:
+            calls.append(url)
+            number = len(calls)
+        return send(number)
+
+    transport = Mock(spec=Transport)
+    transport.send.side_effect = side_effect
+    return DevoClient(api_key="test-api-key", transport=transport, **kwargs), calls
+
+
+def slow_first(number):
+    """Answer the first attempt after half a second and later ones at once."""
+    if number == 1:
+        time.sleep(0.5)
+    return TransportResponse(200, {}, b'{"attempt": %d}' % number)
+
+
+class TestHedgingPolicy:
+    """Test cases for the hedge delay and budget."""
+
+    def test_delay_is_a_percentile_of_recent_latencies(self):
+        """Test that hedging waits for enough samples, then uses the configured percentile."""
+        policy = HedgingPolicy(percentile=90, min_samples=10)
+        for latency in range(1, 10):
+            policy._finished(latency / 100, hedge_won=False)
+        assert policy._delay_for_next_request() is None
+
+        for latency in range(10, 101):
+            policy._finished(latency / 100, hedge_won=False)
+
+        assert policy._delay_for_next_request() == pytest.approx(0.91)
+        assert policy.as_dict()["delay"] == pytest.approx(0.91)
+
+    def test_hedges_are_capped(self):
+        """Test that no more than max_hedge_ratio of recent requests are hedged."""
+        policy = HedgingPolicy(delay=0.0, max_hedge_ratio=0.1, window=50)
+
+        hedged = 0
+        for _ in range(200):
+            policy._delay_for_next_request()
+            hedged += policy._take_hedge()
+
+        assert hedged == 20
+        assert policy.hedges == 20
+
+
+class TestClientHedging:
+    """Test cases for hedged requests on the clients."""
+
+    def test_slow_get_is_hedged(self):
+        """Test that a second attempt goes out after the delay and its reply wins."""
+        policy = HedgingPolicy(delay=0.05, max_hedge_ratio=1.0)
+        client, calls = make_client(slow_first, hedging=policy)
+
+        started = time.monotonic()
+        response = client.get("messages/msg_1")
+        elapsed = time.monotonic() - started
+
+        assert response.json() == {"attempt": 2}
+        assert elapsed < 0.4
+        assert len(calls) == 2
+        assert policy.as_dict()["hedge_wins"] == 1
+        # One logical request
+        assert client.metrics.as_dict()["requests"] == 1
+        client.close()
+
+    def test_fast_reply_is_not_hedged(self):
+        """Test that requests answering within the delay are sent once."""
+        policy = HedgingPolicy(delay=0.2, max_hedge_ratio=1.0)
+        client, calls = make_client(lambda number: TransportResponse(200, {}, b"{}"), hedging=policy)
+
+        for _ in range(5):
+            client.get("messages/msg_1")
+
+        assert len(calls) == 5
+        assert policy.hedges == 0
+
+    def test_only_safe_methods_are_hedged(self):
+        """Test that POSTs are never sent twice."""
+        policy = HedgingPolicy(delay=0.05, max_hedge_ratio=1.0)
+        client, calls = make_client(slow_first, hedging=policy)
+
+        client.post("user-api/sms/quick-send", json={})
+
+        assert len(calls) == 1
+        assert policy.requests == 0
+
+    def test_errors(self):
+        """Test that a quick failure isn't hedged and the first error is raised when both attempts fail."""
+
+        def send(number):
+            if number == 1:
+                raise DevoConnectionException()
+            time.sleep(0.1)
+            raise DevoTimeoutException()
+
+        policy = HedgingPolicy(delay=0.05, max_hedge_ratio=1.0)
+        client, calls = make_client(send, hedging=policy, max_retries=0)
+        with pytest.raises(DevoConnectionException):
+            client.get("messages/msg_1")
+        assert len(calls) == 1
+
+        client, calls = make_client(lambda number: send(number + 1), hedging=policy, max_retries=0)
+        with pytest.raises(DevoTimeoutException):
+            client.get("messages/msg_1")
+        assert len(calls) == 2
+
+    def test_needs_thread_safe_transport(self):
+        """Test that hedging is refused on a transport sharing one requests session across threads."""
+        with pytest.raises(DevoConfigurationException, match="thread_safe=True"):
+            DevoClient(api_key="test-api-key", hedging=True)
+
+        for kwargs in ({"thread_safe": True}, {"transport": "urllib3"}):
+            client = DevoClient(api_key="test-api-key", hedging=True, **kwargs)
+            assert client.hedging is not None
+            client.close()
+
+    def test_after_fork(self):
+        """Test that the parent's worker threads are dropped."""
+        policy = HedgingPolicy(delay=0.05, max_hedge_ratio=1.0)
+        client, _ = make_client(slow_first, hedging=policy)
+        client.get("messages/msg_1")
+
+        client.after_fork()
+
+        assert policy._executor is None
+
+    def test_async_loser_is_cancelled(self):
+        """Test that the async client cancels the slower attempt."""
+        state = {"calls": 0, "cancelled": 0}
+
+        async def handler(request):
+            state["calls"] += 1
+            if state["calls"] == 1:
+                try:
+                    await asyncio.sleep(1)
+                except asyncio.CancelledError:
+                    state["cancelled"] += 1
+                    raise
+            return httpx.Response(200, json={"attempt": state["calls"]})
+
+        async def send():
+            http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            policy = HedgingPolicy(delay=0.05, max_hedge_ratio=1.0)
+            async with AsyncDevoClient(api_key="test-api-key", http_client=http_client, hedging=policy) as client:
+                started = time.monotonic()
+                response = await client.get("messages/msg_1")
+                return response, time.monotonic() - started, policy
+
+        response, elapsed, policy = asyncio.run(send())
+
+        assert response.json() == {"attempt": 2}
+        assert elapsed < 0.5
+        assert state["cancelled"] == 1
+        assert policy.hedge_wins == 1
+
+    def test_async_hedges_each_attempt(self):
+        """Test that the async client hedges a slow retry on its own, as the sync client does."""
+        calls = []
+
+        async def handler(request):
+            calls.append(request.url.path)
+            if len(calls) == 1:
+                return httpx.Response(503)
+            if len(calls) == 2:
+                await asyncio.sleep(1)
+            return httpx.Response(200, json={"attempt": len(calls)})
+
+        async def send():
+            http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            policy = HedgingPolicy(delay=0.05, max_hedge_ratio=1.0)
+            retry_policy = RetryPolicy(RetryRule(base_delay=0.001, max_delay=0.001))
+            async with AsyncDevoClient(
+                api_key="test-api-key", http_client=http_client, hedging=policy, retry_policy=retry_policy
+            ) as client:
+                response = await client.get("messages/msg_1")
+                return response, policy
+
+        response, policy = asyncio.run(send())
+
+        assert response.json() == {"attempt": 3}
+        assert len(calls) == 3
+        # The 503 and the retry were each hedged on their own
+        assert (policy.requests, policy.hedges, policy.hedge_wins) == (2, 1, 1)
@@ -0,0 +1,221 @@
+import asyncio
+
+import httpx
+import pytest
+import requests
+from urllib3.util.retry import Retry
+
+from devhub_python import AsyncDevoClient, DevoClient
+from devhub_python.exceptions import DevoConfigurationException, DevoException
+from devhub_python.http2 import HTTP2Adapter, HTTP2Stats, create_httpx_client
+
+
+def make_session(handler, **kwargs):
+    """Create a requests session whose HTTP/2 adapter is served by ``handler``."""
+    adapter = HTTP2Adapter(http_client=httpx.Client(transport=httpx.MockTransport(handler)), **kwargs)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    return session, adapter
+
+
+class TestHTTP2Stats:
+    """Test cases for the HTTP2Stats counters."""
+
+    def test_trace_counts_known_events(self):
+        """Test that httpcore trace events map onto counters."""
+        stats = HTTP2Stats()
+
+        stats.trace("connection.connect_tcp.complete", {})
+        stats.trace("connection.start_tls.complete", {})
+        stats.trace("http2.send_connection_init.complete", {})
+        for _ in range(4):
+            stats.trace("http2.send_request_headers.complete", {})
+        stats.trace("http2.receive_response_body.complete", {})
+
+        snapshot = stats.as_dict()
+        assert snapshot["connections_opened"] == 1
+        assert snapshot["tls_handshakes"] == 1
+        assert snapshot["http2_connections"] == 1
+        assert snapshot["streams_opened"] == 4
+        assert snapshot["streams_per_connection"] == 4.0
+
+    def test_streams_per_connection_without_connections(self):
+        """Test that the ratio is zero before any HTTP/2 connection is made."""
+        assert HTTP2Stats().as_dict()["streams_per_connection"] == 0.0
+
+    def test_async_trace(self):
+        """Test the async trace callback used by AsyncDevoClient."""
+        stats = HTTP2Stats()
+
+        asyncio.run(stats.async_trace("http11.send_request_headers.complete", {}))
+
+        assert stats.as_dict()["http11_requests"] == 1
+
+
+class TestCreateHttpxClient:
+    """Test cases for create_httpx_client."""
+
+    def test_creates_sync_and_async_clients(self):
+        """Test that the sync and async client types are honoured."""
+        sync_client = create_httpx_client(max_connections=5)
+        async_client = create_httpx_client(async_client=True)
+
+        assert isinstance(sync_client, httpx.Client)
+        assert isinstance(async_client, httpx.AsyncClient)
+        sync_client.close()
+
+    def test_missing_h2_raises_configuration_error(self, mocker):
+        """Test that a missing h2 package surfaces as a configuration error."""
+        mocker.patch("httpx.Client.__init__", side_effect=ImportError("h2 missing"))
+
+        with pytest.raises(DevoConfigurationException, match="h2"):
+            create_httpx_client()
+
+
+class TestHTTP2Adapter:
+    """Test cases for the HTTP2Adapter."""
+
+    def test_builds_requests_response(self):
+        """Test that httpx responses are converted into requests responses."""
+        seen = {}
+
+        def handler(request):
+            seen["method"] = request.method
+            seen["headers"] = request.headers
+            seen["body"] = request.content
+            return httpx.Response(201, json={"id": "msg_1"}, headers={"X-Request-Id": "abc"})
+
+        session, adapter = make_session(handler)
+        response = session.post("https://api.example.com/send", json={"to": "+1"}, headers={"X-API-Key": "k"})
+
+        assert response.status_code == 201
+        assert response.ok
+        assert response.json() == {"id": "msg_1"}
+        assert response.headers["x-request-id"] == "abc"
+        assert response.url == "https://api.example.com/send"
+        assert seen["method"] == "POST"
+        assert seen["headers"]["X-API-Key"] == "k"
+        assert seen["body"] == b'{"to": "+1"}'
+        assert adapter.stats.as_dict()["requests"] == 1
+
+    def test_streaming_response(self):
+        """Test that stream=True reads the body lazily."""
+
+        def handler(request):
+            return httpx.Response(200, content=b"line1\nline2\n")
+
+        session, _ = make_session(handler)
+        response = session.get("https://api.example.com/export", stream=True)
+
+        assert list(response.iter_lines()) == [b"line1", b"line2"]
+
+    def test_retries_retryable_status(self):
+        """Test that the urllib3 Retry policy is honoured for status codes."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) == 1:
+                return httpx.Response(503)
+            return httpx.Response(200, json={"ok": True})
+
+        retry = Retry(total=2, status_forcelist=[503], backoff_factor=0)
+        session, _ = make_session(handler, max_retries=retry)
+        response = session.get("https://api.example.com/status")
+
+        assert response.status_code == 200
+        assert len(calls) == 2
+
+    def test_exhausted_status_retries_raise_retry_error(self):
+        """Test that running out of status retries raises RetryError like HTTPAdapter."""
+        retry = Retry(total=1, status_forcelist=[503], backoff_factor=0)
+        session, _ = make_session(lambda request: httpx.Response(503), max_retries=retry)
+
+        with pytest.raises(requests.exceptions.RetryError):
+            session.get("https://api.example.com/status")
+
+    def test_retries_connection_errors(self):
+        """Test that connection errors are retried."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) == 1:
+                raise httpx.ConnectError("refused", request=request)
+            return httpx.Response(200)
+
+        session, _ = make_session(handler, max_retries=Retry(total=1, backoff_factor=0))
+
+        assert session.get("https://api.example.com/status").status_code == 200
+        assert len(calls) == 2
+
+    @pytest.mark.parametrize(
+        "error_class,expected",
+        [
+            (httpx.ConnectTimeout, requests.exceptions.ConnectTimeout),
+            (httpx.ReadTimeout, requests.exceptions.ReadTimeout),
+            (httpx.ConnectError, requests.exceptions.ConnectionError),
+        ],
+    )
+    def test_translates_transport_errors(self, error_class, expected):
+        """Test that httpx errors are raised as the equivalent requests exceptions."""
+
+        def handler(request):
+            raise error_class("boom", request=request)
+
+        session, _ = make_session(handler)
+
+        with pytest.raises(expected):
+            session.get("https://api.example.com/status", timeout=(1, 2))
+
+
+class TestClientHTTP2:
+    """Test cases for the http2 option on the clients."""
+
+    def test_sync_client_mounts_adapter(self, api_key):
+        """Test that DevoClient(http2=True) routes requests through HTTP2Adapter."""
+        client = DevoClient(api_key=api_key, http2=True)
+
+        assert isinstance(client.session.get_adapter("https://api.example.com"), HTTP2Adapter)
+        assert client.http2_stats()["requests"] == 0
+
+    def test_sync_client_without_http2_has_no_stats(self, api_key):
+        """Test that http2_stats() requires http2=True."""
+        client = DevoClient(api_key=api_key)
+
+        with pytest.raises(DevoConfigurationException):
+            client.http2_stats()
+
+    def test_sync_client_request_over_http2(self, api_key):
+        """Test a full client request and error translation over the HTTP/2 adapter."""
+        responses = iter([httpx.Response(200, json={"success": True})])
+
+        def handler(request):
+            try:
+                return next(responses)
+            except StopIteration:
+                raise httpx.ReadTimeout("timed out", request=request)
+
+        client = DevoClient(api_key=api_key, http2=True, max_retries=0)
+        client._http2_adapter.http_client = httpx.Client(transport=httpx.MockTransport(handler))
+
+        assert client.get("test/endpoint").json() == {"success": True}
+        with pytest.raises(DevoException, match="timed out"):
+            client.get("test/endpoint")
+        assert client.http2_stats()["requests"] == 2
+
+    def test_async_client_http2(self, api_key):
+        """Test that AsyncDevoClient(http2=True) enables HTTP/2 and counts requests."""
+
+        async def run():
+            client = AsyncDevoClient(api_key=api_key, http2=True)
+            client.http_client = httpx.AsyncClient(
+                transport=httpx.MockTransport(lambda request: httpx.Response(200, json={}))
+            )
+            async with client:
+                await client.get("test/endpoint")
+            return client.http2_stats()
+
+        stats = asyncio.run(run())
+
+        assert stats["requests"] == 1
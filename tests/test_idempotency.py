@@ -0,0 +1,264 @@
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import Mock
+
+import httpx
+import pytest
+
+from devhub_python import AsyncDevoClient, DevoClient, IdempotencyJournal
+from devhub_python.exceptions import DevoTimeoutException
+from devhub_python.idempotency import IDEMPOTENCY_KEY_HEADER
+from devhub_python.transport import Transport, TransportResponse
+
+
+def make_client(responses, **kwargs):
+    """Create a client whose transport returns (or raises) ``responses`` in order."""
+    transport = Mock(spec=Transport)
+    transport.send.side_effect = responses
+    return DevoClient(api_key="test-api-key", transport=transport, **kwargs), transport
+
+
+def ok_response(content=b'{"id": "msg_1"}'):
+    """Build a successful transport response."""
+    return TransportResponse(200, {"Content-Type": "application/json"}, content)
+
+
+def sent_keys(transport):
+    """Idempotency keys of every request sent through a mock transport."""
+    return [call.args[2].get(IDEMPOTENCY_KEY_HEADER) for call in transport.send.call_args_list]
+
+
+@pytest.fixture
+def flaky_server():
+    """Run a local server that answers 503 to the first request and 200 afterwards."""
+    seen_keys = []
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            self.rfile.read(int(self.headers.get("Content-Length") or 0))
+            seen_keys.append(self.headers.get(IDEMPOTENCY_KEY_HEADER))
+            status = 503 if len(seen_keys) == 1 else 200
+            self.send_response(status)
+            self.send_header("Content-Length", "2")
+            self.end_headers()
+            self.wfile.write(b"{}")
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}", seen_keys
+    server.shutdown()
+    server.server_close()
+
+
+class TestIdempotencyKeys:
+    """Test cases for the Idempotency-Key header."""
+
+    def test_post_gets_a_key(self):
+        """Test that each POST gets a new key, exposed on the response."""
+        client, transport = make_client([ok_response(), ok_response()])
+
+        first = client.post("sms", json={"message": "hi"})
+        second = client.post("sms", json={"message": "hi"})
+
+        keys = sent_keys(transport)
+        assert first.idempotency_key == keys[0]
+        assert second.idempotency_key == keys[1]
+        assert keys[0] != keys[1]
+
+    def test_get_has_no_key(self):
+        """Test that safe methods are sent without a key."""
+        client, transport = make_client([ok_response()])
+
+        response = client.get("sms")
+
+        assert sent_keys(transport) == [None]
+        assert not hasattr(response, "idempotency_key")
+
+    def test_caller_key(self):
+        """Test that a key from the argument or a header is used as is."""
+        client, transport = make_client([ok_response(), ok_response()])
+
+        client.post("sms", json={}, idempotency_key="order-1")
+        client.post("sms", json={}, headers={"idempotency-key": "order-2"})
+
+        assert sent_keys(transport) == ["order-1", "order-2"]
+        assert "idempotency-key" not in transport.send.call_args.args[2]
+
+    @pytest.mark.parametrize("transport", ["requests", "urllib3"])
+    def test_key_is_stable_across_retries(self, flaky_server, transport):
+        """Test that a retried POST resends the same key."""
+        base_url, seen_keys = flaky_server
+        client = DevoClient(api_key="test-api-key", transport=transport, max_retries=2, trust_env=False)
+        client.base_url = base_url
+
+        response = client.post("sms", json={"message": "hi"})
+
+        assert len(seen_keys) == 2
+        assert seen_keys[0] == seen_keys[1] == response.idempotency_key
+
+    def test_async_key_is_stable_across_retries(self):
+        """Test that the async client's retry loop resends the same key."""
+        seen_keys = []
+
+        def handler(request):
+            seen_keys.append(request.headers[IDEMPOTENCY_KEY_HEADER])
+            return httpx.Response(503 if len(seen_keys) == 1 else 200, json={})
+
+        async def send():
+            http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with AsyncDevoClient(api_key="test-api-key", http_client=http_client) as client:
+                return await client.post("sms", json={"message": "hi"})
+
+        response = asyncio.run(send())
+
+        assert seen_keys[0] == seen_keys[1] == response.idempotency_key
+
+
+class TestIdempotencyJournal:
+    """Test cases for duplicate suppression through the journal."""
+
+    def test_successful_send_is_replayed(self):
+        """Test that repeating a successful send replays it without sending."""
+        journal = IdempotencyJournal()
+        client, transport = make_client([ok_response()], idempotency_journal=journal)
+
+        first = client.post("sms", json={"message": "hi"})
+        second = client.post("sms", json={"message": "hi"})
+
+        assert transport.send.call_count == 1
+        assert second.replayed is True
+        assert second.json() == first.json() == {"id": "msg_1"}
+        assert second.idempotency_key == first.idempotency_key
+        assert journal.suppressed == 1
+
+    def test_failed_send_is_retried_with_the_same_key(self):
+        """Test that a send that timed out is retried under its first key."""
+        journal = IdempotencyJournal()
+        client, transport = make_client(
+            [DevoTimeoutException(), ok_response()], idempotency_journal=journal, max_retries=0
+        )
+
+        with pytest.raises(DevoTimeoutException):
+            client.post("sms", json={"message": "hi"})
+        client.post("sms", json={"message": "hi"})
+
+        keys = sent_keys(transport)
+        assert keys[0] == keys[1]
+        assert journal.suppressed == 0
+
+    def test_different_sends_are_not_suppressed(self):
+        """Test that sends differing in body, API key or caller key are independent."""
+        journal = IdempotencyJournal()
+        client, transport = make_client(
+            [ok_response() for _ in range(4)], idempotency_journal=journal, sandbox_api_key="sandbox-key"
+        )
+
+        client.post("sms", json={"message": "hi"})
+        client.post("sms", json={"message": "bye"})
+        client.post("sms", json={"message": "hi"}, sandbox=True)
+        client.post("sms", json={"message": "hi"}, idempotency_key="order-1")
+
+        assert transport.send.call_count == 4
+        assert len(set(sent_keys(transport))) == 4
+
+    def test_entries_expire(self, mocker):
+        """Test that a send older than the TTL counts as new."""
+        clock = mocker.patch("devhub_python.idempotency.time.time", return_value=1000.0)
+        journal = IdempotencyJournal(ttl=60)
+        first = journal.begin("lookup")
+
+        clock.return_value = 1061.0
+        second = journal.begin("lookup")
+
+        assert second is not first
+        assert second.key != first.key
+
+    def test_least_recently_used_entries_are_dropped(self):
+        """Test that the journal stays within max_entries."""
+        journal = IdempotencyJournal(max_entries=2)
+        first = journal.begin("a")
+        journal.begin("b")
+        journal.begin("a")
+        journal.begin("c")
+
+        assert len(journal) == 2
+        assert journal.begin("a") is first
+
+    def test_journal_file_survives_restart(self, tmp_path):
+        """Test that entries are reloaded from the journal file."""
+        path = str(tmp_path / "sends.journal")
+        client, _ = make_client([ok_response()], idempotency_journal=IdempotencyJournal(path=path))
+        first = client.post("sms", json={"message": "hi"})
+        pending = client.idempotency_journal.begin("pending-send")
+        with open(path, "a") as journal_file:
+            journal_file.write('{"lookup": "torn"')
+
+        journal = IdempotencyJournal(path=path)
+        restarted, transport = make_client([], idempotency_journal=journal)
+        replayed = restarted.post("sms", json={"message": "hi"})
+
+        transport.send.assert_not_called()
+        assert replayed.json() == {"id": "msg_1"}
+        assert replayed.idempotency_key == first.idempotency_key
+        assert journal.begin("pending-send").key == pending.key
+        assert len(journal) == 2
+
+    def test_journal_file_is_compacted_on_load(self, tmp_path):
+        """Test that loading rewrites the journal file with one record per entry, dropping torn records."""
+        path = tmp_path / "sends.journal"
+        client, _ = make_client([ok_response()], idempotency_journal=IdempotencyJournal(path=str(path)))
+        client.post("sms", json={"message": "hi"})
+        client.idempotency_journal.begin("pending-send")
+        with open(path, "a") as journal_file:
+            journal_file.write('{"lookup": "torn"')
+
+        journal = IdempotencyJournal(path=str(path))
+
+        assert len(path.read_text().splitlines()) == len(journal) == 2
+        assert IdempotencyJournal(path=str(path)).begin("pending-send").key == journal.begin("pending-send").key
+
+    def test_journal_file_is_compacted_while_running(self, tmp_path, mocker):
+        """Test that a long-running journal keeps its file to the unexpired entries."""
+        clock = mocker.patch("devhub_python.idempotency.time.time", return_value=1000.0)
+        mocker.patch.object(IdempotencyJournal, "COMPACT_MIN_RECORDS", 10)
+        path = tmp_path / "sends.journal"
+        journal = IdempotencyJournal(ttl=60, path=str(path))
+
+        for i in range(50):
+            clock.return_value += 61
+            journal.complete(f"send-{i}", journal.begin(f"send-{i}"), ok_response())
+
+        assert len(path.read_text().splitlines()) <= 10
+        assert len(journal) <= 5
+        assert IdempotencyJournal(ttl=60, path=str(path)).begin("send-49").completed
+
+    def test_async_successful_send_is_replayed(self):
+        """Test that the async client replays a successful send from the journal."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(200, json={"id": "msg_1"})
+
+        async def send_twice():
+            http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with AsyncDevoClient(
+                api_key="test-api-key", http_client=http_client, idempotency_journal=IdempotencyJournal()
+            ) as client:
+                first = await client.post("sms", json={"message": "hi"}, params={"a": 1})
+                second = await client.post("sms", json={"message": "hi"}, params={"a": 1})
+                third = await client.post("sms", json={"message": "hi"}, params={"a": 2})
+                return first, second, third
+
+        first, second, third = asyncio.run(send_twice())
+
+        assert len(calls) == 2
+        assert second.replayed is True
+        assert second.idempotency_key == first.idempotency_key
+        assert third.idempotency_key != first.idempotency_key
@@ -1,10 +1,11 @@
+import asyncio
 from datetime import datetime
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 
-from devhub_python.models.messages import SendMessageDto, SendMessageSerializer
-from devhub_python.resources.messages import MessagesResource
+from devhub_python.models.messages import Message, SendMessageDto, SendMessageSerializer
+from devhub_python.resources.messages import AsyncMessagesResource, MessagesResource
 
 
 class TestMessagesResource:
@@ -322,3 +323,114 @@ class TestSendMessageSerializer:
         assert serializer.from_ == "sender@example.com"
         assert serializer.pricing == {"cost": 0.01, "currency": "USD"}
         assert serializer.metadata == {"campaign": "test"}
+
+
+class TestAsyncMessagesResource:
+    """Test cases for the async MessagesResource class."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.mock_client = AsyncMock()
+        self.messages_resource = AsyncMessagesResource(self.mock_client)
+
+    def test_send(self):
+        """Test sending a message through the async omni-channel endpoint."""
+        mock_response = Mock()
+        mock_response.json.return_value = {
+            "id": "msg_1",
+            "channel": "sms",
+            "to": "+1234567890",
+            "status": "sent",
+            "direction": "outbound",
+            "content": {"text": "Hello"},
+            "created_at": "2024-01-01T12:00:00Z",
+        }
+        self.mock_client.post.return_value = mock_response
+
+        result = asyncio.run(
+            self.messages_resource.send(SendMessageDto(channel="sms", to="+1234567890", payload={"text": "Hello"}))
+        )
+
+        assert isinstance(result, SendMessageSerializer)
+        self.mock_client.post.assert_awaited_once_with(
+            "messages/send", data={"channel": "sms", "to": "+1234567890", "payload": {"text": "Hello"}}
+        )
+
+    def test_get_and_resend(self):
+        """Test retrieving and resending a message."""
+        mock_response = Mock()
+        mock_response.json.return_value = {
+            "id": "msg_1",
+            "channel": "sms",
+            "type": "text",
+            "to": "+1234567890",
+            "content": {"text": "Hello"},
+            "status": "delivered",
+            "direction": "outbound",
+        }
+        self.mock_client.get.return_value = mock_response
+        self.mock_client.post.return_value = mock_response
+
+        fetched = asyncio.run(self.messages_resource.get("msg_1"))
+        resent = asyncio.run(self.messages_resource.resend("msg_1"))
+
+        assert isinstance(fetched, Message)
+        assert resent.id == "msg_1"
+        self.mock_client.get.assert_awaited_once_with("messages/msg_1")
+        self.mock_client.post.assert_awaited_once_with("messages/msg_1/resend")
+
+    def test_list_with_filters(self):
+        """Test listing messages with filters."""
+        mock_response = Mock()
+        mock_response.json.return_value = {
+            "messages": [
+                {
+                    "id": "msg_1",
+                    "channel": "sms",
+                    "type": "text",
+                    "to": "+1234567890",
+                    "content": {"text": "Hello"},
+                    "status": "delivered",
+                    "direction": "outbound",
+                }
+            ]
+        }
+        self.mock_client.get.return_value = mock_response
+
+        result = asyncio.run(
+            self.messages_resource.list(
+                channel="sms",
+                to="+1234567890",
+                from_="+0987654321",
+                status="delivered",
+                date_sent_after="2024-01-01",
+                date_sent_before="2024-02-01",
+                limit=10,
+            )
+        )
+
+        assert [message.id for message in result] == ["msg_1"]
+        self.mock_client.get.assert_awaited_once_with(
+            "messages",
+            params={
+                "limit": 10,
+                "offset": 0,
+                "channel": "sms",
+                "to": "+1234567890",
+                "from": "+0987654321",
+                "status": "delivered",
+                "date_sent_after": "2024-01-01",
+                "date_sent_before": "2024-02-01",
+            },
+        )
+
+    def test_get_delivery_status(self):
+        """Test fetching delivery status."""
+        mock_response = Mock()
+        mock_response.json.return_value = {"status": "delivered"}
+        self.mock_client.get.return_value = mock_response
+
+        result = asyncio.run(self.messages_resource.get_delivery_status("msg_1"))
+
+        assert result == {"status": "delivered"}
+        self.mock_client.get.assert_awaited_once_with("messages/msg_1/delivery-status")
@@ -0,0 +1,106 @@
+import asyncio
+import threading
+from unittest.mock import Mock
+
+import httpx
+import pytest
+
+from devhub_python import AsyncDevoClient, DevoClient
+from devhub_python.exceptions import DevoAPIException, DevoException
+from devhub_python.metrics import ClientMetrics
+from devhub_python.transport import Transport, TransportResponse
+
+
+class TestClientMetrics:
+    """Test cases for ClientMetrics."""
+
+    def test_counts_requests_and_statuses(self):
+        """Test that finished requests are counted by status code."""
+        metrics = ClientMetrics()
+
+        for status_code in (200, 200, 429, None):
+            metrics.request_started()
+            metrics.request_finished(status_code, 0.5)
+
+        assert metrics.as_dict() == {
+            "requests": 4,
+            "errors": 1,
+            "in_flight": 0,
+            "status_codes": {200: 2, 429: 1},
+            "average_latency": 0.5,
+        }
+
+    def test_in_flight_requests(self):
+        """Test that requests still in flight are excluded from the average latency."""
+        metrics = ClientMetrics()
+        metrics.request_started()
+
+        snapshot = metrics.as_dict()
+
+        assert snapshot["in_flight"] == 1
+        assert snapshot["average_latency"] == 0.0
+
+    def test_concurrent_updates(self):
+        """Test that counters stay exact under concurrent updates."""
+        metrics = ClientMetrics()
+
+        def record():
+            for _ in range(1000):
+                metrics.request_started()
+                metrics.request_finished(200, 0.001)
+
+        threads = [threading.Thread(target=record) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert metrics.as_dict()["status_codes"] == {200: 8000}
+        assert metrics.as_dict()["in_flight"] == 0
+
+
+class TestClientRecordsMetrics:
+    """Test cases for request metrics recorded by the clients."""
+
+    def test_sync_client_records_metrics(self, api_key):
+        """Test that DevoClient records successes, API errors and network errors."""
+        transport = Mock(spec=Transport)
+        transport.send.side_effect = [
+            TransportResponse(200, {}, b"{}"),
+            TransportResponse(400, {}, b'{"message": "Bad"}'),
+            DevoException("Connection error"),
+        ]
+        client = DevoClient(api_key=api_key, transport=transport)
+
+        client.get("ok")
+        with pytest.raises(DevoAPIException):
+            client.get("bad")
+        with pytest.raises(DevoException):
+            client.get("down")
+
+        metrics = client.metrics.as_dict()
+        assert metrics["requests"] == 3
+        assert metrics["errors"] == 1
+        assert metrics["status_codes"] == {200: 1, 400: 1}
+
+    def test_async_client_records_metrics(self, api_key):
+        """Test that AsyncDevoClient records one entry per logical request, not per retry."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(503 if len(calls) == 1 else 200, json={})
+
+        async def run():
+            client = AsyncDevoClient(
+                api_key=api_key, http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            )
+            async with client:
+                await client.get("test")
+            return client.metrics.as_dict()
+
+        metrics = asyncio.run(run())
+
+        assert len(calls) == 2
+        assert metrics["requests"] == 1
+        assert metrics["status_codes"] == {200: 1}
@@ -0,0 +1,281 @@
+import asyncio
+import contextvars
+import random
+import threading
+import time
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from devhub_python import DevoClient
+from devhub_python.exceptions import DevoConfigurationException, DevoValidationException
+from devhub_python.models.contacts import ContactSerializer
+from devhub_python.pagination import paginate, paginate_async
+from devhub_python.resources.contacts import AsyncContactsResource
+
+
+def make_pages(count, page_size, **extra):
+    """Build a fetch function over ``count`` numbered items, recording the pages it was asked for."""
+
+    def fetch(page):
+        fetch.pages.append(page)
+        start = (page - 1) * page_size
+        return {"items": list(range(start, min(start + page_size, count))), **extra}
+
+    fetch.pages = []
+    return fetch
+
+
+def json_response(data):
+    """Create a mock response whose body is ``data``."""
+    response = Mock()
+    response.json.return_value = data
+    return response
+
+
+def contacts_page(page, limit, total):
+    """Build a page of the contacts list response."""
+    start = (page - 1) * limit
+    contacts = [
+        {"id": f"contact_{i}", "created_at": "2024-01-01T00:00:00Z"} for i in range(start, min(total, start + limit))
+    ]
+    return {"contacts": contacts, "total": total, "page": page, "limit": limit, "total_pages": -(-total // limit)}
+
+
+class TestPaginate:
+    """Test cases for walking pages."""
+
+    def test_short_page(self):
+        """Test that iteration stops on a short page without asking for another."""
+        fetch = make_pages(25, 10)
+
+        assert list(paginate(fetch, 10)) == list(range(25))
+        assert fetch.pages == [1, 2, 3]
+
+    def test_totals(self):
+        """Test that ``total_pages``, ``total`` and ``has_next`` end iteration on a full last page."""
+        by_pages = make_pages(20, 10, total_pages=2)
+        by_total = make_pages(20, 10, total=20)
+        by_has_next = make_pages(20, 10, has_next=False)
+        without_totals = make_pages(20, 10)
+
+        assert len(list(paginate(by_pages, 10))) == 20
+        assert len(list(paginate(by_total, 10))) == 20
+        assert len(list(paginate(by_has_next, 10))) == 10
+        assert len(list(paginate(without_totals, 10))) == 20
+        assert (by_pages.pages, by_total.pages, by_has_next.pages) == ([1, 2], [1, 2], [1])
+        assert without_totals.pages == [1, 2, 3]
+
+    def test_max_items_and_start_page(self):
+        """Test that ``max_items`` stops mid-page and ``start_page`` resumes a scan."""
+        fetch = make_pages(100, 10)
+
+        assert list(paginate(fetch, 10, max_items=15)) == list(range(15))
+        assert list(paginate(fetch, 10, start_page=9)) == list(range(80, 100))
+        assert list(paginate(fetch, 10, max_items=0)) == []
+        assert fetch.pages == [1, 2, 9, 10, 11]
+
+    def test_one_page_at_a_time(self):
+        """Test that a page is only fetched once the previous one has been used up."""
+        fetch = make_pages(30, 10)
+        items = paginate(fetch, 10)
+
+        assert [next(items) for _ in range(10)] == list(range(10))
+        assert fetch.pages == [1]
+        next(items)
+        assert fetch.pages == [1, 2]
+
+    @pytest.mark.parametrize("kwargs", [{"page_size": 0}, {"start_page": 0}, {"max_items": -1}])
+    def test_invalid_arguments(self, kwargs):
+        """Test that impossible page sizes, pages and limits are rejected."""
+        arguments = {"page_size": 10, **kwargs}
+
+        with pytest.raises(DevoValidationException):
+            list(paginate(make_pages(10, 10), **arguments))
+
+
+class TestPrefetch:
+    """Test cases for fetching pages in parallel."""
+
+    def test_order_and_parallelism(self):
+        """Test that pages finishing out of order are yielded in order, with at most ``workers`` in flight."""
+        fetch = make_pages(200, 10, total_pages=20)
+        lock = threading.Lock()
+        running = [0, 0]
+
+        def slow_fetch(page):
+            with lock:
+                running[0] += 1
+                running[1] = max(running)
+            time.sleep(random.uniform(0, 0.01))
+            with lock:
+                running[0] -= 1
+            return fetch(page)
+
+        assert list(paginate(slow_fetch, 10, workers=4)) == list(range(200))
+        assert sorted(fetch.pages) == list(range(1, 21))
+        assert 1 < running[1] <= 4
+
+    def test_read_ahead(self):
+        """Test that no more than ``read_ahead`` pages are fetched ahead of the one being read."""
+        fetch = make_pages(1000, 10, total=1000)
+        items = paginate(fetch, 10, workers=2, read_ahead=3)
+
+        assert [next(items) for _ in range(11)] == list(range(11))
+        time.sleep(0.05)
+        assert sorted(fetch.pages) == [1, 2, 3, 4]
+        items.close()
+
+    def test_limits(self):
+        """Test that ``max_items`` bounds the pages fetched and that pages without totals are walked one by one."""
+        capped = make_pages(1000, 10, total_pages=100)
+        without_totals = make_pages(25, 10)
+
+        assert list(paginate(capped, 10, start_page=3, max_items=25, workers=8)) == list(range(20, 45))
+        assert sorted(capped.pages) == [3, 4, 5]
+        assert list(paginate(without_totals, 10, workers=8)) == list(range(25))
+        assert without_totals.pages == [1, 2, 3]
+
+    def test_shrinking_collection(self):
+        """Test that a short page before the planned last one ends the scan."""
+
+        def fetch(page):
+            return {"items": [page] * (10 if page < 3 else 5), "total_pages": 6}
+
+        assert list(paginate(fetch, 10, workers=2, read_ahead=1)) == [1] * 10 + [2] * 10 + [3] * 5
+
+    def test_async(self):
+        """Test that the async paginator runs up to ``workers`` fetches at once and keeps the order."""
+        fetch = make_pages(100, 10, total_pages=10)
+        running = [0, 0]
+
+        async def fetch_async(page):
+            running[0] += 1
+            running[1] = max(running)
+            await asyncio.sleep(0.001 * (10 - page))
+            running[0] -= 1
+            return fetch(page)
+
+        async def collect():
+            return [item async for item in paginate_async(fetch_async, 10, workers=3, max_items=95)]
+
+        assert asyncio.run(collect()) == list(range(95))
+        assert sorted(fetch.pages) == list(range(1, 11))
+        assert running[1] == 3
+
+    def test_threads_see_the_callers_context(self):
+        """Test that pages are fetched in a copy of the caller's context, e.g. to honour its deadline."""
+        request_id = contextvars.ContextVar("request_id", default=None)
+        pages = make_pages(50, 10, total_pages=5)
+        seen = set()
+
+        def fetch(page):
+            seen.add(request_id.get())
+            return pages(page)
+
+        request_id.set("req_1")
+        list(paginate(fetch, 10, workers=4))
+
+        assert seen == {"req_1"}
+
+    @pytest.mark.parametrize("kwargs", [{"workers": 0}, {"read_ahead": 0}])
+    def test_invalid_arguments(self, kwargs):
+        """Test that impossible worker counts and read-ahead buffers are rejected."""
+        with pytest.raises(DevoValidationException):
+            list(paginate(make_pages(10, 10), 10, **kwargs))
+
+
+class TestIterators:
+    """Test cases for the resources' iter_* methods."""
+
+    def setup_method(self):
+        """Set up a client whose GET requests are mocked."""
+        self.client = DevoClient(api_key="test_api_key")
+        self.client.get = Mock()
+
+    def test_contacts(self):
+        """Test that iter_contacts walks the pages with the filters and stops at ``total_pages``."""
+        self.client.get.side_effect = [json_response(contacts_page(page, 2, 4)) for page in (1, 2)]
+
+        contacts = list(self.client.contacts.iter_contacts(limit=2, tags=["vip"]))
+
+        assert [contact.id for contact in contacts] == ["contact_0", "contact_1", "contact_2", "contact_3"]
+        assert all(isinstance(contact, ContactSerializer) for contact in contacts)
+        assert [call.kwargs["params"]["page"] for call in self.client.get.call_args_list] == [1, 2]
+        assert self.client.get.call_args.kwargs["params"]["tags"] == ["vip"]
+
+    @pytest.mark.parametrize("kwargs", [{"thread_safe": True}, {"transport": "urllib3"}])
+    def test_contacts_prefetch(self, kwargs):
+        """Test that iter_contacts fetches the remaining pages in parallel, yielding contacts in order."""
+        client = DevoClient(api_key="test_api_key", **kwargs)
+        client.get = Mock(side_effect=lambda path, params: json_response(contacts_page(params["page"], 10, 95)))
+
+        contacts = list(client.contacts.iter_contacts(limit=10, workers=4))
+
+        assert [contact.id for contact in contacts] == [f"contact_{i}" for i in range(95)]
+        assert client.get.call_count == 10
+
+    def test_prefetch_needs_thread_safe_client(self):
+        """Test that parallel fetches are refused when the client shares one requests session across threads."""
+        with pytest.raises(DevoConfigurationException, match="thread_safe=True"):
+            self.client.contacts.iter_contacts(workers=4)
+        with pytest.raises(DevoConfigurationException):
+            self.client.whatsapp.iter_templates("acc_1", workers=2)
+        self.client.get.assert_not_called()
+
+    def test_messages(self):
+        """Test that iter_messages pages by offset."""
+        messages = [{"id": f"msg_{i}"} for i in range(5)]
+        self.client.get.side_effect = [
+            json_response({"messages": messages[offset : offset + 2]}) for offset in range(4, 10, 2)
+        ]
+
+        ids = [message.id for message in self.client.messages.iter_messages(limit=2, start_page=3, records=True)]
+
+        assert ids == ["msg_4"]
+        assert self.client.get.call_args.kwargs["params"]["offset"] == 4
+
+    def test_raw_pages(self):
+        """Test that endpoints returning plain JSON are walked whether they return arrays or objects."""
+        self.client.get.side_effect = [
+            json_response({"brands": [{"id": "b1"}, {"id": "b2"}], "total": 3}),
+            json_response([{"id": "b3"}]),
+        ]
+
+        brands = list(self.client.rcs.iter_brands(limit=2))
+
+        assert [brand["id"] for brand in brands] == ["b1", "b2", "b3"]
+
+    def test_templates(self):
+        """Test that iter_templates stops when ``has_next`` is false, and passes ``records`` on."""
+        page = {"templates": [{"name": "welcome", "language": "en"}], "total": 5, "page": 1, "limit": 1}
+        self.client.get.return_value = json_response({**page, "has_next": False})
+
+        templates = list(self.client.whatsapp.iter_templates("acc_1", limit=1, records=True))
+
+        assert [template.name for template in templates] == ["welcome"]
+        assert self.client.get.call_count == 1
+
+    def test_async(self):
+        """Test that the async resources return async iterators."""
+        client = AsyncMock()
+        client.get.side_effect = [json_response(contacts_page(page, 2, 3)) for page in (1, 2)]
+        resource = AsyncContactsResource(client)
+
+        async def collect():
+            return [contact.id async for contact in resource.iter_contacts(limit=2, max_items=3)]
+
+        assert asyncio.run(collect()) == ["contact_0", "contact_1", "contact_2"]
+
+    def test_async_paginate(self):
+        """Test that paginate_async follows the same rules as paginate."""
+        fetch = make_pages(25, 10)
+
+        async def fetch_async(page):
+            return fetch(page)
+
+        async def collect():
+            return [item async for item in paginate_async(fetch_async, 10, max_items=12)]
+
+        assert asyncio.run(collect()) == list(range(12))
+        assert fetch.pages == [1, 2]
@@ -0,0 +1,167 @@
+import socket
+import threading
+import time
+
+import pytest
+import requests
+
+from devhub_python import DevoClient
+from devhub_python.exceptions import DevoConfigurationException, DevoConnectionException
+from devhub_python.pool import PooledHTTPAdapter, TrackedPoolManager
+
+
+def make_client(base_url, **kwargs):
+    """Create a client pointed at a local test server."""
+    client = DevoClient(api_key="test-api-key", **kwargs)
+    client.base_url = base_url
+    return client
+
+
+def send_concurrently(client, n, path="test?delay=0.2"):
+    """Send ``n`` requests at once so they all need a connection at the same time."""
+    threads = [threading.Thread(target=client.get, args=(path,)) for _ in range(n)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def unused_port():
+    """Find a local port nothing is listening on."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class TestConnectionPool:
+    """Test cases for the tracked connection pool."""
+
+    @pytest.mark.parametrize("transport", ["requests", "urllib3"])
+    def test_warm_up_opens_connections(self, echo_server, transport):
+        """Test that warm_up pre-opens connections that requests then reuse."""
+        client = make_client(echo_server, transport=transport, pool_maxsize=4)
+
+        assert client.warm_up(3) == 3
+        assert client.pool_stats() == {"in_use": 0, "idle": 3, "created": 3, "discarded": 0}
+
+        for _ in range(5):
+            client.get("test")
+
+        stats = client.pool_stats()
+        assert stats["created"] == 3
+        assert stats["in_use"] == 0
+
+    def test_warm_up_is_capped_at_pool_size(self, echo_server):
+        """Test that warm_up never opens more connections than the pool keeps."""
+        client = make_client(echo_server, pool_maxsize=2)
+
+        assert client.warm_up(10) == 2
+        assert client.warm_up(10) == 0
+        assert client.pool_stats()["idle"] == 2
+
+    def test_warm_up_connection_failure(self):
+        """Test that warm-up failures surface as connection errors."""
+        client = make_client(f"http://127.0.0.1:{unused_port()}")
+
+        with pytest.raises(DevoConnectionException):
+            client.warm_up(1)
+        assert client.pool_stats()["in_use"] == 0
+
+    def test_overflow_connections_are_discarded(self, echo_server):
+        """Test that a non-blocking pool opens and then discards extra connections."""
+        client = make_client(echo_server, pool_maxsize=2)
+
+        send_concurrently(client, 4)
+
+        stats = client.pool_stats()
+        assert stats["created"] == 4
+        assert stats["discarded"] == 2
+        assert stats["idle"] == 2
+        assert stats["in_use"] == 0
+
+    def test_blocking_pool_waits_for_connections(self, echo_server):
+        """Test that a blocking pool never opens more than pool_maxsize connections."""
+        client = make_client(echo_server, pool_maxsize=2, pool_block=True)
+
+        send_concurrently(client, 4)
+
+        stats = client.pool_stats()
+        assert stats["created"] == 2
+        assert stats["discarded"] == 0
+
+    def test_in_use_counts_checked_out_connections(self, echo_server):
+        """Test that in_use reflects requests in flight."""
+        client = make_client(echo_server, pool_maxsize=3)
+        thread = threading.Thread(target=send_concurrently, args=(client, 3, "test?delay=0.3"))
+        thread.start()
+        time.sleep(0.15)
+
+        assert client.pool_stats()["in_use"] == 3
+        thread.join()
+        assert client.pool_stats()["in_use"] == 0
+
+    @pytest.mark.parametrize("transport", ["requests", "urllib3"])
+    def test_idle_connections_are_reaped(self, echo_server, transport):
+        """Test that connections idle longer than pool_idle_timeout are closed."""
+        client = make_client(echo_server, transport=transport, pool_idle_timeout=0.05)
+        client.warm_up(2)
+        time.sleep(0.1)
+
+        client.get("test")
+
+        stats = client.pool_stats()
+        assert stats["discarded"] == 2
+        assert stats["created"] == 3
+        assert stats["idle"] == 1
+
+    def test_reap_idle(self, echo_server):
+        """Test reaping idle connections explicitly across host pools."""
+        manager = TrackedPoolManager(idle_timeout=0.05, maxsize=2)
+        manager.warm_up(echo_server, 2)
+        time.sleep(0.1)
+
+        assert manager.reap_idle() == 2
+        assert manager.pool_stats()["idle"] == 0
+
+    def test_closing_the_pool_discards_connections(self, echo_server):
+        """Test that closing the client closes its pooled connections."""
+        client = make_client(echo_server)
+        client.warm_up(2)
+
+        client.close()
+
+        assert client.pool_stats()["discarded"] == 2
+
+
+class TestPoolConfiguration:
+    """Test cases for configuring the connection pool."""
+
+    def test_pool_settings_are_applied(self, api_key):
+        """Test that pool size and blocking reach the adapter."""
+        client = DevoClient(api_key=api_key, pool_maxsize=50, pool_block=True, pool_idle_timeout=30)
+        adapter = client.session.get_adapter(client.base_url)
+
+        assert isinstance(adapter, PooledHTTPAdapter)
+        assert adapter.poolmanager.connection_pool_kw["maxsize"] == 50
+        assert adapter.poolmanager.connection_pool_kw["block"] is True
+        assert adapter.poolmanager.idle_timeout == 30
+        assert adapter.max_retries.total == 0
+
+    def test_custom_session_has_no_pool_stats(self, api_key):
+        """Test that pool management requires the client's own pool."""
+        client = DevoClient(api_key=api_key, session=requests.Session())
+
+        with pytest.raises(DevoConfigurationException):
+            client.pool_stats()
+        with pytest.raises(DevoConfigurationException):
+            client.warm_up()
+
+    def test_adapter_can_be_pickled(self):
+        """Test that the adapter keeps requests' pickling support."""
+        import pickle
+
+        adapter = pickle.loads(pickle.dumps(PooledHTTPAdapter(idle_timeout=5, pool_maxsize=7)))
+
+        assert adapter.idle_timeout == 5
+        assert adapter.poolmanager.idle_timeout == 5
+        assert adapter.poolmanager.connection_pool_kw["maxsize"] == 7
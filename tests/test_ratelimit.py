@@ -0,0 +1,254 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import AsyncMock, Mock
+
+import httpx
+import pytest
+
+from devhub_python import AsyncDevoClient, DevoClient, RateLimiter
+from devhub_python.exceptions import DevoRateLimitException, DevoTimeoutException
+from devhub_python.ratelimit import parse_rate_limit_headers
+from devhub_python.transport import Transport, TransportResponse
+
+
+@pytest.fixture
+def clock(mocker):
+    """Freeze the limiter's monotonic clock; advance it with ``clock.return_value``."""
+    return mocker.patch("devhub_python.ratelimit.time.monotonic", return_value=100.0)
+
+
+def rate_limit_headers(limit, remaining, reset=None, retry_after=None):
+    """Build rate limit response headers."""
+    headers = {"X-RateLimit-Limit": str(limit), "X-RateLimit-Remaining": str(remaining)}
+    if reset is not None:
+        headers["X-RateLimit-Reset"] = str(reset)
+    if retry_after is not None:
+        headers["Retry-After"] = str(retry_after)
+    return headers
+
+
+@pytest.fixture
+def rate_limited_server():
+    """Run a local server allowing ``limit`` requests per fixed ``window``, answering 429 beyond that."""
+    limit, window = 10, 0.5
+    state = {"start": time.monotonic(), "counts": {}, "rejected": 0}
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            self.rfile.read(int(self.headers.get("Content-Length") or 0))
+            with lock:
+                elapsed = time.monotonic() - state["start"]
+                index = int(elapsed // window)
+                count = state["counts"][index] = state["counts"].get(index, 0) + 1
+                reset = (index + 1) * window - elapsed
+                if count > limit:
+                    state["rejected"] += 1
+            self.send_response(429 if count > limit else 200)
+            self.send_header("X-RateLimit-Limit", str(limit))
+            self.send_header("X-RateLimit-Remaining", str(max(limit - count, 0)))
+            self.send_header("X-RateLimit-Reset", f"{reset:.3f}")
+            self.send_header("Content-Length", "2")
+            self.end_headers()
+            self.wfile.write(b"{}")
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}", limit, window, state
+    server.shutdown()
+    server.server_close()
+
+
+class TestParseRateLimitHeaders:
+    """Test cases for reading rate limit headers."""
+
+    def test_parses_all_headers(self):
+        """Test that every header is parsed as a number."""
+        headers = rate_limit_headers(100, 42, reset=30, retry_after=5)
+
+        assert parse_rate_limit_headers(headers) == {"limit": 100, "remaining": 42, "reset": 30, "retry_after": 5}
+
+    def test_epoch_reset_and_malformed_values(self):
+        """Test that a Unix timestamp reset becomes seconds from now and junk is ignored."""
+        headers = {"X-RateLimit-Limit": "lots", "X-RateLimit-Reset": str(time.time() + 10)}
+
+        info = parse_rate_limit_headers(headers)
+
+        assert info["limit"] is None
+        assert info["remaining"] is None
+        assert 9 < info["reset"] <= 10
+
+
+class TestRateLimiter:
+    """Test cases for the token bucket."""
+
+    def test_unlimited_until_a_limit_is_learned(self, clock):
+        """Test that requests aren't paced before the API reports a limit."""
+        limiter = RateLimiter()
+
+        assert [limiter._reserve() for _ in range(100)] == [0.0] * 100
+
+    def test_explicit_rate(self, clock):
+        """Test pacing at a configured rate before any headers arrive."""
+        limiter = RateLimiter(rate=2, burst=1)
+
+        assert limiter._reserve() == 0.0
+        assert limiter._reserve() == pytest.approx(0.5)
+        assert limiter._reserve() == pytest.approx(1.0)
+        assert limiter.as_dict()["throttled"] == 2
+
+    def test_learns_rate_from_headers(self, clock):
+        """Test that the limit sets the refill rate and remaining trims the bucket."""
+        limiter = RateLimiter(window=10)
+        limiter._reserve()
+        limiter._reserve()
+
+        limiter.update(rate_limit_headers(limit=20, remaining=5))
+
+        assert limiter.rate == 2.0
+        # One request is still in flight, so only 4 of the 5 remaining are free
+        assert limiter.tokens == 4
+        assert [limiter._reserve() for _ in range(5)] == [0.0, 0.0, 0.0, 0.0, pytest.approx(0.5)]
+
+    def test_defers_to_the_next_window(self, clock):
+        """Test that requests beyond the window's remaining budget wait for its reset."""
+        limiter = RateLimiter(window=1, burst=100)
+        limiter._reserve()
+        limiter.update(rate_limit_headers(limit=100, remaining=2, reset=0.25))
+
+        waits = [limiter._reserve() for _ in range(3)]
+
+        assert waits[:2] == [0.0, 0.0]
+        assert waits[2] == pytest.approx(0.25)
+
+    def test_windows_roll_over(self, clock):
+        """Test that a new window's budget opens once the reset time passes."""
+        limiter = RateLimiter(window=1, burst=100)
+        limiter._reserve()
+        limiter.update(rate_limit_headers(limit=3, remaining=0, reset=0.5))
+        deferred = [limiter._reserve() for _ in range(4)]
+
+        clock.return_value = 105.0
+        later = [limiter._reserve() for _ in range(3)]
+
+        # Paced at 3/s, but never before the reset, and the fourth falls into the window after
+        assert deferred == [pytest.approx(0.5), pytest.approx(2 / 3), pytest.approx(1.0), pytest.approx(1.5)]
+        assert later == [0.0, 0.0, 0.0]
+
+    def test_retry_after_holds_requests(self, clock):
+        """Test that a 429 holds every request until Retry-After passes."""
+        limiter = RateLimiter()
+        limiter._reserve()
+
+        limiter.update({"Retry-After": "3"}, status_code=429)
+
+        assert limiter._reserve() == pytest.approx(3.0)
+
+    def test_failed_requests_leave_flight(self, clock):
+        """Test that a request without a response is no longer counted in flight."""
+        limiter = RateLimiter()
+        limiter._reserve()
+
+        limiter.update(None)
+
+        assert limiter.in_flight == 0
+
+    def test_acquire_sleeps(self, clock, mocker):
+        """Test that acquire sleeps for the reserved wait in both flavours."""
+        sleep = mocker.patch("devhub_python.ratelimit.time.sleep")
+        async_sleep = mocker.patch("devhub_python.ratelimit.asyncio.sleep", new_callable=AsyncMock)
+        limiter = RateLimiter(rate=1000, burst=1)
+
+        limiter.acquire()
+        limiter.acquire()
+        # Drive the coroutine by hand: an event loop would stall on the frozen clock
+        with pytest.raises(StopIteration) as finished:
+            limiter.acquire_async().send(None)
+
+        sleep.assert_called_once_with(pytest.approx(0.001))
+        async_sleep.assert_awaited_once_with(pytest.approx(0.002))
+        assert finished.value.value == pytest.approx(0.002)
+
+
+class TestClientRateLimiting:
+    """Test cases for the limiter on the clients."""
+
+    def test_limiter_sees_every_request(self):
+        """Test that the client acquires before and updates after each request."""
+        limiter = Mock(spec=RateLimiter)
+        transport = Mock(spec=Transport)
+        transport.send.side_effect = [
+            TransportResponse(200, rate_limit_headers(10, 9), b"{}"),
+            DevoTimeoutException(),
+        ]
+        client = DevoClient(api_key="test-api-key", transport=transport, max_retries=0, rate_limiter=limiter)
+
+        client.get("a")
+        with pytest.raises(DevoTimeoutException):
+            client.get("b")
+
+        assert limiter.acquire.call_count == 2
+        assert limiter.update.call_args_list[0].args[1] == 200
+        assert limiter.update.call_args_list[1].args == (None, None)
+
+    def test_rate_limiter_flag(self, api_key):
+        """Test that rate_limiter=True creates a limiter shared by all resources."""
+        client = DevoClient(api_key=api_key, rate_limiter=True)
+
+        assert isinstance(client.rate_limiter, RateLimiter)
+        assert client.sms.client.rate_limiter is client.email.client.rate_limiter
+        assert DevoClient(api_key=api_key).rate_limiter is None
+
+    def test_async_client_paces_requests(self):
+        """Test that the async client learns from responses and waits without blocking."""
+
+        def handler(request):
+            return httpx.Response(200, headers=rate_limit_headers(limit=100, remaining=0, reset=0.2), json={})
+
+        async def send():
+            http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with AsyncDevoClient(api_key="test-api-key", http_client=http_client, rate_limiter=True) as client:
+                await client.get("a")
+                started = time.monotonic()
+                await client.get("b")
+                return time.monotonic() - started, client.rate_limiter
+
+        elapsed, limiter = asyncio.run(send())
+
+        assert elapsed >= 0.15
+        assert limiter.as_dict()["throttled"] == 1
+
+    def test_bulk_send_never_trips_429(self, rate_limited_server):
+        """Test that threads sharing a client stay within a fixed-window limit."""
+        base_url, limit, window, state = rate_limited_server
+        client = DevoClient(
+            api_key="test-api-key", max_retries=0, trust_env=False, rate_limiter=RateLimiter(window=window)
+        )
+        client.base_url = base_url
+        total = 4 * limit
+
+        def send(_):
+            try:
+                client.post("sms", json={})
+            except DevoRateLimitException:
+                return 429
+            return 200
+
+        started = time.monotonic()
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            statuses = list(executor.map(send, range(total)))
+        elapsed = time.monotonic() - started
+
+        assert statuses == [200] * total
+        assert state["rejected"] == 0
+        assert max(state["counts"].values()) <= limit
+        # 40 requests at 10 per 0.5 s window need at least three window resets
+        assert elapsed >= 3 * window * 0.9
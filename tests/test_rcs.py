@@ -1,10 +1,12 @@
-from unittest.mock import Mock, patch
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
 from devhub_python.client import DevoClient
 from devhub_python.exceptions import DevoInvalidPhoneNumberException, DevoValidationException
 from devhub_python.models.rcs import RcsAccountSerializer, RCSMessage, RcsSendMessageSerializer, SuccessSerializer
+from devhub_python.resources.rcs import AsyncRCSResource
 
 
 @pytest.fixture
@@ -540,3 +542,154 @@ class TestRCSValidation:
         """Test required account_id parameter for get_testers."""
         with pytest.raises(DevoValidationException, match="account_id is required"):
             rcs_client.rcs.get_testers("")
+
+
+class TestAsyncRCSResource:
+    """Test cases for the async RCS resource."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.mock_client = AsyncMock()
+        self.rcs = AsyncRCSResource(self.mock_client)
+
+    def respond(self, method, payload):
+        """Configure ``method`` on the mock client to return ``payload``."""
+        mock_response = Mock()
+        mock_response.json.return_value = payload
+        getattr(self.mock_client, method).return_value = mock_response
+
+    def test_accounts(self):
+        """Test the account management endpoints."""
+        self.respond(
+            "post",
+            {
+                "id": "acc_1",
+                "name": "Test",
+                "brand_name": "Brand",
+                "business_description": "Desc",
+                "contact_email": "test@example.com",
+                "contact_phone": "+1234567890",
+                "is_approved": True,
+                "created_at": "2024-01-01T00:00:00Z",
+                "updated_at": "2024-01-01T00:00:00Z",
+            },
+        )
+        created = asyncio.run(self.rcs.create_account({"name": "Test"}))
+
+        self.respond(
+            "get",
+            {
+                "rcsAccounts": [
+                    {
+                        "id": "acc_1",
+                        "name": "Test",
+                        "brand_name": "Brand",
+                        "business_description": "Desc",
+                        "contact_email": "test@example.com",
+                        "contact_phone": "+1234567890",
+                        "is_approved": True,
+                        "created_at": "2024-01-01T00:00:00Z",
+                        "updated_at": "2024-01-01T00:00:00Z",
+                    }
+                ]
+            },
+        )
+        accounts = asyncio.run(self.rcs.get_accounts(page=1, limit=10, id="acc_1", is_approved="true"))
+
+        self.respond("post", {"success": True, "message": "Verified"})
+        verified = asyncio.run(self.rcs.verify_account({"account_id": "acc_1"}))
+
+        self.respond("put", {"id": "acc_1"})
+        updated = asyncio.run(self.rcs.update_account("acc_1", {"name": "New"}))
+
+        self.respond("get", {"id": "acc_1"})
+        details = asyncio.run(self.rcs.get_account_details("acc_1"))
+
+        assert isinstance(created, RcsAccountSerializer)
+        assert [account.id for account in accounts] == ["acc_1"]
+        assert isinstance(verified, SuccessSerializer)
+        assert updated == details == {"id": "acc_1"}
+
+    def test_messaging(self):
+        """Test sending and listing RCS messages."""
+        self.respond(
+            "post",
+            {
+                "id": "msg_1",
+                "account_id": "acc_1",
+                "to": "+1234567890",
+                "message_type": "text",
+                "status": "sent",
+                "direction": "outbound",
+                "created_at": "2024-01-01T00:00:00Z",
+                "updated_at": "2024-01-01T00:00:00Z",
+            },
+        )
+        sent = asyncio.run(self.rcs.send_message({"to": "+1234567890"}))
+
+        self.respond(
+            "get",
+            [
+                {
+                    "id": "msg_1",
+                    "account_id": "acc_1",
+                    "to": "+1234567890",
+                    "message_type": "text",
+                    "status": "sent",
+                    "direction": "outbound",
+                    "created_at": "2024-01-01T00:00:00Z",
+                    "updated_at": "2024-01-01T00:00:00Z",
+                }
+            ],
+        )
+        listed = asyncio.run(self.rcs.list_messages(page=1, limit=10, id="msg_1", type="text", search="x"))
+
+        assert isinstance(sent, RcsSendMessageSerializer)
+        assert [message.id for message in listed] == ["msg_1"]
+
+    def test_templates_brands_and_testers(self):
+        """Test the endpoints that return raw JSON."""
+        for method in ("get", "post", "put", "delete"):
+            self.respond(method, {"ok": True})
+
+        results = [
+            asyncio.run(self.rcs.create_template({"name": "t"})),
+            asyncio.run(self.rcs.get_templates(page=1, limit=10, id="t1")),
+            asyncio.run(self.rcs.delete_template({"ids": ["t1"]}, approve="yes")),
+            asyncio.run(self.rcs.update_template("t1", {"name": "t"})),
+            asyncio.run(self.rcs.get_brands(id="b1", page=1, limit=10, search="x")),
+            asyncio.run(self.rcs.create_brand({"name": "b"})),
+            asyncio.run(self.rcs.update_brand("b1", {"name": "b"})),
+            asyncio.run(self.rcs.add_tester({"phone": "+1234567890"})),
+            asyncio.run(self.rcs.get_testers("acc_1", id="t1", page=1, limit=10, search="x")),
+        ]
+
+        assert all(result == {"ok": True} for result in results)
+
+    def test_legacy_methods(self):
+        """Test the legacy send and get methods."""
+        message = {"id": "m1", "to": "+1234567890", "type": "text", "status": "sent", "direction": "outbound"}
+        self.respond("post", message)
+        self.respond("get", message)
+
+        text = asyncio.run(self.rcs.send_text("+1234567890", "Hi", callback_url="https://cb", metadata={"a": 1}))
+        card = asyncio.run(
+            self.rcs.send_rich_card(
+                "+1234567890",
+                "Title",
+                "Description",
+                media_url="https://img",
+                actions=[{"type": "url"}],
+                callback_url="https://cb",
+                metadata={"a": 1},
+            )
+        )
+        fetched = asyncio.run(self.rcs.get("m1"))
+
+        assert isinstance(text, RCSMessage)
+        assert card.id == fetched.id == "m1"
+
+    def test_send_text_invalid_phone(self):
+        """Test that phone validation runs before any request."""
+        with pytest.raises(DevoInvalidPhoneNumberException):
+            asyncio.run(self.rcs.send_text("invalid", "Hi"))
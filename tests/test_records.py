@@ -0,0 +1,118 @@
+import asyncio
+import json
+import pickle
+from unittest.mock import Mock
+
+import httpx
+import pytest
+
+from devhub_python import AsyncDevoClient, DevoClient, Record
+from devhub_python import records as records_module
+from devhub_python.models.contacts import ContactSerializer, GetContactsSerializer
+from devhub_python.models.messages import Message
+from devhub_python.models.sms import SMSMessage
+from devhub_python.records import ContactRecord, MessageRecord, record_type
+from devhub_python.transport import Transport, TransportResponse
+
+CONTACT = {"id": "contact_1", "phone_number": "+1234567890", "created_at": "2024-01-01T00:00:00Z"}
+MESSAGE = {
+    "id": "msg_1",
+    "channel": "sms",
+    "type": "text",
+    "to": "+1234567890",
+    "from": "+1987654321",
+    "content": {"body": "Hi"},
+    "status": "sent",
+    "direction": "outbound",
+}
+
+
+def make_client(body):
+    """Create a client whose transport always answers with ``body``."""
+    transport = Mock(spec=Transport)
+    transport.send.return_value = TransportResponse(200, {}, json.dumps(body).encode())
+    return DevoClient(api_key="test-api-key", transport=transport)
+
+
+class TestRecords:
+    """Test cases for the record types."""
+
+    def test_fields(self):
+        """Test that records hold the model's fields as decoded, with defaults for missing ones."""
+        contact = ContactRecord.from_dict(CONTACT)
+        message = MessageRecord.from_dict(MESSAGE)
+
+        assert isinstance(contact, Record)
+        assert contact.phone_number == "+1234567890"
+        assert contact.created_at == "2024-01-01T00:00:00Z"
+        assert contact.tags is None
+        assert message.from_ == "+1987654321"
+        assert contact._fields == tuple(ContactSerializer.model_fields)
+
+    def test_read_only(self):
+        """Test that records can't be changed."""
+        contact = ContactRecord.from_dict(CONTACT)
+
+        with pytest.raises(AttributeError):
+            contact.phone_number = "+1000000000"
+        with pytest.raises(AttributeError):
+            contact.nickname = "Ada"
+
+    def test_to_model(self):
+        """Test that records convert to their full models."""
+        assert MessageRecord.from_dict(MESSAGE).to_model() == Message.model_validate(MESSAGE)
+        assert ContactRecord.from_dict(CONTACT).to_model() == ContactSerializer.model_validate(CONTACT)
+
+    def test_types(self):
+        """Test that record types are created once per model and public ones pickle by name."""
+        contact = ContactRecord.from_dict(CONTACT)
+
+        assert record_type(ContactSerializer) is ContactRecord
+        assert record_type(SMSMessage).__name__ == "SMSMessageRecord"
+        assert pickle.loads(pickle.dumps(contact)) == contact
+        with pytest.raises(AttributeError):
+            records_module.NoSuchRecord
+
+
+class TestRecordResources:
+    """Test cases for the list endpoints that return records."""
+
+    def test_pages(self):
+        """Test that paged endpoints fill the page with records."""
+        body = {"contacts": [CONTACT], "total": 1, "page": 1, "limit": 50, "total_pages": 1}
+
+        page = make_client(body).contacts.list(records=True)
+
+        assert isinstance(page, GetContactsSerializer)
+        assert page.total == 1
+        assert page.contacts == [ContactRecord.from_dict(CONTACT)]
+
+    def test_groups_and_templates(self):
+        """Test that contact groups and WhatsApp templates come back as records."""
+        groups = make_client({"groups": [{"id": "g1", "name": "VIP"}], "total": 1, "page": 1, "limit": 10})
+        templates = make_client({"templates": [{"name": "welcome", "language": "en"}], "total": 1})
+
+        assert groups.services.contact_groups.list(records=True).groups[0].name == "VIP"
+        assert templates.whatsapp.get_templates("acc_1", records=True).templates[0].language == "en"
+
+    def test_lists(self):
+        """Test that list endpoints return lists of records."""
+        messages = make_client({"messages": [MESSAGE]}).messages.list(records=True)
+        rcs_messages = make_client([{"id": "rcs_1", "from": "+1987654321"}]).rcs.list_messages(records=True)
+
+        assert type(messages[0]).__name__ == "MessageRecord"
+        assert rcs_messages[0].from_ == "+1987654321"
+        assert type(rcs_messages[0]).__name__ == "RcsMessageRecord"
+
+    def test_async_client(self):
+        """Test that the async resources return records too."""
+
+        def handler(request):
+            return httpx.Response(200, json={"messages": [MESSAGE]})
+
+        async def send():
+            http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with AsyncDevoClient(api_key="test-api-key", http_client=http_client) as client:
+                return await client.messages.list(records=True)
+
+        assert asyncio.run(send())[0].to == "+1234567890"
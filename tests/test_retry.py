@@ -0,0 +1,170 @@
+import asyncio
+import email.utils
+import time
+from unittest.mock import Mock
+
+import httpx
+import pytest
+
+from devhub_python import AsyncDevoClient, DevoClient, RetryBudget, RetryPolicy, RetryRule
+from devhub_python.exceptions import DevoAPIException, DevoConnectionException
+from devhub_python.retry import parse_retry_after
+from devhub_python.transport import Transport, TransportResponse
+
+NO_DELAY = RetryRule(base_delay=0, max_delay=0)
+
+
+def make_client(responses, **kwargs):
+    """Create a client whose transport returns (or raises) ``responses`` in order."""
+    transport = Mock(spec=Transport)
+    transport.send.side_effect = responses
+    return DevoClient(api_key="test-api-key", transport=transport, **kwargs), transport
+
+
+def unavailable(headers=None):
+    """Build a 503 transport response."""
+    return TransportResponse(503, headers or {}, b'{"message": "down"}')
+
+
+def ok_response():
+    """Build a successful transport response."""
+    return TransportResponse(200, {}, b"{}")
+
+
+class TestRetryRule:
+    """Test cases for deciding whether and when to retry."""
+
+    def test_decorrelated_jitter(self):
+        """Test that each delay lies between the base delay and three times the previous one, up to the cap."""
+        rule = RetryRule(max_retries=50, base_delay=0.1, max_delay=2.0)
+        state = RetryPolicy(rule, budget=RetryBudget(min_retries=100)).begin("GET", "messages")
+
+        previous = rule.base_delay
+        delays = []
+        for _ in range(50):
+            delay = state.next_delay(503)
+            assert rule.base_delay <= delay <= min(rule.max_delay, previous * 3)
+            delays.append(delay)
+            previous = delay
+
+        assert len(set(delays)) > 1
+        assert state.next_delay(503) is None
+
+    def test_retry_after(self):
+        """Test that Retry-After replaces the backoff, and a too-long one ends the retries."""
+        state = RetryPolicy(RetryRule(max_retry_after=10)).begin("GET", "messages")
+
+        assert state.next_delay(429, {"Retry-After": "3"}) == 3.0
+        assert state.next_delay(429, {"Retry-After": "30"}) is None
+
+    def test_parse_retry_after(self):
+        """Test that Retry-After is read in seconds or as an HTTP date."""
+        in_a_minute = email.utils.formatdate(time.time() + 60, usegmt=True)
+
+        assert parse_retry_after({"Retry-After": "2.5"}) == 2.5
+        assert 58 <= parse_retry_after({"Retry-After": in_a_minute}) <= 60
+        assert parse_retry_after({"Retry-After": "soon"}) is None
+        assert parse_retry_after({}) is None
+
+    def test_what_is_not_retried(self):
+        """Test that other statuses, methods and, if disabled, network errors aren't retried."""
+        policy = RetryPolicy(RetryRule(retry_network_errors=False))
+
+        assert policy.begin("GET", "messages").next_delay(404) is None
+        assert policy.begin("DELETE", "contacts/1").next_delay(503) is None
+        assert policy.begin("GET", "messages").next_delay() is None
+        assert policy.begin("GET", "messages").next_delay(503) is not None
+        assert policy.budget.as_dict()["successes"] == 1
+
+
+class TestRetryPolicy:
+    """Test cases for per-endpoint rules."""
+
+    def test_rules_match_endpoints(self):
+        """Test that patterns match the endpoint name or its path, the first match winning."""
+        sms = RetryRule(max_retries=1)
+        whatsapp = RetryRule(max_retries=5)
+        policy = RetryPolicy(rules={"POST user-api/sms/*": sms, "*whatsapp*": whatsapp, "*": RetryRule()})
+
+        assert policy.rule_for("POST", "user-api/sms/quick-send") is sms
+        assert policy.rule_for("GET", "user-api/whatsapp/templates/123") is whatsapp
+        assert policy.rule_for("GET", "user-api/sms/senders") is policy.rules["*"]
+        assert RetryPolicy().rule_for("GET", "messages").max_retries == 3
+
+
+class TestRetryBudget:
+    """Test cases for the client-wide retry budget."""
+
+    def test_budget_scales_with_successes(self, mocker):
+        """Test that retries beyond the minimum need recent successes, and old ones stop counting."""
+        clock = mocker.patch("devhub_python.retry.time.monotonic", return_value=100.0)
+        budget = RetryBudget(ratio=0.5, window=10, min_retries=2)
+
+        assert [budget.try_spend() for _ in range(3)] == [True, True, False]
+        for _ in range(4):
+            budget.record_success()
+        assert [budget.try_spend() for _ in range(3)] == [True, True, False]
+        assert budget.as_dict() == {"successes": 4, "retries": 4, "exhausted": 2}
+
+        clock.return_value = 110.0
+        assert budget.as_dict()["retries"] == 0
+        assert budget.try_spend() is True
+
+    def test_after_fork(self):
+        """Test that a forked child starts with an empty history."""
+        budget = RetryBudget(min_retries=1)
+        budget.try_spend()
+
+        budget.after_fork()
+
+        assert budget.try_spend() is True
+
+
+class TestClientRetries:
+    """Test cases for retries on the clients."""
+
+    def test_retries_are_one_request(self):
+        """Test that retried attempts count as a single request in the metrics."""
+        client, transport = make_client(
+            [unavailable(), DevoConnectionException(), ok_response()], retry_policy=RetryPolicy(NO_DELAY)
+        )
+
+        response = client.get("messages")
+
+        assert response.status_code == 200
+        assert transport.send.call_count == 3
+        assert client.metrics.as_dict()["requests"] == 1
+        assert client.retry_policy.budget.as_dict()["retries"] == 2
+
+    def test_spent_budget_stops_retries(self):
+        """Test that once the budget is spent, failures are returned without retrying."""
+        policy = RetryPolicy(NO_DELAY, budget=RetryBudget(ratio=0, min_retries=1))
+        client, transport = make_client([unavailable() for _ in range(3)], retry_policy=policy)
+
+        with pytest.raises(DevoAPIException):
+            client.get("messages")
+        with pytest.raises(DevoAPIException):
+            client.get("messages")
+
+        assert transport.send.call_count == 3
+        assert policy.budget.exhausted == 2
+
+    def test_async_retry_after(self):
+        """Test that the async client waits as long as Retry-After says."""
+        statuses = []
+
+        def handler(request):
+            statuses.append(429 if not statuses else 200)
+            return httpx.Response(statuses[-1], headers={"Retry-After": "0.2"}, json={})
+
+        async def send():
+            http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with AsyncDevoClient(api_key="test-api-key", http_client=http_client) as client:
+                started = time.monotonic()
+                await client.get("messages")
+                return time.monotonic() - started
+
+        elapsed = asyncio.run(send())
+
+        assert statuses == [429, 200]
+        assert 0.2 <= elapsed < 1.0
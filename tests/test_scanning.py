@@ -0,0 +1,311 @@
+import asyncio
+import contextvars
+import json
+import threading
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
+
+import pytest
+
+from devhub_python import DevoClient, ScanCheckpoint
+from devhub_python.exceptions import DevoConfigurationException, DevoValidationException
+from devhub_python.models.messages import Message
+from devhub_python.scanning import TimeShard, parse_timestamp, scan_time_range, scan_time_range_async
+
+START = datetime(2024, 3, 1, tzinfo=timezone.utc)
+END = datetime(2024, 3, 2, tzinfo=timezone.utc)
+
+
+def make_messages(moments):
+    """Build messages sent at ``moments``, numbered in order."""
+    return [{"id": f"msg_{i}", "date_sent": moment.isoformat()} for i, moment in enumerate(moments)]
+
+
+def make_api(messages, inclusive=True):
+    """Build a fetch function listing ``messages`` by date range and offset, recording the requests it got."""
+    lock = threading.Lock()
+
+    def fetch(after, before, limit, offset):
+        low, high = parse_timestamp(after), parse_timestamp(before)
+        matching = [
+            message
+            for message in messages
+            if (low <= parse_timestamp(message["date_sent"]) <= high)
+            if inclusive or low < parse_timestamp(message["date_sent"]) < high
+        ]
+        with lock:
+            fetch.requests.append((after, before, limit, offset))
+        return matching[offset : offset + limit]
+
+    fetch.requests = []
+    return fetch
+
+
+def ids(items):
+    """Sort the ids of ``items``."""
+    return sorted(item["id"] for item in items)
+
+
+class TestParseTimestamp:
+    """Test cases for parsing API timestamps."""
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            ("2024-03-01", START),
+            ("2024-03-01T00:00:00Z", START),
+            ("2024-03-01T02:00:00.5+02:00", START + timedelta(milliseconds=500)),
+            ("2024-03-01T00:00:00.1234567Z", START + timedelta(microseconds=123456)),
+            (datetime(2024, 3, 1), START),
+            (None, None),
+        ],
+    )
+    def test_valid(self, value, expected):
+        """Test that dates, offsets, long fractions and naive times parse to aware datetimes."""
+        assert parse_timestamp(value) == expected
+
+    @pytest.mark.parametrize("value", ["yesterday", 1709251200])
+    def test_invalid(self, value):
+        """Test that other values are rejected."""
+        with pytest.raises(DevoValidationException, match="Invalid timestamp"):
+            parse_timestamp(value)
+
+
+class TestScanTimeRange:
+    """Test cases for scanning a time range by shards."""
+
+    @pytest.mark.parametrize("inclusive", [True, False])
+    def test_exactly_once(self, inclusive):
+        """Test that every item of the range comes out once, including items on shard bounds."""
+        moments = [START + timedelta(minutes=7 * i) for i in range(300)] + [START, END, END - timedelta(microseconds=1)]
+        messages = make_messages(moments)
+        expected = ids(message for message in messages if parse_timestamp(message["date_sent"]) < END)
+
+        items = list(scan_time_range(make_api(messages, inclusive), START, END, shards=6, workers=3, limit=10))
+
+        assert ids(items) == expected
+
+    def test_dense_shards_are_split(self):
+        """Test that shards with more items than ``split_threshold`` are split before being read."""
+        burst = [START + timedelta(hours=13, seconds=i) for i in range(500)]
+        messages = make_messages(burst + [START + timedelta(hours=h) for h in range(24)])
+        fetch = make_api(messages)
+        checkpoint = ScanCheckpoint()
+
+        items = list(
+            scan_time_range(
+                fetch,
+                START,
+                END,
+                shards=4,
+                limit=20,
+                split_threshold=40,
+                min_span=timedelta(seconds=1),
+                checkpoint=checkpoint,
+            )
+        )
+
+        assert ids(items) == ids(messages)
+        assert max(offset for *_, limit, offset in fetch.requests if limit == 20) <= 40
+        assert len(checkpoint.shards) > 4
+        assert checkpoint.done
+
+    def test_min_span(self):
+        """Test that shards aren't split below ``min_span``, and are read by offset instead."""
+        messages = make_messages([START + timedelta(hours=5)] * 100)
+        fetch = make_api(messages)
+
+        items = list(
+            scan_time_range(fetch, START, END, shards=1, limit=10, split_threshold=10, min_span=timedelta(hours=6))
+        )
+
+        assert ids(items) == ids(messages)
+        assert max(offset for *_, offset in fetch.requests) == 100
+
+    def test_filters_by_date_sent(self):
+        """Test that models, views and records are kept by their ``date_sent``, and undated items dropped."""
+        inside = Message.model_construct(id="a", date_sent=START + timedelta(hours=1))
+        outside = Mock(date_sent="2024-03-02T00:00:00Z")
+        undated = {"id": "c"}
+
+        items = list(
+            scan_time_range(lambda *args: [inside, outside, undated], START, END, shards=1, min_span=END - START)
+        )
+
+        assert items == [inside]
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"start": END},
+            {"shards": 0},
+            {"workers": 0},
+            {"limit": 0},
+            {"split_threshold": 5},
+            {"min_span": timedelta(0)},
+        ],
+    )
+    def test_invalid_arguments(self, kwargs):
+        """Test that empty ranges and impossible settings are rejected up front."""
+        arguments = {"start": START, "end": END, "limit": 10, **kwargs}
+
+        with pytest.raises(DevoValidationException):
+            scan_time_range(make_api([]), **arguments)
+
+    def test_threads_see_the_callers_context(self):
+        """Test that shards are read in a copy of the caller's context, e.g. to honour its deadline."""
+        request_id = contextvars.ContextVar("request_id", default=None)
+        seen = set()
+
+        def fetch(after, before, limit, offset):
+            seen.add(request_id.get())
+            return []
+
+        request_id.set("req_1")
+        list(scan_time_range(fetch, START, END, shards=4, workers=4))
+
+        assert seen == {"req_1"}
+
+    def test_async(self):
+        """Test that the async scanner reads shards in tasks and yields every item once."""
+        messages = make_messages([START + timedelta(minutes=5 * i) for i in range(250)])
+        fetch = make_api(messages)
+
+        async def fetch_async(*args):
+            await asyncio.sleep(0)
+            return fetch(*args)
+
+        async def collect():
+            scan = scan_time_range_async(fetch_async, START, END, shards=3, workers=2, limit=10, split_threshold=30)
+            return [item async for item in scan]
+
+        assert ids(asyncio.run(collect())) == ids(messages)
+
+
+class TestScanCheckpoint:
+    """Test cases for resuming scans."""
+
+    def test_resume(self, tmp_path):
+        """Test that a scan stopped midway resumes from its checkpoint file, repeating at most one page."""
+        path = str(tmp_path / "scan.checkpoint")
+        messages = make_messages([START + timedelta(minutes=3 * i) for i in range(400)])
+        first = []
+
+        scan = scan_time_range(
+            make_api(messages), START, END, shards=4, workers=1, limit=10, checkpoint=ScanCheckpoint(path)
+        )
+        for item in scan:
+            first.append(item)
+            if len(first) == 155:
+                break
+        scan.close()
+        checkpoint = ScanCheckpoint(path)
+        rest = list(
+            scan_time_range(make_api(messages), START, END, shards=4, workers=1, limit=10, checkpoint=checkpoint)
+        )
+
+        assert set(ids(first + rest)) == set(ids(messages))
+        assert len(first) + len(rest) - len(messages) <= 10
+        assert checkpoint.done
+        assert list(scan_time_range(make_api(messages), START, END, checkpoint=ScanCheckpoint(path))) == []
+
+    def test_interrupted_mid_page(self):
+        """Test that a consumer failing partway through a page gets the rest of that page on resume."""
+        messages = make_messages([START + timedelta(minutes=i) for i in range(50)])
+        checkpoint = ScanCheckpoint()
+        first = []
+
+        with pytest.raises(RuntimeError):
+            for item in scan_time_range(make_api(messages), START, END, shards=1, limit=10, checkpoint=checkpoint):
+                first.append(item)
+                if len(first) == 15:
+                    raise RuntimeError("consumer crashed")
+        [shard] = checkpoint.pending()
+        rest = list(scan_time_range(make_api(messages), START, END, shards=1, limit=10, checkpoint=checkpoint))
+
+        assert shard.offset == 10
+        assert ids(rest) == ids(messages[10:])
+        assert checkpoint.done
+
+    def test_interrupted_mid_page_async(self):
+        """Test that the async scanner also records a page only once all of it has been yielded."""
+        messages = make_messages([START + timedelta(minutes=i) for i in range(50)])
+        fetch = make_api(messages)
+        checkpoint = ScanCheckpoint()
+
+        async def fetch_async(*args):
+            return fetch(*args)
+
+        async def take(count):
+            taken = []
+            async for item in scan_time_range_async(fetch_async, START, END, shards=1, limit=10, checkpoint=checkpoint):
+                taken.append(item)
+                if len(taken) == count:
+                    break
+            return taken
+
+        asyncio.run(take(15))
+
+        assert [shard.offset for shard in checkpoint.pending()] == [10]
+        assert ids(asyncio.run(take(100))) == ids(messages[10:])
+
+    def test_split_survives_a_restart(self, tmp_path):
+        """Test that split shards are reloaded in place of their parent, and torn records skipped."""
+        path = tmp_path / "scan.checkpoint"
+        checkpoint = ScanCheckpoint(str(path))
+        parent = TimeShard(START, END)
+        checkpoint.begin({"start": START.isoformat()}, [parent])
+        children = parent.split(2)
+        parent.done = True
+        checkpoint.record(parent, children)
+        children[0].offset = 30
+        checkpoint.record(children[0])
+        with open(path, "a") as checkpoint_file:
+            checkpoint_file.write('{"start": "2024-03-01T00:00:00+00:00", "end"')
+
+        reloaded = ScanCheckpoint(str(path))
+
+        assert reloaded.scan == {"start": START.isoformat()}
+        assert [(shard.start.hour, shard.offset) for shard in reloaded.pending()] == [(0, 30), (12, 0)]
+        assert json.loads(path.read_text().splitlines()[2])["children"][1]["end"] == END.isoformat()
+
+    def test_different_scan(self):
+        """Test that a checkpoint can't resume a scan of another range or with other filters."""
+        checkpoint = ScanCheckpoint()
+        list(scan_time_range(make_api([]), START, END, checkpoint=checkpoint, filters={"channel": "sms"}))
+
+        with pytest.raises(DevoValidationException, match="different scan"):
+            scan_time_range(make_api([]), START, END, checkpoint=checkpoint, filters={"channel": "email"})
+
+
+class TestMessagesScan:
+    """Test cases for MessagesResource.scan."""
+
+    def test_scan(self):
+        """Test that scan lists each shard with its date filters and the other filters."""
+        messages = make_messages([START + timedelta(hours=i) for i in range(24)])
+        fetch = make_api(messages)
+
+        def get(path, params):
+            response = Mock()
+            page = fetch(params["date_sent_after"], params["date_sent_before"], params["limit"], params["offset"])
+            response.json.return_value = {"messages": [dict(message, to="+1") for message in page]}
+            return response
+
+        client = DevoClient(api_key="test_api_key")
+        client.get = Mock(side_effect=get)
+
+        items = list(client.messages.scan("2024-03-01", "2024-03-02", shards=2, limit=5, records=True, channel="sms"))
+
+        assert sorted(item.id for item in items) == ids(messages)
+        assert all(call.kwargs["params"]["channel"] == "sms" for call in client.get.call_args_list)
+        assert client.get.call_args_list[0].kwargs["params"]["date_sent_after"] == "2024-02-29T23:59:59+00:00"
+
+    def test_workers_need_thread_safe_client(self):
+        """Test that a client sharing one requests session reads one shard at a time unless told otherwise."""
+        client = DevoClient(api_key="test_api_key")
+        client.get = Mock()
+
+        with pytest.raises(DevoConfigurationException, match="thread_safe=True"):
+            client.messages.scan(START, END, workers=4)
+        client.get.assert_not_called()
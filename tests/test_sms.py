@@ -1,10 +1,11 @@
+import asyncio
 from datetime import datetime
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 
 from devhub_python.exceptions import DevoValidationException
-from devhub_python.resources.sms import SMSResource
+from devhub_python.resources.sms import AsyncSMSResource, SMSResource
 
 
 class TestSMSResource:
@@ -341,3 +342,81 @@ class TestSMSResource:
         assert not hasattr(sms_resource, "get")
         assert not hasattr(sms_resource, "list")
         assert not hasattr(sms_resource, "cancel")
+
+
+class TestAsyncSMSResource:
+    """Test cases for the async SMS resource."""
+
+    @pytest.fixture
+    def sms_resource(self):
+        """Create an async SMS resource backed by a mock async client."""
+        return AsyncSMSResource(AsyncMock())
+
+    def test_send_sms_success(self, sms_resource, test_phone_number):
+        """Test sending an SMS through the async resource."""
+        mock_response = Mock()
+        mock_response.json.return_value = {"id": "msg_1", "recipient": test_phone_number, "status": "queued"}
+        sms_resource.client.post.return_value = mock_response
+
+        result = asyncio.run(sms_resource.send_sms(recipient=test_phone_number, message="Hi", sender="+1987654321"))
+
+        assert result.id == "msg_1"
+        sms_resource.client.post.assert_awaited_once_with(
+            "user-api/sms/quick-send",
+            json={"sender": "+1987654321", "recipient": test_phone_number, "message": "Hi", "hlrvalidation": True},
+            sandbox=False,
+        )
+
+    def test_send_sms_invalid_phone(self, sms_resource):
+        """Test that validation runs before any request is awaited."""
+        with pytest.raises(DevoValidationException):
+            asyncio.run(sms_resource.send_sms(recipient="invalid", message="Hi", sender="+1987654321"))
+
+        sms_resource.client.post.assert_not_called()
+
+    def test_get_senders(self, sms_resource):
+        """Test retrieving senders through the async resource."""
+        mock_response = Mock()
+        mock_response.json.return_value = {"senders": [{"phone_number": "+1234567890", "type": "longcode"}]}
+        sms_resource.client.get.return_value = mock_response
+
+        result = asyncio.run(sms_resource.get_senders())
+
+        assert len(result.senders) == 1
+        sms_resource.client.get.assert_awaited_once_with("user-api/me/senders", sandbox=False)
+
+    def test_buy_number(self, sms_resource):
+        """Test purchasing a number through the async resource."""
+        mock_response = Mock()
+        mock_response.json.return_value = {"features": []}
+        sms_resource.client.post.return_value = mock_response
+
+        result = asyncio.run(
+            sms_resource.buy_number(
+                region="US",
+                number="+1234567890",
+                number_type="mobile",
+                agency_authorized_representative="Jane Doe",
+                agency_representative_email="jane@example.com",
+            )
+        )
+
+        assert result.features == []
+
+    def test_get_available_numbers_from_list(self, sms_resource):
+        """Test that a direct array response is parsed into AvailableNumbersResponse."""
+        mock_response = Mock()
+        mock_response.json.return_value = [{"features": []}]
+        sms_resource.client.get.return_value = mock_response
+
+        result = asyncio.run(sms_resource.get_available_numbers(region="US", limit=5, type="mobile"))
+
+        assert len(result.numbers) == 1
+        sms_resource.client.get.assert_awaited_once_with(
+            "user-api/numbers", params={"region": "US", "limit": 5, "type": "mobile"}
+        )
+
+    def test_legacy_send_requires_sender(self, sms_resource):
+        """Test that the legacy send method still requires a sender."""
+        with pytest.raises(DevoValidationException):
+            asyncio.run(sms_resource.send(to="+1234567890", body="Hi"))
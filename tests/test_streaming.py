@@ -0,0 +1,260 @@
+import asyncio
+import json
+from unittest.mock import Mock, patch
+
+import httpx
+import pytest
+
+from devhub_python import AsyncDevoClient, DevoClient, ItemStream, RecordView, RetryPolicy, RetryRule
+from devhub_python.exceptions import DevoAPIException, DevoException, DevoNetworkException, DevoValidationException
+from devhub_python.models.contacts import ContactSerializer
+from devhub_python.models.rcs import RcsSendMessageSerializer
+from devhub_python.models.sms import AvailableNumber
+from devhub_python.streaming import JSONArrayParser
+from devhub_python.transport import RequestsTransport, Transport, TransportResponse, Urllib3StreamResponse
+
+CONTACT = {"id": "contact_1", "phone_number": "+1234567890", "created_at": "2024-01-01T00:00:00Z"}
+RCS_MESSAGE = {
+    "id": "rcs_1",
+    "account_id": "acc_1",
+    "to": "+1234567890",
+    "from": "+1987654321",
+    "message_type": "text",
+    "status": "sent",
+    "direction": "outbound",
+    "created_at": "2024-01-01T00:00:00Z",
+    "updated_at": "2024-01-01T00:00:00Z",
+}
+PAGE = {"contacts": [CONTACT, dict(CONTACT, id="contact_2")], "total": 2, "page": 1, "limit": 50, "total_pages": 1}
+
+
+def parse(document, chunk_size, items_key=None):
+    """Feed ``document`` to a parser ``chunk_size`` bytes at a time and return the parser and its items."""
+    data = document if isinstance(document, bytes) else json.dumps(document, ensure_ascii=False).encode()
+    parser = JSONArrayParser(items_key)
+    items = []
+    for start in range(0, len(data), chunk_size):
+        items.extend(parser.feed(data[start : start + chunk_size]))
+    items.extend(parser.close())
+    return parser, items
+
+
+def make_client(body, chunk_size=7):
+    """Create a client whose transport streams ``body`` in small chunks."""
+    response = TransportResponse(200, {}, json.dumps(body).encode())
+    response.iter_content = Mock(side_effect=lambda size: TransportResponse.iter_content(response, chunk_size))
+    response.close = Mock()
+    transport = Mock(spec=Transport)
+    transport.open.return_value = response
+    return DevoClient(api_key="test-api-key", transport=transport), response
+
+
+class TestJSONArrayParser:
+    """Test cases for the incremental JSON array parser."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 64, 10_000])
+    def test_array(self, chunk_size):
+        """Test that items come out the same whatever the chunk boundaries, multi-byte characters included."""
+        document = [{"name": "Zoë ✓", "n": 12345, "tags": ["a", "b"]}, 1.5e3, None, True, "x", [], {}]
+
+        assert parse(document, chunk_size)[1] == document
+
+    @pytest.mark.parametrize("chunk_size", [1, 5, 10_000])
+    def test_object(self, chunk_size):
+        """Test that the items under ``items_key`` are streamed and the other members collected."""
+        document = {"total": 2, "contacts": [CONTACT, CONTACT], "next": {"page": 2}}
+
+        parser, items = parse(document, chunk_size, items_key="contacts")
+
+        assert items == [CONTACT, CONTACT]
+        assert parser.rest == {"total": 2, "next": {"page": 2}}
+
+    def test_items_as_they_arrive(self):
+        """Test that each item is returned by the chunk that completes it."""
+        parser = JSONArrayParser()
+
+        assert parser.feed(b'[{"id": 1}, {"id"') == [{"id": 1}]
+        assert parser.feed(b": 2}, 3") == [{"id": 2}]
+        assert parser.feed(b"4]") == [34]
+        assert parser.close() == []
+
+    def test_large_values(self):
+        """Test that values spanning many chunks are decoded once they are complete."""
+        document = {"notes": "n" * 300_000, "contacts": [{"blob": "x" * 300_000}, CONTACT]}
+
+        parser, items = parse(document, 1024, items_key="contacts")
+
+        assert items == document["contacts"]
+        assert parser.rest == {"notes": document["notes"]}
+
+    def test_empty(self):
+        """Test empty arrays and objects, and objects without the items."""
+        assert parse(b" [ ] ", 1)[1] == []
+        assert parse(b"{}", 1, items_key="contacts")[1] == []
+        parser, items = parse({"contacts": [1]}, 4)
+        assert items == []
+        assert parser.rest == {"contacts": [1]}
+
+    @pytest.mark.parametrize("document", [b"", b"[1, 2", b'{"a": 1', b"[1 2]", b"[1,, 2]", b'"text"', b"[1] 2"])
+    def test_invalid(self, document):
+        """Test that incomplete and malformed documents raise ValueError."""
+        with pytest.raises(ValueError):
+            parse(document, 2)
+
+
+class TestItemStream:
+    """Test cases for streaming list endpoints."""
+
+    def test_contacts(self):
+        """Test that contacts stream as models, with the page's other fields in ``rest``."""
+        client, response = make_client(PAGE)
+
+        with client.contacts.list(limit=2, stream=True) as contacts:
+            assert isinstance(contacts, ItemStream)
+            assert [contact.id for contact in contacts] == ["contact_1", "contact_2"]
+            assert isinstance(contacts.response, TransportResponse)
+
+        assert contacts.rest == {"total": 2, "page": 1, "limit": 50, "total_pages": 1}
+        assert response.close.called
+        client.transport.open.assert_called_once()
+        client.transport.send.assert_not_called()
+
+    def test_lazy_and_records(self):
+        """Test that ``lazy`` and ``records`` choose what a stream yields."""
+        views = list(make_client(PAGE)[0].contacts.list(stream=True, lazy=True))
+        records = list(
+            make_client({"messages": [{"id": "msg_1", "to": "+1"}]})[0].messages.list(stream=True, records=True)
+        )
+
+        assert isinstance(views[0], RecordView)
+        assert views[1].id == "contact_2"
+        assert type(records[0]).__name__ == "MessageRecord"
+        assert records[0].to == "+1"
+
+    def test_arrays(self):
+        """Test that endpoints returning a bare array stream too."""
+        rcs = make_client([RCS_MESSAGE])[0].rcs.list_messages(stream=True)
+        numbers = make_client([{"features": []}, {"features": []}])[0].sms.get_available_numbers(stream=True)
+
+        messages = list(rcs)
+
+        assert isinstance(messages[0], RcsSendMessageSerializer)
+        assert messages[0].from_ == "+1987654321"
+        assert [type(number) for number in numbers] == [AvailableNumber, AvailableNumber]
+
+    def test_work_starts_before_the_download_ends(self):
+        """Test that the first item is handed over before the rest of the body is read."""
+        client, response = make_client(PAGE)
+        read = []
+        chunks = TransportResponse.iter_content(response, 16)
+        response.iter_content = Mock(return_value=(read.append(chunk) or chunk for chunk in chunks))
+
+        contacts = iter(client.contacts.list(stream=True))
+        first = next(contacts)
+
+        assert isinstance(first, ContactSerializer)
+        assert sum(map(len, read)) < len(response.content)
+        contacts.close()
+        assert response.close.called
+
+    def test_errors(self):
+        """Test read failures, malformed bodies and second iterations."""
+        client, response = make_client(PAGE)
+        response.iter_content = Mock(return_value=iter([b'{"contacts": [', b"oops"]))
+        stream = client.contacts.list(stream=True)
+
+        with pytest.raises(DevoValidationException, match="Failed to parse response"):
+            list(stream)
+        with pytest.raises(DevoException, match="only be iterated once"):
+            list(stream)
+
+        def broken(size):
+            yield b"["
+            raise ConnectionResetError("reset")
+
+        client, response = make_client([])
+        response.iter_content = broken
+        with pytest.raises(DevoNetworkException, match="reset"):
+            list(client.rcs.list_messages(stream=True))
+
+    def test_retry_closes_the_response(self):
+        """Test that a streamed response that is retried is closed first, and that streams aren't hedged."""
+        failed = TransportResponse(503, {}, b"")
+        failed.close = Mock()
+        client, response = make_client(PAGE)
+        client.transport.open.side_effect = [failed, response]
+        client.retry_policy = RetryPolicy(RetryRule(base_delay=0, max_delay=0))
+        client.hedging = Mock()
+
+        assert len(list(client.contacts.list(stream=True))) == 2
+        failed.close.assert_called_once_with()
+        client.hedging.run.assert_not_called()
+
+    def test_error_response(self):
+        """Test that API errors are raised before anything is streamed."""
+        transport = Mock(spec=Transport)
+        transport.open.return_value = TransportResponse(404, {}, b'{"message": "Not found"}')
+
+        with pytest.raises(DevoAPIException, match="Not found"):
+            DevoClient(api_key="test-api-key", transport=transport).messages.list(stream=True)
+
+    def test_async_client(self):
+        """Test that the async resources stream with httpx."""
+
+        def handler(request):
+            return httpx.Response(200, content=json.dumps(PAGE).encode())
+
+        async def collect():
+            http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with AsyncDevoClient(api_key="test-api-key", http_client=http_client) as client:
+                async with await client.contacts.list(stream=True) as contacts:
+                    return [contact.id async for contact in contacts], contacts.rest
+
+        ids, rest = asyncio.run(collect())
+
+        assert ids == ["contact_1", "contact_2"]
+        assert rest["total"] == 2
+
+    def test_async_error_response(self):
+        """Test that the async client reads a streamed error body before raising."""
+
+        def handler(request):
+            return httpx.Response(400, json={"message": "Bad limit"})
+
+        async def send():
+            http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with AsyncDevoClient(api_key="test-api-key", http_client=http_client) as client:
+                await client.messages.list(stream=True)
+
+        with pytest.raises(DevoAPIException, match="Bad limit"):
+            asyncio.run(send())
+
+
+class TestStreamingTransports:
+    """Test cases for opening streamed responses on the built-in transports."""
+
+    @patch("requests.Session.request")
+    def test_requests(self, mock_request):
+        """Test that the requests transport asks the session to stream."""
+        transport = RequestsTransport()
+
+        assert transport.open("GET", "https://api.example.com/x", {}, None, 5.0) is mock_request.return_value
+        mock_request.assert_called_once_with(
+            method="GET", url="https://api.example.com/x", headers={}, data=None, timeout=5.0, stream=True
+        )
+
+    def test_urllib3(self):
+        """Test that urllib3 responses are read chunk by chunk and the connection dropped on close."""
+        raw = Mock(status=200, headers={"Content-Type": "application/json"}, reason="OK")
+        raw.stream.return_value = iter([b"[1,", b"2]"])
+        response = Urllib3StreamResponse(raw, "https://api.example.com/x")
+
+        assert list(response.iter_content(1024)) == [b"[1,", b"2]"]
+        raw.stream.assert_called_once_with(1024)
+        response.close()
+        raw.close.assert_called_once_with()
+        raw.release_conn.assert_called_once_with()
+
+        raw.data = b'{"message": "Bad"}'
+        assert response.json() == {"message": "Bad"}
+        assert list(response.iter_content(4)) == [b'{"me', b"ssag", b'e": ', b'"Bad', b'"}']
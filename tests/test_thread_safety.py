@@ -0,0 +1,135 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+
+from devhub_python import DevoClient
+from devhub_python.exceptions import DevoConfigurationException
+from devhub_python.http2 import HTTP2Adapter
+from devhub_python.transport import ThreadLocalRequestsTransport
+
+
+def make_client(base_url, **kwargs):
+    """Create a thread-safe client pointed at a local test server."""
+    client = DevoClient(api_key="test-api-key", thread_safe=True, **kwargs)
+    client.base_url = base_url
+    return client
+
+
+class TestThreadLocalSessions:
+    """Test cases for thread-safe mode."""
+
+    def test_each_thread_gets_its_own_session(self, api_key):
+        """Test that sessions are per thread and created on first use."""
+        client = DevoClient(api_key=api_key, thread_safe=True)
+        sessions = {}
+
+        def grab(name):
+            sessions[name] = (client.session, client.session)
+
+        threads = [threading.Thread(target=grab, args=(i,)) for i in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert isinstance(client.transport, ThreadLocalRequestsTransport)
+        assert all(first is second for first, second in sessions.values())
+        assert len({id(first) for first, _ in sessions.values()}) == 3
+
+    def test_sessions_share_client_configuration(self, api_key):
+        """Test that per-thread sessions get the client's retry, pool and env settings."""
+        client = DevoClient(api_key=api_key, thread_safe=True, trust_env=False, pool_maxsize=32, max_retries=5)
+
+        adapter = client.session.get_adapter(client.base_url)
+
+        assert client.session.trust_env is False
+        assert adapter.max_retries.total == 0
+        assert client.retry_policy.default.max_retries == 5
+        assert adapter.poolmanager.connection_pool_kw["maxsize"] == 32
+
+    def test_http2_adapter_is_shared(self, api_key):
+        """Test that all threads share the one multiplexing HTTP/2 adapter."""
+        client = DevoClient(api_key=api_key, thread_safe=True, http2=True)
+        adapters = []
+        thread = threading.Thread(target=lambda: adapters.append(client.session.get_adapter(client.base_url)))
+        thread.start()
+        thread.join()
+
+        assert isinstance(adapters[0], HTTP2Adapter)
+        assert adapters[0] is client.session.get_adapter(client.base_url)
+
+    def test_custom_session_is_rejected(self, api_key):
+        """Test that thread_safe can't wrap a single user-supplied session."""
+        with pytest.raises(DevoConfigurationException):
+            DevoClient(api_key=api_key, thread_safe=True, session=requests.Session())
+
+    def test_close_closes_every_thread_session(self, echo_server):
+        """Test that closing the client releases every live thread's connections."""
+        client = make_client(echo_server)
+        ready = threading.Barrier(4)
+        release = threading.Event()
+
+        def worker():
+            client.get("test")
+            ready.wait()
+            release.wait()
+
+        threads = [threading.Thread(target=worker) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        ready.wait()
+
+        assert len(client.transport.sessions) == 3
+        assert client.pool_stats()["idle"] == 3
+
+        client.close()
+        stats = client.pool_stats()
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert stats["idle"] == 0
+        assert stats["created"] == 3
+        assert stats["discarded"] == 3
+
+
+class TestThreadSafetyStress:
+    """Stress tests sharing one client across many threads."""
+
+    @pytest.mark.parametrize("transport", ["requests", "urllib3"])
+    def test_no_cross_talk_across_64_threads(self, echo_server, transport):
+        """Test that every thread gets back exactly the responses to its own requests."""
+        client = make_client(echo_server, transport=transport, pool_maxsize=64)
+        requests_per_thread = 10
+        barrier = threading.Barrier(64)
+
+        def worker(worker_id):
+            barrier.wait()
+            mismatches = []
+            for i in range(requests_per_thread):
+                tag = f"{worker_id}-{i}"
+                echoed = client.post(f"echo/{tag}", json={"tag": tag}, headers={"X-Tag": tag}).json()
+                if echoed["path"] != f"/echo/{tag}" or echoed["headers"].get("X-Tag") != tag:
+                    mismatches.append((tag, echoed["path"]))
+                elif echoed["body"] != f'{{"tag": "{tag}"}}' or echoed["api_key"] != "test-api-key":
+                    mismatches.append((tag, echoed["body"]))
+            return mismatches, id(client.session)
+
+        with ThreadPoolExecutor(max_workers=64) as executor:
+            results = list(executor.map(worker, range(64)))
+
+        assert [mismatch for mismatches, _ in results for mismatch in mismatches] == []
+        if transport == "requests":
+            # All 64 threads were alive at once (barrier), each with its own session
+            assert len({session_id for _, session_id in results}) == 64
+
+        metrics = client.metrics.as_dict()
+        assert metrics["requests"] == 64 * requests_per_thread
+        assert metrics["status_codes"] == {200: 64 * requests_per_thread}
+        assert metrics["in_flight"] == 0
+
+        stats = client.pool_stats()
+        assert stats["in_use"] == 0
+        assert stats["created"] <= 64
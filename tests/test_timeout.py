@@ -0,0 +1,234 @@
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import Mock
+
+import httpx
+import pytest
+import urllib3
+
+from devhub_python import (
+    AsyncDevoClient,
+    ConcurrencyLimiter,
+    DevoClient,
+    RateLimiter,
+    RetryPolicy,
+    RetryRule,
+    Timeout,
+    deadline,
+)
+from devhub_python.exceptions import DevoException, DevoTimeoutException
+from devhub_python.timeout import _deadline
+from devhub_python.transport import Transport, TransportResponse
+
+
+@pytest.fixture
+def unavailable_server():
+    """Run a local server that answers every request with 503."""
+    hits = []
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            hits.append(time.monotonic())
+            self.send_response(503)
+            self.send_header("Content-Length", "2")
+            self.end_headers()
+            self.wfile.write(b"{}")
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}", hits
+    server.shutdown()
+    server.server_close()
+
+
+def make_client(base_url, **kwargs):
+    """Create a client talking to a local server."""
+    client = DevoClient(api_key="test-api-key", trust_env=False, **kwargs)
+    client.base_url = base_url
+    return client
+
+
+class TestTimeout:
+    """Test cases for the Timeout options."""
+
+    def test_transport_timeout(self):
+        """Test that transports get a plain number unless the timeouts differ or there is a deadline."""
+        assert Timeout(5).for_attempt() == 5
+        split = Timeout(connect=1, read=3).for_attempt()
+        assert isinstance(split, urllib3.Timeout)
+        assert (split.connect_timeout, split.read_timeout) == (1, 3)
+
+    def test_attempts_are_cut_to_the_deadline(self):
+        """Test that each attempt's timeouts never outlast the time that is left."""
+        timeout = Timeout(connect=1, read=30).for_attempt(time.monotonic() + 2)
+
+        attempt = timeout.clone()
+
+        assert attempt.connect_timeout == 1
+        assert 1.9 < attempt.read_timeout <= 2
+
+    def test_nested_deadlines_never_extend(self):
+        """Test that an inner deadline can shorten but not lengthen an outer one."""
+        with deadline(1):
+            outer = _deadline.get()
+            with deadline(10):
+                assert _deadline.get() == outer
+            with deadline(0.1):
+                assert _deadline.get() < outer
+            assert Timeout(deadline=5).expires_at() == outer
+        assert _deadline.get() is None
+
+
+class TestDeadlines:
+    """Test cases for deadlines covering retries and waits."""
+
+    def test_deadline_bounds_retried_timeouts(self, echo_server):
+        """Test that timed-out attempts are not retried past the deadline."""
+        client = make_client(echo_server, max_retries=3, timeout=Timeout(read=1, deadline=0.3))
+
+        started = time.monotonic()
+        with pytest.raises(DevoTimeoutException):
+            client.get("slow", params={"delay": 2})
+
+        assert time.monotonic() - started < 0.8
+
+    @pytest.mark.parametrize("transport", ["requests", "urllib3"])
+    def test_deadline_skips_backoff_that_would_not_fit(self, unavailable_server, transport):
+        """Test that a retry whose backoff outlasts the deadline isn't attempted."""
+        base_url, hits = unavailable_server
+        client = make_client(
+            base_url, transport=transport, retry_policy=RetryPolicy(RetryRule(3, base_delay=0.4, max_delay=0.4))
+        )
+
+        started = time.monotonic()
+        with deadline(1.0):
+            with pytest.raises(DevoTimeoutException):
+                client.get("status")
+
+        # Attempts start at about 0, 0.4 and 0.8 seconds; the backoff before a fourth doesn't fit
+        assert len(hits) == 3
+        assert time.monotonic() - started < 1.0
+
+    def test_expired_deadline_fails_before_sending(self):
+        """Test that nothing is sent once the budget is spent."""
+        transport = Mock(spec=Transport)
+        client = DevoClient(api_key="test-api-key", transport=transport)
+
+        with deadline(0):
+            with pytest.raises(DevoTimeoutException):
+                client.get("messages")
+
+        transport.send.assert_not_called()
+
+    def test_limiter_waits_respect_the_deadline(self):
+        """Test that waits for a rate or concurrency slot give up at the deadline."""
+        rate_limiter = RateLimiter(rate=1, burst=1)
+        rate_limiter.acquire()
+        with pytest.raises(DevoTimeoutException):
+            rate_limiter.acquire(timeout=0.1)
+        assert rate_limiter.in_flight == 1
+
+        concurrency_limiter = ConcurrencyLimiter(initial_limit=1)
+        concurrency_limiter.acquire()
+        started = time.monotonic()
+        with pytest.raises(DevoTimeoutException):
+            concurrency_limiter.acquire(timeout=0.1)
+        assert 0.1 <= time.monotonic() - started < 0.5
+        assert concurrency_limiter.as_dict()["waiting"] == 0
+
+        async def acquire():
+            with pytest.raises(DevoTimeoutException):
+                await concurrency_limiter.acquire_async(timeout=0.05)
+
+        asyncio.run(acquire())
+        concurrency_limiter.release(0.01, 200)
+        assert concurrency_limiter.in_flight == 0
+
+
+class TestPerCallOptions:
+    """Test cases for per-call timeout overrides."""
+
+    def test_with_options(self):
+        """Test that a client copy with another timeout shares state and binds its resources."""
+        transport = Mock(spec=Transport)
+        transport.send.return_value = TransportResponse(200, {}, b"{}")
+        client = DevoClient(api_key="test-api-key", transport=transport)
+
+        fast = client.with_options(timeout=Timeout(connect=1, read=3))
+        fast.get("messages")
+
+        timeout = transport.send.call_args.kwargs["timeout"]
+        assert (timeout.connect_timeout, timeout.read_timeout) == (1, 3)
+        assert client.timeout == DevoClient.DEFAULT_TIMEOUT
+        assert fast.sms.client is fast
+        assert fast.metrics is client.metrics
+
+    def test_request_timeout_argument(self):
+        """Test that request() takes a timeout for a single call."""
+        transport = Mock(spec=Transport)
+        transport.send.return_value = TransportResponse(200, {}, b"{}")
+        client = DevoClient(api_key="test-api-key", transport=transport)
+
+        client.get("messages", timeout=2.5)
+
+        assert transport.send.call_args.kwargs["timeout"] == 2.5
+
+
+class TestAsyncDeadlines:
+    """Test cases for deadlines on the async client."""
+
+    def test_deadline_bounds_retries(self):
+        """Test that the async retry loop stops at the deadline and attempts get the remaining time."""
+        timeouts = []
+
+        def handler(request):
+            timeouts.append(request.extensions["timeout"]["read"])
+            return httpx.Response(503, json={})
+
+        async def send():
+            http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with AsyncDevoClient(
+                api_key="test-api-key",
+                http_client=http_client,
+                timeout=Timeout(read=10, deadline=1.0),
+                retry_policy=RetryPolicy(RetryRule(3, base_delay=0.4, max_delay=0.4)),
+            ) as client:
+                started = time.monotonic()
+                with pytest.raises(DevoTimeoutException):
+                    await client.get("status")
+                return time.monotonic() - started
+
+        elapsed = asyncio.run(send())
+
+        assert elapsed < 1.0
+        assert len(timeouts) == 3
+        assert all(timeout <= 1.0 for timeout in timeouts)
+
+    def test_with_options(self):
+        """Test that per-call options work on the async client too."""
+        seen = []
+
+        def handler(request):
+            seen.append(request.extensions["timeout"])
+            return httpx.Response(200, json={})
+
+        async def send():
+            http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with AsyncDevoClient(api_key="test-api-key", http_client=http_client) as client:
+                await client.with_options(timeout=Timeout(connect=1, read=3)).get("messages")
+                with pytest.raises(DevoException):
+                    with deadline(0):
+                        await client.get("messages")
+
+        asyncio.run(send())
+
+        assert len(seen) == 1
+        assert seen[0]["connect"] == 1
+        assert seen[0]["read"] == 3
@@ -0,0 +1,289 @@
+import json
+import subprocess
+import sys
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+import urllib3
+
+from devhub_python import DevoClient
+from devhub_python.exceptions import (
+    DevoAPIException,
+    DevoConfigurationException,
+    DevoConnectionException,
+    DevoNetworkException,
+    DevoTimeoutException,
+)
+from devhub_python.models.sms import SMSQuickSendResponse
+from devhub_python.transport import (
+    RequestsTransport,
+    Transport,
+    TransportResponse,
+    Urllib3Transport,
+    build_query_string,
+    encode_body,
+)
+
+
+class RecordingTransport(Transport):
+    """In-process transport that records requests and replays canned responses."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def send(self, method, url, headers, body=None, timeout=None):
+        self.requests.append({"method": method, "url": url, "headers": headers, "body": body, "timeout": timeout})
+        return self.responses.pop(0)
+
+
+def json_response(status_code, payload):
+    """Build a JSON TransportResponse."""
+    return TransportResponse(status_code, {"Content-Type": "application/json"}, json.dumps(payload).encode())
+
+
+class TestEncoding:
+    """Test cases for the transport-independent request encoding."""
+
+    def test_build_query_string(self):
+        """Test that None values are dropped and lists are repeated."""
+        query = build_query_string({"page": 1, "search": None, "ids": ["a", "b"], "approve": True})
+
+        assert query == "page=1&ids=a&ids=b&approve=True"
+
+    def test_build_query_string_empty(self):
+        """Test that empty params produce an empty query string."""
+        assert build_query_string(None) == ""
+        assert build_query_string({}) == ""
+
+    def test_encode_json(self):
+        """Test JSON body encoding."""
+        body, content_type = encode_body(json={"to": "+1", "text": "héllo"})
+
+        assert json.loads(body) == {"to": "+1", "text": "héllo"}
+        assert content_type == "application/json"
+
+    def test_encode_form(self):
+        """Test form body encoding."""
+        body, content_type = encode_body(data={"channel": "sms", "to": "+1"})
+
+        assert body == b"channel=sms&to=%2B1"
+        assert content_type == "application/x-www-form-urlencoded"
+
+    def test_encode_files(self):
+        """Test multipart body encoding."""
+        body, content_type = encode_body(data={"caption": "hi"}, files={"file": ("a.pdf", b"%PDF", "application/pdf")})
+
+        assert content_type.startswith("multipart/form-data; boundary=")
+        assert b'name="caption"' in body
+        assert b'filename="a.pdf"' in body
+        assert b"%PDF" in body
+
+    def test_encode_no_body(self):
+        """Test that requests without a body have no content type."""
+        assert encode_body() == (None, None)
+
+
+class TestTransportResponse:
+    """Test cases for TransportResponse."""
+
+    def test_response_api(self):
+        """Test the requests-compatible response attributes."""
+        response = TransportResponse(200, {"content-type": "application/json; charset=utf-8"}, b'{"a": "\xc3\xa9"}')
+
+        assert response.ok
+        assert response.headers["Content-Type"].startswith("application/json")
+        assert response.json() == {"a": "é"}
+        assert response.text == '{"a": "é"}'
+        assert repr(response) == "<TransportResponse [200]>"
+
+    def test_non_json_body_raises_value_error(self):
+        """Test that invalid JSON raises ValueError like requests."""
+        response = TransportResponse(502, {}, b"Bad Gateway")
+
+        assert not response.ok
+        with pytest.raises(ValueError):
+            response.json()
+
+
+class TestRequestsTransport:
+    """Test cases for RequestsTransport."""
+
+    @patch("requests.Session.request")
+    def test_send(self, mock_request):
+        """Test that prepared requests are passed to the session unchanged."""
+        mock_request.return_value = Mock(ok=True)
+        transport = RequestsTransport()
+
+        response = transport.send("POST", "https://api.example.com/x?a=1", {"X-API-Key": "k"}, b"{}", 5.0)
+
+        assert response is mock_request.return_value
+        mock_request.assert_called_once_with(
+            method="POST", url="https://api.example.com/x?a=1", headers={"X-API-Key": "k"}, data=b"{}", timeout=5.0
+        )
+
+    @pytest.mark.parametrize(
+        "error,expected",
+        [
+            (requests.exceptions.ReadTimeout(), DevoTimeoutException),
+            (requests.exceptions.ConnectionError(), DevoConnectionException),
+            (requests.exceptions.TooManyRedirects("loop"), DevoNetworkException),
+        ],
+    )
+    @patch("requests.Session.request")
+    def test_error_translation(self, mock_request, error, expected):
+        """Test that requests exceptions become SDK network exceptions."""
+        mock_request.side_effect = error
+
+        with pytest.raises(expected) as exc_info:
+            RequestsTransport().send("GET", "https://api.example.com", {})
+
+        assert exc_info.value.original_exception is error
+
+
+class TestUrllib3Transport:
+    """Test cases for Urllib3Transport."""
+
+    def test_import_with_urllib3_1(self):
+        """Test that the package imports without names that only urllib3 2 has, as with urllib3 1.26."""
+        code = "import urllib3; del urllib3.BaseHTTPResponse; import devhub_python.transport"
+
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_send(self):
+        """Test that requests go straight to the pool manager."""
+        pool_manager = Mock()
+        pool_manager.request.return_value = Mock(status=201, headers={"X-Id": "1"}, data=b'{"id": 1}', reason="OK")
+        transport = Urllib3Transport(pool_manager=pool_manager)
+
+        response = transport.send("POST", "https://api.example.com/x", {"X-API-Key": "k"}, b"{}", 5.0)
+
+        assert isinstance(response, TransportResponse)
+        assert response.status_code == 201
+        assert response.headers["x-id"] == "1"
+        assert response.json() == {"id": 1}
+        call = pool_manager.request.call_args
+        assert call[0] == ("POST", "https://api.example.com/x")
+        assert call[1]["body"] == b"{}"
+        assert call[1]["headers"]["X-API-Key"] == "k"
+        assert call[1]["headers"]["Accept-Encoding"] == urllib3.util.request.ACCEPT_ENCODING
+        assert call[1]["timeout"].read_timeout == 5.0
+
+    @pytest.mark.parametrize(
+        "error,expected",
+        [
+            (urllib3.exceptions.ReadTimeoutError(None, "/", "timed out"), DevoTimeoutException),
+            (urllib3.exceptions.NewConnectionError(None, "refused"), DevoConnectionException),
+            (urllib3.exceptions.ProtocolError("reset"), DevoConnectionException),
+            (
+                urllib3.exceptions.MaxRetryError(None, "/", urllib3.exceptions.ResponseError("too many")),
+                DevoNetworkException,
+            ),
+        ],
+    )
+    def test_error_translation(self, error, expected):
+        """Test that urllib3 exceptions become SDK network exceptions."""
+        pool_manager = Mock()
+        pool_manager.request.side_effect = error
+
+        with pytest.raises(expected):
+            Urllib3Transport(pool_manager=pool_manager).send("GET", "https://api.example.com", {})
+
+    def test_close(self):
+        """Test that closing the transport clears the pools."""
+        pool_manager = Mock()
+
+        Urllib3Transport(pool_manager=pool_manager).close()
+
+        pool_manager.clear.assert_called_once()
+
+
+class TestClientTransports:
+    """Test cases for DevoClient on different transports."""
+
+    def test_default_transport_is_requests(self, api_key):
+        """Test that the requests transport is used by default."""
+        client = DevoClient(api_key=api_key)
+
+        assert isinstance(client.transport, RequestsTransport)
+        assert client.session is client.transport.session
+
+    def test_urllib3_transport_uses_client_retry_policy(self, api_key):
+        """Test that transport='urllib3' leaves retrying to the client's retry policy."""
+        client = DevoClient(api_key=api_key, transport="urllib3", max_retries=5)
+
+        assert isinstance(client.transport, Urllib3Transport)
+        assert client.session is None
+        assert client.transport.retries.total == 0
+        assert client.retry_policy.default.max_retries == 5
+        assert 503 in client.retry_policy.default.status_codes
+
+    def test_unknown_transport_raises(self, api_key):
+        """Test that unknown transport names are rejected."""
+        with pytest.raises(DevoConfigurationException):
+            DevoClient(api_key=api_key, transport="curl")
+
+    def test_http2_requires_requests_transport(self, api_key):
+        """Test that http2 cannot be combined with other transports."""
+        with pytest.raises(DevoConfigurationException):
+            DevoClient(api_key=api_key, transport="urllib3", http2=True)
+
+    def test_resources_work_on_custom_transport(self, api_key, test_phone_number):
+        """Test that resources are unchanged on a custom in-process transport."""
+        transport = RecordingTransport(
+            json_response(200, {"id": "msg_1", "recipient": test_phone_number, "status": "queued"})
+        )
+        client = DevoClient(api_key=api_key, transport=transport)
+
+        result = client.sms.send_sms(recipient=test_phone_number, message="Hello", sender="+1987654321")
+
+        assert isinstance(result, SMSQuickSendResponse)
+        assert result.id == "msg_1"
+        sent = transport.requests[0]
+        assert sent["method"] == "POST"
+        assert sent["url"] == f"{DevoClient.DEFAULT_BASE_URL}/user-api/sms/quick-send"
+        assert sent["headers"]["X-API-Key"] == api_key
+        assert sent["headers"]["Content-Type"] == "application/json"
+        assert json.loads(sent["body"])["recipient"] == test_phone_number
+        assert sent["timeout"] == DevoClient.DEFAULT_TIMEOUT
+
+    def test_error_responses_on_custom_transport(self, api_key):
+        """Test that error handling is transport independent."""
+        transport = RecordingTransport(json_response(400, {"message": "Invalid", "code": "BAD"}))
+        client = DevoClient(api_key=api_key, transport=transport)
+
+        with pytest.raises(DevoAPIException) as exc_info:
+            client.get("test/endpoint", params={"page": 1, "search": None})
+
+        assert exc_info.value.status_code == 400
+        assert transport.requests[0]["url"].endswith("/test/endpoint?page=1")
+
+    def test_explicit_content_type_is_kept(self, api_key):
+        """Test that a caller-supplied Content-Type is not overridden."""
+        transport = RecordingTransport(json_response(200, {}))
+        client = DevoClient(api_key=api_key, transport=transport)
+
+        client.post("x", json={}, headers={"content-type": "application/vnd.devo+json"})
+
+        headers = transport.requests[0]["headers"]
+        assert headers["content-type"] == "application/vnd.devo+json"
+        assert "Content-Type" not in headers
+
+    @pytest.mark.parametrize("transport", ["requests", "urllib3"])
+    def test_transports_send_identical_requests(self, api_key, echo_server, transport):
+        """Test that both shipped transports put the same request on the wire."""
+        client = DevoClient(api_key=api_key, transport=transport)
+        client.base_url = echo_server
+
+        form = client.post("messages/send", data={"channel": "sms", "to": "+1"}, params={"dry": True}).json()
+        upload = client.post("upload", files={"file": ("a.txt", b"hello", "text/plain")}).json()
+        client.close()
+
+        assert form["method"] == "POST"
+        assert form["path"] == "/messages/send?dry=True"
+        assert form["api_key"] == api_key
+        assert form["content_type"] == "application/x-www-form-urlencoded"
+        assert form["body"] == "channel=sms&to=%2B1"
+        assert upload["content_type"].startswith("multipart/form-data")
+        assert "hello" in upload["body"]
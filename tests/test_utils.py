@@ -1,16 +1,34 @@
+import json
 from datetime import datetime
+from unittest.mock import Mock
 
 import pytest
 
 from devhub_python.exceptions import DevoInvalidEmailException, DevoInvalidPhoneNumberException, DevoValidationException
+from devhub_python.models.messages import Message, MessageListResponse
+from devhub_python.transport import TransportResponse
 from devhub_python.utils import (
     format_datetime,
+    parse_response,
+    parse_response_list,
     parse_webhook_signature,
+    response_is_array,
     validate_email,
     validate_phone_number,
     validate_required_string,
+    validate_response,
 )
 
+MESSAGE = {
+    "id": "msg_1",
+    "channel": "sms",
+    "type": "text",
+    "to": "+1234567890",
+    "content": {"body": "Hi"},
+    "status": "sent",
+    "direction": "outbound",
+}
+
 
 class TestValidationUtils:
     """Test cases for validation utility functions."""
@@ -147,3 +165,41 @@ class TestUtilityFunctions:
         # Should only include valid key=value pairs
         assert "no" in result
         assert len(result) == 1
+
+
+class TestResponseParsing:
+    """Test cases for parsing responses into models."""
+
+    def test_parses_body_bytes(self):
+        """Test that models are parsed from the body bytes without calling response.json()."""
+        response = TransportResponse(200, {}, json.dumps({"messages": [MESSAGE, MESSAGE]}).encode())
+        response.json = Mock(side_effect=AssertionError("decoded twice"))
+
+        result = parse_response(response, MessageListResponse)
+
+        assert [message.id for message in result.messages] == ["msg_1", "msg_1"]
+        assert not response_is_array(response)
+
+    def test_parses_arrays(self):
+        """Test that a JSON array is detected and parsed into a list of models."""
+        response = TransportResponse(200, {}, b"  " + json.dumps([MESSAGE]).encode())
+
+        assert response_is_array(response)
+        assert parse_response_list(response, Message)[0].to == "+1234567890"
+
+    def test_falls_back_to_json(self):
+        """Test that responses without a bytes body (e.g. mocks) are parsed from response.json()."""
+        response = Mock()
+        response.json.return_value = [MESSAGE]
+
+        assert response_is_array(response)
+        assert parse_response_list(response, Message)[0].id == "msg_1"
+        response.json.return_value = {}
+        assert parse_response(response, MessageListResponse).messages == []
+
+    def test_validate_response_errors(self):
+        """Test that unparseable bodies raise DevoValidationException."""
+        response = TransportResponse(200, {}, b"{not json")
+
+        with pytest.raises(DevoValidationException, match="Failed to parse response"):
+            validate_response(response, MessageListResponse)
@@ -0,0 +1,126 @@
+import asyncio
+import json
+from datetime import datetime
+from unittest.mock import Mock
+
+import httpx
+import pytest
+
+from devhub_python import AsyncDevoClient, DevoClient, ListView, RecordView
+from devhub_python.exceptions import DevoValidationException
+from devhub_python.models.contacts import ContactSerializer, GetContactsSerializer
+from devhub_python.models.rcs import RcsSendMessageSerializer
+from devhub_python.transport import Transport, TransportResponse
+
+CONTACT = {
+    "id": "contact_1",
+    "phone_number": "+1234567890",
+    "custom_fields": {"plan": "pro"},
+    "created_at": "2024-01-01T00:00:00Z",
+}
+PAGE = {"contacts": [CONTACT, dict(CONTACT, id="contact_2")], "total": 2, "page": 1, "limit": 50, "total_pages": 1}
+RCS_MESSAGE = {
+    "id": "rcs_1",
+    "account_id": "acc_1",
+    "to": "+1234567890",
+    "from": "+1987654321",
+    "message_type": "text",
+    "status": "sent",
+    "direction": "outbound",
+    "created_at": "2024-01-01T00:00:00Z",
+    "updated_at": "2024-01-01T00:00:00Z",
+}
+
+
+def make_client(body):
+    """Create a client whose transport always answers with ``body``."""
+    transport = Mock(spec=Transport)
+    transport.send.return_value = TransportResponse(200, {}, json.dumps(body).encode())
+    return DevoClient(api_key="test-api-key", transport=transport)
+
+
+class TestRecordView:
+    """Test cases for reading fields through views."""
+
+    def test_fields(self):
+        """Test that plain fields are returned as decoded, the rest parsed on access, and defaults filled in."""
+        view = RecordView(GetContactsSerializer, PAGE)
+        contact = view.contacts[0]
+
+        assert isinstance(view.contacts, ListView)
+        assert view.contacts is view.contacts
+        assert contact.phone_number == "+1234567890"
+        assert contact.custom_fields is PAGE["contacts"][0]["custom_fields"]
+        assert contact.created_at == datetime.fromisoformat("2024-01-01T00:00:00+00:00")
+        assert contact.tags is None
+        assert contact.raw is CONTACT
+
+    def test_errors(self):
+        """Test that unknown fields raise AttributeError and missing required ones DevoValidationException."""
+        view = RecordView(ContactSerializer, {"phone_number": "+1234567890"})
+
+        with pytest.raises(AttributeError):
+            view.nickname
+        with pytest.raises(DevoValidationException, match="missing 'id'"):
+            view.id
+
+    def test_to_model(self):
+        """Test that views validate into the full models on request."""
+        view = RecordView(GetContactsSerializer, PAGE)
+
+        assert view.to_model() == GetContactsSerializer.model_validate(PAGE)
+        assert view.contacts.to_models()[1].id == "contact_2"
+
+
+class TestListView:
+    """Test cases for views of JSON arrays."""
+
+    def test_sequence(self):
+        """Test that list views index, slice and iterate like the list of models."""
+        view = ListView(ContactSerializer, PAGE["contacts"])
+
+        assert len(view) == 2
+        assert [contact.id for contact in view] == ["contact_1", "contact_2"]
+        assert view[-1].id == "contact_2"
+        assert [contact.id for contact in view[1:]] == ["contact_2"]
+        assert view.raw is PAGE["contacts"]
+        assert repr(view) == "<ContactSerializer list view of 2>"
+
+
+class TestLazyResources:
+    """Test cases for the lazy list endpoints."""
+
+    def test_contacts(self):
+        """Test that contacts.list(lazy=True) returns a view of the page."""
+        page = make_client(PAGE).contacts.list(lazy=True)
+
+        assert isinstance(page, RecordView)
+        assert page.total == 2
+        assert page.contacts[1].id == "contact_2"
+
+    def test_messages(self):
+        """Test that messages.list(lazy=True) returns a view of the messages, empty if there are none."""
+        assert len(make_client({"messages": [{"id": "msg_1"}]}).messages.list(lazy=True)) == 1
+        assert len(make_client({}).messages.list(lazy=True)) == 0
+
+    def test_rcs_messages(self):
+        """Test that rcs.list_messages(lazy=True) returns a view that honours field aliases."""
+        messages = make_client([RCS_MESSAGE]).rcs.list_messages(lazy=True)
+
+        assert messages[0].from_ == "+1987654321"
+        assert messages.to_models() == [RcsSendMessageSerializer.model_validate(RCS_MESSAGE)]
+
+    def test_async_client(self):
+        """Test that the async resources return views too."""
+
+        def handler(request):
+            return httpx.Response(200, json=PAGE)
+
+        async def send():
+            http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with AsyncDevoClient(api_key="test-api-key", http_client=http_client) as client:
+                return await client.contacts.list(lazy=True)
+
+        page = asyncio.run(send())
+
+        assert page.contacts[0].phone_number == "+1234567890"
@@ -1,9 +1,10 @@
-from unittest.mock import Mock
+import asyncio
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 
 from devhub_python.exceptions import DevoValidationException
-from devhub_python.resources.whatsapp import WhatsAppResource
+from devhub_python.resources.whatsapp import AsyncWhatsAppResource, WhatsAppResource
 
 
 class TestWhatsAppResource:
@@ -1097,3 +1098,148 @@ class TestWhatsAppResource:
 
         assert result.message_id == "msg_catalog_161718"
         assert result.success is True
+
+
+class TestAsyncWhatsAppResource:
+    """Test cases for the async WhatsApp resource."""
+
+    @pytest.fixture
+    def whatsapp_resource(self):
+        """Create an async WhatsApp resource backed by a mock async client."""
+        return AsyncWhatsAppResource(AsyncMock())
+
+    @staticmethod
+    def respond(method, payload):
+        """Configure ``method`` on the mock client to return ``payload``."""
+        mock_response = Mock()
+        mock_response.json.return_value = payload
+        method.return_value = mock_response
+
+    def test_get_accounts(self, whatsapp_resource):
+        """Test getting WhatsApp accounts."""
+        self.respond(
+            whatsapp_resource.client.get,
+            {"accounts": [], "total": 0, "page": 1, "limit": 10, "has_next": False},
+        )
+
+        result = asyncio.run(whatsapp_resource.get_accounts(page=1, limit=10, is_approved=True, search="acme"))
+
+        assert result.total == 0
+        whatsapp_resource.client.get.assert_awaited_once_with(
+            "user-api/whatsapp/accounts", params={"page": 1, "limit": 10, "isApproved": True, "search": "acme"}
+        )
+
+    def test_get_template(self, whatsapp_resource):
+        """Test getting a template by name."""
+        self.respond(
+            whatsapp_resource.client.get,
+            {
+                "name": "welcome_message",
+                "language": "en",
+                "status": "APPROVED",
+                "category": "MARKETING",
+                "components": [],
+            },
+        )
+
+        result = asyncio.run(whatsapp_resource.get_template("welcome_message"))
+
+        assert result.name == "welcome_message"
+
+    def test_upload_file(self, whatsapp_resource):
+        """Test uploading a file."""
+        self.respond(
+            whatsapp_resource.client.post,
+            {"file_id": "f1", "filename": "a.jpg", "file_size": 3, "mime_type": "image/jpeg", "url": "https://x/a.jpg"},
+        )
+
+        result = asyncio.run(whatsapp_resource.upload_file(b"abc", "a.jpg", "image/jpeg"))
+
+        assert result.file_id == "f1"
+        whatsapp_resource.client.post.assert_awaited_once_with(
+            "user-api/whatsapp/upload", files={"file": ("a.jpg", b"abc", "image/jpeg")}
+        )
+
+    def test_upload_file_empty_content(self, whatsapp_resource):
+        """Test that empty uploads are rejected."""
+        with pytest.raises(DevoValidationException):
+            asyncio.run(whatsapp_resource.upload_file(b"", "a.jpg", "image/jpeg"))
+
+    def test_send_normal_message(self, whatsapp_resource):
+        """Test sending a normal message."""
+        self.respond(
+            whatsapp_resource.client.post,
+            {
+                "message_id": "m1",
+                "status": "sent",
+                "to": "+1234567890",
+                "account_id": "acc_1",
+                "timestamp": "2024-01-01T12:00:00Z",
+                "success": True,
+            },
+        )
+
+        result = asyncio.run(whatsapp_resource.send_normal_message(to="+1234567890", message="Hi", account_id="acc_1"))
+
+        assert result.message_id == "m1"
+
+    def test_templates(self, whatsapp_resource):
+        """Test creating, listing and sending templates."""
+        template = {
+            "id": "t1",
+            "name": "welcome_message",
+            "language": "en",
+            "category": "MARKETING",
+            "status": "APPROVED",
+            "components": [],
+        }
+        self.respond(whatsapp_resource.client.post, template)
+        created = asyncio.run(whatsapp_resource.create_template("acc_1", Mock(model_dump=Mock(return_value={}))))
+
+        self.respond(
+            whatsapp_resource.client.get,
+            {"templates": [], "total": 0, "page": 1, "limit": 10, "has_next": False},
+        )
+        listed = asyncio.run(
+            whatsapp_resource.get_templates("acc_1", page=1, limit=10, category="MARKETING", search="w")
+        )
+
+        self.respond(
+            whatsapp_resource.client.post,
+            {
+                "message_id": "m1",
+                "status": "sent",
+                "to": "+1234567890",
+                "account_id": "acc_1",
+                "timestamp": "2024-01-01T12:00:00Z",
+                "success": True,
+            },
+        )
+        sent = asyncio.run(whatsapp_resource.send_template_message("acc_1", Mock(model_dump=Mock(return_value={}))))
+
+        assert created.id == "t1"
+        assert listed.total == 0
+        assert sent.success is True
+
+    def test_get_templates_invalid_category(self, whatsapp_resource):
+        """Test that an invalid template category is rejected."""
+        with pytest.raises(DevoValidationException):
+            asyncio.run(whatsapp_resource.get_templates("acc_1", category="INVALID"))
+
+    def test_legacy_methods(self, whatsapp_resource):
+        """Test the legacy text, template and get methods."""
+        message = {"id": "m1", "to": "+1234567890", "type": "text", "status": "sent", "direction": "outbound"}
+        self.respond(whatsapp_resource.client.post, message)
+        self.respond(whatsapp_resource.client.get, message)
+
+        text = asyncio.run(
+            whatsapp_resource.send_text("+1234567890", "Hi", callback_url="https://cb", metadata={"a": 1})
+        )
+        template = asyncio.run(
+            whatsapp_resource.send_template(
+                "+1234567890", "welcome", parameters=["John"], callback_url="https://cb", metadata={"a": 1}
+            )
+        )
+        fetched = asyncio.run(whatsapp_resource.get("m1"))
+
+        assert text.id == template.id == fetched.id == "m1"